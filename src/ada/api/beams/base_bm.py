@@ -13,6 +13,7 @@ from ada.api.nodes import Node, get_singular_node_by_volume
 from ada.api.transforms import Placement
 from ada.base.physical_objects import BackendGeom
 from ada.base.units import Units
+from ada.core.spatial_index import mark_geometry_changed
 from ada.core.utils import Counter
 from ada.core.vector_utils import is_between_endpoints, unit_vector, vector_length
 from ada.fem.concept.constraints import DofType
@@ -410,6 +411,7 @@ class Beam(BackendGeom):
         self._section = value
         self._section.refs.append(self)
         old.refs.remove(self)
+        mark_geometry_changed()
 
     @property
     def material(self) -> Material:
@@ -530,6 +532,7 @@ class Beam(BackendGeom):
         self._n1.remove_obj_from_refs(self)
         self._n1 = new_node  # .get_main_node_at_point()
         self._n1.add_obj_to_refs(self)
+        mark_geometry_changed()
 
     @property
     def n2(self) -> Node:
@@ -540,6 +543,7 @@ class Beam(BackendGeom):
         self._n2.remove_obj_from_refs(self)
         self._n2 = new_node  # .get_main_node_at_point()
         self._n2.add_obj_to_refs(self)
+        mark_geometry_changed()
 
     @property
     def e1(self) -> Direction:
@@ -548,6 +552,7 @@ class Beam(BackendGeom):
     @e1.setter
     def e1(self, value: Iterable):
         self._e1 = Direction(*value)
+        mark_geometry_changed()
 
     @property
     def e2(self) -> Direction:
@@ -556,6 +561,7 @@ class Beam(BackendGeom):
     @e2.setter
     def e2(self, value: Iterable):
         self._e2 = Direction(*value)
+        mark_geometry_changed()
 
     @property
     def justification(self) -> Justification:
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
+from itertools import compress
 from operator import attrgetter
-from typing import TYPE_CHECKING, Iterable
+from typing import Iterable
+
+import numpy as np
 
 from ada.api.beams import Beam
 from ada.api.containers.base import IndexedCollection
+from ada.core.spatial_index import SpatialIndex
 from ada.core.utils import roundoff
 
-if TYPE_CHECKING:
-    pass
-
 
 class Beams(IndexedCollection[Beam, str, int]):
     def __init__(self, beams: Iterable[Beam] = (), parent=None):
@@ -22,47 +23,60 @@ class Beams(IndexedCollection[Beam, str, int]):
             name_key=attrgetter("name"),
         )
         self._parent = parent
+        self._spatial_index: SpatialIndex | None = None
 
     def get_beams_within_volume(self, vol_, margins) -> Iterable[Beam]:
         """
         :param vol_: List or tuple of tuples [(xmin, xmax), (ymin, ymax), (zmin, zmax)]
         :param margins: Add margins to the volume box (equal in all directions). Input is in meters. Can be negative.
-        :return: List of beam ids
+        :return: Set of beams with at least one end node inside the volume
         """
-        from bisect import bisect_left, bisect_right
+        return self.get_beams_within_volumes([vol_], margins)[0]
 
+    def get_beams_within_volumes(self, vols: Iterable, margins) -> list[set[Beam]]:
+        """Batch version of :meth:`get_beams_within_volume`. Returns one set of beams per volume."""
+        vols = np.asarray(list(vols), dtype=float).reshape(-1, 3, 2)
+        vmin, vmax = vols[:, :, 0], vols[:, :, 1]
         if margins is not None:
-            vol_new = []
-            for p in vol_:
-                vol_new.append((roundoff(p[0] - margins), roundoff(p[1] + margins)))
-        else:
-            vol_new = vol_
-        vol = vol_new
-
-        def sort_beams(bms):
-            xkeys = [key[1] for key in bms]
-            xmin = bisect_left(xkeys, vol[0][0])
-            xmax = bisect_right(xkeys, vol[0][1])
-
-            within_x_list = sorted(bms[xmin:xmax], key=lambda elem: elem[2])
-
-            ykeys = [key[2] for key in within_x_list]
-            ymin = bisect_left(ykeys, vol[1][0])
-            ymax = bisect_right(ykeys, vol[1][1])
-
-            within_y_list = sorted(within_x_list[ymin:ymax], key=lambda elem: elem[3])
-
-            zkeys = [key[3] for key in within_y_list]
-            zmin = bisect_left(zkeys, vol[2][0])
-            zmax = bisect_right(zkeys, vol[2][1])
-
-            within_vol_list = within_y_list[zmin:zmax]
-            return [bm[0] for bm in within_vol_list]
-
-        bm_list1 = [(bm.name, bm.n1.x, bm.n1.y, bm.n1.z) for bm in sorted(self._items, key=lambda bm: bm.n1.x)]
-        bm_list2 = [(bm.name, bm.n2.x, bm.n2.y, bm.n2.z) for bm in sorted(self._items, key=lambda bm: bm.n2.x)]
-
-        return set([self.from_name(bm_id) for bms_ in (bm_list1, bm_list2) for bm_id in sort_beams(bms_)])
+            vmin = np.vectorize(roundoff)(vmin - margins)
+            vmax = np.vectorize(roundoff)(vmax + margins)
+
+        results = [set() for _ in range(len(vols))]
+        hits = self._get_spatial_index().query_boxes(vmin, vmax, by_type=Beam)
+        pairs = [(qi, bm) for qi, row in enumerate(hits) for bm in row if bm.guid in self._idmap]
+        if len(pairs) == 0:
+            return results
+        q_idx, candidates = zip(*pairs)
+
+        # The index bounds are conservative; keep the exact end-node containment test
+        q_idx = np.asarray(q_idx)
+        ends = np.array([(bm.n1.p, bm.n2.p) for bm in candidates], dtype=float)
+        lo, hi = vmin[q_idx][:, None, :], vmax[q_idx][:, None, :]
+        inside = np.all((ends >= lo) & (ends <= hi), axis=2).any(axis=1)
+        for qi, bm in zip(q_idx[inside].tolist(), compress(candidates, inside)):
+            results[qi].add(bm)
+        return results
+
+    def _get_spatial_index(self) -> SpatialIndex:
+        # Reuse the owning part's index when this is its live beam container
+        parent = self._parent
+        if parent is not None and getattr(parent, "_beams", None) is self:
+            return parent.spatial_index
+
+        if getattr(self, "_spatial_index", None) is None:
+            self._spatial_index = SpatialIndex(self._items)
+        return self._spatial_index
+
+    def insert(self, i: int, item: Beam) -> None:
+        super().insert(i, item)
+        if getattr(self, "_spatial_index", None) is not None:
+            self._spatial_index.add(item)
+
+    def __delitem__(self, i):
+        item = self._items[i]
+        super().__delitem__(i)
+        if getattr(self, "_spatial_index", None) is not None:
+            self._spatial_index.discard(item)
 
     def add(self, beam: Beam) -> Beam:
         if beam.name is None:
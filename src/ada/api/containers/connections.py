@@ -115,7 +115,7 @@ class Connections(BaseCollections):
         """
         from ada.api.connections import JointBase
         from ada.api.containers.nodes import Nodes
-        from ada.core.clash_check import are_beams_connected
+        from ada.core.clash_check import connect_beams_batch
 
         ass = self._parent.get_assembly()
         bm_res = ass.beam_clash_check()
@@ -123,8 +123,7 @@ class Connections(BaseCollections):
         nodes = Nodes()
         nmap = dict()
 
-        for bm1_, beams_ in bm_res:
-            are_beams_connected(bm1_, beams_, out_of_plane_tol, point_tol, nodes, nmap)
+        connect_beams_batch(bm_res, out_of_plane_tol, point_tol, nodes, nmap)
 
         for node, mem in nmap.items():
             if joint_func is not None:
@@ -222,24 +222,13 @@ class ArrayNodes(Nodes):
         self.remove([n for n in self if not n.has_refs])
 
     def merge_coincident(self, tol: float = None) -> None:
-        from ada.fem.utils import replace_node
-
+        # one vectorized pass over the store instead of a get_by_volume + replace_node per node
         tol = tol if tol is not None else self._point_tol
-        for n in list(self):
-            if not n.has_refs:
-                continue
-            if not self._store.has_node(n.id):
-                continue
-            dups = sorted(
-                [m for m in self.get_by_volume(tuple(n.p), tol=tol) if m.id != n.id],
-                key=lambda x: len(x.refs),
-            )
-            if dups:
-                primary = max([n] + dups, key=lambda x: len(x.refs))
-                for dup in dups:
-                    replace_node(dup, primary)
-                    self.remove(dup)
+        n_before = self._store.n_nodes
+        self._store.merge_coincident_nodes(tol, referenced_only=True)
         self._invalidate_order()
+        if self._store.n_nodes != n_before:
+            self.renumber()
 
 
 class ArrayElements(FemElements):
@@ -28,6 +28,13 @@ if TYPE_CHECKING:
     from ada.api.nodes import Node
     from ada.fem.results.common import FemNodes
 
+# The 13 neighbour-cell offsets that are lexicographically positive: pairing every cell with
+# itself and these visits each pair of adjacent cells exactly once.
+_HALF_NEIGHBOURS = np.array(
+    [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1) if (dx, dy, dz) > (0, 0, 0)],
+    dtype=np.int64,
+)
+
 
 class ElemArrayBlock:
     """One element type's connectivity, packed.
@@ -122,6 +129,10 @@ class MeshArrays:
     def has_node(self, nid: int) -> bool:
         return int(nid) in self.id2idx
 
+    def node_rows(self, node_ids) -> np.ndarray:
+        """Rows of ``node_ids`` (a vectorised :meth:`node_index`), -1 for ids not in the store"""
+        return _lookup_rows(self.node_ids, np.asarray(node_ids, dtype=np.int64), lambda: self.id2idx)
+
     # ── proxy minting (identity-stable while alive) ──────────────────────
     def node_proxy(self, row: int) -> "NodeProxy":
         row = int(row)
@@ -284,16 +295,17 @@ class MeshArrays:
         self._bbox = None
         return self.coords.shape[0] - 1
 
-    def remove_nodes(self, rows) -> None:
+    def remove_nodes(self, rows) -> np.ndarray | None:
         """Remove node rows and remap every block's connectivity in one shot.
 
         Removed rows must be unreferenced by any element (the caller — e.g.
         ``merge_coincident`` after ``replace_node`` — guarantees this); otherwise
-        the dangling reference becomes ``-1``.
+        the dangling reference becomes ``-1``. Returns the ``old row -> new row`` map
+        (``-1`` for removed rows), or None when nothing was removed.
         """
         rows = np.atleast_1d(np.asarray(list(rows), dtype=np.int64))
         if rows.size == 0:
-            return
+            return None
         keep = np.ones(self.n_nodes, dtype=bool)
         keep[rows] = False
         old2new = np.full(self.n_nodes, -1, dtype=np.int32)
@@ -310,12 +322,80 @@ class MeshArrays:
         # rows shifted -> any cached proxies now point at the wrong row.
         self._proxy_cache.clear()
         self._extra_refs = {}
+        return old2new
 
     def conn_changed(self) -> None:
         """Signal that a block's connectivity was edited (invalidates adjacency)."""
         self._adjacency = None
         self._adj_epoch += 1
 
+    # ── coincident nodes (vectorized) ────────────────────────────────────
+    def coincident_node_map(self, tol: float, referenced_only: bool = False) -> np.ndarray:
+        """``int64 (n,)`` map of every node row to the row it merges into (itself if unique).
+
+        Nodes within ``tol`` of each other on every axis (the ``get_by_volume`` box test)
+        form a group, transitively. The group keeps the node with the most references
+        (elements + side-table refs), the lowest row on a tie. With ``referenced_only``,
+        groups without any referenced node are left alone, like ``Nodes.merge_coincident``.
+        """
+        n = self.n_nodes
+        remap = np.arange(n, dtype=np.int64)
+        if n < 2:
+            return remap
+
+        i, j = _coincident_pairs(self.coords, float(tol))
+        if i.size == 0:
+            return remap
+        labels = _pair_components(n, i, j)
+
+        n_refs = np.zeros(n, dtype=np.int64)
+        for blk in self.blocks.values():
+            n_refs += np.bincount(blk.conn.ravel(), minlength=n)[:n]
+        for row, lst in self._extra_refs.items():
+            n_refs[row] += len(lst)
+
+        # first row of each label after ordering by (label, most refs, row) is the group's keeper
+        order = np.lexsort((remap, -n_refs, labels))
+        first = np.ones(n, dtype=bool)
+        first[1:] = labels[order[1:]] != labels[order[:-1]]
+        keeper = np.empty(n, dtype=np.int64)
+        keeper[labels[order[first]]] = order[first]
+        remap = keeper[labels]
+
+        if referenced_only:
+            remap[n_refs[remap] == 0] = np.flatnonzero(n_refs[remap] == 0)
+        return remap
+
+    def merge_coincident_nodes(self, tol: float, referenced_only: bool = False) -> np.ndarray:
+        """Merge coincident nodes (see :meth:`coincident_node_map`) in one vectorized pass.
+
+        Every block's connectivity is rewritten in place to the kept rows, the merged rows
+        are removed, and side-table refs plus live node proxies are carried over to the kept
+        node, so a ``FemSet`` or ``Beam`` holding a merged node's proxy now sees the kept one.
+        Returns the ``old row -> new row`` map (``int64``, one entry per old row).
+        """
+        remap = self.coincident_node_map(tol, referenced_only)
+        merged = np.flatnonzero(remap != np.arange(remap.size))
+        if merged.size == 0:
+            return remap
+
+        for blk in self.blocks.values():
+            blk.conn[...] = remap[blk.conn]
+
+        proxies = list(self._proxy_cache.items())
+        extra_refs = self._extra_refs
+        old2new = self.remove_nodes(merged)
+        final = old2new[remap].astype(np.int64)
+
+        for row, lst in extra_refs.items():
+            for item in lst:
+                self.add_extra_ref(final[row], item)
+        # kept rows first, so the cache keeps the proxy that already was the kept node
+        for row, proxy in sorted(proxies, key=lambda rp: remap[rp[0]] != rp[0]):
+            proxy._row = int(final[row])
+            self._proxy_cache.setdefault(proxy._row, proxy)
+        return final
+
     # ── element access ───────────────────────────────────────────────────
     def elem_loc(self, eid: int):
         """Return ``(ctype, row)`` for an element id, or raise ValueError."""
@@ -325,6 +405,18 @@ class MeshArrays:
                 return ctype, row
         raise ValueError(f'The elem id "{eid}" is not found')
 
+    def elem_rows(self, el_ids) -> dict:
+        """``{ctype: (positions, rows)}``: for each block holding some of ``el_ids``, the positions
+        of those ids in ``el_ids`` and their rows in the block. Ids in no block are left out."""
+        el_ids = np.asarray(el_ids, dtype=np.int64)
+        out = {}
+        for ctype, blk in self.blocks.items():
+            rows = _lookup_rows(blk.el_ids, el_ids, lambda: blk.eid2row)
+            positions = np.flatnonzero(rows >= 0)
+            if len(positions):
+                out[ctype] = (positions, rows[positions])
+        return out
+
     def n_elems(self) -> int:
         return sum(len(b) for b in self.blocks.values())
 
@@ -392,3 +484,117 @@ class MeshArrays:
         from ada.fem.results.common import FemNodes
 
         return FemNodes(self.coords, self.node_ids)
+
+
+def _lookup_rows(keys: np.ndarray, query: np.ndarray, index_map) -> np.ndarray:
+    """Row of each ``query`` value in the unsorted ``keys`` array, -1 where it is absent.
+
+    Queries much smaller than ``keys`` go through the cached ``index_map()`` id -> row dict;
+    large ones sort ``keys`` once instead."""
+    if len(keys) == 0:
+        return np.full(len(query), -1, dtype=np.int64)
+    if len(query) * 8 < len(keys):
+        get = index_map().get
+        return np.array([get(q, -1) for q in query.tolist()], dtype=np.int64)
+    order = np.argsort(keys, kind="stable")
+    pos = np.searchsorted(keys[order], query).clip(max=len(keys) - 1)
+    return np.where(keys[order][pos] == query, order[pos], -1)
+
+
+def _coincident_pairs(coords: np.ndarray, tol: float) -> tuple[np.ndarray, np.ndarray]:
+    """Row pairs ``(i, j)``, ``i != j``, whose coords differ by at most ``tol`` on every axis.
+
+    Sort-and-sweep: a sweep over each axis' sorted coordinates first drops every point with
+    no other point within ``tol`` along that axis (most of them, in a mesh that is mostly
+    merged already). The rest are binned in a uniform grid of cells at least ``tol`` wide, so
+    a coincident pair always sits in the same or adjacent cells. The cells are sorted by a
+    row-major code, every occupied cell is paired with itself and its 13 forward neighbours
+    by binary search, and only those candidates are distance-tested. ``tol <= 0`` pairs
+    exact duplicates only.
+    """
+    tol = max(float(tol), 0.0)
+    rows = np.arange(coords.shape[0])
+    for ax in range(3):
+        if rows.size < 2:
+            break
+        o = np.argsort(coords[rows, ax], kind="stable")
+        gap = np.diff(coords[rows[o], ax]) <= tol
+        near = np.zeros(rows.size, dtype=bool)
+        near[o[1:]] |= gap
+        near[o[:-1]] |= gap
+        rows = rows[near]
+    if rows.size < 2:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    pts = coords[rows]
+    n = rows.size
+    lo = pts.min(axis=0)
+    # Cells wider than tol only add candidates; 2**20 cells per axis keeps the code in int64
+    cell = max(tol, float((pts.max(axis=0) - lo).max()) / 2**20)
+    if cell == 0.0:
+        cell = 1.0
+    keys = np.floor((pts - lo) / cell).astype(np.int64)
+    # +3 leaves room for the -1/+1 neighbour keys, so a neighbour's code is ``code + shift``
+    spans = keys.max(axis=0) + 3
+    codes = ((keys[:, 0] + 1) * spans[1] + (keys[:, 1] + 1)) * spans[2] + (keys[:, 2] + 1)
+    shifts = (_HALF_NEIGHBOURS[:, 0] * spans[1] + _HALF_NEIGHBOURS[:, 1]) * spans[2] + _HALF_NEIGHBOURS[:, 2]
+
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    first = np.ones(n, dtype=bool)
+    first[1:] = sorted_codes[1:] != sorted_codes[:-1]
+    starts = np.flatnonzero(first)
+    counts = np.diff(np.append(starts, n))
+    cells = sorted_codes[starts]
+
+    pairs_i, pairs_j = [], []
+    for shift in [None, *shifts]:
+        if shift is None:
+            a = np.flatnonzero(counts > 1)
+            b = a
+        else:
+            # the shifted codes stay sorted, which keeps the binary search cache-friendly
+            target = cells + shift
+            pos = np.searchsorted(cells, target)
+            found = pos < cells.size
+            found[found] = cells[pos[found]] == target[found]
+            a = np.flatnonzero(found)
+            b = pos[found]
+        if a.size == 0:
+            continue
+
+        # every (member of a) x (member of b) candidate, flattened
+        na, nb = counts[a], counts[b]
+        n_pairs = na * nb
+        owner = np.repeat(np.arange(a.size), n_pairs)
+        local = np.arange(int(n_pairs.sum())) - np.repeat(np.cumsum(n_pairs) - n_pairs, n_pairs)
+        i = order[starts[a][owner] + local // nb[owner]]
+        j = order[starts[b][owner] + local % nb[owner]]
+        if shift is None:
+            keep = i < j
+            i, j = i[keep], j[keep]
+        close = np.all(np.abs(pts[i] - pts[j]) <= tol, axis=1)
+        pairs_i.append(rows[i[close]])
+        pairs_j.append(rows[j[close]])
+
+    if not pairs_i:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return np.concatenate(pairs_i), np.concatenate(pairs_j)
+
+
+def _pair_components(n: int, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    """Connected-component label (the smallest row) of each of ``n`` rows, given edges ``(i, j)``.
+
+    Min-label propagation with pointer jumping; each round is a couple of vectorized passes
+    over the edges, and the round count grows with the log of the longest chain."""
+    labels = np.arange(n, dtype=np.int64)
+    while True:
+        low = np.minimum(labels[i], labels[j])
+        new = labels.copy()
+        np.minimum.at(new, i, low)
+        np.minimum.at(new, j, low)
+        np.minimum.at(new, labels, new)
+        new = new[new]
+        if np.array_equal(new, labels):
+            return labels
+        labels = new
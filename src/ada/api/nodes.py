@@ -6,6 +6,7 @@ import numpy as np
 
 from ada.base.units import Units
 from ada.config import Config, logger
+from ada.core.spatial_index import mark_geometry_changed
 from ada.geom.points import Point
 
 if TYPE_CHECKING:
@@ -28,8 +29,8 @@ class Node:
         self, p: Iterable[numeric, numeric, numeric] | Point, nid=None, r=None, parent=None, units=Units.M, refs=None
     ):
         self._id = nid
-        self.p: Point = Point(*p) if not isinstance(p, Point) else p
-        if len(self.p) != 3:
+        self._p: Point = Point(*p) if not isinstance(p, Point) else p
+        if len(self._p) != 3:
             raise ValueError("Node object must have exactly 3 coordinates (x, y, z).")
 
         self._r = r
@@ -64,6 +65,15 @@ class Node:
     def id(self, value: int):
         self._id = value
 
+    @property
+    def p(self) -> Point:
+        return self._p
+
+    @p.setter
+    def p(self, value: Point):
+        self._p = value
+        mark_geometry_changed()
+
     @property
     def x(self):
         return self.p[0]
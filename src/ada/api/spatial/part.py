@@ -47,6 +47,8 @@ if TYPE_CHECKING:
     from ada.api.connections import JointBase
     from ada.api.mass import MassPoint
     from ada.cadit.ifc.store import IfcStore
+    from ada.cadit.step.read.stream_reader import StepSelection
+    from ada.core.spatial_index import SpatialIndex
     from ada.fem.containers import COG
     from ada.fem.meshing import GmshOptions
     from ada.visit.rendering.camera import Camera
@@ -92,6 +94,8 @@ class Part(BackendGeom):
         self._parts = dict()
         self._groups: dict[str, Group] = dict()
         self._ifc_class = ifc_class
+        self._spatial_index: SpatialIndex | None = None
+        self._spatial_index_src: tuple[int, int, int] | None = None
 
         if fem is not None:
             fem.parent = self
@@ -131,7 +135,7 @@ class Part(BackendGeom):
             beam.n2 = old_node
 
         beam.change_type = beam.change_type.ADDED
-        self.beams.add(beam)
+        self._index_member(self.beams.add(beam))
 
         if add_to_layer is not None:
             a = self.get_assembly()
@@ -153,7 +157,7 @@ class Part(BackendGeom):
             self.nodes.add(n)
 
         plate.change_type = plate.change_type.ADDED
-        self._plates.add(plate)
+        self._index_member(self._plates.add(plate))
 
         if add_to_layer is not None:
             a = self.get_assembly()
@@ -215,8 +219,14 @@ class Part(BackendGeom):
 
         shape.change_type = change_type
         self._shapes.append(shape)
+        self._index_member(shape)
         return shape
 
+    def _index_member(self, obj: Beam | Plate | Shape) -> None:
+        # Only kept up to date once something has asked for the index
+        if self._spatial_index is not None:
+            self._spatial_index.add(obj)
+
     def add_part(self, part: Part, overwrite: bool = False, add_to_layer: str = None) -> Part:
         if issubclass(type(part), Part) is False:
             raise ValueError("Added Part must be a subclass or instance of Part")
@@ -400,6 +410,7 @@ class Part(BackendGeom):
         get_asm = self.get_assembly
         to_layer_beams = []
         to_layer_plates = []
+        indexed = []
 
         for o in objs:
             if isinstance(o, Beam):
@@ -427,7 +438,7 @@ class Part(BackendGeom):
                     beam.n2 = old
 
                 beam.change_type = beam.change_type.ADDED
-                beams_col.add(beam)
+                indexed.append(beams_col.add(beam))
                 if add_to_layer:
                     to_layer_beams.append(beam)
                 results.append(beam)
@@ -447,7 +458,7 @@ class Part(BackendGeom):
                     nodes.add(n)
 
                 plate.change_type = plate.change_type.ADDED
-                plates_col.add(plate)
+                indexed.append(plates_col.add(plate))
                 if add_to_layer:
                     to_layer_plates.append(plate)
                 results.append(plate)
@@ -455,6 +466,9 @@ class Part(BackendGeom):
             else:
                 raise NotImplementedError(f"Cannot batch-add {type(o)}")
 
+        if self._spatial_index is not None:
+            self._spatial_index.add_many(indexed)
+
         # 4) single get_assembly + layer adds
         if add_to_layer:
             asm = get_asm()
@@ -564,6 +578,9 @@ class Part(BackendGeom):
         include_shells=False,
         reader: Literal["occ", "stream", "auto", "tolerant", "native"] | None = None,
         product_tree: bool = False,
+        products: Iterable[str] | None = None,
+        bbox: tuple[Iterable[float], Iterable[float]] | None = None,
+        max_depth: int | None = None,
     ):
         """
 
@@ -583,7 +600,27 @@ class Part(BackendGeom):
             falls back to OCC if the file uses any entity outside its scope; "tolerant"
             reads every supported solid kernel-free and *skips* the unsupported ones (no
             whole-file OCC fallback) — best for large mixed CAD that would OOM the OCC reader.
+        :param products: Only read solids placed under (or being) one of these STEP products.
+        :param bbox: Only read solid instances whose points' box intersects ``(min_xyz, max_xyz)``,
+            given in the file's coordinates and length unit.
+        :param max_depth: Only read solid instances at most this many assembly levels deep
+            (the root product is level 1).
+
+        The selection (``products`` / ``bbox`` / ``max_depth``) is applied by the pure-Python
+        streaming reader before the unselected solids are parsed, see
+        :class:`ada.cadit.step.read.stream_reader.StepSelection`. ``reader=None``/``"auto"``
+        then reads like ``"tolerant"``; "occ" and "native" can't select and raise ValueError.
         """
+        select = None
+        if products is not None or bbox is not None or max_depth is not None:
+            from ada.cadit.step.read.stream_reader import StepSelection
+
+            select = StepSelection(products=products, bbox=bbox, max_depth=max_depth)
+            if reader in ("occ", "native"):
+                raise ValueError(f"reader={reader!r} can't read a selection (products/bbox/max_depth)")
+            if reader in (None, "auto"):
+                reader = "tolerant"
+
         if reader is None:
             # Resolve the default read path from the active CAD config so it's configurable
             # via CadConfig.step_reader (default "auto": constant-memory streaming + OCC
@@ -607,6 +644,7 @@ class Part(BackendGeom):
                 source_units,
                 reader=reader,
                 product_tree=product_tree,
+                select=select,
             ):
                 return
             # auto-fallback: the file is outside the streaming reader's scope.
@@ -649,6 +687,7 @@ class Part(BackendGeom):
         source_units,
         reader: Literal["stream", "auto", "tolerant", "native"],
         product_tree=False,
+        select: StepSelection | None = None,
     ) -> bool:
         """Read a STEP file via the kernel-free streaming reader, wrapping each
         yielded adapy ``Geometry`` in a ``Shape``. Returns True on success; False
@@ -665,6 +704,9 @@ class Part(BackendGeom):
         levels; the last level is the solid itself). Same-name products under a parent are
         merged into one Part, so the result mirrors the product tree rather than every
         placed instance.
+
+        ``select`` narrows the read to a :class:`StepSelection` of products / box / depth; it
+        always uses the pure-Python two-pass reader, which knows the assembly structure.
         """
         from ada.cadit.step.read.stream_reader import (
             StepStreamUnsupported,
@@ -678,7 +720,7 @@ class Part(BackendGeom):
         # large-file OOM case). "auto"/"tolerant": two-pass deferred resolution so
         # forward-referenced solids (OpenCASCADE and most other writers) read too.
         # "tolerant" additionally skips unsupported solids instead of raising.
-        local_pool = reader == "stream"
+        local_pool = reader == "stream" and select is None
         tolerant = reader == "tolerant"
 
         ada_name = name if name is not None else "CAD" + str(len(self.shapes) + 1)
@@ -736,7 +778,7 @@ class Part(BackendGeom):
         # decode path can't handle; those fall back to the pure-Python reader ("auto")
         # or raise ("native").
         use_native = False
-        if reader in ("native", "auto"):
+        if reader in ("native", "auto") and select is None:
             from ada.cadit.step.read.native_reader import native_adacpp_step_available
 
             if native_adacpp_step_available():
@@ -803,7 +845,7 @@ class Part(BackendGeom):
                 use_native = False
 
         if not use_native:
-            geom_iter = stream_read_step(step_path, local_pool=local_pool, tolerant=tolerant)
+            geom_iter = stream_read_step(step_path, local_pool=local_pool, tolerant=tolerant, select=select)
             try:
                 for i, geometry in enumerate(geom_iter):
                     shp_name = str(geometry.id) if geometry.id not in (None, "") else f"{ada_name}_{i}"
@@ -1410,13 +1452,13 @@ class Part(BackendGeom):
         :param margins: Add margins to the volume box (equal in all directions). Input is in meters. Can be negative.
         :return: A map generator for the list of beams and resulting intersecting beams
         """
-        from ada.core.clash_check import basic_intersect
+        from ada.core.clash_check import batch_intersect
 
         all_parts = self.get_all_subparts() + [self]
         all_beams = [bm for p in all_parts for bm in p.beams]
         all_bm_containers = [p.beams for p in all_parts]
 
-        return filter(None, [basic_intersect(bm, margins, all_bm_containers) for bm in all_beams])
+        return filter(None, batch_intersect(all_beams, margins, all_bm_containers))
 
     def move_all_mats_and_sec_here_from_subparts(self):
         for p in self.get_all_subparts():
@@ -1579,7 +1621,13 @@ class Part(BackendGeom):
         embed_object_metadata: bool = True,
         params: RenderParams = None,
         solid_beams: bool = False,
+        cpus: int = 1,
     ):
+        """Export the part to a GLB file.
+
+        :param cpus: Worker processes used for tessellation. Ignored when ``params`` is given
+            (set ``RenderParams.tessellation_cpus`` instead).
+        """
         if params is None:
             from ada.visit.render_params import FEARenderParams
 
@@ -1590,6 +1638,7 @@ class Part(BackendGeom):
                 filter_by_guids=filter_by_guids,
                 embed_object_metadata=embed_object_metadata,
                 fea_params=FEARenderParams(solid_beams=solid_beams),
+                tessellation_cpus=cpus,
             )
 
         converter = SceneConverter(self, params)
@@ -1605,6 +1654,14 @@ class Part(BackendGeom):
 
             with open(gltf_file, "wb") as f:
                 f.write(converter.build_glb())
+            if params.lod_errors:
+                from ada.visit.gltf.lod import write_glb_lods
+
+                write_glb_lods(gltf_file, params.lod_errors)
+            if params.tile_triangles > 0:
+                from ada.visit.gltf.tiles import tile_glb
+
+                tile_glb(gltf_file, params.tile_triangles)
 
     def to_trimesh_scene(
         self,
@@ -1851,6 +1908,28 @@ class Part(BackendGeom):
     def shapes(self, value: list[Shape]):
         self._shapes = value
 
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        """Bounding-box index over the beams, plates and shapes owned directly by this part.
+
+        Built on first access and then kept up to date by ``add_beam``/``add_plate``/``add_shape``
+        and ``remove()``. Containers that were swapped out or filled behind the part's back are
+        re-synced on the next access, and beams whose nodes moved are re-indexed on the next
+        query (see :func:`ada.core.spatial_index.member_revision`).
+        """
+        from ada.core.spatial_index import SpatialIndex
+
+        if self._spatial_index is None:
+            self._spatial_index = SpatialIndex()
+
+        src = (id(self._beams), id(self._plates), id(self._shapes))
+        n_members = len(self._beams) + len(self._plates) + len(self._shapes)
+        if src != self._spatial_index_src or n_members != len(self._spatial_index):
+            self._spatial_index.sync(chain(self._beams, self._plates, self._shapes))
+            self._spatial_index_src = src
+
+        return self._spatial_index
+
     @property
     def beams(self) -> Beams:
         return self._beams
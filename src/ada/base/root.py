@@ -130,5 +130,10 @@ class Root:
             self.parent.plates.remove(self)
         elif isinstance(self, Section):
             logger.warning("Section removal is not yet supported")
+            return
         else:
             raise NotImplementedError()
+
+        spatial_index = getattr(self.parent, "_spatial_index", None)
+        if spatial_index is not None:
+            spatial_index.discard(self)
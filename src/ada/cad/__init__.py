@@ -283,6 +283,7 @@ class CadBackend(Protocol):
     def transform(self, shape: ShapeHandle, matrix: "np.ndarray", copy: bool = True) -> ShapeHandle: ...
     def distance(self, a: ShapeHandle, b: ShapeHandle) -> float: ...
     def serialize(self, shape: ShapeHandle) -> str: ...
+    def deserialize(self, data: str) -> ShapeHandle: ...
     def is_valid(self, shape: ShapeHandle) -> bool: ...
     def volume(self, shape: ShapeHandle) -> float: ...
     def area(self, shape: ShapeHandle) -> float: ...
@@ -1389,6 +1390,12 @@ class AdacppBackend:
             raise NotImplementedError("adacpp.cad.serialize is not available in this build")
         return fn(shape)
 
+    def deserialize(self, data: str) -> ShapeHandle:
+        fn = getattr(self._cad, "deserialize", None)
+        if fn is None:
+            raise NotImplementedError("adacpp.cad.deserialize is not available in this build")
+        return fn(data)
+
     def is_valid(self, shape: ShapeHandle) -> bool:
         fn = getattr(self._cad, "is_valid", None)
         if fn is None:
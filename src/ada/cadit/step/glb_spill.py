@@ -159,6 +159,79 @@ class GlbSpillStore:
         shutil.rmtree(self._dir, ignore_errors=True)
 
 
+class SolidSpill:
+    """Per-solid, append-only disk spill for tiled output: every solid's position and
+    index bytes go to two shared files as they stream in, while RAM keeps only each
+    solid's material, node, file offsets, triangle count and bounding box. Once the
+    stream ends the solids are partitioned (see ``ada.visit.gltf.tiles``) and each tile
+    is replayed into its own :class:`GlbSpillStore`, so tiling never holds more than one
+    solid's buffers either."""
+
+    def __init__(self, tmpdir: str | None = None):
+        self._dir = tempfile.mkdtemp(prefix="ada_solid_spill_", dir=tmpdir)
+        self._pos_path = os.path.join(self._dir, "solids.pos")
+        self._idx_path = os.path.join(self._dir, "solids.idx")
+        # kept open across add() calls; closed by close_writers()
+        self._pos_fh = open(self._pos_path, "wb")  # noqa: SIM115
+        self._idx_fh = open(self._idx_path, "wb")  # noqa: SIM115
+        self._records: list[tuple] = []  # (mat_id, node_ref, pos offset, n_pos, idx offset, n_idx)
+        self._meshed: list[int] = []  # solids with triangles, the only ones with bounds
+        self._lo: list[np.ndarray] = []
+        self._hi: list[np.ndarray] = []
+        self._pos_off = 0
+        self._idx_off = 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(self, mat_id: int, node_ref, pos: np.ndarray, idx: np.ndarray, normal=None) -> None:
+        """Same signature as :meth:`GlbSpillStore.add`; indices stay solid-local."""
+        pos = np.ascontiguousarray(pos, dtype="<f4")
+        idx = np.ascontiguousarray(idx, dtype="<u4")
+        self._records.append((mat_id, node_ref, self._pos_off, pos.size, self._idx_off, idx.size))
+        self._pos_fh.write(pos.tobytes())
+        self._idx_fh.write(idx.tobytes())
+        self._pos_off += pos.nbytes
+        self._idx_off += idx.nbytes
+        if pos.size and idx.size:
+            p3 = pos.reshape(-1, 3)
+            self._meshed.append(len(self._records) - 1)
+            self._lo.append(p3.min(axis=0))
+            self._hi.append(p3.max(axis=0))
+
+    def node_ref(self, solid: int):
+        return self._records[solid][1]
+
+    def bounds(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """``(solids (m,), min (m, 3), max (m, 3), triangles (m,))`` of the solids that have
+        triangles, in stream order. Empty solids have no bounds and are left out."""
+        solids = np.array(self._meshed, dtype=np.int64)
+        triangles = np.array([self._records[i][5] // 3 for i in self._meshed], dtype=np.int64)
+        return solids, np.array(self._lo).reshape(-1, 3), np.array(self._hi).reshape(-1, 3), triangles
+
+    def replay(self, solids, store: GlbSpillStore) -> None:
+        """``store.add`` the given solids (indices into the stream order), in that order."""
+        self.close_writers()
+        with open(self._pos_path, "rb") as pos_f, open(self._idx_path, "rb") as idx_f:
+            for i in solids:
+                mat_id, node_ref, pos_off, n_pos, idx_off, n_idx = self._records[i]
+                pos_f.seek(pos_off)
+                idx_f.seek(idx_off)
+                pos = np.frombuffer(pos_f.read(4 * n_pos), dtype="<f4")
+                idx = np.frombuffer(idx_f.read(4 * n_idx), dtype="<u4")
+                store.add(mat_id, node_ref, pos, idx)
+
+    def close_writers(self) -> None:
+        """Flush and close the append handles; closing twice is a no-op."""
+        for fh in (self._pos_fh, self._idx_fh):
+            fh.close()
+
+    def cleanup(self) -> None:
+        """Remove the spill temp dir. Idempotent; safe in a ``finally``."""
+        self.close_writers()
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+
 def _base_color_factor(color: Color | None) -> list[float]:
     """Reproduce ``merged_mesh_to_trimesh_scene`` + trimesh's PBR float conversion:
     ``#000000`` -> light-gray, then ``[r,g,b]/255 + [opacity]`` (the 0..1 floats trimesh
@@ -48,7 +48,7 @@ import threading
 from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator
+from typing import Iterable, Iterator
 
 from ada.config import logger
 
@@ -229,7 +229,7 @@ from ada.geom.surfaces import (  # noqa: E402
     TriangulatedFaceSet,
 )
 
-__all__ = ["stream_read_step", "StepStreamUnsupported"]
+__all__ = ["stream_read_step", "StepSelection", "StepStreamUnsupported"]
 
 
 class StepStreamUnsupported(NotImplementedError):
@@ -1935,11 +1935,127 @@ _ROOT_BUILDERS = {
 }
 
 
+# --------------------------------------------------------------------------- #
+# Selective reads
+# --------------------------------------------------------------------------- #
+@dataclass
+class StepSelection:
+    """Subset of a STEP file's solids to read. A placed instance of a solid is kept when it
+    passes every criterion that is set; a solid with no kept instance is never parsed.
+
+    products:
+        Product names. An instance is kept when its own product or any assembly above
+        it carries one of these names.
+    bbox:
+        ``(min_xyz, max_xyz)`` in the file's coordinates and length unit. An instance is
+        kept when the world box of its solid's points (vertices, control points,
+        placements) intersects it. Only the solid's points are parsed for this test.
+    max_depth:
+        Maximum assembly depth: an instance whose assembly path (root product = 1, the
+        solid's own product last) is longer is dropped. A flat file has depth 1.
+    """
+
+    products: Iterable[str] | None = None
+    bbox: tuple[Iterable[float], Iterable[float]] | None = None
+    max_depth: int | None = None
+
+    def __post_init__(self):
+        if self.products is not None:
+            self.products = frozenset(self.products)
+
+    def filter_instances(self, pool_get, rid: int, product: str | None, tmap_entry):
+        """The ``(mats, paths)`` transform-map entry of root ``rid`` narrowed to the kept instances.
+
+        Returns ``(keep, entry)``; ``entry`` is None for the single, no-transform instance."""
+        import numpy as np
+
+        mats, paths = tmap_entry if tmap_entry else ([np.eye(4)], [None])
+        keep = list(range(len(mats)))
+
+        if self.products is not None:
+            keep = [k for k in keep if not self.products.isdisjoint(_instance_names(paths[k], product))]
+        if self.max_depth is not None:
+            keep = [k for k in keep if (len(paths[k]) if paths[k] else 1) <= self.max_depth]
+        if keep and self.bbox is not None:
+            bounds = _root_point_bounds(pool_get, rid)
+            if bounds is None:
+                keep = []
+            else:
+                lo, hi = np.asarray(self.bbox[0], dtype=float), np.asarray(self.bbox[1], dtype=float)
+                keep = [k for k in keep if _box_intersects(_transform_box(bounds, mats[k]), lo, hi)]
+
+        if not keep:
+            return False, None
+        if tmap_entry is None:
+            return True, None
+        return True, ([mats[k] for k in keep], [paths[k] for k in keep])
+
+
+def _instance_names(path, product: str | None) -> set:
+    names = {product} if product else set()
+    for level in path or ():
+        if isinstance(level, (tuple, list)) and len(level) > 1 and level[1]:
+            names.add(level[1])
+    return names
+
+
+def _root_point_bounds(pool_get, rid: int):
+    """Local ``(min, max)`` of every 3D ``CARTESIAN_POINT`` reachable from root ``rid``, or None.
+
+    Walks the entity references without building geometry. B-spline control points bound
+    their curve/surface; circle and cylinder bulges between vertices are not covered."""
+    import numpy as np
+
+    lo = np.full(3, np.inf)
+    hi = np.full(3, -np.inf)
+    seen = {rid}
+    stack = [rid]
+    while stack:
+        rec = pool_get(stack.pop())
+        if rec is None:
+            continue
+        if rec.type == "CARTESIAN_POINT":
+            coords = rec.args[1] if len(rec.args) > 1 else None
+            if isinstance(coords, (list, tuple)) and len(coords) == 3:
+                try:
+                    p = np.array([float(c) for c in coords])
+                except (TypeError, ValueError):
+                    continue
+                np.minimum(lo, p, out=lo)
+                np.maximum(hi, p, out=hi)
+            continue
+        for ref_id in _iter_refs(list(rec.args.values()) if isinstance(rec.args, dict) else rec.args):
+            if ref_id not in seen:
+                seen.add(ref_id)
+                stack.append(ref_id)
+    if not np.isfinite(lo).all():
+        return None
+    return lo, hi
+
+
+def _transform_box(bounds, matrix):
+    import numpy as np
+
+    lo, hi = bounds
+    corners = np.array([[x, y, z] for x in (lo[0], hi[0]) for y in (lo[1], hi[1]) for z in (lo[2], hi[2])])
+    world = corners @ matrix[:3, :3].T + matrix[:3, 3]
+    return world.min(axis=0), world.max(axis=0)
+
+
+def _box_intersects(box, lo, hi) -> bool:
+    return bool((box[0] <= hi).all() and (box[1] >= lo).all())
+
+
 # --------------------------------------------------------------------------- #
 # Public entry point
 # --------------------------------------------------------------------------- #
 def stream_read_step(
-    filepath: str | Path, *, local_pool: bool = True, tolerant: bool = False, on_total=None
+    filepath: str | Path,
+    *,
+    local_pool: bool = True,
+    tolerant: bool = False,
+    on_total=None,
+    select: StepSelection | None = None,
 ) -> Iterator[Geometry]:
     """Lazily stream a STEP file, yielding one :class:`Geometry` per solid.
 
@@ -1972,12 +2088,19 @@ def stream_read_step(
         Optional callback ``on_total(n_roots)`` fired once (two-pass paths only) after
         the index scan, before any solid is yielded — lets a caller show conversion
         progress against the total solid count.
+    select:
+        Optional :class:`StepSelection`: read only the solids (and placed instances)
+        under chosen products, inside a box or above an assembly depth. Unselected solids
+        are never parsed. Needs the assembly structure, so only with ``local_pool=False``.
     """
     filepath = Path(filepath)
     skipped: Counter = Counter()
 
+    if select is not None and local_pool:
+        raise ValueError("stream_read_step: select requires local_pool=False")
+
     if not local_pool:
-        yield from _read_two_pass(filepath, tolerant=tolerant, skipped=skipped, on_total=on_total)
+        yield from _read_two_pass(filepath, tolerant=tolerant, skipped=skipped, on_total=on_total, select=select)
         _log_skips(filepath, skipped)
         return
 
@@ -2113,7 +2236,13 @@ _WS = frozenset(b" \t\r\n")
 
 
 def _read_two_pass(
-    filepath: Path, *, tolerant: bool = False, skipped=None, low_memory: bool | None = None, on_total=None
+    filepath: Path,
+    *,
+    tolerant: bool = False,
+    skipped=None,
+    low_memory: bool | None = None,
+    on_total=None,
+    select: StepSelection | None = None,
 ):
     """General STEP (forward references): resolve each root against the full entity
     table. Large files use a constant-memory mmap + offset-index pool so a worker pod
@@ -2126,10 +2255,10 @@ def _read_two_pass(
         except OSError:
             low_memory = False
     gen = _read_two_pass_lazy if low_memory else _read_two_pass_dict
-    yield from gen(filepath, tolerant=tolerant, skipped=skipped, on_total=on_total)
+    yield from gen(filepath, tolerant=tolerant, skipped=skipped, on_total=on_total, select=select)
 
 
-def _read_two_pass_dict(filepath: Path, *, tolerant: bool, skipped, on_total=None):
+def _read_two_pass_dict(filepath: Path, *, tolerant: bool, skipped, on_total=None, select=None):
     pool: dict[int, _Rec] = {}
     root_ids: list[int] = []
     styled_ids: list[int] = []
@@ -2167,6 +2296,11 @@ def _read_two_pass_dict(filepath: Path, *, tolerant: bool, skipped, on_total=Non
     resolver = _Resolver(pool, angle_scale=angle_scale)
     n_solids = 0
     for rid in root_ids:
+        tmap_entry = tmap.get(rid)
+        if select is not None:
+            keep, tmap_entry = select.filter_instances(pool.get, rid, prod_names.get(rid), tmap_entry)
+            if not keep:
+                continue
         rec = pool[rid]
         name = _solid_name(rec.args, n_solids, prod_names.get(rid))
         resolver.reset_cache()
@@ -2175,7 +2309,7 @@ def _read_two_pass_dict(filepath: Path, *, tolerant: bool, skipped, on_total=Non
             continue
         n_solids += 1
         color = _as_color(colour_map.get(rid))
-        yield from _yield_instances(name, geom, color, tmap.get(rid))
+        yield from _yield_instances(name, geom, color, tmap_entry)
 
 
 def _stmt_end(mm, start: int, n: int) -> int:
@@ -2333,6 +2467,123 @@ def _scan_offset_index(mm):
     return ids, offs, roots, styled, cdsr, srr, absr, sdr
 
 
+# Chunked scan: a statement start is a ';' followed by ``#id`` (and ``= KEYWORD``). A single-quoted string is
+# consumed whole, so a ';' or '#' inside one never matches (an escaped ``''`` reads as two adjacent strings).
+# A quote with no closing partner left in the chunk matches group 1 — the chunk split fell inside a string.
+_SCAN_RE = re.compile(rb"'[^']*'|(')|;\s*#(\d+)\s*(?:=\s*([A-Za-z0-9_]*))?")
+_SCAN_SPLIT_RE = re.compile(rb";\s*#\d+\s*=")
+# Chunks per scan worker; more, smaller chunks even out the uneven entity density of a CAD file.
+_SCAN_CHUNKS_PER_WORKER = 4
+_SCAN_KINDS = {
+    "STYLED_ITEM": 1,
+    "CONTEXT_DEPENDENT_SHAPE_REPRESENTATION": 2,
+    "SHAPE_REPRESENTATION_RELATIONSHIP": 3,
+    "ADVANCED_BREP_SHAPE_REPRESENTATION": 4,
+    "SHAPE_DEFINITION_REPRESENTATION": 5,
+}
+
+
+def _scan_workers(workers: int | None) -> int:
+    """Worker count for the offset scan: ``workers`` if given, else ``ADA_STEP_SCAN_WORKERS`` (default 1)."""
+    if workers is None:
+        try:
+            workers = int(_os.environ.get("ADA_STEP_SCAN_WORKERS", "1"))
+        except ValueError:
+            workers = 1
+    return max(1, workers)
+
+
+def _scan_chunk_bounds(mm, n_chunks: int) -> list[int]:
+    """Byte offsets splitting ``mm`` into about ``n_chunks`` ranges, each starting at a statement's ';'"""
+    n = len(mm)
+    bounds = [0]
+    for k in range(1, n_chunks):
+        m = _SCAN_SPLIT_RE.search(mm, max(k * n // n_chunks, bounds[-1] + 1))
+        if m is None:
+            break
+        if m.start() > bounds[-1]:
+            bounds.append(m.start())
+    bounds.append(n)
+    return bounds
+
+
+def _scan_chunk(filepath: str, start: int, end: int):
+    """Scan-pool entry: record (id, offset) and the root/classified ids of every entity statement in
+    ``[start, end)``. Returns None when the range starts or ends inside a quoted string."""
+    import mmap as _mmap
+
+    import numpy as np
+
+    ids: list[int] = []
+    offs: list[int] = []
+    kinds: list[list[int]] = [[] for _ in range(len(_SCAN_KINDS) + 1)]  # roots + _SCAN_KINDS
+    page = _mmap.PAGESIZE
+    with open(filepath, "rb") as fh, _mmap.mmap(fh.fileno(), 0, access=_mmap.ACCESS_READ) as mm:
+        # Same free-behind as the serial scan, so a worker only keeps a few MB of its range resident
+        freed = (start // page) * page
+        for m in _SCAN_RE.finditer(mm, start, end):
+            if m.start() - freed >= _SCAN_FREE_STEP:
+                target = ((m.start() - _SCAN_FREE_MARGIN) // page) * page
+                try:
+                    mm.madvise(_mmap.MADV_DONTNEED, freed, target - freed)
+                except (AttributeError, OSError, ValueError):
+                    pass
+                freed = target
+            rid = m.group(2)
+            if rid is None:
+                if m.group(1) is not None:
+                    return None
+                continue
+            rid = int(rid)
+            ids.append(rid)
+            offs.append(m.start(2) - 1)
+            kw = m.group(3)
+            if not kw:
+                continue
+            kw = kw.decode("ascii", "replace")
+            if kw in _ROOT_BUILDERS:
+                kinds[0].append(rid)
+            else:
+                kind = _SCAN_KINDS.get(kw)
+                if kind is not None:
+                    kinds[kind].append(rid)
+    return np.array(ids, dtype=np.int64), np.array(offs, dtype=np.int64), kinds
+
+
+def _scan_offset_index_chunked(filepath, workers: int, n_chunks: int | None = None):
+    """:func:`_scan_offset_index` split over statement-aligned chunks of the file, each tokenized by a
+    pool of ``workers`` processes (the scan is CPU-bound Python, so threads would serialise on the GIL).
+    The per-chunk results are concatenated in file order, so the output matches the serial scan.
+
+    Returns None when a chunk split fell inside a quoted string; the caller then runs the serial scan."""
+    import mmap as _mmap
+
+    import numpy as np
+
+    filepath = str(filepath)
+    with open(filepath, "rb") as fh, _mmap.mmap(fh.fileno(), 0, access=_mmap.ACCESS_READ) as mm:
+        bounds = _scan_chunk_bounds(mm, n_chunks or workers * _SCAN_CHUNKS_PER_WORKER)
+    ranges = list(zip(bounds[:-1], bounds[1:]))
+
+    if workers > 1 and len(ranges) > 1:
+        import multiprocessing as mp
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn")) as executor:
+            results = list(executor.map(_scan_chunk, [filepath] * len(ranges), *zip(*ranges)))
+    else:
+        results = [_scan_chunk(filepath, start, end) for start, end in ranges]
+
+    if any(res is None for res in results):
+        logger.debug(f"{Path(filepath).name}: chunk split inside a quoted string, using the serial offset scan")
+        return None
+
+    ids = np.concatenate([res[0] for res in results]) if results else np.empty(0, dtype=np.int64)
+    offs = np.concatenate([res[1] for res in results]) if results else np.empty(0, dtype=np.int64)
+    kinds = [[rid for res in results for rid in res[2][k]] for k in range(len(_SCAN_KINDS) + 1)]
+    return (ids, offs, *kinds)
+
+
 class _OffsetPool:
     """Drop-in for the entity dict: ``get(id)`` looks up the entity's byte offset (binary
     search over the spilled, sorted id array) and parses the statement on demand. The
@@ -2475,7 +2726,154 @@ class StreamIndex:
         self.idx_ids_path = self.idx_offs_path = None
 
 
-def prepare_stream_index(filepath, *, tolerant: bool, on_total=None) -> StreamIndex:
+# Persistent index sidecar: ``<file>.adaidx/`` next to the STEP file holding the sorted id/offset arrays as raw
+# int64 (memmapped in place by every consumer) plus the colour / transform / product-name maps. Bump the version
+# whenever the scan or the maps change meaning, so stale sidecars are rebuilt.
+_INDEX_SIDECAR_VERSION = 2
+_INDEX_SIDECAR_SUFFIX = ".adaidx"
+_INDEX_HASH_SPAN = 1 << 20  # bytes hashed at each end of the file for the sidecar key
+
+
+def _persist_index_enabled(persist_index: bool | None) -> bool:
+    """``persist_index`` if given, else ``ADA_STEP_INDEX_SIDECAR`` (default off)"""
+    if persist_index is not None:
+        return persist_index
+    return _os.environ.get("ADA_STEP_INDEX_SIDECAR", "") not in ("", "0", "false", "no")
+
+
+def index_sidecar_path(filepath) -> Path:
+    """Directory holding the persisted offset index of ``filepath``"""
+    filepath = Path(filepath)
+    return filepath.with_name(filepath.name + _INDEX_SIDECAR_SUFFIX)
+
+
+def _index_key(filepath: Path) -> tuple:
+    """Identity of the file contents the sidecar was built from: size, mtime and a hash of both ends"""
+    import hashlib
+
+    st = filepath.stat()
+    h = hashlib.blake2b(digest_size=16)
+    with filepath.open("rb") as fh:
+        h.update(fh.read(_INDEX_HASH_SPAN))
+        if st.st_size > 2 * _INDEX_HASH_SPAN:
+            fh.seek(-_INDEX_HASH_SPAN, _os.SEEK_END)
+            h.update(fh.read(_INDEX_HASH_SPAN))
+    return _INDEX_SIDECAR_VERSION, st.st_size, st.st_mtime_ns, h.hexdigest()
+
+
+def _load_index_sidecar(filepath: Path, tolerant: bool) -> StreamIndex | None:
+    """The :class:`StreamIndex` persisted next to ``filepath``, or None when missing, stale or unreadable.
+
+    Only plain data is read back (JSON and ``allow_pickle=False`` arrays), so a sidecar can't run code."""
+    import json
+    import zipfile
+
+    import numpy as np
+
+    sidecar = index_sidecar_path(filepath)
+    meta_path = sidecar / "meta.json"
+    if not meta_path.is_file():
+        return None
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        key = tuple(meta.get("key", ()))
+        if key != _index_key(filepath):
+            logger.debug(f"{filepath.name}: stale offset index sidecar, rebuilding")
+            return None
+        with np.load(sidecar / "arrays.npz", allow_pickle=False) as arrays:
+            tmap_ids = arrays["tmap_ids"].tolist()
+            tmap_counts = arrays["tmap_counts"].tolist()
+            tmap_mats = arrays["tmap_mats"]
+        tmap_paths = meta["tmap_paths"]
+        tmap = {}
+        start = 0
+        for sid, count, paths in zip(tmap_ids, tmap_counts, tmap_paths):
+            mats = [m.copy() for m in tmap_mats[start : start + count]]
+            tmap[sid] = (mats, [None if p is None else tuple(tuple(level) for level in p) for p in paths])
+            start += count
+        roots = [int(r) for r in meta["roots"]]
+        colour_map = {int(k): tuple(v) for k, v in meta["colour_map"]}
+        prod_names = {int(k): v for k, v in meta["prod_names"]}
+        angle_scale = float(meta["angle_scale"])
+    except (OSError, ValueError, KeyError, TypeError, zipfile.BadZipFile) as e:
+        logger.debug(f"{filepath.name}: unreadable offset index sidecar ({e}), rebuilding")
+        return None
+
+    has_index = (sidecar / "ids.i64").is_file()
+    idx = StreamIndex(
+        filepath,
+        str(sidecar / "ids.i64") if has_index else None,
+        str(sidecar / "offs.i64") if has_index else None,
+        key[1],
+        roots,
+        colour_map,
+        tmap,
+        prod_names,
+        tolerant,
+        angle_scale=angle_scale,
+    )
+    idx._owns = False  # the sidecar outlives this read
+    return idx
+
+
+def _write_index_sidecar(idx: StreamIndex, key: tuple) -> None:
+    """Move the spilled index of ``idx`` into the sidecar and repoint ``idx`` at it. Best effort: an
+    unwritable location leaves ``idx`` on its tempfiles."""
+    import json
+    import shutil
+
+    import numpy as np
+
+    sidecar = index_sidecar_path(idx.step_path)
+    tmp_suffix = f".{_os.getpid()}.{threading.get_ident()}.tmp"
+    tmap_ids = list(idx.tmap)
+    tmap_mats = [m for sid in tmap_ids for m in idx.tmap[sid][0]]
+    try:
+        sidecar.mkdir(exist_ok=True)
+        for name, src in (("ids.i64", idx.idx_ids_path), ("offs.i64", idx.idx_offs_path)):
+            if src is None:  # empty file
+                (sidecar / name).unlink(missing_ok=True)
+                continue
+            tmp = sidecar / (name + tmp_suffix)
+            shutil.copyfile(src, tmp)
+            _os.replace(tmp, sidecar / name)
+        # The transform matrices go in an npz; the paths and the other maps are plain JSON
+        tmp = sidecar / ("arrays.npz" + tmp_suffix)
+        with tmp.open("wb") as fh:
+            np.savez(
+                fh,
+                tmap_ids=np.asarray(tmap_ids, dtype=np.int64),
+                tmap_counts=np.asarray([len(idx.tmap[sid][0]) for sid in tmap_ids], dtype=np.int64),
+                tmap_mats=np.asarray(tmap_mats, dtype=np.float64).reshape(-1, 4, 4),
+            )
+        _os.replace(tmp, sidecar / "arrays.npz")
+        meta = dict(
+            key=list(key),
+            roots=idx.roots,
+            colour_map=list(idx.colour_map.items()),
+            tmap_paths=[idx.tmap[sid][1] for sid in tmap_ids],
+            prod_names=list(idx.prod_names.items()),
+            angle_scale=idx.angle_scale,
+        )
+        # The meta (with the key) is written last, so a partially written sidecar is never loaded
+        tmp = sidecar / ("meta.json" + tmp_suffix)
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        _os.replace(tmp, sidecar / "meta.json")
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Unable to write the offset index sidecar {sidecar}: {e}")
+        return None
+
+    has_index = idx.idx_ids_path is not None
+    idx.close()  # unlinks the tempfiles
+    if has_index:
+        idx.idx_ids_path = str(sidecar / "ids.i64")
+        idx.idx_offs_path = str(sidecar / "offs.i64")
+    idx._owns = False
+
+
+def prepare_stream_index(
+    filepath, *, tolerant: bool, on_total=None, scan_workers: int | None = None, persist_index: bool | None = None
+) -> StreamIndex:
     """Do the one-time, serial setup for a large STEP file and return a picklable
     :class:`StreamIndex`: scan the offset index, spill it to disk, and build the
     colour / world-transform / product-name maps. This is the only work the conversion
@@ -2485,7 +2883,15 @@ def prepare_stream_index(filepath, *, tolerant: bool, on_total=None) -> StreamIn
     The scan keeps the file off VmRSS (munmap right after the linear pass + free-behind);
     entity reads go through ``os.pread``. The index tempfiles are NOT unlinked here —
     ownership transfers to ``StreamIndex.close()`` after every consumer (parent + workers)
-    has finished, so a spawned worker can still memmap them."""
+    has finished, so a spawned worker can still memmap them.
+
+    ``scan_workers`` > 1 splits the offset scan over that many processes (see
+    :func:`_scan_offset_index_chunked`); None reads ``ADA_STEP_SCAN_WORKERS``.
+
+    ``persist_index`` (None reads ``ADA_STEP_INDEX_SIDECAR``) keeps the index and maps in a
+    sidecar directory next to the file (:func:`index_sidecar_path`), keyed on the file size,
+    mtime and a hash of both ends. A later read of the unchanged file loads it instead of
+    scanning; the sidecar files are then memmapped in place and never unlinked by ``close()``."""
     import mmap
     import os
     import tempfile
@@ -2493,6 +2899,14 @@ def prepare_stream_index(filepath, *, tolerant: bool, on_total=None) -> StreamIn
     import numpy as np
 
     filepath = Path(filepath)
+    persist = _persist_index_enabled(persist_index)
+    if persist:
+        idx = _load_index_sidecar(filepath, tolerant)
+        if idx is not None:
+            if on_total is not None:
+                on_total(len(idx.roots))
+            return idx
+        key = _index_key(filepath)
     fh = open(filepath, "rb")  # noqa: SIM115 - closed in finally once the maps are built
     fd = fh.fileno()
     mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
@@ -2503,8 +2917,12 @@ def prepare_stream_index(filepath, *, tolerant: bool, on_total=None) -> StreamIn
     except (AttributeError, OSError):
         pass
     p_i = p_o = None
+    scan_workers = _scan_workers(scan_workers)
     try:
-        ids_arr, offs_arr, roots, styled, cdsr, srr, absr, sdr = _scan_offset_index(mm)
+        scanned = _scan_offset_index_chunked(filepath, scan_workers) if scan_workers > 1 else None
+        if scanned is None:
+            scanned = _scan_offset_index(mm)
+        ids_arr, offs_arr, roots, styled, cdsr, srr, absr, sdr = scanned
         _mem_probe("after scan (mmap live)", step_path=filepath)
         # The scan is the only mmap consumer; drop the file mapping immediately (~700 MB+
         # on a large assembly) so argsort/spill + every later read run off VmRSS via pread.
@@ -2554,19 +2972,30 @@ def prepare_stream_index(filepath, *, tolerant: bool, on_total=None) -> StreamIn
         if mm is not None:  # early error before the post-scan munmap
             mm.close()
         fh.close()  # the prepare fd; consumers reopen the file in open_pool()
-    return StreamIndex(
+    idx = StreamIndex(
         filepath, p_i, p_o, file_size, roots, colour_map, tmap, prod_names, tolerant, angle_scale=angle_scale
     )
+    if persist:
+        _write_index_sidecar(idx, key)
+    return idx
 
 
-def build_one_solid(idx: StreamIndex, pool, resolver, rid: int, seq: int, *, skipped):
+def build_one_solid(idx: StreamIndex, pool, resolver, rid: int, seq: int, *, skipped, select=None):
     """Build the single ``ada.geom`` :class:`Geometry` for root ``rid`` (position ``seq`` in
     ``idx.roots``), carrying its colour + per-instance world transforms — exactly what the
     serial reader yields for that solid. Returns the Geometry or None (unresolved / dropped).
 
     Stateless across solids (the only per-solid state is ``resolver``'s cache, reset here),
     so a worker can call it for any ``rid`` in any order. ``seq`` is the deterministic
-    ordinal used only for the generic ``solid_N`` fallback name (named solids ignore it)."""
+    ordinal used only for the generic ``solid_N`` fallback name (named solids ignore it).
+
+    With a :class:`StepSelection` ``select``, an unselected solid returns None before any of
+    its entities are parsed, and a selected one carries only its kept instances."""
+    tmap_entry = idx.tmap.get(rid)
+    if select is not None:
+        keep, tmap_entry = select.filter_instances(pool.get, rid, idx.prod_names.get(rid), tmap_entry)
+        if not keep:
+            return None
     rec = pool.get(rid)
     if rec is None:
         return None
@@ -2577,7 +3006,7 @@ def build_one_solid(idx: StreamIndex, pool, resolver, rid: int, seq: int, *, ski
         return None
     color = _as_color(idx.colour_map.get(rid))
     # _yield_instances yields exactly one Geometry per solid (its instance transforms attached).
-    return next(iter(_yield_instances(name, geom, color, idx.tmap.get(rid))), None)
+    return next(iter(_yield_instances(name, geom, color, tmap_entry)), None)
 
 
 def root_face_count(pool, rid: int) -> int:
@@ -2614,7 +3043,7 @@ def root_face_count(pool, rid: int) -> int:
     return max(total, 1)
 
 
-def _read_two_pass_lazy(filepath: Path, *, tolerant: bool, skipped, on_total=None):
+def _read_two_pass_lazy(filepath: Path, *, tolerant: bool, skipped, on_total=None, select=None):
     """Serial streaming read (import-to-Assembly path + the reference oracle): index once,
     then build + yield one Geometry per root. The parallel GLB path reuses the SAME
     ``prepare_stream_index`` / ``build_one_solid`` pieces across worker processes."""
@@ -2625,7 +3054,7 @@ def _read_two_pass_lazy(filepath: Path, *, tolerant: bool, skipped, on_total=Non
         for seq, rid in enumerate(idx.roots):
             if seq == 0 or (seq + 1) % 1000 == 0:
                 _mem_probe(f"streaming solid #{seq + 1}", step_path=idx.step_path, idx_paths=idx_paths)
-            geom = build_one_solid(idx, pool, resolver, rid, seq, skipped=skipped)
+            geom = build_one_solid(idx, pool, resolver, rid, seq, skipped=skipped, select=select)
             if geom is not None:
                 yield geom
     finally:
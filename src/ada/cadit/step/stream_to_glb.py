@@ -35,6 +35,7 @@ def stream_step_to_glb(
     on_progress=None,
     cad_config: "CadConfig | None" = None,
     merge_same_name_siblings: bool = False,
+    tile_triangles: int = 0,
 ) -> dict:
     """Stream-convert a STEP file to a GLB without holding the whole model in memory.
 
@@ -55,6 +56,10 @@ def stream_step_to_glb(
     node / pickable object. Opt in here or via env ``ADA_MERGE_SAME_NAME_SIBLINGS=1``; left
     off the output is one node per solid (pre-merge behaviour).
 
+    ``tile_triangles`` > 0 also writes the model as octree tiles of at most that many
+    triangles next to ``glb_path`` (``<stem>.tile<k>.glb`` + ``<stem>.tileset.json``, see
+    ``ada.visit.gltf.tiles``), so a viewer can fetch only the visible tiles.
+
     Returns ``{"meshed", "total", "skipped", "materials", "reasons"}``.
     """
     import os
@@ -72,7 +77,11 @@ def stream_step_to_glb(
         os.environ.update(_env)
 
     source = StepStreamSource(
-        step_path, tolerant=tolerant, on_progress=on_progress, merge_same_name_siblings=merge_same_name_siblings
+        step_path,
+        tolerant=tolerant,
+        on_progress=on_progress,
+        merge_same_name_siblings=merge_same_name_siblings,
+        tile_triangles=tile_triangles,
     )
     # Spills the per-material merge to disk and streams the GLB straight to ``glb_path``
     # (no in-RAM scene / GLB bytes), so peak memory stays a few hundred MB on assemblies
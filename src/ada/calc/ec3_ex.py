@@ -2,12 +2,20 @@
 from __future__ import annotations
 
 import math
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+import numpy as np
 
 from ada.sections.categories import BaseTypes
 
 if TYPE_CHECKING:
+    from ada import Section
     from ada.fem import Elem
+    from ada.fem.results.common import FEAResult
+
+GAMMA_M1 = 1.15
+IMPERFECTION_FACTORS = dict(a=0.21, b=0.34, c=0.49, d=0.76)
 
 
 def ec3_654(elem: Elem, forces: list[float], buckling_length) -> float:
@@ -21,8 +29,7 @@ def ec3_654(elem: Elem, forces: list[float], buckling_length) -> float:
     fy = elem.fem_sec.material.model.sig_y
     x_lt = lat_buckling_xlt(elem, buckling_length)
 
-    gam_m1 = 1.15
-    mb_rd = x_lt * wy * fy / gam_m1
+    mb_rd = x_lt * wy * fy / GAMMA_M1
     return m_ed / mb_rd
 
 
@@ -32,41 +39,221 @@ def lat_buckling_xlt(elem, buckling_length, is_welded=False):
     wy = p.Wymin
     fy = elem.fem_sec.material.model.sig_y
 
-    imp_fac = dict(a=0.21, b=0.34, c=0.49, d=0.76)
-    if elem.fem_sec.section.type == BaseTypes.IPROFILE:
-        if is_welded:
-            if s.h / s.w_btn <= 2:
-                a_lt = imp_fac["a"]
-            else:
-                a_lt = imp_fac["b"]
-        else:
-            if s.h / s.w_btn <= 2:
-                a_lt = imp_fac["c"]
-            else:
-                a_lt = imp_fac["d"]
-    else:
-        a_lt = imp_fac["d"]
-
+    a_lt = lt_imperfection_factor(s, is_welded)
     m_cr = critical_moment(elem, buckling_length)
-    lam_lt = math.sqrt(wy * fy / m_cr)
-    phi_lt = 0.5 * (1 + a_lt * (lam_lt - 0.2) + lam_lt**2)
-    xi_lt = 1.0 / (phi_lt + math.sqrt(phi_lt**2 - lam_lt**2))
-
-    return min(xi_lt, 1.0)
+    return float(lt_reduction_factor(wy, fy, m_cr, a_lt))
 
 
 def critical_moment(elem, length):
-    # Todo: this is not at all correct. Will finish this later
     p = elem.fem_sec.section.properties
 
     g = elem.fem_sec.material.model.G
     e = elem.fem_sec.material.model.E
-    if elem.fem_sec.section.type == BaseTypes.IPROFILE:
-        m0_cr = (math.pi / length) * math.sqrt(g * p.Ix * p.Iz)
-        i_w = 0
-    else:
+    if elem.fem_sec.section.type != BaseTypes.IPROFILE:
         raise NotImplementedError()
 
-    my_cr = math.sqrt(1 + ((math.pi / length) ** 2) * (e * i_w / (g * p.Ix)))
+    return float(elastic_critical_moment(e, g, p.Iz, p.Ix, warping_constant(elem.fem_sec.section), length))
+
+
+def lt_imperfection_factor(section: Section, is_welded=False) -> float:
+    """Lateral-torsional buckling imperfection factor (EN 1993-1-1 Table 6.3/6.4)."""
+    if section.type != BaseTypes.IPROFILE:
+        return IMPERFECTION_FACTORS["d"]
+    slender = section.h / section.w_btn > 2
+    if is_welded:
+        return IMPERFECTION_FACTORS["b" if slender else "a"]
+    return IMPERFECTION_FACTORS["d" if slender else "c"]
+
+
+def warping_constant(section: Section) -> float:
+    """Warping constant of a doubly symmetric I-section, Iz (h - tf)^2 / 4; 0 for other sections."""
+    if section.type != BaseTypes.IPROFILE:
+        return 0.0
+    t_f = 0.5 * (section.t_ftop + (section.t_fbtn if section.t_fbtn is not None else section.t_ftop))
+    return section.properties.Iz * (section.h - t_f) ** 2 / 4
+
+
+# Vectorized kernels: every argument is a scalar or an array broadcasting against the others.
+
+
+def elastic_critical_moment(e, g, iz, it, iw, length):
+    """Elastic critical moment for lateral-torsional buckling under uniform moment (C1 = 1,
+    k = kw = 1): pi/L * sqrt(E Iz G It) * sqrt(1 + pi^2 E Iw / (L^2 G It))."""
+    length = np.asarray(length, dtype=float)
+    m0_cr = (math.pi / length) * np.sqrt(e * iz * g * it)
+    return m0_cr * np.sqrt(1 + (math.pi / length) ** 2 * (e * iw / (g * it)))
+
+
+def lt_reduction_factor(wy, fy, m_cr, a_lt):
+    """Lateral-torsional buckling reduction factor chi_LT (EN 1993-1-1 6.3.2.2), capped at 1."""
+    lam_lt = np.sqrt(wy * fy / m_cr)
+    phi_lt = 0.5 * (1 + a_lt * (lam_lt - 0.2) + lam_lt**2)
+    xi_lt = 1.0 / (phi_lt + np.sqrt(phi_lt**2 - lam_lt**2))
+    return np.minimum(xi_lt, 1.0)
+
+
+@dataclass
+class Ec3MemberTable:
+    """Per-member section and material data for the batch checks, one array entry per member."""
+
+    member_ids: np.ndarray
+    wy: np.ndarray
+    fy: np.ndarray
+    e: np.ndarray
+    g: np.ndarray
+    iz: np.ndarray
+    it: np.ndarray
+    iw: np.ndarray
+    a_lt: np.ndarray
+    buckling_length: np.ndarray
+
+    @staticmethod
+    def from_members(
+        member_ids: Iterable[int], sections: list[Section], materials: list, buckling_length, is_welded=False
+    ) -> Ec3MemberTable:
+        """Build the table from one section and one material per member. ``buckling_length``
+        is a scalar or one length per member. Sections other than I-profiles get NaN
+        properties for the lateral-torsional check (the scalar check raises for them)."""
+        from ada.sections.properties import pack_general_properties
+
+        packed = pack_general_properties(sections, ("Wymin", "Iz", "Ix"))
+        per_section: dict[int, tuple[float, float, bool]] = {}
+        per_material: dict[int, tuple[float, float, float]] = {}
+        a_lt, iw, is_i, mat = [], [], [], []
+        for sec, material in zip(sections, materials):
+            s = per_section.get(id(sec))
+            if s is None:
+                s = per_section[id(sec)] = (
+                    lt_imperfection_factor(sec, is_welded),
+                    warping_constant(sec),
+                    sec.type == BaseTypes.IPROFILE,
+                )
+            m = per_material.get(id(material))
+            if m is None:
+                model = material.model
+                m = per_material[id(material)] = (model.sig_y, model.E, model.G)
+            a_lt.append(s[0])
+            iw.append(s[1])
+            is_i.append(s[2])
+            mat.append(m)
+
+        mat = np.asarray(mat, dtype=float).reshape(-1, 3)
+        not_i = ~np.asarray(is_i, dtype=bool)
+        iz = np.where(not_i, np.nan, packed["Iz"])
+        member_ids = np.asarray(list(member_ids))
+        return Ec3MemberTable(
+            member_ids=member_ids,
+            wy=packed["Wymin"],
+            fy=mat[:, 0],
+            e=mat[:, 1],
+            g=mat[:, 2],
+            iz=iz,
+            it=packed["Ix"],
+            iw=np.asarray(iw, dtype=float),
+            a_lt=np.asarray(a_lt, dtype=float),
+            buckling_length=np.broadcast_to(np.asarray(buckling_length, dtype=float), member_ids.shape).copy(),
+        )
+
+    @staticmethod
+    def from_fea_result(result: FEAResult, member_ids: Iterable[int], buckling_length, is_welded=False):
+        """Build the table for ``member_ids`` from a result mesh's ``elem_data``, ``sections``
+        and ``materials`` (no per-element ``Elem`` objects are created)."""
+        mesh = result.mesh
+        member_ids = np.asarray(list(member_ids))
+        elem_data = np.asarray(mesh.elem_data)
+        order = np.argsort(elem_data[:, 0], kind="stable")
+        pos = np.searchsorted(elem_data[order, 0], member_ids)
+        pos = np.clip(pos, 0, len(order) - 1)
+        if not np.array_equal(elem_data[order, 0][pos], member_ids):
+            raise ValueError("Some member ids have no element data (material / section) in the result mesh")
+        rows = elem_data[order][pos]
+        sections = [mesh.sections[int(s)] for s in rows[:, 2]]
+        materials = [mesh.materials[int(m)] for m in rows[:, 1]]
+        return Ec3MemberTable.from_members(member_ids, sections, materials, buckling_length, is_welded)
+
+    def buckling_resistance(self) -> np.ndarray:
+        """Design lateral-torsional buckling resistance moment M_b,Rd per member."""
+        m_cr = elastic_critical_moment(self.e, self.g, self.iz, self.it, self.iw, self.buckling_length)
+        x_lt = lt_reduction_factor(self.wy, self.fy, m_cr, self.a_lt)
+        return x_lt * self.wy * self.fy / GAMMA_M1
+
+
+@dataclass
+class CodeCheckResult:
+    """A utilization matrix with its members (rows) and load cases (columns)."""
+
+    member_ids: np.ndarray
+    case_ids: np.ndarray
+    utilization: np.ndarray  # (n_members, n_cases)
+
+    @property
+    def governing_case(self) -> np.ndarray:
+        """Load case with the highest utilization per member."""
+        filled = np.where(np.isnan(self.utilization), -np.inf, self.utilization)
+        return self.case_ids[np.argmax(filled, axis=1)]
+
+    @property
+    def max_utilization(self) -> np.ndarray:
+        filled = np.where(np.isnan(self.utilization), -np.inf, self.utilization)
+        return np.max(filled, axis=1)
+
+    def top(self, n: int = 10) -> list[tuple[int, int, float]]:
+        """The ``n`` worst members as ``(member id, governing case, utilization)``, worst first."""
+        worst = self.max_utilization
+        n = min(n, len(worst))
+        if n == 0:
+            return []
+        idx = np.argpartition(-worst, n - 1)[:n]
+        idx = idx[np.argsort(-worst[idx], kind="stable")]
+        cases = self.governing_case
+        return [(int(self.member_ids[i]), int(cases[i]), float(worst[i])) for i in idx]
+
+
+def ec3_654_batch(members: Ec3MemberTable, forces: np.ndarray, case_ids=None) -> CodeCheckResult:
+    """EN 1993-1-1 6.3.2 lateral-torsional buckling utilization |M_y,Ed| / M_b,Rd for all
+    members over all load cases.
+
+    ``forces`` is ``(n_members, n_cases, 6)`` section forces in the ``ec3_654`` order, or
+    ``(n_members, n_cases, n_points, 6)``, in which case the largest moment along the member
+    governs."""
+    forces = np.asarray(forces)
+    if forces.shape[-1] != 6 or forces.ndim not in (3, 4) or forces.shape[0] != len(members.member_ids):
+        raise ValueError(f"Forces must be (n_members, n_cases[, n_points], 6); got {forces.shape}")
+
+    m_ed = np.abs(forces[..., 4])
+    if m_ed.ndim == 3:
+        m_ed = m_ed.max(axis=2)
+    utilization = m_ed / members.buckling_resistance()[:, None]
+    if case_ids is None:
+        case_ids = np.arange(utilization.shape[1])
+    return CodeCheckResult(members.member_ids, np.asarray(case_ids), utilization)
+
+
+def section_forces_from_result(
+    result: FEAResult, field: str = "FORCES", member_ids=None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Beam section forces of every step of ``field`` as ``(member_ids, case_ids, forces)``
+    with ``forces`` shaped ``(n_members, n_cases, 6)`` and ``member_ids`` sorted.
+
+    Per member and case the result point with the largest |M_y| is kept, so the array stays
+    independent of the number of points per member. Members missing from a case are NaN."""
+    steps = sorted(result.get_results_grouped_by_field_value()[field], key=lambda x: x.step)
+    n_lead = len(steps[0].COLS)
+    if member_ids is None:
+        member_ids = np.concatenate([np.asarray(s.values)[:, 0] for s in steps])
+    member_ids = np.unique(np.asarray(member_ids).astype(int))
 
-    return m0_cr * my_cr
+    forces = np.full((len(member_ids), len(steps), 6), np.nan)
+    for c, step in enumerate(steps):
+        values = np.asarray(step.values)
+        labels = values[:, 0].astype(member_ids.dtype)
+        idx = np.searchsorted(member_ids, labels)
+        known = (idx < len(member_ids)) & (member_ids[np.minimum(idx, len(member_ids) - 1)] == labels)
+        rows, idx = values[known, n_lead : n_lead + 6], idx[known]
+        if not len(idx):
+            continue
+        # last row per member after sorting by (member, |My|) is its governing point
+        order = np.lexsort((np.abs(rows[:, 4]), idx))
+        last = order[np.r_[idx[order][1:] != idx[order][:-1], True]]
+        forces[idx[last], c] = rows[last]
+    return member_ids, np.array([s.step for s in steps]), forces
@@ -3007,14 +3007,17 @@ def _register_ada_loadable() -> None:
             "name": "glb_compression",
             "type": "enum",
             "default": "meshopt",
-            "enum": ["off", "meshopt"],
+            "enum": ["off", "meshopt", "quantize"],
             "description": (
                 "'meshopt' applies EXT_meshopt_compression to the GLB buffers "
                 "(~2.5-3x smaller download, decoded client-side). Structure-preserving: "
                 "re-encodes only the vertex/index bytes losslessly and leaves the glTF JSON "
                 "byte-identical, so node names, draw_ranges, id_hierarchy and ADA_EXT_data "
                 "are kept and picking/hierarchy still work. On by default (gzip-at-rest applies "
-                "on top); a safe no-op if meshoptimizer/adacpp isn't installed in the worker."
+                "on top); a safe no-op if meshoptimizer/adacpp isn't installed in the worker. "
+                "'quantize' first stores positions as int16 and normals as int8 "
+                "(KHR_mesh_quantization, dequantized by the node transforms; index buffers, "
+                "draw_ranges, id_hierarchy and ADA_EXT_data unchanged), then applies meshopt."
             ),
         },
     ]
@@ -104,6 +104,12 @@ class Config:
                 # models (validated ~-49% size / -60% time on a large ship model). Enable for
                 # the rare strict consumer that needs pcurves written explicitly.
                 ConfigEntry("occ_step_write_pcurves", bool, False),
+                # Memory budget (MB) for the process-global OCC body cache (ada.occ.geom.cache).
+                # Least recently used bodies are evicted once the estimated size exceeds it.
+                ConfigEntry("occ_cache_max_mb", int, 1024),
+                # Optional directory where built bodies are spilled as BREP files, so repeated
+                # conversions of the same model skip the rebuild across processes and restarts.
+                ConfigEntry("occ_cache_spill_dir", pathlib.Path, None, required=False),
                 ConfigEntry("add_trace_to_exception", bool, False),
                 # Controls caching of guids
                 ConfigEntry("guid_cache_num", int, 25000),
@@ -259,6 +265,12 @@ class Config:
                 # default; the full test suite passes on both CAD backends with the
                 # substrate active. Set ADA_MESHING_ARRAY_BACKED=false to opt out.
                 ConfigEntry("array_backed", bool, True, required=False),
+                # Largest group of touching beams/plates fragmented in one OCC call by the
+                # partitioning functions. Bigger groups (e.g. a whole deck chained through
+                # shared edges) are split and their seams fragmented pair by pair, which
+                # bounds the size of each boolean but, like the old pairwise path, may
+                # leave the seams non-conformal.
+                ConfigEntry("max_fragment_cluster", int, 512, required=False),
             ],
         ),
         ConfigSection(
@@ -13,8 +13,10 @@ from ada.config import logger
 from .utils import Counter
 from .vector_utils import (
     intersect_calc,
+    intersect_calc_batch,
     is_between_endpoints,
     is_parallel,
+    is_parallel_batch,
     vector_length,
 )
 
@@ -39,6 +41,35 @@ def basic_intersect(bm: Beam, margins, all_beam_containers: list[Beams]):
     return bm, beams
 
 
+def batch_intersect(beams: Iterable[Beam], margins, all_beam_containers: list[Beams]) -> list[tuple[Beam, list[Beam]]]:
+    """Batch version of :func:`basic_intersect`: one spatial-index pass per container for all ``beams``.
+
+    Results are in the order of ``beams``; beams whose bounding box fails are left out, like the
+    ``None`` of :func:`basic_intersect`."""
+    results: list[tuple[Beam, list[Beam]] | None] = []
+    queried = []
+    vols = []
+    for bm in beams:
+        if bm.section.type == "gensec":
+            results.append((bm, []))
+            continue
+        try:
+            vol = bm.bbox().minmax
+        except ValueError as e:
+            logger.error(f"Intersect bbox skipped: {e}\n{traceback.format_exc()}")
+            continue
+        queried.append((len(results), bm))
+        results.append(None)
+        vols.append(list(zip(vol[0], vol[1])))
+
+    if len(queried) > 0:
+        per_container = [beams.get_beams_within_volumes(vols, margins=margins) for beams in all_beam_containers]
+        for i, (slot, bm) in enumerate(queried):
+            touching = [x for x in chain.from_iterable(hits[i] for hits in per_container) if x != bm]
+            results[slot] = (bm, touching)
+    return results
+
+
 def beam_cross_check(bm1: Beam, bm2: Beam, outofplane_tol=0.1):
     """Calculate intersection of beams and return point, s, t"""
     p_check = is_parallel
@@ -68,31 +99,106 @@ def beam_cross_check(bm1: Beam, bm2: Beam, outofplane_tol=0.1):
     return ab_, s, t
 
 
+@dataclass
+class SegmentIntersections:
+    """Closest-point results for candidate pairs of line segments, one row per pair."""
+
+    pairs: np.ndarray  # (K, 2) indices into the first and second segment arrays
+    points: np.ndarray  # (K, 3) closest point on the first segment's line
+    s: np.ndarray  # (K,) parameter along the first segment (0 at start, 1 at end)
+    t: np.ndarray  # (K,) parameter along the second segment
+    parallel: np.ndarray  # (K,) bool
+    distance: np.ndarray  # (K,) gap between the two lines at the closest points
+
+    def hits(self, outofplane_tol=0.1) -> np.ndarray:
+        """Mask of the pairs :func:`beam_cross_check` would accept"""
+        return ~self.parallel & (self.distance <= outofplane_tol)
+
+
+def segment_intersections(
+    segs_a: np.ndarray, segs_b: np.ndarray = None, pairs: np.ndarray = None, margin: float = 0.0
+) -> SegmentIntersections:
+    """Batch :func:`beam_cross_check` kernel over (N, 2, 3) and (M, 2, 3) segment arrays.
+
+    Candidate pairs are taken from ``pairs`` when given, otherwise from a bounding-box broadphase
+    (segment boxes grown by ``margin``). Without ``segs_b`` the segments are checked against each
+    other and each unordered pair is reported once.
+    """
+    from ada.core.spatial_index import AABBTree
+
+    segs_a = np.asarray(segs_a, dtype=float).reshape(-1, 2, 3)
+    self_join = segs_b is None
+    segs_b = segs_a if self_join else np.asarray(segs_b, dtype=float).reshape(-1, 2, 3)
+
+    if pairs is None:
+        tree = AABBTree(segs_b.min(axis=1), segs_b.max(axis=1))
+        if self_join:
+            pairs = tree.overlapping_pairs(tol=margin)
+        else:
+            qi, pi = tree.query_boxes(segs_a.min(axis=1), segs_a.max(axis=1), tol=margin)
+            pairs = np.stack([qi, pi], axis=1)
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+
+    a = segs_a[pairs[:, 0], 0]
+    c = segs_b[pairs[:, 1], 0]
+    ab = segs_a[pairs[:, 0], 1] - a
+    cd = segs_b[pairs[:, 1], 1] - c
+
+    s, t = intersect_calc_batch(a, c, ab, cd)
+    ab_ = a + s[:, None] * ab
+    cd_ = c + t[:, None] * cd
+    parallel = is_parallel_batch(ab, cd)
+    distance = np.linalg.norm(ab_ - cd_, axis=1)
+
+    return SegmentIntersections(pairs, ab_, s, t, parallel, distance)
+
+
 def are_beams_connected(bm1: Beam, beams: List[Beam], out_of_plane_tol, point_tol, nodes, nmap) -> None:
     # TODO: Function should be renamed, or return boolean. Unclear what the function does at the moment
+    connect_beams_batch([(bm1, beams)], out_of_plane_tol, point_tol, nodes, nmap)
+
+
+def connect_beams_batch(
+    candidates: Iterable[tuple[Beam, Iterable[Beam]]], out_of_plane_tol, point_tol, nodes, nmap
+) -> None:
+    """Batch version of :func:`are_beams_connected` over ``(beam, candidate_beams)`` rows.
+
+    All pairs are evaluated in one :func:`segment_intersections` call. Connection nodes are then
+    added in the same order as the per-pair loop so node merging and ``nmap`` are unchanged.
+    """
     from ada import Node
 
-    for bm2 in beams:
-        if bm1 == bm2:
-            continue
+    bm_pairs = [(bm1, bm2) for bm1, beams in candidates for bm2 in beams if bm1 != bm2]
+    if len(bm_pairs) == 0:
+        return None
 
-        res = beam_cross_check(bm1, bm2, out_of_plane_tol)
-        if res is None:
-            continue
-        point, s, t = res
-        t_len = (abs(t) - 1) * bm2.length
-        s_len = (abs(s) - 1) * bm1.length
-        if t_len > bm2.length / 2 or s_len > bm1.length / 2:
-            continue
-        if point is not None:
-            new_node = Node(point)
-            n = nodes.add(new_node, point_tol=point_tol)
-            if n not in nmap.keys():
-                nmap[n] = [bm1]
-            if bm1 not in nmap[n]:
-                nmap[n].append(bm1)
-            if bm2 not in nmap[n]:
-                nmap[n].append(bm2)
+    unique: dict[int, int] = {}
+    unique_beams: list[Beam] = []
+    for bm in chain.from_iterable(bm_pairs):
+        if id(bm) not in unique:
+            unique[id(bm)] = len(unique_beams)
+            unique_beams.append(bm)
+
+    segs = np.array([(bm.n1.p, bm.n2.p) for bm in unique_beams], dtype=float)
+    lengths = np.array([bm.length for bm in unique_beams], dtype=float)
+    pairs = np.array([(unique[id(bm1)], unique[id(bm2)]) for bm1, bm2 in bm_pairs], dtype=np.int64)
+
+    res = segment_intersections(segs, segs, pairs=pairs)
+    len1, len2 = lengths[pairs[:, 0]], lengths[pairs[:, 1]]
+    with np.errstate(invalid="ignore"):
+        s_len = (np.abs(res.s) - 1) * len1
+        t_len = (np.abs(res.t) - 1) * len2
+        ok = res.hits(out_of_plane_tol) & ~(t_len > len2 / 2) & ~(s_len > len1 / 2)
+
+    for k in np.flatnonzero(ok).tolist():
+        bm1, bm2 = bm_pairs[k]
+        n = nodes.add(Node(res.points[k]), point_tol=point_tol)
+        if n not in nmap.keys():
+            nmap[n] = [bm1]
+        if bm1 not in nmap[n]:
+            nmap[n].append(bm1)
+        if bm2 not in nmap[n]:
+            nmap[n].append(bm2)
 
 
 def are_plates_touching(pl1: Plate, pl2: Plate, tol=1e-3):
@@ -165,23 +271,32 @@ def filter_beams_along_plate_edges(pl: Plate, beams: Iterable[Beam]):
 
 def find_beams_connected_to_plate(pl: Plate, beams: list[Beam]) -> list[Beam]:
     """Return all beams with their midpoints inside a specified plate for a given list of beams"""
-    from ada import Node
-    from ada.api.containers import Nodes
-
-    nid = Counter(1)
-    nodes = Nodes(
-        [
-            Node((bm.placement.get_absolute_placement().origin + (bm.n2.p + bm.n1.p) / 2), next(nid), refs=[bm])
-            for bm in beams
-        ]
-    )
+    return find_beams_connected_to_plates([pl], beams)[pl]
 
-    pmin = pl.bbox().p1
-    pmax = pl.bbox().p2
-    res = nodes.get_by_volume(pmin, pmax)
 
-    all_beams_within = list(chain.from_iterable([r.refs for r in res]))
-    return all_beams_within
+def find_beams_connected_to_plates(plates: Iterable[Plate], beams: list[Beam]) -> dict[Plate, list[Beam]]:
+    """Batch version of :func:`find_beams_connected_to_plate`. Beam midpoints are indexed once for all plates."""
+    from ada.core.spatial_index import AABBTree
+
+    plates = list(plates)
+    beams = list(beams)
+    result = {pl: [] for pl in plates}
+    if len(beams) == 0 or len(plates) == 0:
+        return result
+
+    midpoints = np.array(
+        [bm.placement.get_absolute_placement().origin + (bm.n2.p + bm.n1.p) / 2 for bm in beams], dtype=float
+    )
+    tree = AABBTree(midpoints, midpoints)
+    boxes = [pl.bbox() for pl in plates]
+    pmin = np.array([b.p1 for b in boxes], dtype=float)
+    pmax = np.array([b.p2 for b in boxes], dtype=float)
+
+    pl_idx, bm_idx = tree.query_boxes(pmin, pmax)
+    order = np.lexsort((bm_idx, pl_idx))
+    for i, j in zip(pl_idx[order].tolist(), bm_idx[order].tolist()):
+        result[plates[i]].append(beams[j])
+    return result
 
 
 def penetration_check(part: Part):
@@ -302,6 +417,7 @@ def find_edge_connected_perpendicular_plates(plates: list[Plate]) -> PlateConnec
     """Find all plates that are connected at an edge and are perpendicular to that edge."""
     # OCC-backend solid build/distance — imported lazily so this module stays
     # importable under a non-OCC CAD backend (e.g. adacpp). See the internal design notes.
+    from ada.core.spatial_index import AABBTree
     from ada.occ.geom.cache import get_solid_occ
     from ada.occ.occ_clash_check import plates_min_distance
 
@@ -325,6 +441,18 @@ def find_edge_connected_perpendicular_plates(plates: list[Plate]) -> PlateConnec
         # build & cache its solid once
         get_solid_occ(pl)
 
+    # Broadphase: plates whose mid-surface bounds (padded by thickness) are apart cannot touch,
+    # so they never need the OCC distance call
+    guids = list(pdata.keys())
+    pad = np.array([pdata[g]["plate"].t for g in guids], dtype=float)[:, None] + 1e-3
+    mins = np.array([pdata[g]["pts"].min(axis=0) for g in guids]).reshape(-1, 3) - pad
+    maxs = np.array([pdata[g]["pts"].max(axis=0) for g in guids]).reshape(-1, 3) + pad
+    near_pairs = set()
+    if len(guids) > 1:
+        for i, j in AABBTree(mins, maxs).overlapping_pairs().tolist():
+            near_pairs.add((guids[i], guids[j]))
+            near_pairs.add((guids[j], guids[i]))
+
     edge_connected: dict[Plate, list[Plate]] = {}
     mid_span_connected: dict[Plate, list[Plate]] = {}
 
@@ -336,7 +464,7 @@ def find_edge_connected_perpendicular_plates(plates: list[Plate]) -> PlateConnec
         pts1 = d1["pts"]
 
         for guid2, d2 in pdata.items():
-            if guid1 == guid2:
+            if guid1 == guid2 or (guid1, guid2) not in near_pairs:
                 continue
 
             pl2 = d2["plate"]
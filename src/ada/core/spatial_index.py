@@ -0,0 +1,614 @@
+"""Axis-aligned bounding-box index for batch spatial queries over model members.
+
+Two layers:
+
+* :class:`AABBTree` — a static, array-backed bounding volume hierarchy. Primitives are
+  ordered along a Morton curve, grouped into fixed-size leaves and reduced into an
+  implicit complete binary tree (heap layout, children of node ``i`` at ``2i+1``/``2i+2``).
+  Queries are answered in batch by walking the tree breadth-first over a frontier of
+  ``(query, node)`` pairs, so every level is a handful of NumPy ops rather than a Python
+  loop per query.
+* :class:`SpatialIndex` — an incrementally maintained index over arbitrary objects
+  (beams, plates, shapes, ...). Adds land in a small brute-force overflow set and removals
+  are tombstoned; the tree is rebuilt lazily on the next query once the overflow grows past
+  a fraction of the tree. Member bounds are computed lazily too, so adding a shape never
+  triggers a CAD build until the index is actually queried.
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from operator import attrgetter, is_not
+from typing import Any, Callable, Iterable
+
+import numpy as np
+
+# Cap on the number of queries walked through the tree at once. Bounds the size of the
+# (query, node) frontier for dense self-joins without giving up vectorization.
+_QUERY_CHUNK = 16384
+
+
+def _spread_bits(v: np.ndarray) -> np.ndarray:
+    """Insert two zero bits between each of the lower 10 bits of ``v`` (30-bit Morton)."""
+    v = v.astype(np.uint32) & np.uint32(0x3FF)
+    v = (v | (v << 16)) & np.uint32(0x030000FF)
+    v = (v | (v << 8)) & np.uint32(0x0300F00F)
+    v = (v | (v << 4)) & np.uint32(0x030C30C3)
+    v = (v | (v << 2)) & np.uint32(0x09249249)
+    return v
+
+
+def morton_order(points: np.ndarray) -> np.ndarray:
+    """Return the permutation sorting ``points`` (N, 3) along a 30-bit Morton curve."""
+    points = np.asarray(points, dtype=float)
+    if len(points) == 0:
+        return np.empty(0, dtype=np.int64)
+    lo = points.min(axis=0)
+    span = points.max(axis=0) - lo
+    span[span == 0.0] = 1.0
+    q = np.clip(((points - lo) / span * 1023.0).astype(np.int64), 0, 1023)
+    codes = (_spread_bits(q[:, 0]) << 2) | (_spread_bits(q[:, 1]) << 1) | _spread_bits(q[:, 2])
+    return np.argsort(codes, kind="stable")
+
+
+def _ray_box_entry(origins, inv_dirs, zero_dir, bmin, bmax) -> tuple[np.ndarray, np.ndarray]:
+    """Slab test. Returns (t_near, t_far) per row; the ray misses where ``t_near > t_far``."""
+    with np.errstate(invalid="ignore", over="ignore"):
+        t1 = (bmin - origins) * inv_dirs
+        t2 = (bmax - origins) * inv_dirs
+    # Axis-parallel rays: the slab is either the whole line or empty.
+    inside = (origins >= bmin) & (origins <= bmax)
+    t1 = np.where(zero_dir, np.where(inside, -np.inf, np.inf), t1)
+    t2 = np.where(zero_dir, np.where(inside, np.inf, -np.inf), t2)
+    t_near = np.minimum(t1, t2).max(axis=-1)
+    t_far = np.maximum(t1, t2).min(axis=-1)
+    return t_near, t_far
+
+
+def _point_box_distance(points, bmin, bmax) -> np.ndarray:
+    gap = np.maximum(np.maximum(bmin - points, points - bmax), 0.0)
+    return np.sqrt(np.einsum("ij,ij->i", gap, gap))
+
+
+class AABBTree:
+    """Static bounding volume hierarchy over ``N`` axis-aligned boxes.
+
+    All queries are batched and return flat index arrays ``(query_idx, prim_idx)`` so callers
+    can post-filter with NumPy before touching any Python objects.
+    """
+
+    def __init__(self, mins: np.ndarray, maxs: np.ndarray, leaf_size: int = 8):
+        mins = np.asarray(mins, dtype=float).reshape(-1, 3)
+        maxs = np.asarray(maxs, dtype=float).reshape(-1, 3)
+        if mins.shape != maxs.shape:
+            raise ValueError(f"Mismatched bounds {mins.shape=} {maxs.shape=}")
+
+        self.mins = mins
+        self.maxs = maxs
+        self.leaf_size = leaf_size
+
+        n = len(mins)
+        n_leaves = max(1, -(-n // leaf_size))
+        n_leaves = 1 << (n_leaves - 1).bit_length()
+        self._n_leaves = n_leaves
+        self._depth = n_leaves.bit_length() - 1
+
+        # Padded primitive order: -1 marks an empty slot in the last leaves
+        perm = np.full(n_leaves * leaf_size, -1, dtype=np.int64)
+        perm[:n] = morton_order((mins + maxs) * 0.5)
+        self._perm = perm.reshape(n_leaves, leaf_size)
+
+        valid = perm >= 0
+        pmin = np.full((len(perm), 3), np.inf)
+        pmax = np.full((len(perm), 3), -np.inf)
+        pmin[valid] = mins[perm[valid]]
+        pmax[valid] = maxs[perm[valid]]
+
+        node_min = np.empty((2 * n_leaves - 1, 3))
+        node_max = np.empty((2 * n_leaves - 1, 3))
+        node_min[n_leaves - 1 :] = pmin.reshape(n_leaves, leaf_size, 3).min(axis=1)
+        node_max[n_leaves - 1 :] = pmax.reshape(n_leaves, leaf_size, 3).max(axis=1)
+        for level in range(self._depth - 1, -1, -1):
+            idx = np.arange((1 << level) - 1, (1 << (level + 1)) - 1)
+            node_min[idx] = np.minimum(node_min[2 * idx + 1], node_min[2 * idx + 2])
+            node_max[idx] = np.maximum(node_max[2 * idx + 1], node_max[2 * idx + 2])
+
+        self._node_min = node_min
+        self._node_max = node_max
+        # Packed (min, -max) rows so a box-overlap test is one gather and one comparison
+        self._node_packed = np.hstack([node_min, -node_max])
+        self._prim_packed = np.hstack([mins, -maxs])
+
+    def __len__(self) -> int:
+        return len(self.mins)
+
+    @property
+    def bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        """Overall (min, max) of all primitives."""
+        return self._node_min[0], self._node_max[0]
+
+    def _traverse(self, n_queries: int, node_test: Callable, prim_test: Callable) -> tuple[np.ndarray, np.ndarray]:
+        q = np.arange(n_queries, dtype=np.int64)
+        node = np.zeros(n_queries, dtype=np.int64)
+        for _ in range(self._depth + 1):
+            keep = node_test(q, node)
+            q, node = q[keep], node[keep]
+            if node.size == 0 or node[0] >= self._n_leaves - 1:
+                break
+            q = np.repeat(q, 2)
+            node = np.stack([2 * node + 1, 2 * node + 2], axis=1).ravel()
+
+        leaf = node - (self._n_leaves - 1)
+        prims = self._perm[leaf]
+        q = np.repeat(q, self.leaf_size)
+        prims = prims.ravel()
+        valid = prims >= 0
+        q, prims = q[valid], prims[valid]
+        keep = prim_test(q, prims)
+        return q[keep], prims[keep]
+
+    def query_boxes(self, qmin: np.ndarray, qmax: np.ndarray, tol: float = 0.0) -> tuple[np.ndarray, np.ndarray]:
+        """All (query, primitive) pairs whose boxes overlap (inclusive, widened by ``tol``)."""
+        qmin = np.asarray(qmin, dtype=float).reshape(-1, 3)
+        qmax = np.asarray(qmax, dtype=float).reshape(-1, 3)
+        if len(self) == 0 or len(qmin) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        # Overlap <=> node_min <= qmax + tol and -node_max <= -(qmin - tol)
+        packed = np.hstack([qmax + tol, tol - qmin])
+        node_packed, prim_packed = self._node_packed, self._prim_packed
+        out_q, out_p = [], []
+        for start in range(0, len(qmin), _QUERY_CHUNK):
+            chunk = packed[start : start + _QUERY_CHUNK]
+            q, p = self._traverse(
+                len(chunk),
+                lambda q, n: np.all(node_packed[n] <= chunk[q], axis=1),
+                lambda q, p: np.all(prim_packed[p] <= chunk[q], axis=1),
+            )
+            out_q.append(q + start)
+            out_p.append(p)
+        return np.concatenate(out_q), np.concatenate(out_p)
+
+    def overlapping_pairs(self, tol: float = 0.0) -> np.ndarray:
+        """Unique ``(i, j)`` pairs with ``i < j`` of primitives whose boxes overlap. Shape (K, 2)."""
+        q, p = self.query_boxes(self.mins, self.maxs, tol=tol)
+        keep = q < p
+        return np.stack([q[keep], p[keep]], axis=1)
+
+    def query_rays(
+        self, origins: np.ndarray, directions: np.ndarray, max_dist: float = np.inf
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """All (ray, primitive, t_entry) hits, with ``t`` in units of ``directions``.
+
+        Rays starting inside a box report ``t_entry = 0``.
+        """
+        origins = np.asarray(origins, dtype=float).reshape(-1, 3)
+        directions = np.asarray(directions, dtype=float).reshape(-1, 3)
+        if len(self) == 0 or len(origins) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+
+        zero_dir = directions == 0.0
+        with np.errstate(divide="ignore"):
+            inv_dirs = 1.0 / directions
+
+        def hit(q, bmin, bmax):
+            t_near, t_far = _ray_box_entry(origins[q], inv_dirs[q], zero_dir[q], bmin, bmax)
+            return (t_near <= t_far) & (t_far >= 0.0) & (t_near <= max_dist)
+
+        out_q, out_p = [], []
+        for start in range(0, len(origins), _QUERY_CHUNK):
+            sl = np.arange(start, min(start + _QUERY_CHUNK, len(origins)))
+            q, p = self._traverse(
+                len(sl),
+                lambda q, n: hit(sl[q], self._node_min[n], self._node_max[n]),
+                lambda q, p: hit(sl[q], self.mins[p], self.maxs[p]),
+            )
+            out_q.append(sl[q])
+            out_p.append(p)
+
+        q, p = np.concatenate(out_q), np.concatenate(out_p)
+        t_near, _ = _ray_box_entry(origins[q], inv_dirs[q], zero_dir[q], self.mins[p], self.maxs[p])
+        return q, p, np.maximum(t_near, 0.0)
+
+    def nearest(self, points: np.ndarray, k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """The ``k`` nearest primitives (by point-to-box distance) for every point.
+
+        Returns ``(indices, distances)`` both shaped (Q, k). Rows are padded with ``-1`` / ``inf``
+        when fewer than ``k`` primitives exist.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        n_q = len(points)
+        idx_out = np.full((n_q, k), -1, dtype=np.int64)
+        dist_out = np.full((n_q, k), np.inf)
+        if len(self) == 0 or n_q == 0:
+            return idx_out, dist_out
+
+        k_eff = min(k, len(self))
+        lo, hi = self.bounds
+        diag = float(np.linalg.norm(hi - lo)) or 1.0
+        # Start from the typical spacing of k primitives and double until every query has k
+        # candidates strictly within the radius. A box at distance <= r always overlaps the
+        # query cube of half-width r, so the box query is a conservative candidate filter.
+        radius = np.full(n_q, diag * (k_eff / len(self)) ** (1.0 / 3.0))
+        # Beyond this radius every primitive is a candidate, so the search always terminates
+        limit = _point_box_distance(points, np.broadcast_to(lo, points.shape), np.broadcast_to(hi, points.shape)) + diag
+        todo = np.arange(n_q)
+        while todo.size:
+            p = points[todo]
+            r = radius[todo][:, None]
+            q, prim = self.query_boxes(p - r, p + r)
+            d = _point_box_distance(p[q], self.mins[prim], self.maxs[prim])
+            within = d <= radius[todo][q]
+            q, prim, d = q[within], prim[within], d[within]
+
+            counts = np.bincount(q, minlength=len(todo))
+            done = (counts >= k_eff) | (radius[todo] >= limit[todo])
+            sel = done[q]
+            q, prim, d = q[sel], prim[sel], d[sel]
+            order = np.lexsort((prim, d, q))
+            q, prim, d = q[order], prim[order], d[order]
+            first = np.searchsorted(q, q, side="left")
+            rank = np.arange(len(q)) - first
+            take = rank < k
+            rows = todo[q[take]]
+            idx_out[rows, rank[take]] = prim[take]
+            dist_out[rows, rank[take]] = d[take]
+
+            radius[todo[~done]] *= 2.0
+            todo = todo[~done]
+
+        return idx_out, dist_out
+
+
+def member_bounds(obj) -> tuple[np.ndarray, np.ndarray]:
+    """Cheap, conservative axis-aligned bounds of a model member.
+
+    Beams are bounded by their (eccentric) centreline padded with the half diagonal of the
+    section, in node coordinates. This is a superset of ``Beam.bbox()`` and avoids the
+    section-profile evaluation that makes the exact box costly on large models. Everything
+    else falls back to its own ``bbox()``.
+    """
+    from ada.api.beams import Beam
+
+    if isinstance(obj, Beam):
+        p1 = obj.n1.p if obj.e1 is None else obj.n1.p + obj.e1
+        p2 = obj.n2.p if obj.e2 is None else obj.n2.p + obj.e2
+        pts = np.array([p1, p2], dtype=float)
+        pad = _section_half_diagonal(obj.section)
+        taper = getattr(obj, "taper", None)
+        if taper is not None and taper is not obj.section:
+            pad = max(pad, _section_half_diagonal(taper))
+        return pts.min(axis=0) - pad, pts.max(axis=0) + pad
+
+    bbox = obj.bbox()
+    return np.asarray(bbox.p1, dtype=float), np.asarray(bbox.p2, dtype=float)
+
+
+_geometry_revision = 0
+
+
+def mark_geometry_changed() -> None:
+    """Note that some member may have moved: the next query of every :class:`SpatialIndex`
+    compares the :func:`member_revision` of its members, and the OCC body cache re-hashes the
+    description of the next object it is asked for. Called by the ``Node.p`` and beam node /
+    eccentricity / section setters."""
+    global _geometry_revision
+    _geometry_revision += 1
+
+
+def geometry_revision() -> int:
+    """Counter bumped by :func:`mark_geometry_changed`"""
+    return _geometry_revision
+
+
+def member_revision(obj) -> tuple | None:
+    """Cheap geometry revision of a model member, compared before each query to find members that
+    moved since they were indexed. ``None`` means the member is not checked.
+
+    The revision is a tuple of the objects :func:`member_bounds` reads, compared by identity:
+    for beams the end nodes, their (read-only) coordinate arrays, the eccentricities and the
+    section. Moving a beam replaces at least one of them. Other members are only re-read
+    through :meth:`SpatialIndex.update`, as their ``bbox()`` is too costly to poll.
+    """
+    if isinstance(obj, _beam_type()):
+        n1, n2 = obj.n1, obj.n2
+        return n1, n1.p, n2, n2.p, obj.e1, obj.e2, obj.section
+    return None
+
+
+@cache
+def _beam_type() -> type:
+    from ada.api.beams import Beam
+
+    return Beam
+
+
+def _section_half_diagonal(sec) -> float:
+    from ada.sections.categories import BaseTypes
+
+    if sec.type in (BaseTypes.CIRCULAR, BaseTypes.TUBULAR):
+        return float(sec.r or 0.0)
+    h = sec.h or 0.0
+    w = max(sec.w_top or 0.0, sec.w_btn or 0.0)
+    return 0.5 * float(np.hypot(h, w))
+
+
+class SpatialIndex:
+    """Incrementally maintained AABB index over objects.
+
+    Objects are keyed by ``key`` (``guid`` by default) and bounded by ``bounds_func``
+    (:func:`member_bounds` by default). Adds and removals are O(1); the underlying
+    :class:`AABBTree` is rebuilt lazily on query once more than ``rebuild_fraction`` of
+    it has changed. Objects added since the last rebuild are answered by a vectorized
+    brute-force scan.
+
+    When :func:`mark_geometry_changed` was called since the last query, the ``revision_func``
+    (:func:`member_revision` by default) of every indexed object is compared (element-wise, by
+    identity) with its value when the bounds were read, and objects whose revision changed
+    are re-indexed, so moving a beam's nodes needs no explicit
+    :meth:`update`.
+    """
+
+    def __init__(
+        self,
+        objects: Iterable = (),
+        bounds_func: Callable[[Any], tuple[np.ndarray, np.ndarray]] = member_bounds,
+        key: Callable[[Any], Any] = attrgetter("guid"),
+        leaf_size: int = 8,
+        rebuild_fraction: float = 0.1,
+        revision_func: Callable[[Any], tuple | None] | None = member_revision,
+    ):
+        self._bounds_func = bounds_func
+        self._key = key
+        self._revision_func = revision_func
+        self._leaf_size = leaf_size
+        self._rebuild_fraction = rebuild_fraction
+
+        self._objects: list = []
+        self._slots: dict[Any, int] = {}
+        self._free: list[int] = []
+        self._mins = np.empty((0, 3))
+        self._maxs = np.empty((0, 3))
+        self._unbounded: set[int] = set()
+        self._revisions: dict[int, Any] = {}
+        self._checked_revision = _geometry_revision
+
+        self._tree: AABBTree | None = None
+        self._tree_slots = np.empty(0, dtype=np.int64)
+        self._tree_slot_cache: set[int] | None = None
+        self._pending: set[int] = set()
+        self._n_stale = 0
+
+        self.add_many(objects)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, obj) -> bool:
+        return self._key(obj) in self._slots
+
+    def __iter__(self):
+        return (self._objects[s] for s in self._slots.values())
+
+    def add(self, obj) -> None:
+        self.add_many((obj,))
+
+    def add_many(self, objects: Iterable) -> None:
+        for obj in objects:
+            k = self._key(obj)
+            if k in self._slots:
+                continue
+            slot = self._free.pop() if self._free else self._new_slot()
+            self._objects[slot] = obj
+            self._slots[k] = slot
+            self._unbounded.add(slot)
+            self._pending.add(slot)
+
+    def remove(self, obj) -> None:
+        slot = self._slots.pop(self._key(obj))
+        self._release(slot)
+
+    def discard(self, obj) -> None:
+        slot = self._slots.pop(self._key(obj), None)
+        if slot is not None:
+            self._release(slot)
+
+    def update(self, obj) -> None:
+        """Re-read the bounds of an object that moved or changed shape."""
+        self.discard(obj)
+        self.add(obj)
+
+    def sync(self, objects: Iterable) -> None:
+        """Make the index hold exactly ``objects``, keeping bounds of members already indexed."""
+        objects = list(objects)
+        keep = {self._key(o) for o in objects}
+        for k in [k for k in self._slots if k not in keep]:
+            self._release(self._slots.pop(k))
+        self.add_many(objects)
+
+    def clear(self) -> None:
+        self.__init__(
+            bounds_func=self._bounds_func,
+            key=self._key,
+            leaf_size=self._leaf_size,
+            rebuild_fraction=self._rebuild_fraction,
+            revision_func=self._revision_func,
+        )
+
+    def query_box(self, pmin, pmax, tol: float = 0.0, by_type: type | tuple[type, ...] = None) -> list:
+        """All objects whose bounds overlap the box ``[pmin, pmax]``."""
+        return self.query_boxes([pmin], [pmax], tol=tol, by_type=by_type)[0]
+
+    def query_boxes(self, mins, maxs, tol: float = 0.0, by_type: type | tuple[type, ...] = None) -> list[list]:
+        """Batch box query. Returns one list of overlapping objects per query box."""
+        mins = np.asarray(mins, dtype=float).reshape(-1, 3)
+        maxs = np.asarray(maxs, dtype=float).reshape(-1, 3)
+        q, slots, _ = self._collect(lambda tree: (*tree.query_boxes(mins, maxs, tol=tol), None))
+        order = np.lexsort((slots, q))
+        return self._group(len(mins), q[order], slots[order], by_type)
+
+    def query_rays(
+        self, origins, directions, max_dist: float = np.inf, by_type: type | tuple[type, ...] = None
+    ) -> list[list[tuple[Any, float]]]:
+        """Batch ray query. Returns per ray the ``(object, t_entry)`` hits sorted by distance."""
+        origins = np.asarray(origins, dtype=float).reshape(-1, 3)
+        directions = np.asarray(directions, dtype=float).reshape(-1, 3)
+        q, slots, t = self._collect(lambda tree: tree.query_rays(origins, directions, max_dist=max_dist))
+        order = np.lexsort((slots, t, q))
+        hits = self._group(len(origins), q[order], slots[order], None)
+        t_iter = iter(t[order].tolist())
+        return [
+            [(obj, ti) for obj, ti in zip(row, t_iter) if by_type is None or isinstance(obj, by_type)] for row in hits
+        ]
+
+    def nearest(self, points, k: int = 1, by_type: type | tuple[type, ...] = None) -> list[list]:
+        """Batch k-nearest query by point-to-bounds distance. Returns per point up to ``k`` objects, closest first."""
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        self._sync(force_rebuild=True)
+        if self._tree is None:
+            return [[] for _ in range(len(points))]
+        idx, _ = self._tree.nearest(points, k=k)
+        rows = [[self._objects[s] for s in self._tree_slots[row[row >= 0]].tolist()] for row in idx]
+        if by_type is not None:
+            rows = [[o for o in row if isinstance(o, by_type)] for row in rows]
+        return rows
+
+    def overlapping_pairs(self, tol: float = 0.0, by_type: type | tuple[type, ...] = None) -> list[tuple[Any, Any]]:
+        """All unordered pairs of indexed objects whose bounds overlap."""
+        self._sync(force_rebuild=True)
+        if self._tree is None:
+            return []
+        objs = self._objects
+        out = []
+        for i, j in self._tree_slots[self._tree.overlapping_pairs(tol=tol)].tolist():
+            a, b = objs[i], objs[j]
+            if by_type is None or (isinstance(a, by_type) and isinstance(b, by_type)):
+                out.append((a, b))
+        return out
+
+    def get_bounds(self, obj) -> tuple[np.ndarray, np.ndarray]:
+        self._refresh_moved()
+        slot = self._slots[self._key(obj)]
+        self._compute_bounds()
+        return self._mins[slot].copy(), self._maxs[slot].copy()
+
+    # — internals —
+
+    def _new_slot(self) -> int:
+        slot = len(self._objects)
+        self._objects.append(None)
+        if slot >= len(self._mins):
+            cap = max(16, 2 * len(self._mins))
+            mins = np.full((cap, 3), np.inf)
+            maxs = np.full((cap, 3), -np.inf)
+            mins[:slot] = self._mins[:slot]
+            maxs[:slot] = self._maxs[:slot]
+            self._mins, self._maxs = mins, maxs
+        return slot
+
+    def _release(self, slot: int) -> None:
+        self._objects[slot] = None
+        self._mins[slot] = np.inf
+        self._maxs[slot] = -np.inf
+        self._unbounded.discard(slot)
+        self._revisions.pop(slot, None)
+        if slot in self._pending:
+            self._pending.discard(slot)
+        else:
+            self._n_stale += 1
+        # A slot still referenced by the tree must not be reused before the next rebuild,
+        # otherwise the tree would report the new occupant with the old occupant's box.
+        if self._tree is None or slot not in self._tree_slot_set:
+            self._free.append(slot)
+
+    @property
+    def _tree_slot_set(self) -> set[int]:
+        cache = self._tree_slot_cache
+        if cache is None:
+            cache = self._tree_slot_cache = set(self._tree_slots.tolist())
+        return cache
+
+    def _compute_bounds(self) -> None:
+        revision_func = self._revision_func
+        for slot in self._unbounded:
+            obj = self._objects[slot]
+            pmin, pmax = self._bounds_func(obj)
+            self._mins[slot] = pmin
+            self._maxs[slot] = pmax
+            rev = revision_func(obj) if revision_func is not None else None
+            if rev is not None:
+                self._revisions[slot] = rev
+        self._unbounded.clear()
+
+    def _refresh_moved(self) -> None:
+        """Re-index the objects whose revision changed since their bounds were read."""
+        revision_func = self._revision_func
+        if revision_func is None or self._checked_revision == _geometry_revision:
+            return
+        self._checked_revision = _geometry_revision
+        objs = self._objects
+        moved = []
+        for slot, rev in self._revisions.items():
+            obj = objs[slot]
+            if any(map(is_not, revision_func(obj), rev)):
+                moved.append(obj)
+        for obj in moved:
+            self.update(obj)
+
+    def _live_slots(self) -> np.ndarray:
+        return np.fromiter(sorted(self._slots.values()), dtype=np.int64, count=len(self._slots))
+
+    def _is_alive(self, slots: np.ndarray) -> np.ndarray:
+        objs = self._objects
+        return np.fromiter((objs[s] is not None for s in slots.tolist()), dtype=bool, count=len(slots))
+
+    def _sync(self, force_rebuild: bool = False) -> None:
+        self._refresh_moved()
+        self._compute_bounds()
+        n_tree = len(self._tree_slots)
+        changed = len(self._pending) + self._n_stale
+        if self._tree is None and not self._slots:
+            return
+        if force_rebuild or self._tree is None or changed > max(self._leaf_size, self._rebuild_fraction * n_tree):
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        live = self._live_slots()
+        self._tree = AABBTree(self._mins[live], self._maxs[live], leaf_size=self._leaf_size)
+        self._tree_slots = live
+        self._tree_slot_cache = None
+        self._pending.clear()
+        self._n_stale = 0
+        # Slots released while the old tree referenced them are free again now
+        used = set(self._slots.values())
+        self._free = [s for s in range(len(self._objects)) if s not in used]
+
+    def _collect(self, query: Callable) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+        """Run ``query`` against the tree and the not-yet-merged additions, returning live slots."""
+        self._sync()
+        empty = np.empty(0, dtype=np.int64)
+        if self._tree is None:
+            return empty, empty, np.empty(0)
+        q, p, extra = query(self._tree)
+        slots = self._tree_slots[p]
+        if self._n_stale:
+            alive = self._is_alive(slots)
+            q, slots = q[alive], slots[alive]
+            extra = extra[alive] if extra is not None else None
+        if self._pending:
+            pend = np.fromiter(self._pending, dtype=np.int64, count=len(self._pending))
+            q2, p2, extra2 = query(AABBTree(self._mins[pend], self._maxs[pend], leaf_size=self._leaf_size))
+            q, slots = np.concatenate([q, q2]), np.concatenate([slots, pend[p2]])
+            extra = np.concatenate([extra, extra2]) if extra is not None else None
+        if extra is None:
+            extra = np.empty(0)
+        return q, slots, extra
+
+    def _group(self, n_queries: int, q: np.ndarray, slots: np.ndarray, by_type) -> list[list]:
+        results: list[list] = [[] for _ in range(n_queries)]
+        objs = self._objects
+        for qi, s in zip(q.tolist(), slots.tolist()):
+            obj = objs[s]
+            if by_type is None or isinstance(obj, by_type):
+                results[qi].append(obj)
+        return results
@@ -136,6 +136,34 @@ def intersect_calc(a: np.ndarray, c: np.ndarray, ab: np.ndarray, cd: np.ndarray)
     return s, t
 
 
+def intersect_calc_batch(a: np.ndarray, c: np.ndarray, ab: np.ndarray, cd: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized :func:`intersect_calc` over (K, 3) rows of line pairs A + s*AB = C + t*CD.
+
+    Returns the least-squares s & t per row (the parameters of the closest points between the two
+    lines). Rows where the lines are parallel have no unique solution and return NaN."""
+    w0 = a - c
+    uu = np.einsum("ij,ij->i", ab, ab)
+    uv = np.einsum("ij,ij->i", ab, cd)
+    vv = np.einsum("ij,ij->i", cd, cd)
+    uw = np.einsum("ij,ij->i", ab, w0)
+    vw = np.einsum("ij,ij->i", cd, w0)
+    denom = uu * vv - uv * uv
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(denom != 0.0, (uv * vw - vv * uw) / denom, np.nan)
+        t = np.where(denom != 0.0, (uu * vw - uv * uw) / denom, np.nan)
+    return s, t
+
+
+def is_parallel_batch(ab: np.ndarray, cd: np.ndarray, tol=Config().general_point_tol) -> np.ndarray:
+    """Vectorized :func:`is_parallel` over (K, 3) rows"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ab_u = ab / np.linalg.norm(ab, axis=1)[:, None]
+        cd_u = cd / np.linalg.norm(cd, axis=1)[:, None]
+    cos_a = np.clip(np.einsum("ij,ij->i", ab_u, cd_u), -1.0, 1.0)
+    return np.abs(np.sin(np.arccos(cos_a))) < tol
+
+
 def intersection_point(v1, v2):
     """Get the coordinate of the intersecting point between vectors v1 and v2"""
     if isinstance(v1, np.ndarray):
@@ -751,6 +751,9 @@ class FemSets:
                 raise ValueError(f"Elref type '{type(elref)}' is not recognized")
 
         def eval_set(fset):
+            if fset._member_ids is not None:
+                # id-backed members resolve through the parent FEM on access
+                return
             if fset.type == SetTypes.ELSET:
                 el_type = Elem
                 get_func = get_elset
@@ -763,17 +766,13 @@ class FemSets:
                 fset._members = [get_func(m) for m in fset.members]
 
         if "generate" in fem_set.metadata.keys():
-            if fem_set.metadata["generate"] is True and len(fem_set.members) == 0:
+            if fem_set.metadata["generate"] is True and len(fem_set) == 0:
                 gen_mem = fem_set.metadata["gen_mem"]
                 fem_set._members = [i for i in range(gen_mem[0], gen_mem[1] + 1, gen_mem[2])]
                 fem_set.metadata["generate"] = False
 
         if fem_set.type == SetTypes.NSET:
-            if (
-                len(fem_set.members) == 1
-                and isinstance(fem_set.members[0], str)
-                and not isinstance(fem_set.members[0], Node)
-            ):
+            if len(fem_set) == 1 and isinstance(fem_set.members[0], str) and not isinstance(fem_set.members[0], Node):
                 fem_set._members = self.nodes[fem_set.members[0]]
                 fem_set.parent = self._fem_obj
                 return fem_set
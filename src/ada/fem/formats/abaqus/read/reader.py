@@ -44,6 +44,8 @@ if TYPE_CHECKING:
     from ada.api.spatial import Assembly, Part
     from ada.fem import FEM
 
+    from .stream import StreamedDeck
+
 
 @dataclass
 class InstanceData:
@@ -56,6 +58,7 @@ class InstanceData:
 def read_fem(fem_file, fem_name=None) -> Assembly:
     """This will create and add an AbaqusPart object based on a path reference to a Abaqus input file."""
     from ada import Assembly
+    from ada.config import Config
 
     logger.info("Starting import of Abaqus input file")
 
@@ -65,7 +68,16 @@ def read_fem(fem_file, fem_name=None) -> Assembly:
 
     assembly = Assembly("TempAssembly")
 
-    bulk_str = read_bulk_w_includes(fem_file)
+    if Config().meshing_array_backed:
+        # Stream the deck and its includes once: part/instance *Node/*Element data goes
+        # straight to arrays, the remaining (small) text is what the regex readers see.
+        from .stream import stream_inp
+
+        mesh_blocks = stream_inp(fem_file)
+        bulk_str = mesh_blocks.text
+    else:
+        mesh_blocks = None
+        bulk_str = read_bulk_w_includes(fem_file)
     lbulk = bulk_str.lower()
     ass_start = lbulk.find("\n*assembly")
     ass_end = lbulk.rfind("\n*end assembly")
@@ -92,9 +104,9 @@ def read_fem(fem_file, fem_name=None) -> Assembly:
 
     ass_data = extract_instance_data(assembly_str[:inst_end])
 
-    part_list = import_parts(bulk_str[:ass_start], ass_data, assembly)
+    part_list = import_parts(bulk_str[:ass_start], ass_data, assembly, mesh_blocks)
     if len(part_list) == 0:
-        add_fem_without_assembly(bulk_str, assembly)
+        add_fem_without_assembly(bulk_str, assembly, mesh_blocks)
 
     if uses_assembly_parts is True:
         ass_sets = assembly_str[inst_end:]
@@ -165,7 +177,9 @@ def extract_instance_data(assembly_bulk) -> dict[str, List[InstanceData]]:
     return ass_data
 
 
-def import_parts(bulk_str, instance_data: dict[str, List[InstanceData]], assembly: Assembly) -> List[Part]:
+def import_parts(
+    bulk_str, instance_data: dict[str, List[InstanceData]], assembly: Assembly, mesh_blocks: StreamedDeck = None
+) -> List[Part]:
     part_list = []
 
     for m in cards.parts_matches.finditer(bulk_str):
@@ -175,12 +189,12 @@ def import_parts(bulk_str, instance_data: dict[str, List[InstanceData]], assembl
 
         for i in instance_data[name]:
             p_bulk_str = i.instance_bulk if part_bulk_str == "" and i.instance_bulk != "" else part_bulk_str
-            part = get_fem_from_bulk_str(name, p_bulk_str, assembly, i)
+            part = get_fem_from_bulk_str(name, p_bulk_str, assembly, i, mesh_blocks)
             part_list.append(part)
     return part_list
 
 
-def add_fem_without_assembly(bulk_str, assembly: Assembly) -> Part:
+def add_fem_without_assembly(bulk_str, assembly: Assembly, mesh_blocks: StreamedDeck = None) -> Part:
     part_name_matches = list(cards.part_names.finditer(bulk_str))
     p_nmatch = tuple(part_name_matches)
 
@@ -194,10 +208,12 @@ def add_fem_without_assembly(bulk_str, assembly: Assembly) -> Part:
     p_name = next(part_name_counter) if p_name is None else p_name
     inst = InstanceData("", p_name, "")
 
-    return get_fem_from_bulk_str(p_name, p_bulk, assembly, inst)
+    return get_fem_from_bulk_str(p_name, p_bulk, assembly, inst, mesh_blocks)
 
 
-def get_fem_from_bulk_str(name, bulk_str, assembly: Assembly, instance_data: InstanceData) -> "Part":
+def get_fem_from_bulk_str(
+    name, bulk_str, assembly: Assembly, instance_data: InstanceData, mesh_blocks: StreamedDeck = None
+) -> "Part":
     from ada import FEM, Part
     from ada.config import Config
 
@@ -208,7 +224,7 @@ def get_fem_from_bulk_str(name, bulk_str, assembly: Assembly, instance_data: Ins
     fem = part.fem
 
     if Config().meshing_array_backed:
-        _build_array_nodes_elements(bulk_str, fem)
+        _build_array_nodes_elements(bulk_str, fem, mesh_blocks)
     else:
         fem.nodes = get_nodes_from_inp(bulk_str, fem)
         fem.elements = get_elem_from_bulk_str(bulk_str, fem)
@@ -234,24 +250,42 @@ def get_fem_from_bulk_str(name, bulk_str, assembly: Assembly, instance_data: Ins
     return part
 
 
-def _build_array_nodes_elements(bulk_str, fem) -> None:
+def _build_array_nodes_elements(bulk_str, fem, mesh_blocks: StreamedDeck = None) -> None:
     """Substrate-direct Abaqus node/element build: no object Node/Elem for the
     structural mesh. Special blocks (mass/connector/cross-instance) fall back to the
-    object element parser as ArrayElements overflow."""
+    object element parser as ArrayElements overflow. With ``mesh_blocks`` from the
+    streaming reader, the blocks whose markers are in ``bulk_str`` are used as parsed."""
+    from collections import defaultdict
+
     import numpy as np
 
     from ada.api.mesh.containers import ArrayElements, ArrayNodes
     from ada.api.mesh.store import MeshArrays
 
     from .read_elements import get_elem_arrays, grab_elements
+    from .stream import StreamedNodes
 
     coords, node_ids, nsets = get_nodes_from_inp_arrays(bulk_str)
-    store = MeshArrays(coords, node_ids)
     by_type, overflow = get_elem_arrays(bulk_str)
+    node_parts = [(node_ids, coords)]
+    elem_parts = defaultdict(list)
     for ctype, (el_ids, conns, elsets) in by_type.items():
+        elem_parts[ctype].append((np.array(el_ids, dtype=np.int64), np.array(conns, dtype=np.int64), elsets))
+
+    for blk in mesh_blocks.blocks_in(bulk_str) if mesh_blocks is not None else []:
+        if isinstance(blk, StreamedNodes):
+            node_parts.append((blk.node_ids, blk.coords))
+            if blk.nset is not None:
+                nsets.append((blk.nset, blk.node_ids.tolist()))
+        else:
+            elem_parts[blk.ctype].append((blk.el_ids, blk.conn, [blk.elset] * len(blk.el_ids)))
+
+    store = MeshArrays(np.concatenate([c for _, c in node_parts]), np.concatenate([i for i, _ in node_parts]))
+    for ctype, parts in elem_parts.items():
         blk = store.add_elem_block_from_id_conn(
-            ctype, np.array(el_ids, dtype=np.int64), np.array(conns, dtype=np.int64)
+            ctype, np.concatenate([p[0] for p in parts]), np.concatenate([p[1] for p in parts])
         )
+        elsets = [e for p in parts for e in p[2]]
         if any(e is not None for e in elsets):
             blk.elsets = elsets
 
@@ -513,8 +547,78 @@ def str_to_ints(instr):
         return [str(x.strip()) for l in instr.splitlines() for x in l.split(",") if x.strip() != ""]
 
 
-def get_sets_from_bulk(bulk_str, fem: FEM) -> FemSets:
+# Set cards below this count are always parsed in-process
+_PARALLEL_MIN_SET_CARDS = 2_000
+
+
+def _parse_workers(workers: int | None) -> int:
+    """Worker count for the set-card parse: ``workers`` if given, else ``ADA_ABAQUS_PARSE_WORKERS`` (default 1)."""
+    if workers is None:
+        try:
+            workers = int(os.environ.get("ADA_ABAQUS_PARSE_WORKERS", "1"))
+        except ValueError:
+            workers = 1
+    return max(1, workers)
+
+
+def parse_set_members(members_str: str) -> Union[np.ndarray, list[str]]:
+    """The data lines of one *Nset/*Elset card as a packed int64 id array, or, when the card
+    lists set names, as the ``str_to_ints`` string list"""
+    try:
+        return np.array(members_str.replace(",", " ").split(), dtype=np.int64)
+    except ValueError:
+        return str_to_ints(members_str)
+
+
+def _parse_set_members_batch(members_strs: list[str]) -> list:
+    return [parse_set_members(x) for x in members_strs]
+
+
+def parse_set_cards(bulk_str: str, workers: int | None = None) -> list[tuple[re.Match, Union[np.ndarray, list]]]:
+    """Split ``bulk_str`` into its *Nset/*Elset cards and parse their members, as
+    ``(match, members)`` pairs in deck order. The cards are independent, so with ``workers``
+    (or ``ADA_ABAQUS_PARSE_WORKERS``) above 1 and enough cards, the member parsing is spread
+    over a process pool (it is CPU-bound Python, so threads would serialise on the GIL)."""
+    matches = list(cards.re_sets.finditer(bulk_str))
+    members_strs = [m.group(6) for m in matches]
+    workers = _parse_workers(workers)
+    if workers > 1 and len(matches) >= _PARALLEL_MIN_SET_CARDS:
+        import multiprocessing as mp
+        from concurrent.futures import ProcessPoolExecutor
+
+        size = -(-len(members_strs) // (4 * workers))
+        batches = [members_strs[i : i + size] for i in range(0, len(members_strs), size)]
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn")) as executor:
+            members = [x for batch in executor.map(_parse_set_members_batch, batches) for x in batch]
+    else:
+        members = _parse_set_members_batch(members_strs)
+    return list(zip(matches, members))
+
+
+def _known_ids(parent_instance: FEM, set_type_l: str, ids: np.ndarray) -> np.ndarray:
+    """Mask of the ``ids`` that exist in the array-backed ``parent_instance``"""
+    if set_type_l == "nset":
+        return parent_instance.nodes.store.node_rows(ids) >= 0
+    store = parent_instance.elements.store
+    known = np.zeros(len(ids), dtype=bool)
+    for positions, _ in store.elem_rows(ids).values():
+        known[positions] = True
+    # masses/springs/connectors are objects outside the element blocks
+    for pos in np.flatnonzero(~known).tolist():
+        try:
+            parent_instance.elements.from_id(int(ids[pos]))
+            known[pos] = True
+        except ValueError:
+            pass
+    return known
+
+
+def get_sets_from_bulk(bulk_str, fem: FEM, workers: int | None = None) -> FemSets:
+    """Read all *Nset/*Elset cards. On an array-backed FEM, sets local to ``fem`` are built
+    id-backed straight from the parsed id arrays (no per-member proxy). ``workers`` is passed
+    to :func:`parse_set_cards`."""
     from ada import Assembly
+    from ada.api.mesh.containers import ArrayElements, ArrayNodes
 
     if fem.parent is not None:
         all_parts = fem.parent.get_all_parts_in_assembly()
@@ -544,19 +648,25 @@ def get_sets_from_bulk(bulk_str, fem: FEM) -> FemSets:
     # resolve string references through it.
     parsed: dict[tuple[str, str], "FemSet"] = {}
 
-    def get_set(match):
+    def get_set(match, members):
         name = match.group(2)
         set_type = match.group(1)
         set_type_l = set_type.lower()
         internal = True if match.group(3) is not None else False
         instance = match.group(4)
         generate = True if match.group(5) is not None else False
-        members_str = match.group(6)
-        gen_mem = str_to_ints(members_str) if generate is True else []
-        raw_members = [] if generate is True else str_to_ints(members_str)
+        gen_mem = [int(x) for x in members] if generate is True else []
         metadata = dict(instance=instance, internal=internal, generate=generate, gen_mem=gen_mem)
         parent_instance = get_parent_instance(instance)
 
+        if parent_instance is fem and isinstance(fem.nodes, ArrayNodes) and isinstance(fem.elements, ArrayElements):
+            fem_set = get_array_set(name, set_type, members, metadata)
+            if fem_set is not None:
+                parsed[(set_type_l, name)] = fem_set
+                return fem_set
+
+        raw_members = [] if generate is True else list(members)
+
         from_id_fn = parent_instance.elements.from_id if set_type_l == "elset" else parent_instance.nodes.from_id
 
         resolved: list = []
@@ -607,17 +717,34 @@ def get_sets_from_bulk(bulk_str, fem: FEM) -> FemSets:
 
         return fem_set
 
-    return FemSets([get_set(x) for x in cards.re_sets.finditer(bulk_str)], parent=fem)
+    def get_array_set(name, set_type, members, metadata) -> FemSet | None:
+        """The id-backed set for a card of plain ids, a generate range or names of other
+        id-backed sets; None to fall back to the per-member path."""
+        set_type_l = set_type.lower()
+        if metadata["generate"]:
+            start, stop, step = (metadata["gen_mem"] + [1])[:3]
+            ids = np.arange(start, stop + 1, step, dtype=np.int64)
+            metadata["generate"] = False
+        elif isinstance(members, np.ndarray):
+            ids = members
+        else:
+            composed = [parsed.get((set_type_l, ref)) for ref in members]
+            if any(fs is None or fs._member_ids is None for fs in composed):
+                return None
+            ids = np.array([mid for fs in composed for mid in fs._member_ids], dtype=np.int64)
+
+        known = _known_ids(fem, set_type_l, ids)
+        if not known.all():
+            logger.warning(
+                "abaqus read: set %r references %d unknown id(s) — skipping them (e.g. %r)",
+                name,
+                int((~known).sum()),
+                int(ids[~known][0]),
+            )
+            ids = ids[known]
+        return FemSet(name, ids.tolist(), set_type=set_type, metadata=metadata, parent=fem)
 
-    # import concurrent.futures
-    # with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-    #     futures = []
-    #     for number in re_sets.finditer(bulk_str):
-    #         future = executor.submit(get_set, number)
-    #         futures.append(future)
-    #     sets = [future.result() for future in concurrent.futures.as_completed(futures)]
-    #
-    # return FemSetsCollection(sets, parent)
+    return FemSets([get_set(m, members) for m, members in parse_set_cards(bulk_str, workers)], parent=fem)
 
 
 # Abaqus standard named boundary conditions -> the DOFs they fix (1..3 translations,
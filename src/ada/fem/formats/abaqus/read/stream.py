@@ -0,0 +1,236 @@
+"""Single-pass *streaming* read of an Abaqus .inp deck's mesh.
+
+The bulk of a large .inp deck is ``*Node`` and ``*Element`` data; everything else (sets,
+sections, materials, BCs, steps) is comparatively tiny. This reader walks the deck line by
+line over an mmap, following ``*INCLUDE`` cards lazily as it reaches them, so neither the
+deck nor its includes are ever held as one string. Part/instance mesh data is parsed in
+chunks straight into packed numpy arrays, and each streamed block is replaced by a marker
+comment in a small text skeleton that the existing regex readers still run over.
+
+Mirrors the Sesam streaming reader (``sesam/read/stream.py``). Assembly-level ``*Node`` /
+``*Element`` blocks (reference points, connectors, cross-instance elements) are small and stay
+in the skeleton for the object parsers.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import pathlib
+import re
+from dataclasses import dataclass
+from typing import Iterator, Union
+
+import numpy as np
+
+from ada.config import logger
+from ada.fem.formats.abaqus.elem_shapes import (
+    UnsupportedAbaqusElementType,
+    abaqus_el_type_to_ada,
+)
+from ada.fem.shapes.definitions import ShapeResolver
+
+from . import cards
+
+# Data lines parsed per numpy call while streaming a mesh block
+STREAM_CHUNK = 100_000
+
+# Element types the array path always hands to the object parser
+_OBJECT_ELTYPES = ("MASS", "ROTARYI", "CONN3D2")
+
+_re_include = re.compile(rb"^\*include\s*,\s*input\s*=\s*(.*?)\s*$", re.IGNORECASE)
+# The nset name stops at the next keyword parameter (``*NODE, NSET=N1, SYSTEM=R``)
+_re_node = re.compile(r"^\*node\s*(?:,\s*nset=(?P<nset>[^,\n]*?))?\s*(?:,[^\n]*)?$", re.IGNORECASE)
+_re_marker = re.compile(r"^\*\*ADA-STREAM-BLOCK (\d+)$", re.MULTILINE)
+
+
+@dataclass
+class StreamedNodes:
+    node_ids: np.ndarray
+    coords: np.ndarray
+    nset: str | None = None
+
+
+@dataclass
+class StreamedElements:
+    ctype: object
+    el_ids: np.ndarray
+    conn: np.ndarray
+    elset: str | None = None
+
+
+StreamedBlock = Union[StreamedNodes, StreamedElements]
+
+
+@dataclass
+class StreamedDeck:
+    """The text skeleton of a streamed deck plus the mesh blocks cut out of it"""
+
+    text: str
+    blocks: list[StreamedBlock]
+
+    def blocks_in(self, bulk_str: str) -> list[StreamedBlock]:
+        """The streamed blocks whose markers appear in ``bulk_str`` (a slice of ``text``)"""
+        return [self.blocks[int(m.group(1))] for m in _re_marker.finditer(bulk_str)]
+
+
+def marker(index: int) -> str:
+    return f"**ADA-STREAM-BLOCK {index}\n"
+
+
+def iter_deck_lines(inp_path: os.PathLike) -> Iterator[bytes]:
+    """Lines of an .inp deck (``\\n``-terminated bytes) with every ``*INCLUDE`` card replaced
+    by the lines of the included file. Includes are opened when they are reached and resolved
+    relative to the file that includes them."""
+    inp_path = pathlib.Path(inp_path).resolve()
+    if inp_path.stat().st_size == 0:
+        return
+
+    with open(inp_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        for line in iter(m.readline, b""):
+            line = line.rstrip(b"\r\n") + b"\n"
+            if line[:2] == b"*i" or line[:2] == b"*I":
+                inc = _re_include.match(line.rstrip(b"\n"))
+                if inc is not None:
+                    rel_path = inc.group(1).decode().strip('"').replace("\\", "/")
+                    yield from iter_deck_lines(inp_path.parent / rel_path)
+                    continue
+            yield line
+
+
+class _BlockReader:
+    """Accumulates the data lines of one ``*Node``/``*Element`` block and parses them to arrays
+    ``STREAM_CHUNK`` lines at a time. Tokens of an element continued past a chunk boundary
+    are carried into the next chunk."""
+
+    def __init__(self, row_width: int | None, dtype):
+        self.row_width = row_width
+        self.dtype = dtype
+        self.lines: list[bytes] = []
+        self.carry = np.zeros(0, dtype=dtype)
+        self.parsed: list[np.ndarray] = []
+
+    def add(self, line: bytes) -> None:
+        if self.row_width is None:
+            # node blocks: the first data line gives the row width (id + 2 or 3 coordinates)
+            self.row_width = len(line.replace(b",", b" ").split())
+        self.lines.append(line)
+        if len(self.lines) >= STREAM_CHUNK:
+            self._parse()
+
+    def _parse(self) -> None:
+        tokens = b" ".join(self.lines).replace(b",", b" ").split()
+        self.lines = []
+        values = np.concatenate([self.carry, np.array(tokens).astype(self.dtype)]) if tokens else self.carry
+        n_rows = len(values) // self.row_width
+        self.parsed.append(values[: n_rows * self.row_width].reshape(n_rows, self.row_width))
+        self.carry = values[n_rows * self.row_width :]
+
+    def finish(self) -> np.ndarray:
+        if self.row_width is None:
+            return np.zeros((0, 1), dtype=self.dtype)
+        self._parse()
+        if len(self.carry) != 0:
+            raise ValueError(f"Abaqus data block has {len(self.carry)} trailing value(s) not filling a row")
+        return np.concatenate(self.parsed)
+
+
+def stream_inp(inp_path: os.PathLike) -> StreamedDeck:
+    """Stream an .inp deck and its includes once.
+
+    Every ``*Node`` and plain ``*Element`` block inside a ``*Part``/``*Instance`` (or anywhere
+    in a deck without an ``*Assembly``) is parsed to arrays and replaced in the returned text
+    by a single ``**ADA-STREAM-BLOCK <i>`` comment line pointing into ``blocks``. All other
+    lines are kept verbatim."""
+    blocks: list[StreamedBlock] = []
+    text: list[str] = []
+
+    in_assembly = in_part = in_instance = False
+    reader: _BlockReader | None = None
+    header = None  # (nset,) for node blocks, (ctype, elset) for element blocks
+    skipping = False  # dropping the data lines of an unsupported element block
+
+    def close_block():
+        nonlocal reader
+        if reader is None:
+            return
+        data = reader.finish()
+        if len(data) != 0:
+            if len(header) == 1:
+                width = min(data.shape[1], 4)
+                coords = np.zeros((len(data), 3))
+                coords[:, : width - 1] = data[:, 1:width]
+                blocks.append(StreamedNodes(data[:, 0].astype(np.int64), coords, header[0]))
+            else:
+                blocks.append(StreamedElements(header[0], data[:, 0], data[:, 1:], header[1]))
+            text.append(marker(len(blocks) - 1))
+        reader = None
+
+    for line in iter_deck_lines(inp_path):
+        if skipping:
+            if line[:1] != b"*":
+                continue
+            skipping = False
+        if reader is not None:
+            if line[:1] != b"*":
+                if line.strip():
+                    reader.add(line)
+                continue
+            close_block()
+
+        if line[:1] != b"*" or line[:2] == b"**":
+            text.append(line.decode(errors="replace"))
+            continue
+
+        s = line.decode(errors="replace")
+        keyword = s[1:].split(",", 1)[0].strip().lower()
+        if keyword == "part":
+            in_part = True
+        elif keyword == "end part":
+            in_part = False
+        elif keyword == "assembly":
+            in_assembly = True
+        elif keyword == "end assembly":
+            in_assembly = False
+        elif keyword == "instance":
+            in_instance = True
+        elif keyword == "end instance":
+            in_instance = False
+        elif keyword in ("node", "element") and (in_part or in_instance or not in_assembly):
+            header = _block_header(s)
+            if header is None:
+                skipping = True
+                continue
+            if header is not False:
+                if keyword == "node":
+                    reader = _BlockReader(None, np.float64)
+                else:
+                    reader = _BlockReader(ShapeResolver.get_el_nodes_from_type(header[0]) + 1, np.int64)
+                continue
+
+        text.append(s)
+
+    close_block()
+    return StreamedDeck("".join(text), blocks)
+
+
+def _block_header(keyword_line: str):
+    """``(nset,)`` for a ``*Node`` line, ``(ctype, elset)`` for a streamable ``*Element`` line,
+    None for an element block of an unsupported type (its data is dropped), or False when
+    the block should stay in the text for the object parsers."""
+    m = _re_node.match(keyword_line.rstrip("\n"))
+    if m is not None:
+        return (m.group("nset"),)
+
+    m = cards.re_el.match(keyword_line)
+    if m is None:
+        return False
+    eltype = m.group("eltype")
+    if eltype.upper() in _OBJECT_ELTYPES:
+        return False
+    try:
+        ctype = abaqus_el_type_to_ada(eltype)
+    except UnsupportedAbaqusElementType as exc:
+        logger.warning("abaqus read: skipping element block — %s", exc)
+        return None
+    return ctype, m.group("elset")
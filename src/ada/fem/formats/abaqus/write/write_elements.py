@@ -2,9 +2,18 @@ from __future__ import annotations
 
 from itertools import groupby
 from operator import attrgetter
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+import numpy as np
 
 from ada.core.utils import NewLine
+from ada.fem.formats.packed_write import (
+    chunks,
+    format_rows,
+    packed_store,
+    rstrip_stream,
+    runs,
+)
 from ada.fem.shapes import definitions as shape_def
 
 from .helper_utils import get_instance_name
@@ -12,23 +21,35 @@ from .write_masses import write_mass_elem
 
 if TYPE_CHECKING:
     from ada import FEM
+    from ada.api.mesh.store import ElemArrayBlock
     from ada.fem import Elem, FemSet
 
 
 def elements_str(fem: "FEM", written_on_assembly_level: bool) -> str:
-    part_el = fem.elements
-    grouping = groupby(part_el, key=attrgetter("type", "elset"))
+    return "".join(iter_elements_str(fem, written_on_assembly_level))
+
+
+def iter_elements_str(fem: "FEM", written_on_assembly_level: bool) -> Iterator[str]:
+    """The ``*ELEMENT`` blocks in pieces. The packed blocks of an array-backed FEM written on part
+    level are formatted from the arrays in chunks; the rest goes through :func:`elwriter`."""
     if len(fem.elements) == 0:
-        return "** No elements"
+        yield "** No elements"
+        return
 
-    return "".join(
-        list(
-            filter(
-                lambda x: x is not None,
-                [elwriter(x, elements, fem, written_on_assembly_level) for x, elements in grouping],
-            )
-        )
-    ).rstrip()
+    store = packed_store(fem) if written_on_assembly_level is False else None
+    objects = fem.elements if store is None else fem.elements._overflow
+
+    def pieces():
+        if store is not None:
+            for blk in store.blocks.values():
+                for start, stop, elset in runs(blk.elsets, len(blk)):
+                    yield from iter_packed_elements(blk, elset, fem, start, stop)
+        for x, elements in groupby(objects, key=attrgetter("type", "elset")):
+            el_str = elwriter(x, elements, fem, written_on_assembly_level)
+            if el_str is not None:
+                yield el_str
+
+    yield from rstrip_stream(pieces())
 
 
 def write_elements(
@@ -44,6 +65,29 @@ def write_elements(
     return f"""*ELEMENT, type={el_type}{el_set_str}\n{el_str}\n"""
 
 
+def elem_row_fmt(n_nodes: int) -> str:
+    """``%``-format of an element line as :func:`write_elem` lays it out for ``n_nodes`` nodes"""
+    nl = NewLine(10, suffix=7 * " ")
+    di = " %d" if n_nodes > 6 else "%13d"
+    return "%7d, " + " ".join([f"{di}," + next(nl) for _ in range(n_nodes)])[:-1]
+
+
+def iter_packed_elements(
+    blk: ElemArrayBlock, elset: FemSet | None, fem: FEM, start: int, stop: int, el_type: str = None
+) -> Iterator[str]:
+    """One ``*ELEMENT`` block for rows ``start:stop`` of a packed block, formatted in chunks"""
+    if el_type is None:
+        el_type = fem.options.ABAQUS.default_elements.get_element_type(blk.ctype)
+    el_set_str = f", ELSET={elset.name}" if elset is not None else ""
+    yield f"*ELEMENT, type={el_type}{el_set_str}\n"
+    row_fmt = elem_row_fmt(blk.nodes_per_elem)
+    node_ids = fem.nodes.store.node_ids
+    for sl in chunks(stop - start):
+        rows = slice(start + sl.start, start + sl.stop)
+        data = np.column_stack([blk.el_ids[rows], node_ids[blk.conn[rows]]])
+        yield format_rows(row_fmt, data) + "\n"
+
+
 def write_elem(el: Elem, alevel: bool) -> str:
     nl = NewLine(10, suffix=7 * " ")
     if len(el.nodes) > 6:
@@ -1,20 +1,46 @@
 from operator import attrgetter
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
+
+import numpy as np
+
+from ada.fem.formats.packed_write import (
+    chunks,
+    format_rows,
+    nodes_in_id_order,
+    packed_store,
+)
 
 if TYPE_CHECKING:
     from ada import FEM
 
+NODE_FMT = "%7d, %13.6f, %13.6f, %13.6f"
+
 
 def nodes_str(fem: "FEM"):
+    return "".join(iter_nodes_str(fem))
+
+
+def iter_nodes_str(fem: "FEM") -> Iterator[str]:
+    """The ``*NODE`` block in pieces; an array-backed FEM is formatted from its packed arrays in chunks"""
     f = "{nid:>7}, {x:>13.6f}, {y:>13.6f}, {z:>13.6f}"
     if len(fem.nodes) == 0:
-        return "** No Nodes"
-    return (
-        "*NODE\n"
-        + "\n".join(
-            [f.format(nid=no.id, x=no[0], y=no[1], z=no[2]) for no in sorted(fem.nodes, key=attrgetter("id"))]
-        ).rstrip()
-    )
+        yield "** No Nodes"
+        return
+
+    store = packed_store(fem)
+    if store is None:
+        yield (
+            "*NODE\n"
+            + "\n".join(
+                [f.format(nid=no.id, x=no[0], y=no[1], z=no[2]) for no in sorted(fem.nodes, key=attrgetter("id"))]
+            ).rstrip()
+        )
+        return
+
+    nids, coords = nodes_in_id_order(store)
+    yield "*NODE"
+    for sl in chunks(len(nids)):
+        yield "\n" + format_rows(NODE_FMT, np.column_stack([nids[sl], coords[sl]]))
 
 
 def rp_str(fem: "FEM") -> str:
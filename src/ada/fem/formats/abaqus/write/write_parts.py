@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
 from ada.config import Config
 from ada.fem.conversion_utils import convert_ecc_to_mpc, convert_hinges_2_couplings
+from ada.fem.formats.packed_write import rstrip_stream
 
 from .write_constraints import constraints_str
-from .write_elements import elements_str
+from .write_elements import iter_elements_str
 from .write_masses import masses_str
-from .write_nodes import nodes_str, rp_str
+from .write_nodes import iter_nodes_str, rp_str
 from .write_sections import sections_str
 from .write_sets import elsets_str, nsets_str
 from .write_springs import springs_str
@@ -44,15 +45,24 @@ def write_part_bulk(part_in: "Part", analysis_dir):
         return None
 
     with open(bulk_file, "w") as d:
-        d.write(write_abaqus_part_str(part_in))
+        for piece in iter_abaqus_part_str(part_in):
+            d.write(piece)
 
 
 def write_abaqus_part_str(part: "Part") -> str:
+    return "".join(iter_abaqus_part_str(part))
+
+
+def iter_abaqus_part_str(part: "Part") -> Iterator[str]:
+    """The part bulk in pieces, so the (chunked) node and element blocks can be streamed to file"""
     fem = part.fem
-    return f"""** Abaqus Part {part.name}
-** Exported using ADA OpenSim
-{nodes_str(fem)}
-{elements_str(fem, False)}
+
+    def pieces():
+        yield f"** Abaqus Part {part.name}\n** Exported using ADA OpenSim\n"
+        yield from iter_nodes_str(fem)
+        yield "\n"
+        yield from iter_elements_str(fem, False)
+        yield f"""
 {rp_str(fem)}
 {elsets_str(fem, False)}
 {nsets_str(fem, False)}
@@ -60,7 +70,9 @@ def write_abaqus_part_str(part: "Part") -> str:
 {masses_str(fem, False)}
 {surfaces_str(fem, False)}
 {constraints_str(fem, False)}
-{springs_str(fem)}""".rstrip()
+{springs_str(fem)}"""
+
+    yield from rstrip_stream(pieces())
 
 
 def instance_move_str(self):
@@ -0,0 +1,384 @@
+"""Streaming CalculiX ``.frd`` reader for the FEA viewer artefact bake.
+
+:class:`CcxResultModel` walks the whole ``.frd`` line by line and keeps every result block
+of every step in memory, which is what a large transient run cannot afford. This reader
+mmaps the file and builds a byte-offset index of its blocks once — the ``2C`` node block,
+the ``3C`` element block and one entry per ``-4`` result block with the step / eigen
+metadata in force when it was written — by reading only the header lines and jumping over
+each data block to its ``-3`` terminator. A block's data rows are then parsed in one go as
+a fixed-width ``uint8`` matrix over the mmapped slice: every number sits in a fixed column
+range, so negative values glued to the previous column need no regex fallback.
+
+``iter_field_steps`` parses one result block per step, so at most one step of one field is
+resident at a time. The mesh, specs and per-step values match
+``FEAResultStreamAdapter(read_from_frd_file_proto(path))``; nodes a block does not list
+are back-filled with NaN.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import pathlib
+from dataclasses import dataclass, field
+from typing import Iterator
+
+import numpy as np
+
+from ada.config import logger
+from ada.fem.formats.calculix.results.read_frd_file import ReadFrdFailedException
+from ada.fem.results.artefacts import (
+    FieldSpec,
+    MeshGeometry,
+    StepValues,
+    _classify_field,
+)
+from ada.fem.results.common import CellBlockData
+
+# FRD element type code → (cell type, number of nodes)
+FRD_ELEMENT_TYPES = {
+    1: ("hexahedron", 8),
+    2: ("wedge", 6),
+    3: ("tetra", 4),
+    4: ("hexahedron20", 20),
+    5: ("wedge15", 15),
+    6: ("tetra10", 10),
+    7: ("triangle", 3),
+    8: ("triangle6", 6),
+    9: ("quad", 4),
+    10: ("quad8", 8),
+    11: ("line", 2),
+    12: ("line3", 3),
+}
+
+# Width of the node/element id column for the ``2C``/``3C`` format flag (0 short, 1 long)
+_ID_WIDTH = {0: 5, 1: 10}
+
+# Width of a value column in nodal result rows
+_VALUE_WIDTH = 12
+
+# A data row starts with one blank and a two-character record key (`` -1``, `` -2``)
+_KEY_WIDTH = 3
+
+_BLANK = ord(" ")
+
+
+@dataclass
+class FrdResultBlock:
+    """One ``-4`` result block: its field name, declared components, the step label in force
+    when it was written and the byte span of its data rows"""
+
+    name: str
+    components: list[str]
+    step: int | None
+    eigen_freq: float | None
+    start: int
+    stop: int
+
+
+@dataclass
+class FrdIndex:
+    ccx_version: str | None = None
+    id_width: int = 10
+    nodes: tuple[int, int] | None = None
+    elements: tuple[int, int] | None = None
+    results: list[FrdResultBlock] = field(default_factory=list)
+
+
+def index_frd(buf) -> FrdIndex:
+    """Byte-offset index of the blocks of an ASCII ``.frd`` file held in ``buf`` (an mmap or
+    bytes). Only header lines are decoded; data blocks are skipped to their terminator."""
+    idx = FrdIndex()
+    step = mode = eigen_freq = None
+    pos, size = 0, len(buf)
+
+    while pos < size:
+        line, pos = _next_line(buf, pos)
+        if line.startswith(b"-4"):
+            components = []
+            while pos < size:
+                sub, nxt = _next_line(buf, pos)
+                if not sub.startswith(b"-5"):
+                    break
+                components.append(sub.split()[1].decode())
+                pos = nxt
+            start, stop, pos = _data_span(buf, pos)
+            idx.results.append(
+                FrdResultBlock(
+                    name=line.split()[1].decode(),
+                    components=components,
+                    step=mode if mode is not None else step,
+                    eigen_freq=eigen_freq if mode is not None else None,
+                    start=start,
+                    stop=stop,
+                )
+            )
+        elif line.startswith(b"2C") or line.startswith(b"3C"):
+            tokens = line.split()
+            fmt = int(tokens[-1]) if len(tokens) > 2 else 1
+            if fmt not in _ID_WIDTH:
+                raise ReadFrdFailedException(f"Unsupported FRD block format {fmt} (binary FRD is not supported)")
+            idx.id_width = _ID_WIDTH[fmt]
+            start, stop, pos = _data_span(buf, pos)
+            if line.startswith(b"2C"):
+                idx.nodes = (start, stop)
+            else:
+                idx.elements = (start, stop)
+        elif line.startswith(b"1PSTEP"):
+            step = int(float(line.split()[2]))
+        elif line.startswith(b"1PMODE"):
+            mode = int(float(line.split()[-1]))
+        elif line.startswith(b"100CL"):
+            eigen_freq = float(line.split()[2])
+        elif line.startswith(b"1UVERSION"):
+            idx.ccx_version = line.split()[-1].decode().lower().replace("version", "").strip()
+
+    return idx
+
+
+def _next_line(buf, pos: int) -> tuple[bytes, int]:
+    eol = buf.find(b"\n", pos)
+    if eol == -1:
+        eol = len(buf)
+    return buf[pos:eol].strip(), eol + 1
+
+
+def _data_span(buf, pos: int) -> tuple[int, int, int]:
+    """``(start, stop, next_pos)`` of the data rows starting at ``pos`` and the offset of the
+    line after their `` -3`` terminator"""
+    end = buf.find(b"\n -3", pos - 1)
+    if end == -1:
+        raise ReadFrdFailedException(f"FRD data block at byte {pos} has no -3 terminator")
+    stop = max(end + 1, pos)
+    _, next_pos = _next_line(buf, stop)
+    return pos, stop, next_pos
+
+
+def fixed_width_rows(buf, start: int = 0, stop: int | None = None) -> np.ndarray:
+    """The lines of ``buf[start:stop]`` as an ``(n_lines, width)`` uint8 matrix, shorter lines
+    blank-padded. A view over ``buf`` when every line has the same length."""
+    raw = np.frombuffer(buf, dtype=np.uint8, count=(len(buf) if stop is None else stop) - start, offset=start)
+    ends = np.flatnonzero(raw == 10)
+    if raw.size and raw[-1] != 10:
+        ends = np.append(ends, raw.size)
+    if ends.size == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    lengths = ends - starts
+    width = int(lengths.max())
+    if (lengths == width).all() and ends[-1] == len(ends) * (width + 1) - 1:
+        rows = raw[: len(ends) * (width + 1)].reshape(-1, width + 1)[:, :width]
+    else:
+        cols = np.arange(width)
+        inside = cols < lengths[:, None]
+        rows = np.full((len(ends), width), _BLANK, dtype=np.uint8)
+        rows[inside] = raw[(starts[:, None] + cols)[inside]]
+    if (rows == 13).any():
+        rows = np.where(rows == 13, np.uint8(_BLANK), rows)
+    return rows
+
+
+def fixed_width_fields(rows: np.ndarray, start: int, width: int, count: int) -> tuple[np.ndarray, np.ndarray]:
+    """``count`` consecutive ``width``-wide fields from column ``start`` of every row, as an
+    ``(n_rows, count)`` bytes array plus the mask of the fields that are not blank"""
+    end = start + width * count
+    if rows.shape[1] < end:
+        rows = np.pad(rows, ((0, 0), (0, end - rows.shape[1])), constant_values=_BLANK)
+    block = np.ascontiguousarray(rows[:, start:end]).reshape(len(rows), count, width)
+    filled = (block != _BLANK).any(axis=2)
+    return block.view(f"S{width}").reshape(len(rows), count), filled
+
+
+def parse_nodes(rows: np.ndarray, id_width: int) -> tuple[np.ndarray, np.ndarray]:
+    """``(node_ids, coords)`` of the rows of a ``2C`` block"""
+    ids, _ = fixed_width_fields(rows, _KEY_WIDTH, id_width, 1)
+    values, _ = fixed_width_fields(rows, _KEY_WIDTH + id_width, _VALUE_WIDTH, 3)
+    return ids[:, 0].astype(np.int64), values.astype(np.float64)
+
+
+def parse_elements(rows: np.ndarray, id_width: int) -> list[tuple[int, np.ndarray, np.ndarray]]:
+    """``[(frd_type, el_ids, conn), ...]`` of the rows of a ``3C`` block, one entry per element
+    type in order of first appearance. ``conn`` holds node ids."""
+    is_header = rows[:, 2] == ord("1")
+    if not is_header.any():
+        return []
+    header = rows[is_header]
+    el_ids = fixed_width_fields(header, _KEY_WIDTH, id_width, 1)[0][:, 0].astype(np.int64)
+    el_types = fixed_width_fields(header, _KEY_WIDTH + id_width, 5, 1)[0][:, 0].astype(np.int64)
+
+    node_rows = rows[~is_header]
+    per_row = max((rows.shape[1] - _KEY_WIDTH) // id_width, 1)
+    fields, filled = fixed_width_fields(node_rows, _KEY_WIDTH, id_width, per_row)
+    nodes = fields[filled].astype(np.int64)
+
+    # owner element of every node id, from the header preceding its row
+    owner = (np.cumsum(is_header) - 1)[~is_header]
+    counts = np.bincount(np.repeat(owner, filled.sum(axis=1)), minlength=len(el_ids))
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+    blocks = []
+    _, first = np.unique(el_types, return_index=True)
+    for frd_type in el_types[np.sort(first)]:
+        sel = el_types == frd_type
+        n_nodes = np.unique(counts[sel])
+        if len(n_nodes) != 1:
+            raise ReadFrdFailedException(f"FRD elements of type {frd_type} have varying node counts {n_nodes}")
+        conn = nodes[offsets[sel][:, None] + np.arange(n_nodes[0])]
+        blocks.append((int(frd_type), el_ids[sel], conn))
+    return blocks
+
+
+def parse_results(rows: np.ndarray, id_width: int) -> tuple[np.ndarray, np.ndarray]:
+    """``(node_ids, values)`` of the rows of a ``-4`` result block. Records continued on
+    ``-2`` rows are joined; ``values`` has one column per value written for a node."""
+    is_record = rows[:, 2] == ord("1")
+    n_records = int(is_record.sum())
+    if n_records == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros((0, 0))
+
+    ids = fixed_width_fields(rows[is_record], _KEY_WIDTH, id_width, 1)[0][:, 0].astype(np.int64)
+    per_row = max((rows.shape[1] - _KEY_WIDTH - id_width) // _VALUE_WIDTH, 1)
+    fields, filled = fixed_width_fields(rows, _KEY_WIDTH + id_width, _VALUE_WIDTH, per_row)
+
+    lines_per_record = len(rows) // n_records
+    if lines_per_record * n_records != len(rows) or not is_record[::lines_per_record].all():
+        raise ReadFrdFailedException("FRD result block mixes records of different line counts")
+    # the value columns written on each line of the first record
+    widths = filled[:lines_per_record].sum(axis=1)
+    fields = fields.reshape(n_records, lines_per_record, per_row)
+    values = np.concatenate([fields[:, j, :w] for j, w in enumerate(widths)], axis=1)
+    return ids, values.astype(np.float64)
+
+
+class FrdStreamReader:
+    """Per-step streaming reader over an ASCII ``.frd`` file, backed by a byte-offset index
+    of its blocks. Drive it via the FEAStreamReader protocol."""
+
+    def __init__(self, frd_path: os.PathLike):
+        self._path = pathlib.Path(frd_path)
+        self._file = open(self._path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.index = index_frd(self._mm)
+        self._geom: MeshGeometry | None = None
+        self._node_ids: np.ndarray | None = None
+        self._node_order: np.ndarray | None = None
+        self._field_specs_cache: list[FieldSpec] | None = None
+
+    # ----- protocol -------------------------------------------------------
+
+    def read_mesh_geometry(self) -> MeshGeometry:
+        if self._geom is not None:
+            return self._geom
+        if self.index.nodes is None:
+            raise ReadFrdFailedException("No nodes found. Maybe there was an issue with the analysis")
+        if self.index.elements is None:
+            raise ReadFrdFailedException("No element information from Calculix")
+
+        node_ids, points = parse_nodes(self._rows(self.index.nodes), self.index.id_width)
+        self._node_ids = node_ids
+        self._node_order = np.argsort(node_ids, kind="stable")
+
+        cell_blocks: list[CellBlockData] = []
+        for frd_type, el_ids, conn in parse_elements(self._rows(self.index.elements), self.index.id_width):
+            cell_type = FRD_ELEMENT_TYPES.get(frd_type, (None,))[0]
+            if cell_type is None:
+                logger.warning(f"FRD element type {frd_type} is not supported; skipping {len(el_ids)} elements")
+                continue
+            data = self._node_positions(conn.ravel(), f"Element block of type {cell_type!r}").reshape(conn.shape)
+            cell_blocks.append(CellBlockData(cell_type=cell_type, data=data, identifiers=el_ids))
+
+        self._geom = MeshGeometry(points=points, cell_blocks=cell_blocks)
+        return self._geom
+
+    def field_specs(self) -> list[FieldSpec]:
+        if self._field_specs_cache is not None:
+            return self._field_specs_cache
+
+        n_points = int(self.read_mesh_geometry().points.shape[0])
+        specs: list[FieldSpec] = []
+        for name, blocks in self._blocks_by_field().items():
+            first = blocks[0]
+            components = first.components[: self._n_values(first)] or [name]
+            # eigen runs label a step by its frequency, static/transient ones by the step number
+            step_values = [float(b.eigen_freq if b.eigen_freq is not None else b.step) for b in blocks]
+            specs.append(
+                FieldSpec(
+                    name=name,
+                    components=components,
+                    n_steps=len(blocks),
+                    n_points=n_points,
+                    support="nodal",
+                    step_values=step_values,
+                    category=_classify_field(name, None),
+                )
+            )
+
+        self._field_specs_cache = specs
+        return specs
+
+    def iter_field_steps(self, field_name: str) -> Iterator[StepValues]:
+        spec = next((s for s in self.field_specs() if s.name == field_name), None)
+        if spec is None:
+            raise KeyError(field_name)
+
+        for i, block in enumerate(self._blocks_by_field()[field_name]):
+            ids, data = parse_results(self._rows((block.start, block.stop)), self.index.id_width)
+            values = np.full((spec.n_points, spec.n_components), np.nan)
+            n = min(spec.n_components, data.shape[1]) if data.size else 0
+            values[self._node_positions(ids, f"Field {field_name!r}"), :n] = data[:, :n]
+            yield StepValues(step_index=i, step_value=spec.step_values[i], values=values)
+
+    # FRD result blocks are nodal (CalculiX extrapolates stresses to the nodes), so there
+    # are no element fields to stream.
+    def element_field_specs(self):
+        return []
+
+    def iter_element_field_steps(self, spec):
+        raise NotImplementedError("FRD files carry nodal result blocks only")
+
+    def try_solid_beams(self):
+        # CalculiX expands beams and shells to solids before writing the .frd
+        return None
+
+    def try_history_records(self):
+        return None
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "FrdStreamReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ----- helpers --------------------------------------------------------
+
+    def _rows(self, span: tuple[int, int]) -> np.ndarray:
+        return fixed_width_rows(self._mm, *span)
+
+    def _blocks_by_field(self) -> dict[str, list[FrdResultBlock]]:
+        """Result blocks grouped by field name in order of first appearance, each group sorted
+        by step (stable, as the adapter orders an FEAResult's field data)"""
+        grouped: dict[str, list[FrdResultBlock]] = {}
+        for block in self.index.results:
+            grouped.setdefault(block.name, []).append(block)
+        return {name: sorted(blocks, key=lambda b: b.step) for name, blocks in grouped.items()}
+
+    def _n_values(self, block: FrdResultBlock) -> int:
+        """Value columns per node of a result block, sampled from its first record"""
+        second = self._mm.find(b"\n -1", block.start, block.stop)
+        stop = block.stop if second == -1 else second + 1
+        return parse_results(self._rows((block.start, stop)), self.index.id_width)[1].shape[1]
+
+    def _node_positions(self, ids: np.ndarray, owner: str) -> np.ndarray:
+        """0-based point indices of node ``ids``"""
+        sorted_ids = self._node_ids[self._node_order]
+        pos = np.minimum(np.searchsorted(sorted_ids, ids), max(len(sorted_ids) - 1, 0))
+        found = sorted_ids[pos] == ids if len(sorted_ids) else np.zeros(len(ids), dtype=bool)
+        if not found.all():
+            # surface the source data error rather than misplacing values
+            raise ValueError(f"{owner} references unknown node id {int(ids[~found][0])}.")
+        return self._node_order[pos]
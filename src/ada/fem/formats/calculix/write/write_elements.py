@@ -1,26 +1,43 @@
 from itertools import groupby
 from operator import attrgetter
-from typing import Iterable
+from typing import Iterable, Iterator
 
 from ada.core.utils import NewLine
 from ada.fem import Elem, FemSection
 from ada.fem.containers import FemElements
 from ada.fem.exceptions import IncompatibleElements
-from ada.fem.shapes import ElemShape
-from ada.fem.shapes import definitions as shape_def
+from ada.fem.formats.abaqus.write.write_elements import iter_packed_elements
+from ada.fem.formats.packed_write import packed_store, runs
+from ada.fem.shapes import ElemShape, definitions as shape_def
 
 
 def elements_str(fem_elements: FemElements) -> str:
+    return "".join(iter_elements_str(fem_elements))
+
+
+def iter_elements_str(fem_elements: FemElements) -> Iterator[str]:
+    """The ``*ELEMENT`` blocks in pieces; packed element blocks are formatted from the arrays in chunks"""
     if len(fem_elements) == 0:
-        return "** No elements"
+        yield "** No elements"
+        return
 
-    el_str = ""
-    for (el_type, fem_sec), elements in groupby(fem_elements, key=attrgetter("type", "fem_sec")):
+    fem = fem_elements.parent
+    store = packed_store(fem) if fem is not None else None
+    if store is None:
+        objects = fem_elements
+    else:
+        objects = fem_elements._overflow
+        for blk in store.blocks.values():
+            if isinstance(blk.ctype, shape_def.ConnectorTypes):
+                continue
+            for start, stop, fem_sec in runs(blk.fem_secs, len(blk)):
+                sub_eltype = el_type_sub(blk.ctype, fem_sec)
+                yield from iter_packed_elements(blk, fem_sec.elset, fem, start, stop, el_type=sub_eltype)
+
+    for (el_type, fem_sec), elements in groupby(objects, key=attrgetter("type", "fem_sec")):
         if isinstance(el_type, shape_def.ConnectorTypes):
             continue
-        el_str += elwriter(el_type, fem_sec, elements)
-
-    return el_str
+        yield elwriter(el_type, fem_sec, elements)
 
 
 def elwriter(eltype, fem_sec: FemSection, elements: Iterable[Elem]):
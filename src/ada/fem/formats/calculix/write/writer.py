@@ -3,24 +3,33 @@ from __future__ import annotations
 import traceback
 from itertools import groupby
 from operator import attrgetter
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
+
+import numpy as np
 
 from ada.api.containers import Nodes
 from ada.config import logger
 from ada.core.utils import NewLine, get_current_user
 from ada.fem import Bc, FemSection, FemSet
 from ada.fem.formats.abaqus.write.write_bc import aba_bc_map, valid_aba_bcs
+from ada.fem.formats.abaqus.write.write_nodes import NODE_FMT
 from ada.fem.formats.abaqus.write.write_sections import (
     eval_general_properties,
     shell_section_str,
     solid_section_str,
 )
+from ada.fem.formats.packed_write import (
+    chunks,
+    format_rows,
+    nodes_in_id_order,
+    rstrip_stream,
+)
 from ada.fem.formats.utils import get_fem_model_from_assembly
 from ada.fem.steps import StepExplicit
 
 from ..compatibility import check_compatibility
 from .templates import main_header_str
-from .write_elements import elements_str
+from .write_elements import iter_elements_str
 from .write_loads import get_all_grav_loads
 from .write_steps import step_str
 
@@ -50,8 +59,12 @@ def to_fem(assembly: Assembly, name, analysis_dir, metadata=None, model_data_onl
         f.write(main_header_str.format(username=get_current_user()))
 
         # Part level information
-        f.write(nodes_str(p.fem.nodes) + "\n")
-        f.write(elements_str(p.fem.elements).strip() + "\n")
+        for piece in iter_nodes_str(p.fem.nodes):
+            f.write(piece)
+        f.write("\n")
+        for piece in rstrip_stream(iter_elements_str(p.fem.elements)):
+            f.write(piece)
+        f.write("\n")
         f.write("*USER ELEMENT,TYPE=U1,NODES=2,INTEGRATION POINTS=2,MAXDOF=6\n")
         f.write(elsets_str(p.fem.elsets) + "\n")
         f.write(elsets_str(assembly.fem.elsets) + "\n")
@@ -129,13 +142,28 @@ def get_section_str(fem_sec: FemSection):
 
 
 def nodes_str(fem_nodes: Nodes) -> str:
+    return "".join(iter_nodes_str(fem_nodes))
+
+
+def iter_nodes_str(fem_nodes: Nodes) -> Iterator[str]:
+    """The ``*NODE`` block in pieces; array-backed nodes are formatted from the packed arrays in chunks"""
+    from ada.api.mesh.containers import ArrayNodes
+
     if len(fem_nodes) == 0:
-        return "** No Nodes"
+        yield "** No Nodes"
+        return
+
+    if isinstance(fem_nodes, ArrayNodes):
+        nids, coords = nodes_in_id_order(fem_nodes.store)
+        yield "*NODE"
+        for sl in chunks(len(nids)):
+            yield "\n" + format_rows(NODE_FMT, np.column_stack([nids[sl], coords[sl]]))
+        return
 
     f = "{nid:>7}, {x:>13.6f}, {y:>13.6f}, {z:>13.6f}"
     n_ = (f.format(nid=no.id, x=no[0], y=no[1], z=no[2]) for no in sorted(fem_nodes, key=attrgetter("id")))
 
-    return "*NODE\n" + "\n".join(n_).rstrip()
+    yield "*NODE\n" + "\n".join(n_).rstrip()
 
 
 def gen_set_str(fem_set: FemSet):
@@ -147,7 +147,9 @@ class RmedStreamReader:
         self._field_specs_cache = specs
         return specs
 
-    def iter_field_steps(self, field_name: str) -> Iterator[StepValues]:
+    def _nodal_field(self, field_name: str):
+        """``(spec, field group, sorted time keys)`` of a nodal field; raises for unknown and
+        non-nodal fields."""
         if "CHA" not in self._f or field_name not in self._f["CHA"]:
             raise KeyError(field_name)
 
@@ -162,7 +164,10 @@ class RmedStreamReader:
             )
 
         field_group = self._f["CHA"][field_name]
-        time_keys = sorted(field_group.keys())
+        return spec, field_group, sorted(field_group.keys())
+
+    def iter_field_steps(self, field_name: str) -> Iterator[StepValues]:
+        spec, field_group, time_keys = self._nodal_field(field_name)
         profiles = self._f["PROFILS"] if "PROFILS" in self._f else None
 
         for i, key in enumerate(time_keys):
@@ -174,6 +179,23 @@ class RmedStreamReader:
                 values=values,
             )
 
+    def iter_steps_for_fields(self, specs):
+        """Step-major pass over several nodal fields, as ``(index into specs, step)``: step
+        ``i`` of every field is read before step ``i + 1`` of any, so the file is walked once
+        instead of once per field."""
+        from ada.fem.results.artefacts import ElementFieldSpec
+
+        if any(isinstance(spec, ElementFieldSpec) for spec in specs):
+            raise NotImplementedError("RmedStreamReader does not yet stream element fields")
+        fields = [self._nodal_field(spec.name) for spec in specs]
+        profiles = self._f["PROFILS"] if "PROFILS" in self._f else None
+
+        for i in range(max((len(time_keys) for _, _, time_keys in fields), default=0)):
+            for k, (spec, field_group, time_keys) in enumerate(fields):
+                if i < len(time_keys):
+                    values = _read_nodal_step(field_group[time_keys[i]], profiles, spec.n_points, spec.n_components)
+                    yield k, StepValues(step_index=i, step_value=spec.step_values[i], values=values)
+
     # Element fields aren't streamed by the RMED reader yet — Phase 1
     # only covers nodal output through this path. Returning an empty
     # list lets the bake's element-field loop run as a no-op without
@@ -48,3 +48,27 @@ def export_mesh_data_to_sqlite(instance_id, mesh_name: str, mesh: libaster.Mesh,
         cell_sets.append((set_id, cell_group_name, instance_id, cell_id))
         set_id += 1
     sql_store.insert_table("ElementSets", cell_sets)
+
+
+def export_nodal_field_to_sqlite(
+    instance_id, step_id: int, name: str, field: libaster.FieldOnNodesReal, sql_store: SQLiteFEAStore, frame=0.0
+):
+    """Store a nodal field as one columnar ``FieldArrays`` entry (point ids as in
+    :func:`export_mesh_data_to_sqlite`). Components missing at a node are stored as NaN."""
+    simple = field.toSimpleFieldOnNodes()
+    values, mask = simple.toNumpy()
+    values = np.where(mask, values, np.nan)
+    point_ids = np.arange(1, len(values) + 1)
+    sql_store.insert_field_array(
+        name, step_id, point_ids, values, list(simple.getComponents()), instance_id=instance_id, frame=frame
+    )
+
+
+def export_nodal_results_to_sqlite(instance_id, step_id: int, result: libaster.Result, sql_store: SQLiteFEAStore):
+    """Store every nodal field of ``result`` at every stored index (the frame) with
+    :func:`export_nodal_field_to_sqlite`."""
+    for index in result.getIndexes():
+        for name in result.getFieldsNames():
+            field = result.getField(name, index)
+            if isinstance(field, libaster.FieldOnNodesReal):
+                export_nodal_field_to_sqlite(instance_id, step_id, name, field, sql_store, frame=float(index))
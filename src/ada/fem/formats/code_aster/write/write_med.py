@@ -6,6 +6,7 @@ import h5py
 import numpy as np
 
 from ada.config import Config
+from ada.fem.formats.packed_write import chunks, packed_store
 from ada.fem.shapes import definitions as shape_def
 
 from ..common import ada_to_med_type
@@ -43,6 +44,22 @@ def med_elements(part: Part, time_step: h5py.Group, profile: str, families: h5py
     elements_group = time_step.create_group("MAI")
     elements_group.attrs.create("CGT", 1)
 
+    store = packed_store(part.fem)
+    if store is not None:
+        for blk in store.blocks.values():
+            med_type = ada_to_med_type(blk.ctype, part.fem.options.CODE_ASTER.use_reduced_integration)
+            if med_type in elements_group:
+                raise ValueError(f"med_type {med_type} is already defined. rewrite is needed.")
+            med_cells = _med_cells_group(elements_group, med_type, profile)
+            _write_column_major(med_cells, "NOD", blk.conn, lambda rows: store.node_ids[rows])
+            num = med_cells.create_dataset("NUM", data=blk.el_ids)
+            num.attrs.create("CGT", 1)
+            num.attrs.create("NBR", len(blk))
+
+        if len(part.fem.elsets.keys()) > 0:
+            _add_cell_sets(elements_group, part, families)
+        return
+
     for group, elements in part.fem.elements.group_by_type():
         med_type = ada_to_med_type(group, part.fem.options.CODE_ASTER.use_reduced_integration)
         elements = list(elements)
@@ -65,15 +82,7 @@ def med_elements(part: Part, time_step: h5py.Group, profile: str, families: h5py
         if med_type in elements_group:
             raise ValueError(f"med_type {med_type} is already defined. rewrite is needed.")
 
-        med_cells = elements_group.create_group(med_type)
-        med_cells.attrs.create("CGT", 1)
-        med_cells.attrs.create("CGS", 1)
-        med_cells.attrs.create("PFL", np.bytes_(profile))
-
-        # Add GEO attribute with the MED geometry type code
-        if med_type in med_geometry_type:
-            med_cells.attrs.create("GEO", med_geometry_type[med_type])
-
+        med_cells = _med_cells_group(elements_group, med_type, profile)
         nod = med_cells.create_dataset("NOD", data=cells.flatten(order="F"))
         nod.attrs.create("CGT", 1)
         nod.attrs.create("NBR", len(cells))
@@ -88,6 +97,34 @@ def med_elements(part: Part, time_step: h5py.Group, profile: str, families: h5py
         _add_cell_sets(elements_group, part, families)
 
 
+def _med_cells_group(elements_group: h5py.Group, med_type: str, profile: str) -> h5py.Group:
+    med_cells = elements_group.create_group(med_type)
+    med_cells.attrs.create("CGT", 1)
+    med_cells.attrs.create("CGS", 1)
+    med_cells.attrs.create("PFL", np.bytes_(profile))
+
+    # Add GEO attribute with the MED geometry type code
+    if med_type in med_geometry_type:
+        med_cells.attrs.create("GEO", med_geometry_type[med_type])
+    return med_cells
+
+
+def _write_column_major(group: h5py.Group, name: str, table: np.ndarray, convert=None) -> h5py.Dataset:
+    """Write the ``(m, k)`` ``table`` as the flat column-major dataset MED expects (what
+    ``flatten(order="F")`` gives), ``WRITE_CHUNK`` rows at a time. ``convert`` maps each row
+    chunk to the stored values (e.g. node rows -> node ids)."""
+    m, k = table.shape
+    sample = table[:0] if convert is None else convert(table[:0])
+    dset = group.create_dataset(name, shape=(m * k,), dtype=sample.dtype)
+    for sl in chunks(m):
+        values = table[sl] if convert is None else convert(table[sl])
+        for j in range(k):
+            dset[j * m + sl.start : j * m + sl.stop] = values[:, j]
+    dset.attrs.create("CGT", 1)
+    dset.attrs.create("NBR", m)
+    return dset
+
+
 def med_nodes(part: "Part", time_step, profile, families):
     """
     TODO: Go through each data group and set in HDF5 file and make sure that it writes what was read 1:1.
@@ -96,28 +133,37 @@ def med_nodes(part: "Part", time_step, profile, families):
     Add the following datasets ['COO', 'FAM', 'NUM'] to the 'NOE' group
     """
 
-    points = np.zeros((int(part.fem.nodes.max_nid), 3))
+    store = packed_store(part.fem)
+    experimental_numbering = Config().code_aster_ca_experimental_id_numbering is True
+    if store is not None:
+        if experimental_numbering:
+            # the node iteration order of the array facade
+            rows = part.fem.nodes._sorted_rows
+            points, node_ids = store.coords[rows], store.node_ids[rows]
+        else:
+            points = np.zeros((int(part.fem.nodes.max_nid), 3))
+            points[store.node_ids - 1] = store.coords
+    else:
+        points = np.zeros((int(part.fem.nodes.max_nid), 3))
 
-    def pmap(n):
-        points[int(n.id - 1)] = n.p
+        def pmap(n):
+            points[int(n.id - 1)] = n.p
 
-    list(map(pmap, part.fem.nodes))
+        list(map(pmap, part.fem.nodes))
 
-    # Try this
-    if Config().code_aster_ca_experimental_id_numbering is True:
-        points = np.array([n.p for n in part.fem.nodes])
+        # Try this
+        if experimental_numbering:
+            points = np.array([n.p for n in part.fem.nodes])
+            node_ids = [n.id for n in part.fem.nodes]
 
     nodes_group = time_step.create_group("NOE")
     nodes_group.attrs.create("CGT", 1)
     nodes_group.attrs.create("CGS", 1)
 
     nodes_group.attrs.create("PFL", np.bytes_(profile))
-    coo = nodes_group.create_dataset("COO", data=points.flatten(order="F"))
-    coo.attrs.create("CGT", 1)
-    coo.attrs.create("NBR", len(points))
+    _write_column_major(nodes_group, "COO", points)
 
-    if Config().code_aster_ca_experimental_id_numbering is True:
-        node_ids = [n.id for n in part.fem.nodes]
+    if experimental_numbering:
         num = nodes_group.create_dataset("NUM", data=node_ids)
         num.attrs.create("CGT", 1)
         num.attrs.create("NBR", len(points))
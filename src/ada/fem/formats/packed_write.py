@@ -0,0 +1,88 @@
+"""Chunked, array-level formatting of the mesh bulk for the FEM deck writers.
+
+When a FEM is array-backed (``ArrayNodes``/``ArrayElements`` over one
+:class:`~ada.api.mesh.store.MeshArrays`), the Abaqus, CalculiX, Sesam and Code_Aster writers
+format the nodes and every element block straight from the packed arrays, ``WRITE_CHUNK`` rows
+at a time: one ``%``-format call over a whole chunk instead of minting a proxy and calling
+``str.format`` per node/element. The text is identical to the per-object path, and the chunks
+are yielded so a writer can stream them to file with flat peak memory.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from ada import FEM
+    from ada.api.mesh.store import MeshArrays
+
+WRITE_CHUNK = 50_000
+
+# ``write_ff`` number field: two leading blanks for a positive value, one for a negative one
+FF_NUMBER = " %- 15.8E"
+
+
+def packed_store(fem: FEM) -> MeshArrays | None:
+    """The shared store of an array-backed FEM, or None for the object model"""
+    from ada.api.mesh.containers import ArrayElements, ArrayNodes
+
+    if isinstance(fem.nodes, ArrayNodes) and isinstance(fem.elements, ArrayElements):
+        return fem.nodes.store
+    return None
+
+
+def chunks(n: int, size: int = WRITE_CHUNK) -> Iterator[slice]:
+    for start in range(0, n, size):
+        yield slice(start, min(start + size, n))
+
+
+def format_rows(row_fmt: str, data: np.ndarray) -> str:
+    """Format every row of the 2D ``data`` with the ``%``-style ``row_fmt``, joined by newlines.
+
+    Integers may be passed as floats for ``%d`` fields (exact below 2**53)."""
+    if len(data) == 0:
+        return ""
+    return "\n".join([row_fmt] * len(data)) % tuple(np.asarray(data).ravel().tolist())
+
+
+def ff_row_fmt(flag: str, row_lengths: Iterable[int]) -> str:
+    """The ``%``-format of one :func:`~ada.fem.formats.sesam.write.write_utils.write_ff` record
+    with ``row_lengths`` numbers per line (without the trailing newline)"""
+    return f"{flag:<8}" + ("\n" + 8 * " ").join(FF_NUMBER * n for n in row_lengths)
+
+
+def nodes_in_id_order(store: MeshArrays) -> tuple[np.ndarray, np.ndarray]:
+    """``(node_ids, coords)`` sorted by node id, as the writers list them"""
+    order = np.argsort(store.node_ids, kind="stable")
+    return store.node_ids[order], store.coords[order]
+
+
+def runs(values: list | None, n: int) -> list[tuple[int, int, object]]:
+    """``(start, stop, value)`` runs of consecutive equal entries of a per-row attribute list,
+    the packed equivalent of ``itertools.groupby`` over the rows"""
+    if values is None:
+        return [(0, n, None)] if n else []
+    out = []
+    start = 0
+    for i in range(1, n + 1):
+        if i == n or not (values[i] is values[start] or values[i] == values[start]):
+            out.append((start, i, values[start]))
+            start = i
+    return out
+
+
+def rstrip_stream(pieces: Iterable[str]) -> Iterator[str]:
+    """Yield ``pieces`` with the whitespace at the end of their concatenation stripped"""
+    held = None
+    for piece in pieces:
+        if held is None:
+            held = piece
+        elif piece.strip():
+            yield held
+            held = piece
+        else:
+            held += piece
+    if held is not None:
+        yield held.rstrip()
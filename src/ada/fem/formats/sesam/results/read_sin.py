@@ -22,6 +22,11 @@ import numpy as np
 from ada.fem.formats.sesam.read import cards
 from ada.fem.formats.sesam.results.read_sif import SifReader
 from ada.fem.formats.sesam.results.sin_reader import SinFile, open_sin
+from ada.fem.formats.sesam.results.step_fields import (
+    cards_for,
+    element_step,
+    nodal_step,
+)
 
 if TYPE_CHECKING:
     from ada.fem.results.common import FEAResult
@@ -370,11 +375,6 @@ def read_result_names(sin: SinFile) -> dict[int, str]:
 
 _RV_TYPE_NAMES = ("RVNODDIS", "RVSTRESS", "RVFORCES")
 
-# Element field name (as the adapter advertises it) → its RV card, so the
-# streaming reader gathers only that field's card per step instead of all of
-# them once per field. Nodal fields use their card name directly (RVNODDIS).
-_ELEM_FIELD_TO_CARD = {"STRESS": "RVSTRESS", "FORCES": "RVFORCES"}
-
 
 def read_sin_metadata(sin_file: str | pathlib.Path) -> SinMetadata:
     """Enumerate steps + fields in a SIN without loading any values.
@@ -512,6 +512,11 @@ class SinStreamReader:
     def __exit__(self, *exc: object) -> None:
         self.close()
 
+    def step_ids(self) -> list[int]:
+        """The IRES result case id of every step, in step order. Load combinations match
+        their basic cases on these (``step_values`` may be eigenfrequencies)."""
+        return [int(s) for s in self._steps]
+
     # ── helpers ───────────────────────────────────────────────────────
     def _discover_steps(self) -> list[int]:
         steps: set[int] = set()
@@ -577,18 +582,17 @@ class SinStreamReader:
             return self._rep
         return FEAResultStreamAdapter(self._load_step(self._steps[idx]))
 
-    def _field_adapter(self, idx: int, card: str | None):
-        """Adapter over step ``idx`` loading only ``card``'s block (one field).
+    def _field_adapter(self, idx: int, cards: "set[str] | None"):
+        """Adapter over step ``idx`` loading only the ``cards`` blocks.
 
         Reuses the cached step-0 representative when available; every other
-        step gathers just the one RV card instead of all three — so iterating a
-        field no longer re-reads (and, on a range source, re-fetches) the other
-        fields' records once per field."""
+        step gathers just the requested RV cards instead of all three — so
+        iterating a field no longer re-reads (and, on a range source,
+        re-fetches) the other fields' records once per field."""
         from ada.fem.results.artefacts import FEAResultStreamAdapter
 
         if idx == 0 and self._rep is not None:
             return self._rep
-        cards = {card} if card else None
         return FEAResultStreamAdapter(self._load_step(self._steps[idx], cards=cards))
 
     def _with_global_steps(self, specs):
@@ -608,42 +612,34 @@ class SinStreamReader:
         return self._with_global_steps(self._adapter_for(0).element_field_specs())
 
     def iter_field_steps(self, field_name: str):
-        import dataclasses
-
         labels = self._step_values()
-        # A nodal field's name is its RV card (RVNODDIS) — gather only that one.
-        card = field_name if field_name in _RV_TYPE_NAMES else None
+        cards = cards_for([field_name])
         for i in range(len(self._steps)):
-            ad = self._field_adapter(i, card)
-            emitted = 0
-            for sv in ad.iter_field_steps(field_name):
-                yield dataclasses.replace(sv, step_index=i, step_value=labels[i])
-                emitted += 1
-            if emitted != 1:
-                raise RuntimeError(
-                    f"SIN nodal field {field_name!r} yielded {emitted} steps at step "
-                    f"index {i} (expected 1) — field missing or duplicated for a step"
-                )
+            yield from nodal_step(self._field_adapter(i, cards), field_name, i, labels[i], "SIN")
 
     def iter_element_field_steps(self, spec):
-        import dataclasses
+        labels = self._step_values()
+        cards = cards_for([spec.name])
+        for i in range(len(self._steps)):
+            yield from element_step(self._field_adapter(i, cards), spec, i, labels[i], "SIN")
+
+    def iter_steps_for_fields(self, specs):
+        """Step-major pass over several nodal / element fields, as
+        ``(index into specs, step)``: each step's RV cards are read once
+        for all of ``specs`` instead of once per field."""
+        from ada.fem.results.artefacts import ElementFieldSpec
 
         labels = self._step_values()
-        card = _ELEM_FIELD_TO_CARD.get(spec.name)
+        cards = cards_for([s.name for s in specs])
         for i in range(len(self._steps)):
-            ad = self._field_adapter(i, card)
-            ad_spec = next(
-                (s for s in ad.element_field_specs() if s.name == spec.name and s.elem_type == spec.elem_type),
-                None,
-            )
-            if ad_spec is None:
-                raise RuntimeError(f"SIN element field {spec.name!r}/{spec.elem_type} missing at step index {i}")
-            if ad_spec.element_labels != spec.element_labels:
-                # The bake writes every step against spec.element_labels (step 0's
-                # order); a reordered step would silently mis-correlate values.
-                raise RuntimeError(f"SIN element field {spec.name!r} element order drifted at step index {i}")
-            for esv in ad.iter_element_field_steps(ad_spec):
-                yield dataclasses.replace(esv, step_index=i, step_value=labels[i])
+            ad = self._field_adapter(i, cards)
+            for k, spec in enumerate(specs):
+                if isinstance(spec, ElementFieldSpec):
+                    for esv in element_step(ad, spec, i, labels[i], "SIN"):
+                        yield k, esv
+                else:
+                    for sv in nodal_step(ad, spec.name, i, labels[i], "SIN"):
+                        yield k, sv
 
     def try_solid_beams(self):
         return self._adapter_for(0).try_solid_beams()
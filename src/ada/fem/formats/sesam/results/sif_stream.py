@@ -29,16 +29,15 @@ from ada.fem.formats.sesam.results.sif_index import (
     assemble_reduced_local,
     build_sif_index,
 )
+from ada.fem.formats.sesam.results.step_fields import (
+    cards_for,
+    element_step,
+    nodal_step,
+)
 
 # Read RV cards in a stable order so each step's block is rebuilt the same way.
 _RV_ORDER = ("RVNODDIS", "RVSTRESS", "RVFORCES")
 
-# Element field name (as the adapter advertises it) → the RV card it comes from.
-# Lets ``iter_element_field_steps`` load only that field's card block per step
-# instead of every step's whole record set (the SIF layout is columnar by card,
-# so each field is one contiguous block — reading just it keeps the bake to a
-# single pass with no per-field re-reads).
-_ELEM_FIELD_TO_CARD = {"STRESS": "RVSTRESS", "FORCES": "RVFORCES"}
 
 # Sentinel appended when parsing a step's RV bytes so the line-based reader hits
 # a clean block end (a non-card, non-numeric line) instead of running off the
@@ -72,6 +71,11 @@ class SifStreamReader:
     def __exit__(self, *exc: object) -> None:
         self.close()
 
+    def step_ids(self) -> list[int]:
+        """The IRES result case id of every step, in step order. Load combinations match
+        their basic cases on these (``step_values`` may be eigenfrequencies)."""
+        return [int(s) for s in self._steps]
+
     # ── static (step-invariant) parse, once ───────────────────────────
     def _ensure_static(self) -> None:
         if self._static is not None:
@@ -182,16 +186,15 @@ class SifStreamReader:
             return self._rep
         return FEAResultStreamAdapter(self._load_step(self._steps[idx]))
 
-    def _field_adapter(self, idx: int, card: str | None):
-        """Adapter over step ``idx`` loading only ``card``'s block (one field).
+    def _field_adapter(self, idx: int, cards: "set[str] | None"):
+        """Adapter over step ``idx`` loading only the ``cards`` blocks.
 
         Reusing the cached step-0 representative when it's available avoids a
-        redundant re-read of step 0; every other step loads just the one card."""
+        redundant re-read of step 0; every other step loads just those cards."""
         from ada.fem.results.artefacts import FEAResultStreamAdapter
 
         if idx == 0 and self._rep is not None:
             return self._rep
-        cards = {card} if card else None
         return FEAResultStreamAdapter(self._load_step(self._steps[idx], cards=cards))
 
     def _ensure_lis(self) -> None:
@@ -252,40 +255,34 @@ class SifStreamReader:
         return self._with_global_steps(self._adapter_for(0).element_field_specs())
 
     def iter_field_steps(self, field_name: str):
-        import dataclasses
-
         labels = self._nodal_labels()
-        # A nodal field's name is its RV card (RVNODDIS) — read only that block.
-        card = field_name if field_name in _RV_ORDER else None
+        cards = cards_for([field_name])
         for i in range(len(self._steps)):
-            ad = self._field_adapter(i, card)
-            emitted = 0
-            for sv in ad.iter_field_steps(field_name):
-                yield dataclasses.replace(sv, step_index=i, step_value=labels[i])
-                emitted += 1
-            if emitted != 1:
-                raise RuntimeError(
-                    f"SIF nodal field {field_name!r} yielded {emitted} steps at step "
-                    f"index {i} (expected 1) — field missing or duplicated for a step"
-                )
+            yield from nodal_step(self._field_adapter(i, cards), field_name, i, labels[i], "SIF")
 
     def iter_element_field_steps(self, spec):
-        import dataclasses
-
         labels = self._plain_labels()  # element fields aren't LIS-enriched
-        card = _ELEM_FIELD_TO_CARD.get(spec.name)
+        cards = cards_for([spec.name])
+        for i in range(len(self._steps)):
+            yield from element_step(self._field_adapter(i, cards), spec, i, labels[i], "SIF")
+
+    def iter_steps_for_fields(self, specs):
+        """Step-major pass over several nodal / element fields, as
+        ``(index into specs, step)``: each step's RV cards are read once
+        for all of ``specs`` instead of once per field."""
+        from ada.fem.results.artefacts import ElementFieldSpec
+
+        nodal_labels, elem_labels = self._nodal_labels(), self._plain_labels()
+        cards = cards_for([s.name for s in specs])
         for i in range(len(self._steps)):
-            ad = self._field_adapter(i, card)
-            ad_spec = next(
-                (s for s in ad.element_field_specs() if s.name == spec.name and s.elem_type == spec.elem_type),
-                None,
-            )
-            if ad_spec is None:
-                raise RuntimeError(f"SIF element field {spec.name!r}/{spec.elem_type} missing at step index {i}")
-            if ad_spec.element_labels != spec.element_labels:
-                raise RuntimeError(f"SIF element field {spec.name!r} element order drifted at step index {i}")
-            for esv in ad.iter_element_field_steps(ad_spec):
-                yield dataclasses.replace(esv, step_index=i, step_value=labels[i])
+            ad = self._field_adapter(i, cards)
+            for k, spec in enumerate(specs):
+                if isinstance(spec, ElementFieldSpec):
+                    for esv in element_step(ad, spec, i, elem_labels[i], "SIF"):
+                        yield k, esv
+                else:
+                    for sv in nodal_step(ad, spec.name, i, nodal_labels[i], "SIF"):
+                        yield k, sv
 
     def try_solid_beams(self):
         return self._adapter_for(0).try_solid_beams()
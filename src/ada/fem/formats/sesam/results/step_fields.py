@@ -0,0 +1,62 @@
+"""Per-step field helpers shared by the Sesam streaming readers.
+
+Both :class:`~ada.fem.formats.sesam.results.read_sin.SinStreamReader` and
+:class:`~ada.fem.formats.sesam.results.sif_stream.SifStreamReader` map one
+step at a time through a single-step ``FEAResultStreamAdapter``. These
+helpers pick the RV cards a set of fields needs, and pull one field's step
+out of that adapter relabelled as the global step it belongs to.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+
+RV_CARDS = ("RVNODDIS", "RVSTRESS", "RVFORCES")
+
+# Element field name (as the adapter advertises it) → its RV card, so the
+# streaming readers gather only that field's card per step instead of all of
+# them once per field. Nodal fields use their card name directly (RVNODDIS).
+ELEM_FIELD_TO_CARD = {"STRESS": "RVSTRESS", "FORCES": "RVFORCES"}
+
+
+def cards_for(field_names) -> "set[str] | None":
+    """RV cards holding ``field_names``: a nodal field's name is its card
+    (RVNODDIS), element fields map through ``ELEM_FIELD_TO_CARD``. ``None``
+    (read every card) when any field's card is unknown."""
+    cards = set()
+    for name in field_names:
+        card = name if name in RV_CARDS else ELEM_FIELD_TO_CARD.get(name)
+        if card is None:
+            return None
+        cards.add(card)
+    return cards
+
+
+def nodal_step(ad, field_name: str, i: int, label: float, fmt: str):
+    """The one step of ``field_name`` in the single-step adapter ``ad``, relabelled as step ``i``.
+    ``fmt`` ("SIN" / "SIF") only names the source format in errors."""
+    emitted = 0
+    for sv in ad.iter_field_steps(field_name):
+        yield dataclasses.replace(sv, step_index=i, step_value=label)
+        emitted += 1
+    if emitted != 1:
+        raise RuntimeError(
+            f"{fmt} nodal field {field_name!r} yielded {emitted} steps at step "
+            f"index {i} (expected 1) — field missing or duplicated for a step"
+        )
+
+
+def element_step(ad, spec, i: int, label: float, fmt: str):
+    """``spec``'s bucket in the single-step adapter ``ad``, relabelled as step ``i``."""
+    ad_spec = next(
+        (s for s in ad.element_field_specs() if s.name == spec.name and s.elem_type == spec.elem_type),
+        None,
+    )
+    if ad_spec is None:
+        raise RuntimeError(f"{fmt} element field {spec.name!r}/{spec.elem_type} missing at step index {i}")
+    if ad_spec.element_labels != spec.element_labels:
+        # The bake writes every step against spec.element_labels (step 0's
+        # order); a reordered step would silently mis-correlate values.
+        raise RuntimeError(f"{fmt} element field {spec.name!r} element order drifted at step index {i}")
+    for esv in ad.iter_element_field_steps(ad_spec):
+        yield dataclasses.replace(esv, step_index=i, step_value=label)
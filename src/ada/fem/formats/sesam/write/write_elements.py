@@ -1,13 +1,27 @@
-from typing import List, Tuple
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator, List, Tuple
+
+import numpy as np
 
 from ada import FEM
 from ada.config import logger
 from ada.fem import Elem
+from ada.fem.formats.packed_write import (
+    chunks,
+    ff_row_fmt,
+    format_rows,
+    packed_store,
+    runs,
+)
 from ada.fem.shapes.definitions import ConnectorTypes
 
 from ..common import sesam_el_map
 from .write_utils import write_ff
 
+if TYPE_CHECKING:
+    from ada.api.mesh.store import ElemArrayBlock
+
 
 def eltype_2_sesam(eltyp) -> int:
     for ses, gen in sesam_el_map.items():
@@ -53,11 +67,30 @@ def elem_str(fem: FEM, thick_map) -> str:
 
     'GELMNT1', 'elnox', 'elno', 'eltyp', 'eltyad', 'nids'
     """
+    return "".join(iter_elem_str(fem, thick_map))
+
+
+def iter_elem_str(fem: FEM, thick_map) -> Iterator[str]:
+    """:func:`elem_str` in pieces. The packed blocks of an array-backed FEM are formatted from the
+    arrays in chunks; the remaining (object) elements go through :func:`write_elem`."""
+    store = packed_store(fem)
+    elements = fem.elements.stru_elements if store is None else fem.elements._overflow
 
     writable: list[Elem] = []
     skipped_connector = 0
     skipped_unsectioned = 0
-    for el in fem.elements.stru_elements:
+    packed_rows = []
+    if store is not None:
+        for blk in store.blocks.values():
+            if isinstance(blk.ctype, ConnectorTypes):
+                skipped_connector += len(blk)
+                continue
+            secs = blk.fem_secs if blk.fem_secs is not None else [None] * len(blk)
+            rows = np.array([r for r, sec in enumerate(secs) if sec is not None], dtype=np.int64)
+            skipped_unsectioned += len(blk) - len(rows)
+            if len(rows) > 0:
+                packed_rows.append((blk, rows))
+    for el in elements:
         if isinstance(el.type, ConnectorTypes):
             skipped_connector += 1
             continue
@@ -82,7 +115,9 @@ def elem_str(fem: FEM, thick_map) -> str:
             skipped_unsectioned,
         )
 
-    out_str = "".join(
+    for blk, rows in packed_rows:
+        yield from _iter_packed_gelmnt1(blk, rows, store.node_ids)
+    yield "".join(
         [
             write_ff(
                 "GELMNT1",
@@ -92,10 +127,60 @@ def elem_str(fem: FEM, thick_map) -> str:
         ]
     )
 
-    for el in writable:
-        out_str += write_elem(el, thick_map)
+    for blk, rows in packed_rows:
+        yield from _iter_packed_gelref1(store, blk, rows, thick_map)
+    yield "".join([write_elem(el, thick_map) for el in writable])
+
+
+def _iter_packed_gelmnt1(blk: ElemArrayBlock, rows: np.ndarray, node_ids: np.ndarray) -> Iterator[str]:
+    n_nodes = blk.nodes_per_elem
+    # write_nodal_data's layout: up to 4 ids per line, and an empty last line when it divides evenly
+    layout = [n_nodes] if n_nodes <= 4 else [4] * (n_nodes // 4) + [n_nodes % 4]
+    row_fmt = ff_row_fmt("GELMNT1", [4] + layout)
+    eltyp = eltype_2_sesam(blk.ctype)
+    for sl in chunks(len(rows)):
+        r = rows[sl]
+        el_ids = blk.el_ids[r]
+        head = np.column_stack([el_ids, el_ids, np.full_like(el_ids, eltyp), np.zeros_like(el_ids)])
+        yield format_rows(row_fmt, np.column_stack([head, node_ids[blk.conn[r]]])) + "\n"
+
+
+def _iter_packed_gelref1(store, blk: ElemArrayBlock, rows: np.ndarray, thick_map) -> Iterator[str]:
+    from ada.fem.elements import ElemType
 
-    return out_str
+    row_fmt = ff_row_fmt("GELREF1", [4, 4, 4])
+    sec_props: dict[int, tuple[int, int]] = {}
+    for sl in chunks(len(rows)):
+        data = []
+        special = []
+        for r in rows[sl].tolist():
+            fem_sec = blk.fem_secs[r]
+            props = sec_props.get(id(fem_sec))
+            if props is None:
+                if fem_sec.type == ElemType.LINE:
+                    sec_id = fem_sec.section.id
+                elif fem_sec.type == ElemType.SHELL:
+                    sec_id = thick_map[fem_sec.thickness]
+                elif fem_sec.type == ElemType.SOLID:
+                    sec_id = 0
+                else:
+                    raise ValueError(f'Unsupported elem type "{fem_sec.type}"')
+                props = sec_props[id(fem_sec)] = (fem_sec.material.id, sec_id)
+            metadata = blk.metadata.get(r, {})
+            transno = metadata.get("transno")
+            is_special = metadata.get("fixno") is not None or transno is None
+            special.append(is_special)
+            data.append((int(blk.el_ids[r]), props[0], 0, 0, 0, 0, 0, 0, props[1], 0, 0, 0 if is_special else transno))
+
+        data = np.array(data, dtype=float)
+        for start, stop, is_special in runs(special, len(special)):
+            if is_special:
+                # hinged (two-line GELREF1) or missing transno: the per-element writer handles/raises
+                yield "".join(
+                    [write_elem(store.elem_proxy(blk.ctype, r), thick_map) for r in rows[sl][start:stop].tolist()]
+                )
+            else:
+                yield format_rows(row_fmt, data[start:stop]) + "\n"
 
 
 def write_nodal_data(el: Elem) -> List[Tuple[int]]:
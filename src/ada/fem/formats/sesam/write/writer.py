@@ -2,12 +2,21 @@ from __future__ import annotations
 
 import datetime
 from operator import attrgetter
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
+
+import numpy as np
 
 from ada.config import logger
 from ada.core.utils import Counter, get_current_user
 from ada.fem import FEM
 from ada.fem.exceptions.model_definition import DoesNotSupportMultiPart
+from ada.fem.formats.packed_write import (
+    chunks,
+    ff_row_fmt,
+    format_rows,
+    nodes_in_id_order,
+    packed_store,
+)
 
 from .templates import top_level_fem_str
 from .write_sets import sets_str
@@ -19,7 +28,7 @@ if TYPE_CHECKING:
 
 def to_fem(assembly, name, analysis_dir=None, metadata=None, model_data_only=False):
     from .write_constraints import constraint_str
-    from .write_elements import elem_str
+    from .write_elements import iter_elem_str
     from .write_loads import loads_str
     from .write_masses import mass_str
     from .write_sections import sections_str
@@ -75,13 +84,15 @@ def to_fem(assembly, name, analysis_dir=None, metadata=None, model_data_only=Fal
         d.write(materials_str(materials))
         d.write(sections_str(part.fem, thick_map))
         d.write(univec_str(part.fem))
-        d.write(nodes_str(part.fem))
+        for piece in iter_nodes_str(part.fem):
+            d.write(piece)
         d.write(mass_str(part.fem))
         d.write(sets_str(part.fem))
         d.write(bc_str(part.fem) + bc_str(assembly.fem))
         d.write(constraint_str(part.fem) + constraint_str(assembly.fem))
         d.write(hinges_str(part.fem))
-        d.write(elem_str(part.fem, thick_map))
+        for piece in iter_elem_str(part.fem, thick_map):
+            d.write(piece)
         d.write(loads_str(assembly.fem) + loads_str(part.fem))
         d.write("IEND                0.00            0.00            0.00            0.00\n")
 
@@ -107,6 +118,29 @@ def materials_str(materials: list[Material]):
 
 
 def nodes_str(fem: FEM) -> str:
+    return "".join(iter_nodes_str(fem))
+
+
+def iter_nodes_str(fem: FEM) -> Iterator[str]:
+    """The GNODE and GCOORD records in pieces; an array-backed FEM is formatted from its packed arrays in chunks"""
+    store = packed_store(fem)
+    if store is not None and store.n_nodes > 0:
+        nids, coords = nodes_in_id_order(store)
+        dup = nids[1:][nids[1:] == nids[:-1]]
+        if dup.size > 0:
+            raise Exception('Doubly defined node id "{}". TODO: Make necessary code updates'.format(dup[0]))
+        gnode_fmt = ff_row_fmt("GNODE", [4])
+        for sl in chunks(len(nids)):
+            ids = nids[sl].astype(float)
+            yield format_rows(gnode_fmt, np.column_stack([ids, ids, np.full_like(ids, 6), np.full_like(ids, 123456)]))
+            yield "\n"
+        gcoord_fmt = ff_row_fmt("GCOORD", [4])
+        for sl in chunks(len(nids)):
+            # + 0.0 turns -0.0 into 0.0, like write_ff's make_zero
+            yield format_rows(gcoord_fmt, np.column_stack([nids[sl], coords[sl] + 0.0]))
+            yield "\n"
+        return
+
     nodes = sorted(fem.nodes, key=attrgetter("id"))
 
     nids = []
@@ -116,11 +150,10 @@ def nodes_str(fem: FEM) -> str:
         else:
             raise Exception('Doubly defined node id "{}". TODO: Make necessary code updates'.format(n[0]))
     if len(nodes) == 0:
-        return "** No Nodes"
+        yield "** No Nodes"
     else:
-        out_str = "".join([write_ff("GNODE", [(no.id, no.id, 6, 123456)]) for no in nodes])
-        out_str += "".join([write_ff("GCOORD", [(no.id, no[0], no[1], no[2])]) for no in nodes])
-        return out_str
+        yield "".join([write_ff("GNODE", [(no.id, no.id, 6, 123456)]) for no in nodes])
+        yield "".join([write_ff("GCOORD", [(no.id, no[0], no[1], no[2])]) for no in nodes])
 
 
 def bc_str(fem: FEM) -> str:
@@ -0,0 +1,162 @@
+"""Bounding-box broadphase and batched OCC fragmentation for the partitioning functions.
+
+Fragmenting every pair of objects costs N² OCC booleans even though most pairs are far apart.
+Instead, group the objects into clusters of (transitively) touching bounding boxes and fragment
+each cluster once with all of its members as objects. gmsh returns the fragment map in input
+order, so the new entities can be handed back to each member. Clusters are capped in size, so a
+long chain of touching objects doesn't end up in one huge boolean.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ada.config import Config, logger
+from ada.core.spatial_index import AABBTree
+
+if TYPE_CHECKING:
+    from ada.fem.meshing import GmshSession
+    from ada.fem.meshing.concepts import GmshData
+
+
+def gmsh_obj_bounds(gmsh_session: GmshSession, gmsh_objs: list[GmshData]) -> tuple[np.ndarray, np.ndarray]:
+    """Axis-aligned bounds of each object's OCC entities, shape (N, 3) each"""
+    get_bbox = gmsh_session.model.occ.getBoundingBox
+    mins = np.full((len(gmsh_objs), 3), np.inf)
+    maxs = np.full((len(gmsh_objs), 3), -np.inf)
+    for i, gmsh_obj in enumerate(gmsh_objs):
+        for dim, tag in gmsh_obj.entities:
+            xmin, ymin, zmin, xmax, ymax, zmax = get_bbox(dim, tag)
+            mins[i] = np.minimum(mins[i], (xmin, ymin, zmin))
+            maxs[i] = np.maximum(maxs[i], (xmax, ymax, zmax))
+    return mins, maxs
+
+
+def connected_clusters(n: int, pairs: np.ndarray | list[tuple[int, int]]) -> list[list[int]]:
+    """Connected components (size >= 2) of the graph on ``n`` nodes given by ``pairs``"""
+    parent = list(range(n))
+
+    def find(i: int) -> int:
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    for i, j in np.asarray(pairs, dtype=np.int64).reshape(-1, 2).tolist():
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+
+    clusters: dict[int, list[int]] = {}
+    for i in range(n):
+        clusters.setdefault(find(i), []).append(i)
+    return [c for c in clusters.values() if len(c) > 1]
+
+
+def touching_pairs(mins: np.ndarray, maxs: np.ndarray, tol: float = 1e-6) -> np.ndarray:
+    """Index pairs whose bounding boxes (grown by ``tol``) overlap, shape (M, 2)"""
+    if len(mins) < 2:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.asarray(AABBTree(mins, maxs).overlapping_pairs(tol=tol), dtype=np.int64).reshape(-1, 2)
+
+
+def capped_clusters(
+    n: int, pairs: np.ndarray | list[tuple[int, int]], max_size: int
+) -> tuple[list[list[int]], list[tuple[int, int]]]:
+    """Connected clusters of at most ``max_size`` members and the pairs left crossing between them.
+
+    A chain of touching objects (a deck of edge-connected plates) is one connected cluster however
+    large it grows. Larger clusters are cut into breadth-first runs of ``max_size`` members, so each
+    run stays spatially compact; the pairs joining two runs are returned for a pairwise pass."""
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2).tolist()
+    adjacency: dict[int, list[int]] = {}
+    for i, j in pairs:
+        adjacency.setdefault(i, []).append(j)
+        adjacency.setdefault(j, []).append(i)
+
+    chunks = []
+    for cluster in connected_clusters(n, pairs):
+        if len(cluster) <= max_size:
+            chunks.append(cluster)
+            continue
+        order, seen = [], {cluster[0]}
+        queue = deque([cluster[0]])
+        while queue:
+            i = queue.popleft()
+            order.append(i)
+            for j in adjacency[i]:
+                if j not in seen:
+                    seen.add(j)
+                    queue.append(j)
+        chunks += [order[k : k + max_size] for k in range(0, len(order), max_size)]
+
+    chunk_of = {i: c for c, chunk in enumerate(chunks) for i in chunk}
+    crossing = {(min(i, j), max(i, j)): None for i, j in pairs if i != j and chunk_of[i] != chunk_of[j]}
+    return chunks, list(crossing)
+
+
+def fragment_clusters(
+    gmsh_session: GmshSession,
+    gmsh_objs: list[GmshData],
+    pairs: np.ndarray | list[tuple[int, int]],
+    remove_object: bool = True,
+    remove_tool: bool = True,
+    max_size: int | None = None,
+) -> None:
+    """Fragment each cluster of ``gmsh_objs`` connected through ``pairs`` in one OCC call.
+
+    Clusters are capped at ``max_size`` members (default ``Config().meshing_max_fragment_cluster``);
+    the connections between the parts of a split cluster are then fragmented pair by pair, so the
+    seams between parts are not guaranteed to be conformal."""
+    if max_size is None:
+        max_size = Config().meshing_max_fragment_cluster
+
+    chunks, crossing = capped_clusters(len(gmsh_objs), pairs, max(max_size, 2))
+    if crossing:
+        logger.info(
+            f"Fragmenting clusters of over {max_size} objects in parts; "
+            f"{len(crossing)} connections between the parts are fragmented pairwise"
+        )
+    for chunk in chunks:
+        fragment_objects(
+            gmsh_session, [gmsh_objs[i] for i in chunk], remove_object=remove_object, remove_tool=remove_tool
+        )
+    for i, j in crossing:
+        fragment_objects(
+            gmsh_session, [gmsh_objs[i]], [gmsh_objs[j]], remove_object=remove_object, remove_tool=remove_tool
+        )
+
+
+def fragment_objects(
+    gmsh_session: GmshSession,
+    objects: list[GmshData],
+    tools: list[GmshData] = (),
+    remove_object: bool = True,
+    remove_tool: bool = True,
+) -> None:
+    """Fragment ``objects`` (and optional ``tools``) in a single OCC call and update their entities"""
+    tools = list(tools)
+    if len(objects) == 0 or len(objects) + len(tools) < 2:
+        return None
+
+    if len(tools) == 0:
+        objects, tools = objects[:1], objects[1:]
+
+    obj_tags = [dt for gmsh_obj in objects for dt in gmsh_obj.entities]
+    tool_tags = [dt for gmsh_obj in tools for dt in gmsh_obj.entities]
+    _, res_map = gmsh_session.model.occ.fragment(
+        obj_tags, tool_tags, removeObject=remove_object, removeTool=remove_tool
+    )
+
+    # res_map holds one list of new entities per input dim-tag, objects first then tools
+    res_iter = iter(res_map)
+    for gmsh_obj in objects + tools:
+        new_entities = []
+        for _ in gmsh_obj.entities:
+            new_entities.extend(next(res_iter))
+        gmsh_obj.entities = new_entities
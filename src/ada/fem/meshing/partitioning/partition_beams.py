@@ -1,5 +1,10 @@
 from ada.config import Config, logger
 from ada.fem.meshing import GmshSession
+from ada.fem.meshing.partitioning.broadphase import (
+    fragment_clusters,
+    gmsh_obj_bounds,
+    touching_pairs,
+)
 
 
 def split_crossing_beams(gmsh_session: GmshSession):
@@ -16,34 +21,12 @@ def split_crossing_beams(gmsh_session: GmshSession):
     if br_names is not None and "partition_isect_bm_pre" in br_names:
         gmsh_session.open_gui()
 
-    for bm in beams:
-        bm_gmsh_obj = gmsh_session.model_map[bm]
-        for other_bm in beams:
-            if bm == other_bm:
-                continue
-            bm_other_gmsh_obj = gmsh_session.model_map[other_bm]
-
-            res, res_map = gmsh_session.model.occ.fragment(
-                bm_gmsh_obj.entities, bm_other_gmsh_obj.entities, removeTool=False, removeObject=True
-            )
-
-            num_object_entities = len(bm_gmsh_obj.entities)
-
-            # Split res_map into two parts: one for pl_gmsh_obj.entities and one for bm_gmsh_obj.entities
-            object_entities_new = []
-            tool_entities_new = []
-
-            for i, new_entities in enumerate(res_map):
-                if i < num_object_entities:
-                    # These correspond to the original object entities
-                    object_entities_new.extend(new_entities)
-                else:
-                    # These correspond to the original tool entities
-                    tool_entities_new.extend(new_entities)
-
-            # Update the entities for both objects
-            bm_gmsh_obj.entities = object_entities_new
-            bm_other_gmsh_obj.entities = tool_entities_new
+    # Only beams whose bounding boxes touch (directly or through a chain of others) can split each
+    # other. Each such cluster is fragmented in one OCC call instead of once per ordered beam pair.
+    gmsh_objs = [gmsh_session.model_map[bm] for bm in beams]
+    mins, maxs = gmsh_obj_bounds(gmsh_session, gmsh_objs)
+    pairs = touching_pairs(mins, maxs, tol=Config().general_point_tol)
+    fragment_clusters(gmsh_session, gmsh_objs, pairs, remove_object=True, remove_tool=False)
 
     # One synchronize at end. Subsequent OCC ops on these tags don't
     # need an intermediate flush — see the same fix in partition_plates.
@@ -56,7 +39,7 @@ def split_intersecting_beams(
     logger.info("Running 'split_intersecting_beams' partitioning function")
     from ada import Beam, Node
     from ada.api.containers import Beams, Nodes
-    from ada.core.clash_check import are_beams_connected, basic_intersect
+    from ada.core.clash_check import batch_intersect, connect_beams_batch
 
     br_names = Config().meshing_open_viewer_breakpoint_names
 
@@ -67,8 +50,7 @@ def split_intersecting_beams(
 
     nodes = Nodes()
     nmap: dict[Node, list[Beam]] = dict()
-    for bm, cbeams in filter(None, [basic_intersect(bm, margins, [bm_cont]) for bm in all_beams]):
-        are_beams_connected(bm, cbeams, out_of_plane_tol, point_tol, nodes, nmap)
+    connect_beams_batch(batch_intersect(all_beams, margins, [bm_cont]), out_of_plane_tol, point_tol, nodes, nmap)
 
     for n, beams in nmap.items():
         split_point = gmsh_session.model.occ.addPoint(n.x, n.y, n.z)
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from ada.config import Config, logger
 from ada.core.clash_check import (
     PlateConnections,
     filter_away_beams_along_plate_edges,
-    find_beams_connected_to_plate,
+    find_beams_connected_to_plates,
 )
 from ada.fem.meshing import GmshSession
+from ada.fem.meshing.partitioning.broadphase import (
+    fragment_clusters,
+    fragment_objects,
+)
+
+if TYPE_CHECKING:
+    from ada import Plate
 
 
 def fragment_plates(plate_con: PlateConnections, gmsh_session: GmshSession):
@@ -17,31 +26,7 @@ def fragment_plates(plate_con: PlateConnections, gmsh_session: GmshSession):
     if br_names is not None and "pre_fragment_plates" in br_names:
         gmsh_session.open_gui()
 
-    for pl1, con_plates in plate_con.edge_connected.items():
-        pl1_gmsh_obj = gmsh_session.model_map[pl1]
-        for pl2 in con_plates:
-            pl2_gmsh_obj = gmsh_session.model_map[pl2]
-            res, res_map = gmsh_session.model.occ.fragment(
-                pl1_gmsh_obj.entities, pl2_gmsh_obj.entities, removeTool=False, removeObject=False
-            )
-
-            num_object_entities = len(pl1_gmsh_obj.entities)
-
-            # Split res_map into two parts: one for pl_gmsh_obj.entities and one for bm_gmsh_obj.entities
-            object_entities_new = []
-            tool_entities_new = []
-
-            for i, new_entities in enumerate(res_map):
-                if i < num_object_entities:
-                    # These correspond to the original object entities
-                    object_entities_new.extend(new_entities)
-                else:
-                    # These correspond to the original tool entities
-                    tool_entities_new.extend(new_entities)
-
-            # Update the entities for both objects
-            pl1_gmsh_obj.entities = object_entities_new
-            pl2_gmsh_obj.entities = tool_entities_new
+    _fragment_connected_plates(plate_con.edge_connected, gmsh_session)
 
     # Synchronize + validate once at the end. The previous version
     # called both inside the inner loop after every fragment, which
@@ -60,35 +45,7 @@ def partition_intersected_plates(plate_con: PlateConnections, gmsh_session: Gmsh
     """split plates that have plate connections at their mid-span"""
     logger.info("Running 'partition_intersected_plates' partitioning function")
 
-    for pl1, con_plates in plate_con.mid_span_connected.items():
-        pl1_gmsh_obj = gmsh_session.model_map[pl1]
-
-        for pl2 in con_plates:
-            pl2_gmsh_obj = gmsh_session.model_map[pl2]
-            if pl2 == pl1:
-                continue
-
-            res, res_map = gmsh_session.model.occ.fragment(
-                pl1_gmsh_obj.entities, pl2_gmsh_obj.entities, removeObject=False, removeTool=False
-            )
-
-            num_object_entities = len(pl1_gmsh_obj.entities)
-
-            # Split res_map into two parts: one for pl_gmsh_obj.entities and one for bm_gmsh_obj.entities
-            object_entities_new = []
-            tool_entities_new = []
-
-            for i, new_entities in enumerate(res_map):
-                if i < num_object_entities:
-                    # These correspond to the original object entities
-                    object_entities_new.extend(new_entities)
-                else:
-                    # These correspond to the original tool entities
-                    tool_entities_new.extend(new_entities)
-
-            # Update the entities for both objects
-            pl1_gmsh_obj.entities = object_entities_new
-            pl2_gmsh_obj.entities = tool_entities_new
+    _fragment_connected_plates(plate_con.mid_span_connected, gmsh_session)
 
     gmsh_session.model.occ.synchronize()
     gmsh_session.check_model_entities()
@@ -110,42 +67,20 @@ def split_plates_by_beams(gmsh_session: GmshSession):
     logger.info("Running 'split_plates_by_beams' partitioning function")
 
     plates = [obj for obj in gmsh_session.model_map.keys() if type(obj) is Plate]
+    contained_beams = find_beams_connected_to_plates(plates, beams)
     for pl in plates:
         pl_gmsh_obj = gmsh_session.model_map[pl]
-        int_bm_map = dict()
-        all_contained_beams = find_beams_connected_to_plate(pl, beams)
+        all_contained_beams = contained_beams[pl]
         inside_beams = filter_away_beams_along_plate_edges(pl, all_contained_beams)
         if len(inside_beams) == 0:
             continue
 
-        for bm in inside_beams:
-            bm_gmsh_obj = gmsh_session.model_map[bm]
-            for li_dim, li_ent in bm_gmsh_obj.entities:
-                int_bm_map[(li_dim, li_ent)] = bm_gmsh_obj
-
-            res, res_map = gmsh_session.model.occ.fragment(
-                pl_gmsh_obj.entities, bm_gmsh_obj.entities, removeTool=False, removeObject=False
-            )
-            num_object_entities = len(pl_gmsh_obj.entities)
-
-            # Split res_map into two parts: one for pl_gmsh_obj.entities and one for bm_gmsh_obj.entities
-            object_entities_new = []
-            tool_entities_new = []
+        # All beams inside the plate are imprinted in a single fragment call
+        bm_gmsh_objs = [gmsh_session.model_map[bm] for bm in inside_beams]
+        fragment_objects(gmsh_session, [pl_gmsh_obj], bm_gmsh_objs, remove_object=False, remove_tool=False)
 
-            for i, new_entities in enumerate(res_map):
-                if i < num_object_entities:
-                    # These correspond to the original object entities
-                    object_entities_new.extend(new_entities)
-                else:
-                    # These correspond to the original tool entities
-                    tool_entities_new.extend(new_entities)
-
-            # Update the entities for both objects
-            pl_gmsh_obj.entities = object_entities_new
-            bm_gmsh_obj.entities = tool_entities_new
-
-            if br_names is not None and "partition_bm_split_cut" in br_names:
-                gmsh_session.open_gui()
+        if br_names is not None and "partition_bm_split_cut" in br_names:
+            gmsh_session.open_gui()
 
     # Synchronize + validate once at end-of-function instead of after
     # every fragment. On the Mini example (245 plates / 855 beams / 666
@@ -154,3 +89,12 @@ def split_plates_by_beams(gmsh_session: GmshSession):
     # dominated the runtime.
     gmsh_session.model.occ.synchronize()
     gmsh_session.check_model_entities()
+
+
+def _fragment_connected_plates(connections: dict[Plate, list[Plate]], gmsh_session: GmshSession):
+    """Fragment each cluster of connected plates in one OCC call instead of once per connected pair"""
+    plates = list(dict.fromkeys([pl1 for pl1 in connections] + [pl2 for con in connections.values() for pl2 in con]))
+    index = {pl: i for i, pl in enumerate(plates)}
+    pairs = [(index[pl1], index[pl2]) for pl1, con in connections.items() for pl2 in con if pl2 != pl1]
+    gmsh_objs = [gmsh_session.model_map[pl] for pl in plates]
+    fragment_clusters(gmsh_session, gmsh_objs, pairs, remove_object=False, remove_tool=False)
@@ -1,5 +1,5 @@
 from ada import Beam, Part, Plate
-from ada.core.clash_check import find_beams_connected_to_plate
+from ada.core.clash_check import find_beams_connected_to_plates
 
 from . import GmshOptions, GmshSession
 
@@ -17,11 +17,13 @@ def mesh_mixed_shell_and_beams(p: Part):
                 gmap[obj] = pl.entities
 
         beams = list(p.get_all_physical_objects(by_type=Beam))
+        plates = list(p.get_all_physical_objects(by_type=Plate))
+        contained_beams = find_beams_connected_to_plates(plates, beams)
         gs.open_gui()
-        for pl in p.get_all_physical_objects(by_type=Plate):
+        for pl in plates:
             intersecting_beams = []
             for pl_dim, pl_ent in gmap[pl]:
-                for bm in find_beams_connected_to_plate(pl, beams):
+                for bm in contained_beams[pl]:
                     for li_dim, li_ent in gmap[bm]:
                         intersecting_beams.append(li_ent)
 
@@ -7,7 +7,9 @@ source and produces three artefact kinds:
 * ``fea.<field>.bin`` — one binary blob per field, all steps, step-major.
   Header is JSON in a fixed 1 KB prefix; payload is a contiguous
   ``[n_steps × n_points × n_components]`` float32 array. Frontend
-  range-fetches by step.
+  range-fetches by step. An opt-in v2 layout (:class:`BlobEncoding`)
+  stores one compressed, optionally quantized / delta-coded chunk
+  per step behind a chunk offset table.
 * ``fea.manifest.json`` — catalogue: mesh metadata, per-field metadata,
   pre-computed scalar ranges so the colormap stays fixed across steps.
 
@@ -24,20 +26,28 @@ import json
 import os
 import pathlib
 import struct
-from dataclasses import dataclass
-from dataclasses import field as dc_field
-from typing import Callable, Iterable, Iterator, Literal, Protocol
+import zlib
+from dataclasses import dataclass, field as dc_field
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Literal, Protocol
 
 import numpy as np
 
 from ada.fem.results.common import CellBlockData
 
+if TYPE_CHECKING:
+    from ada.fem.results.combinations import LoadCombinations
+
 # Binary format: 4-byte magic, uint32 version, uint32 json_len, JSON
 # header, zero-padded to 1024 bytes, then payload. Header version
 # bump signals a breaking layout change (e.g. variable-stride steps).
 BLOB_MAGIC = b"AFBL"
 BLOB_VERSION = 1
 BLOB_HEADER_BYTES = 1024
+# Encoded layout (opt-in via :class:`BlobEncoding`): same 1 KB header,
+# then a ``uint64[n_steps + 1]`` table of absolute chunk offsets, then
+# one compressed chunk per step. Raw v1 blobs stay the default so
+# consumers that slice fixed strides keep working.
+BLOB_ENCODED_VERSION = 2
 # v2 adds the optional ``history`` section (time-series at monitored
 # nodes / elements). v1 manifests carry only mesh + fields; v2 readers
 # treat ``history`` as optional so old artefacts keep loading.
@@ -52,6 +62,7 @@ MANIFEST_VERSION = 2
 # layout uniform.
 ELEM_FIELD_MAGIC = b"AFEL"
 ELEM_FIELD_VERSION = 1
+ELEM_FIELD_ENCODED_VERSION = 2  # chunked layout, as BLOB_ENCODED_VERSION
 # Same 1 KB prefix as AFBL — header carries only O(1) binary shape
 # metadata. ``element_labels`` and ``ip_layout`` live in the
 # manifest's ``per_type`` entry where they can grow with the model
@@ -363,6 +374,11 @@ class FEAStreamReader(Protocol):
     ``iter_element_field_steps``) are optional: a reader that yields
     no element fields can return an empty list. The bake skips the
     element-field emission loop entirely when no specs come back.
+
+    ``iter_steps_for_fields(specs)`` is optional too: readers that
+    can load one step for all of its fields at once yield
+    ``(index into specs, StepValues | ElementStepValues)`` step-major,
+    which the parallel bake prefers over one pass per field.
     """
 
     def read_mesh_geometry(self) -> MeshGeometry: ...
@@ -688,11 +704,11 @@ class FEAResultStreamAdapter:
 
     No real streaming benefit — the adapter already has the full
     FEAResult — but it lets formats that haven't been rewritten as
-    native streamers (SIF, FRD) flow through the same artefact
-    pipeline. When a big-model SIF or FRD case actually OOMs the
-    bake, the answer is to write a native streaming reader for that
-    format and replace the adapter for that format only; the
-    artefact code on top doesn't change.
+    native streamers (SIN by default) flow through the same artefact
+    pipeline. When a big-model case actually OOMs the bake, the
+    answer is to write a native streaming reader for that format
+    and replace the adapter for that format only (as SIF and FRD
+    have); the artefact code on top doesn't change.
     """
 
     def __init__(self, result):
@@ -1071,6 +1087,7 @@ class FieldArtefactMeta:
     stride_bytes: int
     scalar_range_per_component: dict[str, tuple[float, float]]
     scalar_range_magnitude: tuple[float, float]
+    encoding: dict | None = None  # the blob's ``encoding`` header entry; None for raw v1
 
 
 # ---------------------------------------------------------------------------
@@ -1460,7 +1477,180 @@ def write_beam_solids_edges(
 # ---------------------------------------------------------------------------
 
 
-def _encode_blob_header(spec: FieldSpec, stride_bytes: int) -> bytes:
+@dataclass(frozen=True)
+class BlobEncoding:
+    """Opt-in compressed layout for the AFBL / AFEL field blobs.
+
+    Each step is written as one chunk — the step's values as unsigned
+    integer codes (the float bits, or int16 quantization codes),
+    optionally differenced against the previous step, byte-shuffled
+    so equal-significance bytes sit together, then deflated with
+    ``zlib`` (browser-native via ``DecompressionStream("deflate")``).
+    A chunk offset table after the header keeps random access per
+    step.
+
+    * ``quantize="int16"``: lossy — each component is mapped onto
+      ``[-32767, 32767]`` against the field's scalar range (the same
+      numbers the manifest publishes, so the colour LUT and the codes
+      agree); ``-32768`` marks NaN. Needs a first pass over the steps
+      to compute the range before any chunk is written.
+    * ``delta``: chunks hold the difference (modulo the code width)
+      from the previous step's codes, which is lossless on the codes.
+      Every ``keyframe_interval``-th step is stored whole so reading
+      step ``i`` decodes at most ``keyframe_interval`` chunks.
+    """
+
+    level: int = 6
+    quantize: Literal["int16"] | None = None
+    delta: bool = False
+    keyframe_interval: int = 16
+
+    def header_entry(self, ranges: list[tuple[float, float]] | None) -> dict:
+        entry = {
+            "codec": "zlib",
+            "shuffle": True,
+            "quantize": self.quantize,
+            "delta": self.delta,
+            "keyframe_interval": self.keyframe_interval if self.delta else 1,
+        }
+        if self.quantize is not None:
+            entry["ranges"] = [list(r) for r in ranges]
+        return entry
+
+
+class _RangeTracker:
+    """NaN-safe per-component + magnitude (first 3 components) scalar
+    ranges, updated one step at a time. Components are the last axis
+    of the step array, so nodal ``(n_points, n_comp)`` and element
+    ``(n_elements, n_ips, n_comp)`` steps share the same tracking."""
+
+    def __init__(self, n_components: int):
+        self.n_components = n_components
+        self.comp_min = np.full(n_components, np.inf, dtype=np.float64)
+        self.comp_max = np.full(n_components, -np.inf, dtype=np.float64)
+        self.mag_min = np.inf
+        self.mag_max = -np.inf
+
+    def update(self, arr: np.ndarray) -> None:
+        # Range tracking, NaN-safe so profile-restricted fields
+        # don't poison the bounds.
+        finite = np.isfinite(arr)
+        for c in range(self.n_components):
+            col = arr[..., c][finite[..., c]]
+            if col.size:
+                self.comp_min[c] = min(self.comp_min[c], float(col.min()))
+                self.comp_max[c] = max(self.comp_max[c], float(col.max()))
+
+        if self.n_components >= 3:
+            # Magnitude over the first 3 components — for stress
+            # tensors this isn't the von Mises invariant but still
+            # gives a sensible default colour range; the von-Mises
+            # reduction is a frontend-side option.
+            mag = np.linalg.norm(arr[..., :3], axis=-1)
+            mag = mag[np.isfinite(mag)]
+            if mag.size:
+                self.mag_min = min(self.mag_min, float(mag.min()))
+                self.mag_max = max(self.mag_max, float(mag.max()))
+
+    def component_ranges(self) -> list[tuple[float, float]]:
+        # All-NaN component — fall back to (0, 0) so the manifest
+        # stays JSON-encodable.
+        return [
+            (float(lo), float(hi)) if np.isfinite(lo) and np.isfinite(hi) else (0.0, 0.0)
+            for lo, hi in zip(self.comp_min, self.comp_max)
+        ]
+
+    def magnitude_range(self) -> tuple[float, float]:
+        if not (np.isfinite(self.mag_min) and np.isfinite(self.mag_max)):
+            return 0.0, 0.0
+        return float(self.mag_min), float(self.mag_max)
+
+
+_QUANT_NAN = -32768
+_QUANT_SPAN = 65534  # codes -32767..32767
+
+
+def _step_codes(arr: np.ndarray, entry: dict) -> np.ndarray:
+    """The unsigned integer codes one step is stored as"""
+    if entry["quantize"] == "int16":
+        lo, hi = np.asarray(entry["ranges"], dtype=np.float64).T
+        scale = np.where(hi > lo, _QUANT_SPAN / np.where(hi > lo, hi - lo, 1.0), 0.0)
+        with np.errstate(invalid="ignore"):
+            q = np.rint((arr - lo) * scale) - 32767
+        codes = np.where(np.isfinite(arr), np.clip(q, -32767, 32767), _QUANT_NAN).astype(np.int16)
+        return codes.view(np.uint16)
+    return np.ascontiguousarray(arr).view(f"u{arr.dtype.itemsize}")
+
+
+def _codes_to_values(codes: np.ndarray, entry: dict, dtype: np.dtype) -> np.ndarray:
+    if entry["quantize"] == "int16":
+        lo, hi = np.asarray(entry["ranges"], dtype=np.float64).T
+        q = codes.view(np.int16)
+        values = lo + (q.astype(np.float64) + 32767) * ((hi - lo) / _QUANT_SPAN)
+        values[q == _QUANT_NAN] = np.nan
+        return values.astype(dtype)
+    return codes.view(dtype)
+
+
+def _pack_chunk(codes: np.ndarray, level: int) -> bytes:
+    # byte shuffle: all first bytes, then all second bytes, ...
+    planes = codes.reshape(-1).view(np.uint8).reshape(-1, codes.dtype.itemsize).T
+    return zlib.compress(np.ascontiguousarray(planes).tobytes(), level)
+
+
+def _unpack_chunk(chunk: bytes, code_dtype: np.dtype, shape: tuple) -> np.ndarray:
+    planes = np.frombuffer(zlib.decompress(chunk), dtype=np.uint8).reshape(code_dtype.itemsize, -1)
+    return np.ascontiguousarray(planes.T).view(code_dtype).reshape(shape)
+
+
+class _ChunkedStepWriter:
+    """Writes the offset table + one chunk per step of an encoded blob.
+    The table is reserved up front and filled in by :meth:`finish`."""
+
+    def __init__(self, f, n_steps: int, encoding: BlobEncoding, entry: dict):
+        self._f = f
+        self._encoding = encoding
+        self._entry = entry
+        self._offsets = [f.tell() + 8 * (n_steps + 1)]
+        self._table_pos = f.tell()
+        self._prev: np.ndarray | None = None
+        f.write(b"\x00" * 8 * (n_steps + 1))
+
+    def write(self, arr: np.ndarray) -> None:
+        codes = _step_codes(arr, self._entry)
+        step = len(self._offsets) - 1
+        keyframe = not self._encoding.delta or step % self._encoding.keyframe_interval == 0
+        self._f.write(_pack_chunk(codes if keyframe else codes - self._prev, self._encoding.level))
+        self._prev = codes
+        self._offsets.append(self._f.tell())
+
+    def finish(self) -> None:
+        end = self._f.tell()
+        self._f.seek(self._table_pos)
+        self._f.write(np.asarray(self._offsets, dtype="<u8").tobytes())
+        self._f.seek(end)
+
+
+def _read_encoded_step(path, header: dict, header_bytes: int, step_index: int, shape: tuple) -> np.ndarray:
+    """Decode one step of an encoded blob — from its keyframe when
+    the chunks are delta-coded."""
+    entry = header["encoding"]
+    dtype = np.dtype(header["dtype"])
+    code_dtype = np.dtype(np.uint16) if entry["quantize"] == "int16" else np.dtype(f"u{dtype.itemsize}")
+    first = step_index - step_index % entry["keyframe_interval"] if entry["delta"] else step_index
+    with open(path, "rb") as f:
+        f.seek(header_bytes + 8 * first)
+        offsets = np.frombuffer(f.read(8 * (step_index - first + 2)), dtype="<u8").astype(np.int64)
+        f.seek(offsets[0])
+        buf = f.read(offsets[-1] - offsets[0])
+    codes = None
+    for a, b in zip(offsets[:-1] - offsets[0], offsets[1:] - offsets[0]):
+        chunk = _unpack_chunk(buf[a:b], code_dtype, shape)
+        codes = chunk if codes is None else codes + chunk
+    return _codes_to_values(codes, entry, dtype)
+
+
+def _encode_blob_header(spec: FieldSpec, stride_bytes: int, encoding: dict | None = None) -> bytes:
     """Pack the JSON header + binary frame into the fixed-size prefix.
 
     Header carries only O(1) binary shape metadata — n_steps,
@@ -1468,7 +1658,8 @@ def _encode_blob_header(spec: FieldSpec, stride_bytes: int) -> bytes:
     values / scalar ranges all live in the manifest, where they
     belong. This keeps the binary header well under 1 KB no matter
     how many steps the field has, so the frontend can rely on a
-    fixed 1 KB initial range read.
+    fixed 1 KB initial range read. An encoded blob adds its
+    ``encoding`` entry (with the quantization ranges, O(n_components)).
     """
 
     header_obj = {
@@ -1479,91 +1670,47 @@ def _encode_blob_header(spec: FieldSpec, stride_bytes: int) -> bytes:
         "dtype": spec.dtype.name,
         "stride_bytes": stride_bytes,
     }
+    if encoding is not None:
+        header_obj["encoding"] = encoding
     json_bytes = json.dumps(header_obj, separators=(",", ":")).encode("utf-8")
     if 12 + len(json_bytes) > BLOB_HEADER_BYTES:
         raise ValueError(
             f"Blob header for field {spec.name!r} doesn't fit in "
             f"{BLOB_HEADER_BYTES} bytes (needs {12 + len(json_bytes)})."
         )
-    prefix = BLOB_MAGIC + struct.pack("<II", BLOB_VERSION, len(json_bytes)) + json_bytes
+    version = BLOB_VERSION if encoding is None else BLOB_ENCODED_VERSION
+    prefix = BLOB_MAGIC + struct.pack("<II", version, len(json_bytes)) + json_bytes
     return prefix + b"\x00" * (BLOB_HEADER_BYTES - len(prefix))
 
 
+def _nodal_step_array(spec: FieldSpec, sv: StepValues) -> np.ndarray:
+    arr = np.asarray(sv.values, dtype=spec.dtype)
+    if arr.ndim == 1:
+        arr = arr.reshape(-1, 1)
+    if arr.shape != (spec.n_points, spec.n_components):
+        raise ValueError(
+            f"Field {spec.name!r} step {sv.step_index} produced shape "
+            f"{arr.shape}, expected {(spec.n_points, spec.n_components)}."
+        )
+    return arr
+
+
 def write_field_blob_streaming(
     reader: FEAStreamReader,
     spec: FieldSpec,
     out_path: os.PathLike,
+    encoding: BlobEncoding | None = None,
 ) -> FieldArtefactMeta:
     """Stream one field's step-stack to disk; return the manifest meta.
 
     Computes the per-component and magnitude scalar ranges as steps
     pass through, so the bake never needs the full field stack in
-    memory.
+    memory. With an ``encoding`` the blob is written in the chunked
+    v2 layout; int16 quantization reads the steps twice (ranges
+    first, then the codes).
     """
 
-    out_path = pathlib.Path(out_path)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    stride = spec.n_points * spec.n_components * spec.dtype.itemsize
-
-    comp_min = np.full(spec.n_components, np.inf, dtype=np.float64)
-    comp_max = np.full(spec.n_components, -np.inf, dtype=np.float64)
-    mag_min = np.inf
-    mag_max = -np.inf
-
-    with open(out_path, "wb") as f:
-        f.write(_encode_blob_header(spec, stride))
-        seen = 0
-        for sv in reader.iter_field_steps(spec.name):
-            arr = np.asarray(sv.values, dtype=spec.dtype)
-            if arr.ndim == 1:
-                arr = arr.reshape(-1, 1)
-            if arr.shape != (spec.n_points, spec.n_components):
-                raise ValueError(
-                    f"Field {spec.name!r} step {sv.step_index} produced shape "
-                    f"{arr.shape}, expected {(spec.n_points, spec.n_components)}."
-                )
-            f.write(arr.tobytes(order="C"))
-
-            # Range tracking, NaN-safe so profile-restricted fields
-            # don't poison the bounds.
-            finite = np.isfinite(arr)
-            for c in range(spec.n_components):
-                col = arr[:, c][finite[:, c]]
-                if col.size:
-                    comp_min[c] = min(comp_min[c], float(col.min()))
-                    comp_max[c] = max(comp_max[c], float(col.max()))
-
-            if spec.n_components >= 3:
-                mag = np.linalg.norm(arr[:, :3], axis=1)
-                mag = mag[np.isfinite(mag)]
-                if mag.size:
-                    mag_min = min(mag_min, float(mag.min()))
-                    mag_max = max(mag_max, float(mag.max()))
-            seen += 1
-
-    if seen != spec.n_steps:
-        raise ValueError(f"Field {spec.name!r} streamed {seen} steps but spec says {spec.n_steps}.")
-
-    range_per_comp: dict[str, tuple[float, float]] = {}
-    for c, name in enumerate(spec.components):
-        if np.isfinite(comp_min[c]) and np.isfinite(comp_max[c]):
-            range_per_comp[name] = (float(comp_min[c]), float(comp_max[c]))
-        else:
-            # All-NaN field — fall back to (0, 0) so the manifest
-            # stays JSON-encodable.
-            range_per_comp[name] = (0.0, 0.0)
-
-    if not (np.isfinite(mag_min) and np.isfinite(mag_max)):
-        mag_min, mag_max = 0.0, 0.0
-
-    return FieldArtefactMeta(
-        spec=spec,
-        blob_filename=out_path.name,
-        stride_bytes=stride,
-        scalar_range_per_component=range_per_comp,
-        scalar_range_magnitude=(float(mag_min), float(mag_max)),
-    )
+    return _write_blob_job(reader, _FieldBlobJob(spec, out_path, encoding))
 
 
 # ---------------------------------------------------------------------------
@@ -1581,9 +1728,10 @@ class ElementFieldArtefactMeta:
     stride_bytes: int
     scalar_range_per_component: dict[str, tuple[float, float]]
     scalar_range_magnitude: tuple[float, float]
+    encoding: dict | None = None  # the blob's ``encoding`` header entry; None for raw v1
 
 
-def _encode_elem_field_blob_header(spec: ElementFieldSpec, stride_bytes: int) -> bytes:
+def _encode_elem_field_blob_header(spec: ElementFieldSpec, stride_bytes: int, encoding: dict | None = None) -> bytes:
     """Binary header for the AFEL blob — same 12-byte (magic + version
     + json_len) prefix shape as AFBL, zero-padded to 1 KB. JSON
     payload carries only O(1) shape metadata; ``element_labels`` and
@@ -1600,94 +1748,298 @@ def _encode_elem_field_blob_header(spec: ElementFieldSpec, stride_bytes: int) ->
         "dtype": spec.dtype.name,
         "stride_bytes": stride_bytes,
     }
+    if encoding is not None:
+        header_obj["encoding"] = encoding
     json_bytes = json.dumps(header_obj, separators=(",", ":")).encode("utf-8")
     if 12 + len(json_bytes) > ELEM_FIELD_HEADER_BYTES:
         raise ValueError(
             f"AFEL header for {spec.name!r}/{spec.elem_type} doesn't fit in "
             f"{ELEM_FIELD_HEADER_BYTES} bytes (needs {12 + len(json_bytes)})."
         )
-    prefix = ELEM_FIELD_MAGIC + struct.pack("<II", ELEM_FIELD_VERSION, len(json_bytes)) + json_bytes
+    version = ELEM_FIELD_VERSION if encoding is None else ELEM_FIELD_ENCODED_VERSION
+    prefix = ELEM_FIELD_MAGIC + struct.pack("<II", version, len(json_bytes)) + json_bytes
     return prefix + b"\x00" * (ELEM_FIELD_HEADER_BYTES - len(prefix))
 
 
+def _element_step_array(spec: ElementFieldSpec, sv: ElementStepValues) -> np.ndarray:
+    arr = np.asarray(sv.values, dtype=spec.dtype)
+    if arr.shape != (spec.n_elements, spec.n_ips, spec.n_components):
+        raise ValueError(
+            f"Element field {spec.name!r}/{spec.elem_type} step "
+            f"{sv.step_index} produced shape {arr.shape}, expected "
+            f"{(spec.n_elements, spec.n_ips, spec.n_components)}."
+        )
+    return np.ascontiguousarray(arr)
+
+
 def write_element_field_blob_streaming(
     reader: FEAStreamReader,
     spec: ElementFieldSpec,
     out_path: os.PathLike,
+    encoding: BlobEncoding | None = None,
 ) -> ElementFieldArtefactMeta:
     """Stream one (field, elem_type) bucket's step-stack to disk.
 
     Per-step payload shape is ``(n_elements, n_ips, n_components)``
     float32. Scalar ranges (per-component + magnitude over the first
     3 components when the field has at least 3) are computed inline
-    so the manifest can pin the colour LUT across all steps.
+    so the manifest can pin the colour LUT across all steps. An
+    ``encoding`` selects the chunked v2 layout, as for AFBL.
     """
 
-    out_path = pathlib.Path(out_path)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
+    return _write_blob_job(reader, _FieldBlobJob(spec, out_path, encoding))
+
+
+class _FieldBlobJob:
+    """One AFBL / AFEL blob written a step at a time: step validation,
+    range tracking, the raw or chunked payload and the manifest meta.
+    Shared by the one-field writers above and the parallel bake,
+    which feeds many jobs from one pass over the source."""
+
+    def __init__(self, spec: FieldSpec | ElementFieldSpec, out_path: os.PathLike, encoding: BlobEncoding | None):
+        self.spec = spec
+        self.out_path = pathlib.Path(out_path)
+        self.encoding = encoding
+        self.is_element = isinstance(spec, ElementFieldSpec)
+        self.tracker = _RangeTracker(spec.n_components)
+        self.entry: dict | None = None
+        self._f = None
+        self._chunks: _ChunkedStepWriter | None = None
+        self._seen = 0
+        if self.is_element:
+            self.stride = spec.n_elements * spec.n_ips * spec.n_components * spec.dtype.itemsize
+        else:
+            self.stride = spec.n_points * spec.n_components * spec.dtype.itemsize
 
-    n_components = spec.n_components
-    stride = spec.n_elements * spec.n_ips * n_components * spec.dtype.itemsize
+    @property
+    def needs_range_pass(self) -> bool:
+        # int16 codes are relative to the field's ranges, so those are
+        # needed before the first chunk is written
+        return self.encoding is not None and self.encoding.quantize is not None
+
+    def iter_steps(self, reader: FEAStreamReader):
+        if self.is_element:
+            return reader.iter_element_field_steps(self.spec)
+        return reader.iter_field_steps(self.spec.name)
+
+    def step_array(self, sv) -> np.ndarray:
+        if self.is_element:
+            return _element_step_array(self.spec, sv)
+        return _nodal_step_array(self.spec, sv)
+
+    def track(self, arr: np.ndarray) -> None:
+        self.tracker.update(arr)
+        self._seen += 1
+
+    def open(self) -> None:
+        if self.needs_range_pass:
+            self._check_count()
+            self._seen = 0
+        if self.encoding is not None:
+            self.entry = self.encoding.header_entry(self.tracker.component_ranges())
+        self.out_path.parent.mkdir(parents=True, exist_ok=True)
+        self._f = open(self.out_path, "wb")
+        if self.is_element:
+            self._f.write(_encode_elem_field_blob_header(self.spec, self.stride, self.entry))
+        else:
+            self._f.write(_encode_blob_header(self.spec, self.stride, self.entry))
+        if self.encoding is not None:
+            self._chunks = _ChunkedStepWriter(self._f, self.spec.n_steps, self.encoding, self.entry)
 
-    comp_min = np.full(n_components, np.inf, dtype=np.float64)
-    comp_max = np.full(n_components, -np.inf, dtype=np.float64)
-    mag_min = np.inf
-    mag_max = -np.inf
+    def write(self, arr: np.ndarray) -> None:
+        if self._chunks is None:
+            self._f.write(arr.tobytes(order="C"))
+        else:
+            self._chunks.write(arr)
+        if not self.needs_range_pass:
+            self.tracker.update(arr)
+        self._seen += 1
 
-    with open(out_path, "wb") as f:
-        f.write(_encode_elem_field_blob_header(spec, stride))
-        seen = 0
-        for sv in reader.iter_element_field_steps(spec):
-            arr = np.asarray(sv.values, dtype=spec.dtype)
-            if arr.shape != (spec.n_elements, spec.n_ips, n_components):
-                raise ValueError(
-                    f"Element field {spec.name!r}/{spec.elem_type} step "
-                    f"{sv.step_index} produced shape {arr.shape}, expected "
-                    f"{(spec.n_elements, spec.n_ips, n_components)}."
-                )
-            f.write(np.ascontiguousarray(arr).tobytes(order="C"))
-
-            finite = np.isfinite(arr)
-            for c in range(n_components):
-                col = arr[..., c][finite[..., c]]
-                if col.size:
-                    comp_min[c] = min(comp_min[c], float(col.min()))
-                    comp_max[c] = max(comp_max[c], float(col.max()))
-
-            if n_components >= 3:
-                # Magnitude over the first 3 components — for stress
-                # tensors this isn't the von Mises invariant but still
-                # gives a sensible default colour range; the von-Mises
-                # reduction is a frontend-side option.
-                first3 = arr[..., :3]
-                mag = np.linalg.norm(first3, axis=-1)
-                mag = mag[np.isfinite(mag)]
-                if mag.size:
-                    mag_min = min(mag_min, float(mag.min()))
-                    mag_max = max(mag_max, float(mag.max()))
-            seen += 1
-
-    if seen != spec.n_steps:
-        raise ValueError(
-            f"Element field {spec.name!r}/{spec.elem_type} streamed {seen} " f"steps but spec says {spec.n_steps}."
+    def close(self) -> None:
+        if self._f is None:
+            return
+        if self._chunks is not None:
+            self._chunks.finish()
+        self._f.close()
+        self._f = None
+
+    def _check_count(self) -> None:
+        spec = self.spec
+        if self._seen == spec.n_steps:
+            return
+        if self.is_element:
+            raise ValueError(
+                f"Element field {spec.name!r}/{spec.elem_type} streamed {self._seen} "
+                f"steps but spec says {spec.n_steps}."
+            )
+        raise ValueError(f"Field {spec.name!r} streamed {self._seen} steps but spec says {spec.n_steps}.")
+
+    def meta(self) -> FieldArtefactMeta | ElementFieldArtefactMeta:
+        self._check_count()
+        meta_cls = ElementFieldArtefactMeta if self.is_element else FieldArtefactMeta
+        return meta_cls(
+            spec=self.spec,
+            blob_filename=self.out_path.name,
+            stride_bytes=self.stride,
+            scalar_range_per_component=dict(zip(self.spec.components, self.tracker.component_ranges())),
+            scalar_range_magnitude=self.tracker.magnitude_range(),
+            encoding=self.entry,
         )
 
-    range_per_comp: dict[str, tuple[float, float]] = {}
-    for c, name in enumerate(spec.components):
-        if np.isfinite(comp_min[c]) and np.isfinite(comp_max[c]):
-            range_per_comp[name] = (float(comp_min[c]), float(comp_max[c]))
-        else:
-            range_per_comp[name] = (0.0, 0.0)
-    if not (np.isfinite(mag_min) and np.isfinite(mag_max)):
-        mag_min, mag_max = 0.0, 0.0
-
-    return ElementFieldArtefactMeta(
-        spec=spec,
-        blob_filename=out_path.name,
-        stride_bytes=stride,
-        scalar_range_per_component=range_per_comp,
-        scalar_range_magnitude=(float(mag_min), float(mag_max)),
-    )
+
+def _write_blob_job(reader: FEAStreamReader, job: _FieldBlobJob):
+    if job.needs_range_pass:
+        for sv in job.iter_steps(reader):
+            job.track(job.step_array(sv))
+    job.open()
+    try:
+        for sv in job.iter_steps(reader):
+            job.write(job.step_array(sv))
+    finally:
+        job.close()
+    return job.meta()
+
+
+# ---------------------------------------------------------------------------
+# Parallel field bake
+# ---------------------------------------------------------------------------
+
+# Default bound on the step arrays read but not yet written by the
+# parallel bake, in MB (overridden by ADA_FEA_BAKE_STEP_BUFFER_MB).
+BAKE_STEP_BUFFER_MB = 512
+
+
+def _bake_workers(workers: int | None) -> int:
+    """Writer threads for the field blobs: ``workers`` if given, else ``ADA_FEA_BAKE_WORKERS`` (default 1)."""
+    if workers is None:
+        try:
+            workers = int(os.environ.get("ADA_FEA_BAKE_WORKERS", "1"))
+        except ValueError:
+            workers = 1
+    return max(1, workers)
+
+
+def _step_buffer_bytes(step_buffer_bytes: int | None) -> int:
+    if step_buffer_bytes is None:
+        try:
+            mb = float(os.environ.get("ADA_FEA_BAKE_STEP_BUFFER_MB", BAKE_STEP_BUFFER_MB))
+        except ValueError:
+            mb = BAKE_STEP_BUFFER_MB
+        step_buffer_bytes = int(mb * 1024 * 1024)
+    return max(1, step_buffer_bytes)
+
+
+def iter_steps_shared(reader: FEAStreamReader, specs: list) -> Iterator[tuple[int, StepValues | ElementStepValues]]:
+    """One pass over the source for several nodal / element fields, as
+    ``(index into specs, step)`` pairs. Readers that can load a step
+    once for all of its fields implement ``iter_steps_for_fields``
+    (step-major); otherwise each field is iterated in turn."""
+
+    shared = getattr(reader, "iter_steps_for_fields", None)
+    if shared is not None:
+        yield from shared(specs)
+        return
+    for i, spec in enumerate(specs):
+        steps = reader.iter_element_field_steps(spec) if isinstance(spec, ElementFieldSpec) else None
+        for sv in steps if steps is not None else reader.iter_field_steps(spec.name):
+            yield i, sv
+
+
+class _StepBuffer:
+    """Bytes of step arrays handed to the writer threads but not yet
+    written. A step larger than the whole budget still goes through,
+    alone."""
+
+    def __init__(self, limit: int):
+        import threading
+
+        self.limit = limit
+        self._used = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, n: int) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: self._used == 0 or self._used + n <= self.limit)
+            self._used += n
+
+    def release(self, n: int) -> None:
+        with self._cond:
+            self._used -= n
+            self._cond.notify_all()
+
+
+def _fan_out(reader: FEAStreamReader, jobs: list[_FieldBlobJob], method: str, workers: int, buffer_bytes: int):
+    """Read the steps of ``jobs`` in one shared pass and run
+    ``job.<method>(arr)`` on a pool of writer threads. Every job is
+    pinned to one thread, so its steps are handled in order; the
+    reduce / encode / write work of different fields overlaps (numpy
+    reductions, zlib and file writes release the GIL)."""
+
+    import queue
+    import threading
+
+    budget = _StepBuffer(buffer_bytes)
+    lanes: list[queue.Queue] = [queue.Queue() for _ in range(min(workers, len(jobs)))]
+    errors: list[BaseException] = []
+
+    def drain(lane: queue.Queue) -> None:
+        while True:
+            item = lane.get()
+            if item is None:
+                return
+            job, arr = item
+            try:
+                if not errors:
+                    getattr(job, method)(arr)
+            except BaseException as exc:  # noqa: BLE001 — re-raised on the reading thread
+                errors.append(exc)
+            finally:
+                budget.release(arr.nbytes)
+
+    threads = [threading.Thread(target=drain, args=(lane,), daemon=True) for lane in lanes]
+    for t in threads:
+        t.start()
+    try:
+        for i, sv in iter_steps_shared(reader, [job.spec for job in jobs]):
+            if errors:
+                break
+            job = jobs[i]
+            arr = job.step_array(sv)
+            budget.acquire(arr.nbytes)
+            lanes[i % len(lanes)].put((job, arr))
+    finally:
+        for lane in lanes:
+            lane.put(None)
+        for t in threads:
+            t.join()
+    if errors:
+        raise errors[0]
+
+
+def write_field_blobs_parallel(
+    reader: FEAStreamReader,
+    jobs: list[_FieldBlobJob],
+    workers: int,
+    step_buffer_bytes: int,
+) -> list:
+    """Write many field blobs from one shared pass over the source
+    (two when a quantized encoding needs the ranges first). Peak
+    memory for the in-flight steps is capped at ``step_buffer_bytes``.
+    Returns the metas in ``jobs`` order."""
+
+    if not jobs:
+        return []
+    ranged = [job for job in jobs if job.needs_range_pass]
+    if ranged:
+        _fan_out(reader, ranged, "track", workers, step_buffer_bytes)
+    try:
+        for job in jobs:
+            job.open()
+        _fan_out(reader, jobs, "write", workers, step_buffer_bytes)
+    finally:
+        for job in jobs:
+            job.close()
+    return [job.meta() for job in jobs]
 
 
 # ---------------------------------------------------------------------------
@@ -1821,6 +2173,7 @@ def build_manifest(
                     "stride_bytes": fm.stride_bytes,
                     "dtype": spec.dtype.name,
                     "byte_order": "little",
+                    **({"encoding": fm.encoding} if fm.encoding is not None else {}),
                 },
                 "n_steps": spec.n_steps,
                 "steps": steps,
@@ -1897,6 +2250,7 @@ def build_manifest(
                         "stride_bytes": em.stride_bytes,
                         "dtype": es.dtype.name,
                         "byte_order": "little",
+                        **({"encoding": em.encoding} if em.encoding is not None else {}),
                     },
                     "scalar_range": {k: list(v) for k, v in em.scalar_range_per_component.items()},
                 }
@@ -2186,6 +2540,27 @@ def _make_sin_reader(path: pathlib.Path) -> "FEAStreamReader":
     return FEAResultStreamAdapter(read_sin_file(path))
 
 
+def _make_frd_reader(path: pathlib.Path) -> "FEAStreamReader":
+    # Default: the native FrdStreamReader — a byte-offset index over the
+    # mmapped .frd and one fixed-width numpy parse per result block, so a
+    # long transient run bakes with one step of one field resident.
+    # ADA_FEA_FRD_STREAMER=0/false/off forces the full-materialise adapter
+    # over read_from_frd_file_proto (e.g. to rule the streamer out when
+    # triaging).
+    import os
+
+    if os.environ.get("ADA_FEA_FRD_STREAMER", "").strip().lower() in {"0", "false", "no", "off"}:
+        from ada.fem.formats.calculix.results.read_frd_file import (
+            read_from_frd_file_proto,
+        )
+
+        return FEAResultStreamAdapter(read_from_frd_file_proto(path))
+
+    from ada.fem.formats.calculix.results.frd_stream import FrdStreamReader
+
+    return FrdStreamReader(path)
+
+
 def _make_fem_reader(path: pathlib.Path) -> "FEAStreamReader":
     """Stream-reader for a results-less FEM mesh (.inp / .fem).
 
@@ -2272,6 +2647,7 @@ def _ensure_builtin_stream_readers() -> None:
     _STREAM_READERS.setdefault(".rmed", _make_rmed_reader)
     _STREAM_READERS.setdefault(".sif", _make_sif_reader)
     _STREAM_READERS.setdefault(".sin", _make_sin_reader)
+    _STREAM_READERS.setdefault(".frd", _make_frd_reader)
     # Design-model FEM meshes flow through the same streaming bake (mesh + beam-solids, no
     # result fields) so FE-mesh visualisation has a single path. (.rmed keeps its native
     # results streamer above; plain .med is a mesh-only deck read via from_fem.)
@@ -2320,6 +2696,11 @@ def bake_fea_artefacts_from_source(
     src_key: str = "",
     source_sha256: str | None = None,
     legacy_glb_url_template: str | None = None,
+    blob_encoding: BlobEncoding | None = None,
+    field_workers: int | None = None,
+    step_buffer_bytes: int | None = None,
+    derived_fields: bool = False,
+    combinations: LoadCombinations | None = None,
 ) -> "BakeResult":
     """End-to-end bake from a source file path. Picks the right
     reader for the extension and drives the streaming bake. Raises
@@ -2336,6 +2717,11 @@ def bake_fea_artefacts_from_source(
             src=src,
             source_sha256=source_sha256,
             legacy_glb_url_template=legacy_glb_url_template,
+            blob_encoding=blob_encoding,
+            field_workers=field_workers,
+            step_buffer_bytes=step_buffer_bytes,
+            derived_fields=derived_fields,
+            combinations=combinations,
         )
 
 
@@ -2357,6 +2743,11 @@ def bake_artefacts(
     nodal_only: bool = True,
     include_element_fields: bool = True,
     on_artefact: Callable[[pathlib.Path], None] | None = None,
+    blob_encoding: BlobEncoding | None = None,
+    field_workers: int | None = None,
+    step_buffer_bytes: int | None = None,
+    derived_fields: bool = False,
+    combinations: LoadCombinations | None = None,
 ) -> BakeResult:
     """Drive the streaming bake end-to-end.
 
@@ -2380,7 +2771,44 @@ def bake_artefacts(
     construction reads only in-memory metas (never the blob bytes), so
     a sink that deletes the file after shipping it is safe. The
     returned ``BakeResult`` still lists every path; whether those
-    files survive on disk is the sink's choice."""
+    files survive on disk is the sink's choice.
+
+    ``blob_encoding``: write the field blobs in the compressed,
+    chunked v2 layout (see :class:`BlobEncoding`) instead of raw
+    float32 strides. Off by default.
+
+    ``field_workers``: writer threads for the field blobs (default
+    ``ADA_FEA_BAKE_WORKERS``, else 1 — one field at a time). Above 1
+    every step is read once for all fields (see
+    :func:`write_field_blobs_parallel`) and the blobs are emitted
+    once all of them are written. ``step_buffer_bytes`` caps the
+    step arrays held between the read and the writers (default
+    ``ADA_FEA_BAKE_STEP_BUFFER_MB`` MB, else
+    ``BAKE_STEP_BUFFER_MB``).
+
+    ``derived_fields``: also bake von Mises, Tresca and principal
+    stresses of every stress field and the resultant of every
+    displacement field as ``"<field>.<kind>"`` fields (see
+    :class:`~ada.fem.results.derived.DerivedFieldsReader`).
+
+    ``combinations``: also bake the envelope of every field with all
+    basic cases of the load combinations as single-step
+    ``"<field>.ENV_MAX"`` / ``ENV_MIN`` / ``ENV_ABSMAX`` / ``ENV_GOVERNING``
+    fields (see
+    :class:`~ada.fem.results.combinations.CombinationEnvelopeReader`).
+    Derived fields are not enveloped."""
+
+    linear_fields = None
+    if combinations is not None:
+        linear_fields = {s.name for s in reader.field_specs()} | {s.name for s in reader.element_field_specs()}
+    if derived_fields:
+        from ada.fem.results.derived import DerivedFieldsReader
+
+        reader = DerivedFieldsReader(reader)
+    if combinations is not None:
+        from ada.fem.results.combinations import CombinationEnvelopeReader
+
+        reader = CombinationEnvelopeReader(reader, combinations, fields=linear_fields)
 
     out_dir = pathlib.Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -2458,18 +2886,8 @@ def bake_artefacts(
         n_beam_solid_edges = write_beam_solids_edges(solid_beams, beam_solids_edges_path)
         emit(beam_solids_edges_path)
 
-    field_metas: list[FieldArtefactMeta] = []
-    blob_paths: list[pathlib.Path] = []
-    for spec in reader.field_specs():
-        if nodal_only and spec.support != "nodal":
-            continue
-        blob_path = out_dir / f"fea.{spec.name}.bin"
-        meta = write_field_blob_streaming(reader, spec, blob_path)
-        field_metas.append(meta)
-        blob_paths.append(blob_path)
-        emit(blob_path)
-
-    elem_field_metas: list[ElementFieldArtefactMeta] = []
+    nodal_specs = [spec for spec in reader.field_specs() if not (nodal_only and spec.support != "nodal")]
+    elem_specs: list[ElementFieldSpec] = []
     if include_element_fields:
         # Best-effort: a reader that hasn't implemented the
         # element-field protocol yet (returns from a Protocol stub or
@@ -2480,14 +2898,29 @@ def bake_artefacts(
             elem_specs = reader.element_field_specs()
         except (AttributeError, NotImplementedError):
             elem_specs = []
-        for es in elem_specs:
-            # Filename includes elem_type so each (field, type) bucket
-            # gets a distinct file the frontend can range-fetch.
-            blob_path = out_dir / f"fea.{es.name}.{es.elem_type}.elements.bin"
-            em = write_element_field_blob_streaming(reader, es, blob_path)
-            elem_field_metas.append(em)
-            blob_paths.append(blob_path)
-            emit(blob_path)
+
+    # Filenames include elem_type so each element (field, type) bucket
+    # gets a distinct file the frontend can range-fetch.
+    jobs = [_FieldBlobJob(spec, out_dir / f"fea.{spec.name}.bin", blob_encoding) for spec in nodal_specs]
+    jobs += [
+        _FieldBlobJob(es, out_dir / f"fea.{es.name}.{es.elem_type}.elements.bin", blob_encoding) for es in elem_specs
+    ]
+    workers = _bake_workers(field_workers)
+    if workers > 1 and len(jobs) > 1:
+        # Each step is read once for all fields; the per-field reduce /
+        # encode / write runs on the writer threads.
+        metas = write_field_blobs_parallel(reader, jobs, workers, _step_buffer_bytes(step_buffer_bytes))
+        for job in jobs:
+            emit(job.out_path)
+    else:
+        metas = []
+        for job in jobs:
+            metas.append(_write_blob_job(reader, job))
+            emit(job.out_path)
+
+    field_metas: list[FieldArtefactMeta] = metas[: len(nodal_specs)]
+    elem_field_metas: list[ElementFieldArtefactMeta] = metas[len(nodal_specs) :]
+    blob_paths: list[pathlib.Path] = [job.out_path for job in jobs]
 
     # History output — time series at monitored points. Optional; the
     # bake tolerates readers that pre-date the method (AttributeError)
@@ -2794,20 +3227,23 @@ def read_blob_header(path: os.PathLike) -> dict:
     if prefix[:4] != BLOB_MAGIC:
         raise ValueError(f"{path}: not an AFBL blob (magic {prefix[:4]!r}).")
     version, json_len = struct.unpack("<II", prefix[4:12])
-    if version != BLOB_VERSION:
-        raise ValueError(f"{path}: blob version {version}, expected {BLOB_VERSION}.")
+    if version not in (BLOB_VERSION, BLOB_ENCODED_VERSION):
+        raise ValueError(f"{path}: blob version {version}, expected {BLOB_VERSION} or {BLOB_ENCODED_VERSION}.")
     return json.loads(prefix[12 : 12 + json_len].decode("utf-8"))
 
 
 def read_blob_step(path: os.PathLike, step_index: int) -> np.ndarray:
     """Read one step's payload from an AFBL blob. Used by tests; the
-    frontend equivalent is a Range fetch."""
+    frontend equivalent is a Range fetch. Encoded (v2) blobs are
+    decoded transparently."""
 
     header = read_blob_header(path)
     if step_index < 0 or step_index >= header["n_steps"]:
         raise IndexError(step_index)
     n_points = header["n_points"]
     n_components = header["n_components"]
+    if "encoding" in header:
+        return _read_encoded_step(path, header, BLOB_HEADER_BYTES, step_index, (n_points, n_components))
     dtype = np.dtype(header["dtype"])
     stride = header["stride_bytes"]
     offset = BLOB_HEADER_BYTES + step_index * stride
@@ -2828,8 +3264,10 @@ def read_elem_field_blob_header(path: os.PathLike) -> dict:
     if prefix[:4] != ELEM_FIELD_MAGIC:
         raise ValueError(f"{path}: not an AFEL blob (magic {prefix[:4]!r}).")
     version, json_len = struct.unpack("<II", prefix[4:12])
-    if version != ELEM_FIELD_VERSION:
-        raise ValueError(f"{path}: AFEL version {version}, expected {ELEM_FIELD_VERSION}.")
+    if version not in (ELEM_FIELD_VERSION, ELEM_FIELD_ENCODED_VERSION):
+        raise ValueError(
+            f"{path}: AFEL version {version}, expected {ELEM_FIELD_VERSION} or {ELEM_FIELD_ENCODED_VERSION}."
+        )
     return json.loads(prefix[12 : 12 + json_len].decode("utf-8"))
 
 
@@ -2843,6 +3281,9 @@ def read_elem_field_blob_step(path: os.PathLike, step_index: int) -> np.ndarray:
     n_elements = header["n_elements"]
     n_ips = header["n_ips"]
     n_components = header["n_components"]
+    if "encoding" in header:
+        shape = (n_elements, n_ips, n_components)
+        return _read_encoded_step(path, header, ELEM_FIELD_HEADER_BYTES, step_index, shape)
     dtype = np.dtype(header["dtype"])
     stride = header["stride_bytes"]
     offset = ELEM_FIELD_HEADER_BYTES + step_index * stride
@@ -0,0 +1,312 @@
+"""Linear load combinations over unit-case results.
+
+A :class:`LoadCombinations` is a coefficient matrix: one row per combination, one column
+per basic case (a step id in the result). Combined fields are never stored; they are
+evaluated from the stack of case values as one matrix multiply per chunk of rows:
+
+* :class:`CombinedField` gives single combinations lazily and the :class:`Envelope`
+  (min / max / abs-max and the governing combination of each) over all of them, holding
+  only ``n_combinations x chunk_rows`` combined values at a time;
+* ``FEAResult.combine`` and ``SQLiteFEAStore.combine_field`` build a
+  :class:`CombinedField` from stored unit cases;
+* :class:`CombinationEnvelopeReader` wraps a streaming bake reader so the artefact bake
+  writes each field's envelope as extra fields.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Hashable, Iterator, Mapping
+
+import numpy as np
+
+from ada.config import logger
+
+if TYPE_CHECKING:
+    from ada.fem.results.common import FEAResult
+    from ada.fem.results.field_data import FieldData
+
+# Rows per matrix multiply when enveloping: bounds the combined block to
+# n_combinations x ENVELOPE_CHUNK_ROWS x n_components values.
+ENVELOPE_CHUNK_ROWS = 4096
+
+
+@dataclass
+class LoadCombinations:
+    """``coefficients[i, j]`` is the factor of basic case ``case_ids[j]`` in
+    combination ``combination_ids[i]``."""
+
+    combination_ids: list[Hashable]
+    case_ids: list[int]
+    coefficients: np.ndarray  # (n_combinations, n_cases)
+
+    def __post_init__(self):
+        self.coefficients = np.asarray(self.coefficients, dtype=float)
+        if self.coefficients.shape != (len(self.combination_ids), len(self.case_ids)):
+            raise ValueError(
+                f"Coefficient matrix is {self.coefficients.shape}, expected "
+                f"{(len(self.combination_ids), len(self.case_ids))} (combinations x cases)"
+            )
+
+    @staticmethod
+    def from_dict(combinations: Mapping[Hashable, Mapping[int, float]]) -> LoadCombinations:
+        """From ``{combination id: {case id: factor}}`` — the shape
+        ``read_result_combinations`` returns for a SIN's RDRESCMB records."""
+        case_ids = sorted({case for factors in combinations.values() for case in factors})
+        column = {case: j for j, case in enumerate(case_ids)}
+        coefficients = np.zeros((len(combinations), len(case_ids)))
+        for i, factors in enumerate(combinations.values()):
+            for case, factor in factors.items():
+                coefficients[i, column[case]] += factor
+        return LoadCombinations(list(combinations), case_ids, coefficients)
+
+    def __len__(self) -> int:
+        return len(self.combination_ids)
+
+    def row(self, combination_id: Hashable) -> np.ndarray:
+        try:
+            return self.coefficients[self.combination_ids.index(combination_id)]
+        except ValueError:
+            raise KeyError(f"Unknown combination {combination_id!r}") from None
+
+
+@dataclass
+class Envelope:
+    """Per-value extremes over all combinations; ``governing_*`` hold the combination id
+    index (into ``LoadCombinations.combination_ids``) that produced each extreme."""
+
+    max: np.ndarray
+    min: np.ndarray
+    absmax: np.ndarray
+    governing_max: np.ndarray
+    governing_min: np.ndarray
+    governing_absmax: np.ndarray
+
+
+def envelope(coefficients: np.ndarray, stack: np.ndarray, chunk_rows: int = ENVELOPE_CHUNK_ROWS) -> Envelope:
+    """Envelope of ``coefficients @ stack`` over the combinations, one chunk of rows at a time.
+
+    ``stack`` is ``(n_cases, n_rows, ...)``. The abs-max keeps the sign of the governing
+    value."""
+    n_rows = stack.shape[1]
+    tail = stack.shape[2:]
+    out = {k: np.empty((n_rows,) + tail) for k in ("max", "min", "absmax")}
+    gov = {k: np.empty((n_rows,) + tail, dtype=np.int64) for k in ("max", "min", "absmax")}
+    for start in range(0, n_rows, max(1, chunk_rows)):
+        stop = min(start + chunk_rows, n_rows)
+        block = stack[:, start:stop]
+        combined = (coefficients @ block.reshape(len(block), -1)).reshape((len(coefficients),) + block.shape[1:])
+        i_max = combined.argmax(axis=0)
+        i_min = combined.argmin(axis=0)
+        i_abs = np.abs(combined).argmax(axis=0)
+        for key, idx in (("max", i_max), ("min", i_min), ("absmax", i_abs)):
+            gov[key][start:stop] = idx
+            out[key][start:stop] = np.take_along_axis(combined, idx[None], axis=0)[0]
+    return Envelope(out["max"], out["min"], out["absmax"], gov["max"], gov["min"], gov["absmax"])
+
+
+class CombinedField:
+    """A field's unit-case stack together with the combinations to evaluate over it.
+
+    ``stack`` is ``(n_cases, n_rows, n_components)`` in ``combinations.case_ids`` order.
+    ``template`` (optional) is one case's field-data object; :meth:`field_data` copies
+    its leading label columns and class onto a combined step."""
+
+    def __init__(self, combinations: LoadCombinations, stack: np.ndarray, template: FieldData | None = None):
+        if stack.shape[0] != len(combinations.case_ids):
+            raise ValueError(f"Case stack has {stack.shape[0]} cases, combinations use {len(combinations.case_ids)}")
+        self.combinations = combinations
+        self.stack = stack
+        self.template = template
+        self._envelope: Envelope | None = None
+
+    def __getitem__(self, combination_id: Hashable) -> np.ndarray:
+        return np.tensordot(self.combinations.row(combination_id), self.stack, axes=1)
+
+    def __iter__(self) -> Iterator[tuple[Hashable, np.ndarray]]:
+        for i, combination_id in enumerate(self.combinations.combination_ids):
+            yield combination_id, np.tensordot(self.combinations.coefficients[i], self.stack, axes=1)
+
+    def envelope(self, chunk_rows: int = ENVELOPE_CHUNK_ROWS) -> Envelope:
+        if self._envelope is None:
+            self._envelope = envelope(self.combinations.coefficients, self.stack, chunk_rows)
+        return self._envelope
+
+    def field_data(self, combination_id: Hashable) -> FieldData:
+        """Combination ``combination_id`` as a field-data object shaped like the template's."""
+        if self.template is None:
+            raise ValueError("No template field data to shape the combined field on")
+        values = self[combination_id]
+        source = np.asarray(self.template.values)
+        if source.ndim == 2:
+            n_lead = len(self.template.COLS)
+            values = np.concatenate([source[:, :n_lead], values.reshape(len(source), -1)], axis=1)
+        out = dataclasses.replace(self.template, name=f"{self.template.name}@{combination_id}", values=values)
+        out._mesh = getattr(self.template, "_mesh", None)
+        return out
+
+
+def combine_result_field(result: FEAResult, field: str, combinations: LoadCombinations) -> CombinedField:
+    """Stack the basic cases of ``field`` in ``result`` (by step id) for combining."""
+    items = {x.step: x for x in result.get_results_grouped_by_field_value().get(field, [])}
+    missing = [case for case in combinations.case_ids if case not in items]
+    if missing:
+        raise ValueError(f"Field {field!r} has no steps {missing}; available are {sorted(items)}")
+
+    def components(fd) -> np.ndarray:
+        values = np.asarray(fd.values)
+        if values.ndim == 3:
+            return values
+        n_lead = len(fd.COLS)
+        return values[:, n_lead : n_lead + len(fd.components)]
+
+    cases = [items[case] for case in combinations.case_ids]
+    stack = np.stack([components(fd) for fd in cases])
+    return CombinedField(combinations, stack, template=cases[0])
+
+
+# ---------------------------------------------------------------------------
+# Bake reader wrapper
+# ---------------------------------------------------------------------------
+
+ENVELOPE_KINDS = ("MAX", "MIN", "ABSMAX", "GOVERNING")
+
+
+class CombinationEnvelopeReader:
+    """``FEAStreamReader`` that adds, for every nodal and element field of the
+    wrapped reader, single-step ``"<field>.ENV_<kind>"`` fields: the max, min and
+    abs-max over ``combinations`` and the combination index governing the abs-max.
+
+    A field's unit cases are read once and stacked; the combinations are never all
+    held at once. Cases are matched on the wrapped reader's ``step_ids()`` when it
+    has one (the Sesam readers: their nodal ``step_values`` may be LIS
+    eigenfrequencies), else on the spec's ``step_values``. Fields that lack a
+    basic case are left without an envelope, with a warning, as are (silently)
+    fields not named in ``fields`` when it is given (derived fields such as von
+    Mises are not linear in the cases, so their envelope cannot be combined this
+    way)."""
+
+    # Envelope fields need their source field's whole case stack, so the bake's
+    # shared step pass falls back to reading one field at a time.
+    iter_steps_for_fields = None
+
+    def __init__(
+        self,
+        reader,
+        combinations: LoadCombinations,
+        chunk_rows: int = ENVELOPE_CHUNK_ROWS,
+        fields: set[str] | None = None,
+    ):
+        self._reader = reader
+        self.combinations = combinations
+        self.fields = fields
+        self.chunk_rows = chunk_rows
+        self._sources: dict[tuple[str, str | None], tuple] = {}
+        self._envelopes: dict[tuple[str, str | None], Envelope] = {}
+        self._field_specs = None
+        self._element_field_specs = None
+
+    def __getattr__(self, item):
+        return getattr(self._reader, item)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._reader.close()
+
+    @staticmethod
+    def _key(spec) -> tuple[str, str | None]:
+        return spec.name, getattr(spec, "elem_type", None)
+
+    def _case_steps(self, spec) -> list[int] | None:
+        """The step index of each basic case in ``spec``'s steps, or ``None`` (with a
+        warning) when a case is missing."""
+        step_ids = getattr(self._reader, "step_ids", None)
+        labels = step_ids() if callable(step_ids) else spec.step_values
+        position = {float(label): i for i, label in enumerate(labels)}
+        missing = [c for c in self.combinations.case_ids if float(c) not in position]
+        if missing:
+            logger.warning(f"No load combination envelope for {spec.name!r}: basic cases {missing} not found")
+            return None
+        return [position[float(c)] for c in self.combinations.case_ids]
+
+    def _envelope_specs(self, specs: list) -> list:
+        out = []
+        for spec in specs:
+            if self.fields is not None and spec.name not in self.fields:
+                continue
+            steps = self._case_steps(spec)
+            if steps is None:
+                continue
+            for kind in ENVELOPE_KINDS:
+                env = dataclasses.replace(
+                    spec, name=f"{spec.name}.ENV_{kind}", n_steps=1, step_values=[0.0], category="other"
+                )
+                self._sources[self._key(env)] = (spec, kind, steps)
+                out.append(env)
+        return out
+
+    def field_specs(self):
+        if self._field_specs is None:
+            specs = self._reader.field_specs()
+            self._field_specs = [*specs, *self._envelope_specs([s for s in specs if s.support == "nodal"])]
+        return self._field_specs
+
+    def element_field_specs(self):
+        if self._element_field_specs is None:
+            specs = self._reader.element_field_specs()
+            self._element_field_specs = [*specs, *self._envelope_specs(specs)]
+        return self._element_field_specs
+
+    def _envelope_for(self, spec, case_steps: list[int]) -> Envelope:
+        key = self._key(spec)
+        env = self._envelopes.get(key)
+        if env is None:
+            from ada.fem.results.artefacts import ElementFieldSpec
+
+            if isinstance(spec, ElementFieldSpec):
+                steps = self._reader.iter_element_field_steps(spec)
+            else:
+                steps = self._reader.iter_field_steps(spec.name)
+            wanted = {step: j for j, step in enumerate(case_steps)}
+            stack = None
+            for sv in steps:
+                j = wanted.get(sv.step_index)
+                if j is None:
+                    continue
+                values = np.asarray(sv.values, dtype=np.float64)
+                if stack is None:
+                    stack = np.empty((len(wanted),) + values.shape)
+                stack[j] = values
+            env = self._envelopes[key] = envelope(self.combinations.coefficients, stack, self.chunk_rows)
+        return env
+
+    def _envelope_step(self, spec, kind: str, case_steps: list[int], step_type):
+        env = self._envelope_for(spec, case_steps)
+        values = {"MAX": env.max, "MIN": env.min, "ABSMAX": env.absmax, "GOVERNING": env.governing_absmax}[kind]
+        return step_type(step_index=0, step_value=0.0, values=values.astype(np.float32))
+
+    def iter_field_steps(self, field_name: str):
+        from ada.fem.results.artefacts import StepValues
+
+        self.field_specs()
+        source = self._sources.get((field_name, None))
+        if source is None:
+            yield from self._reader.iter_field_steps(field_name)
+            return
+        yield self._envelope_step(*source, StepValues)
+
+    def iter_element_field_steps(self, spec):
+        from ada.fem.results.artefacts import ElementStepValues
+
+        self.element_field_specs()
+        source = self._sources.get(self._key(spec))
+        if source is None:
+            yield from self._reader.iter_element_field_steps(spec)
+            return
+        yield self._envelope_step(*source, ElementStepValues)
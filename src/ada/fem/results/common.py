@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 import pathlib
 from dataclasses import dataclass, field
@@ -22,7 +23,9 @@ if TYPE_CHECKING:
 
     from ada import Material, Node, Section
     from ada.fem import Elem, FemSet
+    from ada.fem.results.combinations import CombinedField, LoadCombinations
     from ada.fem.results.concepts import EigenDataSummary
+    from ada.fem.results.derived import DerivedFieldEngine
     from ada.visit.colors import Color
 
 
@@ -164,6 +167,82 @@ class MeshStore:
             )
 
 
+@dataclass(frozen=True)
+class _ShapeTemplates:
+    """Per-element-type index templates into one element's node list."""
+
+    edges: np.ndarray  # (n_edges, 2)
+    tris: np.ndarray | None  # (n_tris, 3); None for line-like elements
+    polys: np.ndarray | None  # (n_faces, 4) solid faces padded with -1; None for non-solids
+    tri_face: np.ndarray | None  # (n_tris,) index into ``polys`` of each triangle
+
+
+@functools.lru_cache(maxsize=None)
+def _shape_templates(el_type, n_nodes: int) -> _ShapeTemplates:
+    """Templates read off an ``ElemShape`` over the node positions ``0..n_nodes-1``, so the
+    vectorized path reproduces the per-element ``edges`` / ``get_faces()`` exactly."""
+    from ada.fem.shapes import ElemShape, definitions as shape_def
+
+    shape = ElemShape(el_type, np.arange(n_nodes))
+    edges = np.asarray(shape.edges, dtype=np.int64).reshape(-1, 2)
+    if not isinstance(shape.type, (shape_def.ShellShapes, shape_def.SolidShapes)):
+        return _ShapeTemplates(edges, None, None, None)
+
+    tris = np.asarray(shape.get_faces(), dtype=np.int64).reshape(-1, 3)
+    if not isinstance(shape.type, shape_def.SolidShapes):
+        return _ShapeTemplates(edges, tris, None, None)
+
+    faces = shape.solids_face_seq
+    polys = np.full((len(faces), 4), -1, dtype=np.int64)
+    tri_face = []
+    for i, face in enumerate(faces):
+        polys[i, : len(face)] = face
+        tri_face += [i] * (len(face) - 2)  # quads split into two triangles in get_faces()
+    return _ShapeTemplates(edges, tris, polys, np.asarray(tri_face, dtype=np.int64))
+
+
+@dataclass
+class _BlockTopology:
+    block: ElementBlock
+    templates: _ShapeTemplates
+    rows: np.ndarray  # (n_elements, n_nodes) node row indices
+    edges: np.ndarray  # (n_elements, n_edges, 2)
+    tris: np.ndarray  # (n_tris, 3), element-major
+    tri_elems: np.ndarray | None = None  # element of each triangle once faces are filtered
+
+
+def _keep_exterior_faces(blocks: list[_BlockTopology]) -> None:
+    """Drop the triangles of solid faces that two elements share (sorted-key deduplication
+    over the corner nodes of every solid face in the mesh)."""
+    solid = [b for b in blocks if b.templates.polys is not None]
+    if not solid:
+        return
+
+    keys = []
+    for b in solid:
+        polys = b.templates.polys
+        corners = np.where(polys >= 0, b.rows[:, np.maximum(polys, 0)], -1)
+        keys.append(np.sort(corners, axis=2).reshape(-1, 4))
+    keys = np.concatenate(keys)
+
+    order = np.lexsort(keys.T[::-1])
+    ordered = keys[order]
+    new_group = np.r_[True, np.any(ordered[1:] != ordered[:-1], axis=1)]
+    group = np.cumsum(new_group) - 1
+    counts = np.bincount(group)
+    exterior = np.empty(len(keys), dtype=bool)
+    exterior[order] = counts[group] == 1
+
+    start = 0
+    for b in solid:
+        n_el, n_faces = len(b.rows), len(b.templates.polys)
+        keep_face = exterior[start : start + n_el * n_faces].reshape(n_el, n_faces)
+        start += n_el * n_faces
+        keep = keep_face[:, b.templates.tri_face]
+        b.tris = b.tris.reshape(n_el, -1, 3)[keep]
+        b.tri_elems = np.nonzero(keep)[0]
+
+
 @dataclass
 class Mesh:
     elements: list[ElementBlock]
@@ -196,43 +275,60 @@ class Mesh:
         elem.fem_sec = fs
         return elem
 
-    def get_edges_and_faces_from_mesh(self) -> tuple[np.ndarray, np.ndarray]:
-        from ada.fem.shapes import ElemShape
+    def _node_rows(self, cell_block: ElementBlock, order: np.ndarray = None) -> np.ndarray:
+        """``cell_block.node_refs`` as 0-based row indices into ``nodes.coords``. Node ids are
+        mapped by binary search over the sorted identifiers (``order`` is their argsort, when
+        already at hand); unknown ids are left as they are."""
+        refs = np.asarray(cell_block.node_refs)
+        if cell_block.node_refs_are_indices:
+            return refs
+
+        ids = np.asarray(self.nodes.identifiers)
+        if not len(ids):
+            return refs.copy()
+        if order is None:
+            order = np.argsort(ids, kind="stable")
+        sorted_ids = ids[order]
+        pos = np.minimum(np.searchsorted(sorted_ids, refs), len(ids) - 1)
+        return np.where(sorted_ids[pos] == refs, order[pos], refs)
+
+    def _block_topology(self, skin_only=False) -> list[_BlockTopology]:
+        """Edges and triangles of every drawable element block, one template gather per block.
+
+        With ``skin_only`` the faces shared by two solid elements are dropped, leaving the
+        exterior skin of the solid parts (shell faces are kept as they are)."""
         from ada.fem.shapes import definitions as shape_def
 
-        nmap = {x: i for i, x in enumerate(self.nodes.identifiers)}
-        keys = np.array(list(nmap.keys()))
-
-        edges = []
-        faces = []
+        order = np.argsort(np.asarray(self.nodes.identifiers), kind="stable")
+        out = []
         for cell_block in self.elements:
             el_type = cell_block.elem_info.type
             # Mass elements (point + nonstructural) don't contribute to
-            # vis. Skip at the block level so ElemShape construction
-            # never sees node-ref arrays bundled by an elset (e.g.
+            # vis. Skip at the block level so the shape templates are
+            # never built from node-ref arrays bundled by an elset (e.g.
             # *Nonstructural Mass) which would fail the 1-node check.
             if isinstance(el_type, shape_def.MassTypes):
                 continue
 
-            if cell_block.node_refs_are_indices:
-                nodes_copy = cell_block.node_refs
-            else:
-                nodes_copy = cell_block.node_refs.copy()
-                nodes_copy[np.isin(nodes_copy, keys)] = np.vectorize(nmap.get)(nodes_copy[np.isin(nodes_copy, keys)])
-
-            for elem in nodes_copy:
-                elem_shape = ElemShape(el_type, elem)
-                try:
-                    edges += elem_shape.edges
-                except IndexError as e:
-                    logger.error(e)
-                    continue
-                if isinstance(elem_shape.type, (shape_def.LineShapes, shape_def.ConnectorTypes)):
-                    continue
-                faces += elem_shape.get_faces()
-
-        faces = np.array(faces).reshape(int(len(faces) / 3), 3)
-        edges = np.array(edges).reshape(int(len(edges) / 2), 2)
+            rows = self._node_rows(cell_block, order)
+            tpl = _shape_templates(el_type, rows.shape[1])
+            tris = np.empty((0, 3), dtype=rows.dtype) if tpl.tris is None else rows[:, tpl.tris].reshape(-1, 3)
+            out.append(_BlockTopology(cell_block, tpl, rows, rows[:, tpl.edges], tris))
+
+        if skin_only:
+            _keep_exterior_faces(out)
+        return out
+
+    def get_edges_and_faces_from_mesh(self, skin_only=False) -> tuple[np.ndarray, np.ndarray]:
+        """Element edges ``(n, 2)`` and triangles ``(m, 3)`` as node row indices.
+
+        ``skin_only`` drops the interior faces of solid elements (see ``_block_topology``);
+        the edges are the same in both modes."""
+        blocks = self._block_topology(skin_only)
+        if not blocks:
+            return np.empty((0, 2), dtype=np.int64), np.empty((0, 3), dtype=np.int64)
+        edges = np.concatenate([b.edges.reshape(-1, 2) for b in blocks])
+        faces = np.concatenate([b.tris for b in blocks])
         return edges, faces
 
     def create_mesh_stores(
@@ -245,8 +341,10 @@ class Mesh:
         line_color: Color | None = None,
         points_color: Color | None = None,
         solid_bm_color: Color | None = None,
+        skin_only=False,
     ) -> MeshStore:
-        from ada.fem.shapes import ElemShape
+        """Merged point, line and face meshes with one graph node per node and element.
+        ``skin_only`` draws only the exterior faces of solid elements."""
         from ada.fem.shapes import definitions as shape_def
         from ada.visit.colors import Color
 
@@ -272,9 +370,6 @@ class Mesh:
             GraphNode(parent_name + "_po", graph.next_node_id(), hash=create_guid(), parent=parent_node)
         )
 
-        nmap = {x: i for i, x in enumerate(self.nodes.identifiers)}
-        keys = np.array(list(nmap.keys()))
-
         coords = self.nodes.coords.flatten()
         edges = []
         faces = []
@@ -283,55 +378,57 @@ class Mesh:
         sh_groups = []
         li_groups = []
 
-        for cell_block in self.elements:
+        n_edges = 0
+        n_faces = 0
+        for topo in self._block_topology(skin_only):
+            cell_block = topo.block
             el_type = cell_block.elem_info.type
-            # Mass elements don't contribute to vis — see note above.
-            if isinstance(el_type, shape_def.MassTypes):
-                continue
-
-            if cell_block.node_refs_are_indices:
-                nodes_copy = cell_block.node_refs
-            else:
-                nodes_copy = cell_block.node_refs.copy()
-                nodes_copy[np.isin(nodes_copy, keys)] = np.vectorize(nmap.get)(nodes_copy[np.isin(nodes_copy, keys)])
             if use_solid_beams and isinstance(el_type, (shape_def.LineShapes, shape_def.ConnectorTypes)):
                 continue
 
-            el_idmap = {i: x for i, x in enumerate(cell_block.identifiers)}
-
-            for elem_ref, elem in enumerate(nodes_copy, start=0):
-                elem_id = el_idmap[elem_ref]
-                elem_shape = ElemShape(el_type, elem)
-
-                new_edges = elem_shape.edges
-                edges += new_edges
+            # Flat index buffers, one template gather per block; the draw ranges follow
+            # from the per-element counts.
+            n_el = len(topo.rows)
+            el_edges = topo.edges.reshape(n_el, -1)
+            edges.append(el_edges.ravel())
+            per_edge = el_edges.shape[1]
+            # line ranges start after the element's own edges (historical layout)
+            li_starts = (n_edges + per_edge * np.arange(1, n_el + 1)).tolist()
+            n_edges += el_edges.size
+
+            has_faces = topo.templates.tris is not None
+            if has_faces:
+                faces.append(topo.tris.ravel())
+                if topo.tri_elems is None:
+                    counts = np.full(n_el, 3 * len(topo.templates.tris))
+                else:
+                    counts = 3 * np.bincount(topo.tri_elems, minlength=n_el)
+                face_starts = (n_faces + np.cumsum(counts) - counts).tolist()
+                counts = counts.tolist()
+                n_faces += topo.tris.size
 
+            for i, elem_id in enumerate(cell_block.identifiers):
                 if line_node is not None:
-
-                    li_s = len(edges)
                     node = graph.add_node(
                         GraphNode(f"Li{elem_id}", graph.next_node_id(), hash=create_guid(), parent=line_node)
                     )
-                    li_groups.append(GroupReference(node, li_s, len(new_edges)))
-
-                if isinstance(elem_shape.type, (shape_def.LineShapes, shape_def.ConnectorTypes)):
-                    continue
+                    li_groups.append(GroupReference(node, li_starts[i], per_edge))
+                if has_faces:
+                    node = graph.add_node(
+                        GraphNode(f"EL{elem_id}", graph.next_node_id(), hash=create_guid(), parent=face_node)
+                    )
+                    sh_groups.append(GroupReference(node, face_starts[i], counts[i]))
 
-                face_s = len(faces)
-                new_faces = elem_shape.get_faces()
-                faces += new_faces
-                node = graph.add_node(
-                    GraphNode(f"EL{elem_id}", graph.next_node_id(), hash=create_guid(), parent=face_node)
-                )
-                sh_groups.append(GroupReference(node, face_s, len(new_faces)))
+        edges = np.concatenate(edges) if edges else np.array([])
+        faces = np.concatenate(faces) if faces else np.array([])
 
         for i, n in enumerate(sorted(self.nodes.identifiers)):
             node = graph.add_node(GraphNode(f"P{int(n)}", graph.next_node_id(), parent=points_node))
             po_groups.append(GroupReference(node, i, 1))
 
-        edges_mesh = MergedMesh(np.array(edges), coords, None, line_color, MeshType.LINES, groups=li_groups)
+        edges_mesh = MergedMesh(edges, coords, None, line_color, MeshType.LINES, groups=li_groups)
         points_mesh = MergedMesh(None, coords, None, points_color, MeshType.POINTS, groups=po_groups)
-        face_mesh = MergedMesh(np.array(faces), coords, None, shell_color, MeshType.TRIANGLES, groups=sh_groups)
+        face_mesh = MergedMesh(faces, coords, None, shell_color, MeshType.TRIANGLES, groups=sh_groups)
 
         bm_solid_mesh = None
         line_elems = self.get_line_elems() if self.elem_data is not None else []
@@ -485,8 +582,28 @@ class FEAResult:
         for x in self.results:
             yield x
 
+    @property
+    def derived(self) -> DerivedFieldEngine:
+        """Lazily computed derived fields (von Mises, principal stresses, ...); see
+        :mod:`ada.fem.results.derived`."""
+        engine = getattr(self, "_derived", None)
+        if engine is None:
+            from ada.fem.results.derived import DerivedFieldEngine
+
+            engine = self._derived = DerivedFieldEngine(self)
+        return engine
+
+    def combine(self, field: str, combinations: LoadCombinations) -> CombinedField:
+        """Factored load combinations of ``field`` over its steps as basic cases; combined
+        values are evaluated on access (see :mod:`ada.fem.results.combinations`)."""
+        from ada.fem.results.combinations import combine_result_field
+
+        return combine_result_field(self, field, combinations)
+
     def get_data(self, field: str, step: int):
         steps = self.get_results_grouped_by_field_value().get(field)
+        if steps is None and self.derived.is_derived(field):
+            return self.derived.get(field, step).get_all_values()
         if step == -1:
             field_data = list(sorted(steps, key=lambda x: x.step))[-1]
         else:
@@ -552,14 +669,21 @@ class FEAResult:
         write_to_vtu_file(self.mesh.nodes, self.mesh.elements, point_data, cell_data, filepath)
 
     def to_trimesh(
-        self, step: int, field: str, warp_field: str = None, warp_step: int = None, warp_scale: float = None, cfunc=None
+        self,
+        step: int,
+        field: str,
+        warp_field: str = None,
+        warp_step: int = None,
+        warp_scale: float = None,
+        cfunc=None,
+        skin_only=False,
     ):
         import trimesh
         from trimesh.path.entities import Line
         from trimesh.visual.material import PBRMaterial
 
         vertices = self.mesh.nodes.coords
-        edges, faces = self.mesh.get_edges_and_faces_from_mesh()
+        edges, faces = self.mesh.get_edges_and_faces_from_mesh(skin_only=skin_only)
 
         # Colorize data
         vertex_color = self._colorize_data(field, step, cfunc)
@@ -590,11 +714,12 @@ class FEAResult:
         warp_scale=None,
         cfunc=None,
         apply_transform=False,
+        skin_only=False,
     ):
         from ...core.vector_transforms import rot_matrix
 
         dest_file = pathlib.Path(dest_file).resolve().absolute()
-        scene = self.to_trimesh(step, field, warp_field, warp_step, warp_scale, cfunc)
+        scene = self.to_trimesh(step, field, warp_field, warp_step, warp_scale, cfunc, skin_only=skin_only)
 
         if apply_transform:
             # If you want Y up. This will counteract that transform
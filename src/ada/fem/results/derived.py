@@ -0,0 +1,480 @@
+"""Derived result fields computed from the raw fields a solver wrote.
+
+von Mises, Tresca and principal stresses (values and directions) from a stress tensor
+field, the resultant of a displacement field and the extreme-fibre axial stress of beams
+from their section forces. Every kernel works on a whole step at once — the component
+axis is the last one, any leading shape is allowed — and reuses step-sized buffers
+instead of building per-element temporaries.
+
+Derived fields are addressed as ``"<source field>.<kind>"`` (e.g.
+``"result__SIEF_ELNO.MISES"``) and computed lazily:
+
+* :class:`DerivedFieldEngine` serves them from a :class:`FEAResult` (``FEAResult.derived``,
+  and ``FEAResult.get_data`` falls back to it), caching one result per (field, step);
+* :class:`DerivedFieldsReader` wraps a streaming bake reader so the artefact bake writes
+  them as extra nodal / element fields, one step at a time.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING, Callable, Iterator
+
+import numpy as np
+
+from ada.config import logger
+
+if TYPE_CHECKING:
+    from ada.fem.results.common import FEAResult
+    from ada.fem.results.field_data import FieldData
+
+# Canonical stress order is xx, yy, zz, xy, yz, zx; a missing component reads as zero
+# (plane-stress shell output carries only xx, yy and xy).
+STRESS_ALIASES: dict[str, tuple[str, ...]] = {
+    "xx": ("SXX", "SIXX", "SIGXX", "S11"),
+    "yy": ("SYY", "SIYY", "SIGYY", "S22"),
+    "zz": ("SZZ", "SIZZ", "SIGZZ", "S33"),
+    "xy": ("SXY", "SIXY", "TAUXY", "S12"),
+    "yz": ("SYZ", "SIYZ", "TAUYZ", "S23"),
+    "zx": ("SZX", "SXZ", "SIXZ", "TAUXZ", "TAUZX", "S13"),
+}
+DISP_ALIASES: dict[str, tuple[str, ...]] = {
+    "x": ("DX", "D1", "U1", "UX"),
+    "y": ("DY", "D2", "U2", "UY"),
+    "z": ("DZ", "D3", "U3", "UZ"),
+}
+# Axial force and bending moments about the local y and z axes (Sesam RVFORCES,
+# Code_Aster EFGE/SIEF on beams).
+BEAM_FORCE_ALIASES: dict[str, tuple[str, ...]] = {
+    "n": ("NXX", "N"),
+    "my": ("MXY", "MFY", "MY"),
+    "mz": ("MXZ", "MFZ", "MZ"),
+}
+
+
+def _column_map(components, aliases: dict[str, tuple[str, ...]]) -> dict[str, int]:
+    upper = [c.upper() for c in components]
+    out = {}
+    for key, names in aliases.items():
+        idx = next((upper.index(n) for n in names if n in upper), None)
+        if idx is not None:
+            out[key] = idx
+    return out
+
+
+def _gather(values: np.ndarray, cols: dict[str, int], keys) -> np.ndarray:
+    """``values[..., cols[k]]`` for each of ``keys`` into one new array; zero where absent."""
+    out = np.zeros(values.shape[:-1] + (len(keys),), dtype=np.result_type(values.dtype, np.float32))
+    for j, key in enumerate(keys):
+        if key in cols:
+            out[..., j] = values[..., cols[key]]
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Kernels
+# ---------------------------------------------------------------------------
+
+
+def von_mises(stress: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """von Mises equivalent stress of ``(..., 6)`` canonical-order stresses."""
+    s = stress
+    if out is None:
+        out = np.empty(s.shape[:-1], dtype=s.dtype)
+    tmp = np.empty_like(out)
+    np.subtract(s[..., 0], s[..., 1], out=out)
+    np.square(out, out=out)
+    for a, b in ((1, 2), (2, 0)):
+        np.subtract(s[..., a], s[..., b], out=tmp)
+        np.square(tmp, out=tmp)
+        out += tmp
+    out *= 0.5
+    for c in (3, 4, 5):
+        np.square(s[..., c], out=tmp)
+        tmp *= 3.0
+        out += tmp
+    return np.sqrt(out, out=out)
+
+
+def stress_tensors(stress: np.ndarray) -> np.ndarray:
+    """``(..., 3, 3)`` symmetric tensors from ``(..., 6)`` canonical-order stresses."""
+    t = np.empty(stress.shape[:-1] + (3, 3), dtype=stress.dtype)
+    for (i, j), c in zip(((0, 0), (1, 1), (2, 2), (0, 1), (1, 2), (2, 0)), range(6)):
+        t[..., i, j] = stress[..., c]
+        t[..., j, i] = stress[..., c]
+    return t
+
+
+def _finite_rows(t: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Tensors with NaN rows zeroed (LAPACK rejects them) and the mask of those rows."""
+    bad = ~np.isfinite(t).all(axis=(-2, -1))
+    if bad.any():
+        t = t.copy()
+        t[bad] = 0.0
+    return t, bad
+
+
+def principal_stresses(stress: np.ndarray, directions: bool = False):
+    """Principal stresses ``(..., 3)`` ordered s1 >= s2 >= s3, and with
+    ``directions`` the matching unit vectors as the columns of ``(..., 3, 3)``."""
+    t, bad = _finite_rows(stress_tensors(stress))
+    if directions:
+        w, v = np.linalg.eigh(t)
+        w, v = w[..., ::-1], v[..., ::-1]
+        w[bad] = np.nan
+        v[bad] = np.nan
+        return w, v
+    w = np.linalg.eigvalsh(t)[..., ::-1]
+    w[bad] = np.nan
+    return w
+
+
+def tresca(principal: np.ndarray) -> np.ndarray:
+    """Tresca equivalent stress (s1 - s3) from ``(..., 3)`` ordered principal stresses."""
+    return principal[..., 0] - principal[..., 2]
+
+
+def resultant(vectors: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """Euclidean norm over the last axis (resultant displacement)."""
+    if out is None:
+        out = np.empty(vectors.shape[:-1], dtype=vectors.dtype)
+    tmp = np.empty_like(out)
+    np.square(vectors[..., 0], out=out)
+    for c in range(1, vectors.shape[-1]):
+        np.square(vectors[..., c], out=tmp)
+        out += tmp
+    return np.sqrt(out, out=out)
+
+
+def beam_fibre_stress(forces: np.ndarray, area, wy, wz) -> np.ndarray:
+    """Extreme-fibre axial stress ``(..., 2)`` as (max, min) of N/A ± My/Wy ± Mz/Wz.
+
+    ``forces`` is ``(..., 3)`` as (N, My, Mz); ``area``, ``wy`` and ``wz`` broadcast
+    against its leading shape (one value per row for mixed sections)."""
+    out = np.empty(forces.shape[:-1] + (2,), dtype=forces.dtype)
+    axial = np.divide(forces[..., 0], area, out=out[..., 0])
+    bending = np.abs(forces[..., 1]) / wy
+    bending += np.abs(forces[..., 2]) / wz
+    np.subtract(axial, bending, out=out[..., 1])
+    out[..., 0] += bending
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Derived-field kinds
+# ---------------------------------------------------------------------------
+
+
+class _StepKernels:
+    """Derived values of one step of one source field. Shares the canonical
+    gather and the principal-stress solve between the kinds asked for."""
+
+    def __init__(self, values: np.ndarray, components):
+        self.values = values
+        self.components = components
+
+    @cached_property
+    def stress(self) -> np.ndarray:
+        return _gather(self.values, _column_map(self.components, STRESS_ALIASES), tuple(STRESS_ALIASES))
+
+    @cached_property
+    def principal(self) -> np.ndarray:
+        return principal_stresses(self.stress)
+
+    @cached_property
+    def beam_forces(self) -> np.ndarray:
+        return _gather(self.values, _column_map(self.components, BEAM_FORCE_ALIASES), tuple(BEAM_FORCE_ALIASES))
+
+
+@dataclass(frozen=True)
+class DerivedKind:
+    """One derived quantity: what it needs from the source field and how it is computed."""
+
+    name: str
+    components: tuple[str, ...]
+    source: str  # "stress" | "displacement" | "beam_forces"
+    compute: Callable[[_StepKernels], np.ndarray]
+    category: str = "other"
+
+
+def _principal_dirs(k: _StepKernels) -> np.ndarray:
+    _, v = principal_stresses(k.stress, directions=True)
+    # column i of v is direction i -> components S1X, S1Y, S1Z, S2X, ...
+    return np.swapaxes(v, -1, -2).reshape(v.shape[:-2] + (9,))
+
+
+def _displacement(k: _StepKernels) -> np.ndarray:
+    cols = _column_map(k.components, DISP_ALIASES)
+    return resultant(_gather(k.values, cols, tuple(DISP_ALIASES)))[..., None]
+
+
+DERIVED_KINDS: dict[str, DerivedKind] = {
+    kind.name: kind
+    for kind in (
+        DerivedKind("MISES", ("MISES",), "stress", lambda k: von_mises(k.stress)[..., None], "stress"),
+        DerivedKind("TRESCA", ("TRESCA",), "stress", lambda k: tresca(k.principal)[..., None], "stress"),
+        DerivedKind("PRINCIPAL", ("S1", "S2", "S3"), "stress", lambda k: k.principal, "stress"),
+        DerivedKind(
+            "PRINCIPAL_DIR",
+            tuple(f"S{i}{a}" for i in (1, 2, 3) for a in "XYZ"),
+            "stress",
+            _principal_dirs,
+        ),
+        DerivedKind("MAGNITUDE", ("MAGNITUDE",), "displacement", _displacement),
+        # needs per-element section properties; computed by DerivedFieldEngine only
+        DerivedKind("FIBRE", ("SMAX", "SMIN"), "beam_forces", lambda k: k.beam_forces),
+    )
+}
+
+
+def source_kind(components) -> str | None:
+    """Which derived-field source a field's components make it, if any."""
+    stress = _column_map(components, STRESS_ALIASES)
+    if "xx" in stress and "yy" in stress:
+        return "stress"
+    if len(_column_map(components, DISP_ALIASES)) == 3:
+        return "displacement"
+    if len(_column_map(components, BEAM_FORCE_ALIASES)) == 3:
+        return "beam_forces"
+    return None
+
+
+def kinds_for(components) -> list[DerivedKind]:
+    source = source_kind(components)
+    return [k for k in DERIVED_KINDS.values() if k.source == source]
+
+
+def split_derived_name(name: str) -> tuple[str, DerivedKind] | None:
+    """``("<source field>", kind)`` for a derived field name, else ``None``."""
+    source, _, kind = name.rpartition(".")
+    if not source or kind not in DERIVED_KINDS:
+        return None
+    return source, DERIVED_KINDS[kind]
+
+
+# ---------------------------------------------------------------------------
+# FEAResult engine
+# ---------------------------------------------------------------------------
+
+
+class DerivedFieldEngine:
+    """Lazily computed derived fields of a :class:`FEAResult`.
+
+    Each ``(field, step)`` is computed once, over the whole step, and returned as a
+    field-data object of the source's class and row layout (leading label columns
+    kept), so ``get_all_values`` and the VTU / GLB exporters take it as they would
+    a raw field."""
+
+    def __init__(self, result: FEAResult):
+        self._result = result
+        self._cache: dict[tuple[str, int], FieldData] = {}
+
+    def available(self) -> list[str]:
+        """Derived field names the result's raw fields support."""
+        names = []
+        for name, items in self._result.get_results_grouped_by_field_value().items():
+            for kind in kinds_for(items[0].components):
+                if kind.source == "beam_forces" and self._result.mesh.sections is None:
+                    continue
+                names.append(f"{name}.{kind.name}")
+        return names
+
+    def is_derived(self, name: str) -> bool:
+        parts = split_derived_name(name)
+        return parts is not None and parts[0] in self._result.get_results_grouped_by_field_value()
+
+    def get(self, name: str, step: int) -> FieldData:
+        """The derived field ``name`` at ``step`` (``-1`` = last step)."""
+        parts = split_derived_name(name)
+        if parts is None:
+            raise ValueError(f"{name!r} is not a derived field name; available are {self.available()}")
+        source_name, kind = parts
+        items = self._result.get_results_grouped_by_field_value().get(source_name)
+        if items is None:
+            raise ValueError(f"Unable to find source field {source_name!r} for derived field {name!r}")
+        if step == -1:
+            source = sorted(items, key=lambda x: x.step)[-1]
+        else:
+            matches = [x for x in items if x.step == step]
+            if len(matches) != 1:
+                raise ValueError(
+                    f"Found {len(matches)} results of field data based on step {step}.\n"
+                    f"Available steps are {[x.step for x in items]}"
+                )
+            source = matches[0]
+
+        key = (name, source.step)
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = self._cache[key] = self._compute(source, name, kind)
+        return cached
+
+    def _compute(self, source: FieldData, name: str, kind: DerivedKind) -> FieldData:
+        if source_kind(source.components) != kind.source:
+            raise ValueError(f"Field {source.name!r} with components {source.components} has no {kind.name!r}")
+
+        values = np.asarray(source.values)
+        n_lead = 0 if values.ndim == 3 else len(source.COLS)
+        kernels = _StepKernels(values[..., n_lead : n_lead + len(source.components)], source.components)
+        derived = kind.compute(kernels)
+        if kind.source == "beam_forces":
+            if n_lead == 0:
+                raise ValueError(f"Field {source.name!r} carries no element labels to look up beam sections by")
+            area, wy, wz = self._section_moduli(values[:, 0])
+            derived = beam_fibre_stress(derived, area, wy, wz)
+
+        if n_lead:
+            derived = np.concatenate([values[:, :n_lead], derived.astype(values.dtype, copy=False)], axis=1)
+        out = dataclasses.replace(source, name=name, components=list(kind.components), values=derived)
+        out._mesh = self._result.mesh
+        return out
+
+    def _section_moduli(self, elem_labels: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Area and elastic section moduli per row, looked up through ``mesh.elem_data``."""
+        mesh = self._result.mesh
+        if mesh.elem_data is None or not mesh.sections:
+            raise ValueError("Beam fibre stress needs the mesh's element section data")
+
+        elem_data = np.asarray(mesh.elem_data)
+        order = np.argsort(elem_data[:, 0], kind="stable")
+        ids = elem_data[order, 0]
+        labels = elem_labels.astype(ids.dtype)
+        pos = np.clip(np.searchsorted(ids, labels), 0, len(ids) - 1)
+        found = ids[pos] == labels
+        sec_ids = np.where(found, elem_data[order, 2][pos], -1).astype(int)
+
+        unique, inverse = np.unique(sec_ids, return_inverse=True)
+        table = np.full((len(unique), 3), np.nan)
+        for i, sec_id in enumerate(unique):
+            sec = mesh.sections.get(int(sec_id))
+            props = sec.properties if sec is not None else None
+            if props is None or not all((props.Ax, props.Wymin, props.Wzmin)):
+                logger.warning(f"No area / section moduli for section {sec_id}; its fibre stress is NaN")
+                continue
+            table[i] = props.Ax, props.Wymin, props.Wzmin
+        per_row = table[inverse]
+        return per_row[:, 0], per_row[:, 1], per_row[:, 2]
+
+
+# ---------------------------------------------------------------------------
+# Bake reader wrapper
+# ---------------------------------------------------------------------------
+
+
+class DerivedFieldsReader:
+    """``FEAStreamReader`` that adds the derived fields of the wrapped reader's
+    stress and displacement fields (nodal and element) to its own.
+
+    Derived steps are computed from the source step as it streams past; a shared
+    step pass (``iter_steps_for_fields``) reads each source step once for the
+    source and all of its derived fields. Beam fibre stress is left out: stream
+    readers carry no section properties."""
+
+    BAKE_KINDS = ("MISES", "TRESCA", "PRINCIPAL", "MAGNITUDE")
+
+    def __init__(self, reader, kinds=BAKE_KINDS):
+        self._reader = reader
+        self._kinds = [DERIVED_KINDS[k] for k in kinds]
+        # derived (name, elem_type or None) -> (source spec, kind)
+        self._sources: dict[tuple[str, str | None], tuple] = {}
+        self._field_specs = None
+        self._element_field_specs = None
+
+    def __getattr__(self, item):
+        return getattr(self._reader, item)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._reader.close()
+
+    @staticmethod
+    def _key(spec) -> tuple[str, str | None]:
+        return spec.name, getattr(spec, "elem_type", None)
+
+    def _derived_specs(self, specs: list) -> list:
+        out = []
+        for spec in specs:
+            source = source_kind(spec.components)
+            for kind in self._kinds:
+                if kind.source != source:
+                    continue
+                derived = dataclasses.replace(
+                    spec, name=f"{spec.name}.{kind.name}", components=list(kind.components), category=kind.category
+                )
+                self._sources[self._key(derived)] = (spec, kind)
+                out.append(derived)
+        return out
+
+    def field_specs(self):
+        if self._field_specs is None:
+            specs = self._reader.field_specs()
+            nodal = [s for s in specs if s.support == "nodal"]
+            self._field_specs = [*specs, *self._derived_specs(nodal)]
+        return self._field_specs
+
+    def element_field_specs(self):
+        if self._element_field_specs is None:
+            specs = self._reader.element_field_specs()
+            self._element_field_specs = [*specs, *self._derived_specs(specs)]
+        return self._element_field_specs
+
+    def _derive(self, kind: DerivedKind, spec, sv):
+        values = kind.compute(_StepKernels(np.asarray(sv.values), spec.components))
+        return dataclasses.replace(sv, values=values.astype(np.float32, copy=False))
+
+    def iter_field_steps(self, field_name: str):
+        self.field_specs()
+        source = self._sources.get((field_name, None))
+        if source is None:
+            yield from self._reader.iter_field_steps(field_name)
+            return
+        spec, kind = source
+        for sv in self._reader.iter_field_steps(spec.name):
+            yield self._derive(kind, spec, sv)
+
+    def iter_element_field_steps(self, spec):
+        self.element_field_specs()
+        source = self._sources.get(self._key(spec))
+        if source is None:
+            yield from self._reader.iter_element_field_steps(spec)
+            return
+        src_spec, kind = source
+        for sv in self._reader.iter_element_field_steps(src_spec):
+            yield self._derive(kind, src_spec, sv)
+
+    def iter_steps_for_fields(self, specs) -> Iterator[tuple[int, object]]:
+        """Step-major pass: each source step is read once and its derived
+        steps share one canonical gather / principal solve."""
+        from ada.fem.results.artefacts import iter_steps_shared
+
+        self.field_specs()
+        self.element_field_specs()
+        sources: list = []
+        index: dict[tuple[str, str | None], int] = {}
+        wanted: list[list[tuple[int, DerivedKind | None]]] = []
+        for k, spec in enumerate(specs):
+            src_spec, kind = self._sources.get(self._key(spec), (spec, None))
+            key = self._key(src_spec)
+            if key not in index:
+                index[key] = len(sources)
+                sources.append(src_spec)
+                wanted.append([])
+            wanted[index[key]].append((k, kind))
+
+        for j, sv in iter_steps_shared(self._reader, sources):
+            kernels = None
+            for k, kind in wanted[j]:
+                if kind is None:
+                    yield k, sv
+                    continue
+                if kernels is None:
+                    kernels = _StepKernels(np.asarray(sv.values), sources[j].components)
+                values = kind.compute(kernels)
+                yield k, dataclasses.replace(sv, values=values.astype(np.float32, copy=False))
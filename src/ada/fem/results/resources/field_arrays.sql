@@ -0,0 +1,16 @@
+create table if not exists FieldArrays
+(
+    FieldName  TEXT,
+    Location   TEXT,
+    InstanceID INTEGER,
+    StepID     INTEGER,
+    Frame      REAL,
+    Components TEXT,
+    DType      TEXT,
+    NRows      INTEGER,
+    LabelCols  INTEGER,
+    Labels     BLOB,
+    Data       BLOB
+);
+
+create unique index if not exists FieldArraysKey on FieldArrays (FieldName, Location, StepID, InstanceID, Frame);
@@ -100,4 +100,7 @@ create table metadata
     project  TEXT,
     user     TEXT,
     filename TEXT
-);
\ No newline at end of file
+);
+create index FieldNodesKey on FieldNodes (FieldVarID, StepID, InstanceID, PointID);
+
+create index FieldElemKey on FieldElem (FieldVarID, StepID, InstanceID, ElemID);
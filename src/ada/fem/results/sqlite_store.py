@@ -1,9 +1,39 @@
+from __future__ import annotations
+
+import json
 import pathlib
 import sqlite3
+from dataclasses import dataclass
+from itertools import chain
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
 
 from ada.config import logger
 
+if TYPE_CHECKING:
+    from ada.fem.results.combinations import CombinedField, LoadCombinations
+
 _RESULTS_SCHEMA_PATH = pathlib.Path(__file__).parent / "resources/results.sql"
+_FIELD_ARRAYS_SCHEMA_PATH = pathlib.Path(__file__).parent / "resources/field_arrays.sql"
+
+
+@dataclass
+class FieldArray:
+    """One field at one (step, frame, instance) from the columnar ``FieldArrays`` table.
+
+    ``labels`` is ``(n_rows,)`` point ids or ``(n_rows, 2)`` element ids and integration
+    points; ``values`` is ``(n_rows, n_components)``. Both are read-only views on the
+    stored blobs (no copy)."""
+
+    name: str
+    location: Literal["nodal", "element"]
+    instance_id: int
+    step_id: int
+    frame: float
+    components: list[str]
+    labels: np.ndarray
+    values: np.ndarray
 
 
 class SQLiteFEAStore:
@@ -34,6 +64,11 @@ class SQLiteFEAStore:
                 self.conn.executescript("DELETE FROM PointSets;")
                 self.conn.executescript("DELETE FROM ElementSets;")
 
+        # Older databases (and ODB dumps) predate the columnar table
+        self._init_field_arrays()
+        if clean_tables:
+            self.conn.executescript("DELETE FROM FieldArrays;")
+
         self.cursor = self.conn.cursor()
 
     def __del__(self):
@@ -44,7 +79,21 @@ class SQLiteFEAStore:
             schema = f.read()
         self.conn.executescript(schema)
 
-    def insert_table(self, table_name: str, data: list[tuple]):
+    def _init_field_arrays(self):
+        with open(_FIELD_ARRAYS_SCHEMA_PATH, "r") as f:
+            schema = f.read()
+        self.conn.executescript(schema)
+
+    def create_field_indexes(self):
+        """Index the row-per-value field tables on (field variable, step, instance, id). New
+        databases get these from the schema; call this once on databases written elsewhere
+        before running many ``get_field_*_data`` queries."""
+        self.conn.executescript(
+            """create index if not exists FieldNodesKey on FieldNodes (FieldVarID, StepID, InstanceID, PointID);
+               create index if not exists FieldElemKey on FieldElem (FieldVarID, StepID, InstanceID, ElemID);"""
+        )
+
+    def insert_table(self, table_name: str, data: list[tuple], commit=True):
         if not data:
             logger.warning("No data to insert")
             return
@@ -54,7 +103,94 @@ class SQLiteFEAStore:
         sql_query = f"INSERT INTO {table_name} VALUES ({placeholders})"
 
         self.cursor.executemany(sql_query, data)
-        self.conn.commit()
+        if commit:
+            self.conn.commit()
+
+    def insert_field_array(
+        self,
+        name: str,
+        step_id: int,
+        labels: np.ndarray,
+        values: np.ndarray,
+        components: list[str] = None,
+        instance_id: int = 1,
+        frame: float = 0.0,
+        commit=True,
+    ):
+        """Store one field at one step as two blobs in the columnar ``FieldArrays`` table.
+
+        ``labels`` is ``(n_rows,)`` point ids (a nodal field) or ``(n_rows, 2)`` element ids
+        and integration points (an element field); ``values`` is ``(n_rows, n_components)``
+        and keeps its float dtype; the component names are stored as a JSON array. An existing
+        array at the same key is replaced. ``get_field_nodal_data`` / ``get_field_elem_data``
+        read these arrays before the row tables."""
+        labels = np.ascontiguousarray(labels, dtype=np.int64)
+        values = np.asarray(values)
+        if values.ndim == 1:
+            values = values[:, None]
+        if values.dtype.kind != "f":
+            values = values.astype(np.float64)
+        values = np.ascontiguousarray(values)
+        if len(labels) != len(values) or labels.ndim not in (1, 2):
+            raise ValueError(f"Labels {labels.shape} do not match values {values.shape}")
+        if components is None:
+            components = [str(i) for i in range(values.shape[1])]
+        if len(components) != values.shape[1]:
+            raise ValueError(f"{len(components)} component names for {values.shape[1]} columns")
+
+        location = "nodal" if labels.ndim == 1 else "element"
+        row = (
+            name,
+            location,
+            instance_id,
+            step_id,
+            frame,
+            json.dumps(list(components)),
+            values.dtype.str,
+            len(values),
+            1 if labels.ndim == 1 else labels.shape[1],
+            labels.tobytes(),
+            values.tobytes(),
+        )
+        self.cursor.execute(f"INSERT OR REPLACE INTO FieldArrays VALUES ({', '.join('?' * len(row))})", row)
+        if commit:
+            self.conn.commit()
+
+    def get_field_array(
+        self, name: str, step_id: int, instance_id: int = 1, frame: float = None, element=False
+    ) -> FieldArray:
+        """A field stored with :meth:`insert_field_array`, at the last frame of the step unless
+        ``frame`` is given. One indexed lookup; the arrays are views on the returned blobs."""
+        location = "element" if element else "nodal"
+        query = """SELECT Frame, Components, DType, NRows, LabelCols, Labels, Data FROM FieldArrays
+                   WHERE FieldName = ? AND Location = ? AND StepID = ? AND InstanceID = ?"""
+        params = [name, location, step_id, instance_id]
+        if frame is not None:
+            query += " AND Frame = ?"
+            params.append(frame)
+        query += " ORDER BY Frame DESC LIMIT 1"
+        self.cursor.execute(query, params)
+        row = self.cursor.fetchone()
+        if row is None:
+            raise KeyError(f"No {location} field {name!r} at step {step_id} (instance {instance_id})")
+
+        frame, components, dtype, n_rows, label_cols, labels, data = row
+        components = json.loads(components)
+        labels = np.frombuffer(labels, dtype=np.int64)
+        if label_cols > 1:
+            labels = labels.reshape(n_rows, label_cols)
+        values = np.frombuffer(data, dtype=np.dtype(dtype)).reshape(n_rows, len(components))
+        return FieldArray(name, location, instance_id, step_id, frame, components, labels, values)
+
+    def get_field_array_keys(self, name: str = None) -> list[tuple[str, str, int, int, float]]:
+        """``(name, location, instance id, step id, frame)`` of the stored field arrays."""
+        query = "SELECT FieldName, Location, InstanceID, StepID, Frame FROM FieldArrays"
+        params = []
+        if name is not None:
+            query += " WHERE FieldName = ?"
+            params.append(name)
+        self.cursor.execute(query + " ORDER BY FieldName, Location, StepID, InstanceID, Frame", params)
+        return self.cursor.fetchall()
 
     def get_steps(self):
         query = """SELECT * FROM Steps"""
@@ -63,9 +199,19 @@ class SQLiteFEAStore:
         return results
 
     def get_field_vars(self):
+        """The rows of the FieldVars table, followed by ``(None, component, field name)`` for each
+        component of the fields stored with :meth:`insert_field_array`."""
         query = """SELECT * FROM FieldVars"""
         self.cursor.execute(query)
         results = self.cursor.fetchall()
+
+        self.cursor.execute("SELECT DISTINCT FieldName, Components FROM FieldArrays ORDER BY FieldName")
+        seen = set()
+        for field_name, components in self.cursor.fetchall():
+            for component in json.loads(components):
+                if (field_name, component) not in seen:
+                    seen.add((field_name, component))
+                    results.append((None, component, field_name))
         return results
 
     def get_history_data(
@@ -135,8 +281,61 @@ class SQLiteFEAStore:
             return df
         return results
 
+    def _field_array_rows(
+        self, name: str, element: bool, step_id=None, instance_id=None, label=None, int_point=None
+    ) -> list[tuple] | None:
+        """Rows of the ``get_field_*_data`` shape for the component ``name`` (or every component of
+        the field ``name``) from the ``FieldArrays`` table, or ``None`` when no array holds it."""
+        query = """SELECT mi.Name, st.Name, fa.Frame, fa.Components, fa.DType, fa.NRows, fa.LabelCols,
+                          fa.Labels, fa.Data
+                   FROM FieldArrays as fa
+                        INNER JOIN ModelInstances as mi on fa.InstanceID = mi.ID
+                        INNER JOIN Steps as st on fa.StepID = st.ID
+                   WHERE fa.Location = ?
+                     AND (fa.FieldName = ? OR EXISTS (SELECT 1 FROM json_each(fa.Components) WHERE value = ?))"""
+        params = ["element" if element else "nodal", name, name]
+        if step_id is not None:
+            query += " AND fa.StepID = ?"
+            params.append(step_id)
+        if instance_id is not None:
+            query += " AND fa.InstanceID = ?"
+            params.append(instance_id)
+        self.cursor.execute(query + " ORDER BY fa.InstanceID, fa.StepID, fa.Frame", params)
+        arrays = self.cursor.fetchall()
+        if not arrays:
+            return None
+
+        out = []
+        for instance, step, frame, components, dtype, n_rows, label_cols, labels, data in arrays:
+            components = json.loads(components)
+            labels = np.frombuffer(labels, dtype=np.int64).reshape(n_rows, label_cols)
+            values = np.frombuffer(data, dtype=np.dtype(dtype)).reshape(n_rows, len(components))
+            keep = np.ones(n_rows, dtype=bool)
+            if label is not None:
+                keep &= labels[:, 0] == label
+            if int_point is not None:
+                keep &= labels[:, 1] == int_point
+            labels, values = labels[keep].tolist(), values[keep]
+            # a component name selects that column, the field name all of them
+            selected = [j for j, c in enumerate(components) if c == name] or range(len(components))
+            for j in selected:
+                component = components[j]
+                column = values[:, j].tolist()
+                if element:
+                    out += [(instance, lb[0], step, component, lb[1], frame, v) for lb, v in zip(labels, column)]
+                else:
+                    out += [(instance, lb[0], step, component, frame, v) for lb, v in zip(labels, column)]
+        return out
+
     def get_field_elem_data(self, name, step_id=None, instance_id=None, elem_id=None, int_point=None):
-        """This returns a join from the FieldVars table and the FieldElem tables."""
+        """This returns a join from the FieldVars table and the FieldElem tables.
+
+        Fields stored with :meth:`insert_field_array` (``name`` a component or a field name) are
+        read from the ``FieldArrays`` table instead."""
+        rows = self._field_array_rows(name, True, step_id, instance_id, elem_id, int_point)
+        if rows is not None:
+            return rows
+
         base_query = """SELECT mi.Name,
                              fe.ElemID,
                             st.Name,
@@ -174,7 +373,14 @@ class SQLiteFEAStore:
         return results
 
     def get_field_nodal_data(self, name, step_id=None, instance_id=None, point_id=None):
-        """This returns a join from the FieldVars table and the FieldNodes tables."""
+        """This returns a join from the FieldVars table and the FieldNodes tables.
+
+        Fields stored with :meth:`insert_field_array` (``name`` a component or a field name) are
+        read from the ``FieldArrays`` table instead."""
+        rows = self._field_array_rows(name, False, step_id, instance_id, point_id)
+        if rows is not None:
+            return rows
+
         base_query = """SELECT mi.Name,
                            fn.PointID,
                            st.Name,
@@ -206,5 +412,119 @@ class SQLiteFEAStore:
         results = self.cursor.fetchall()
         return results
 
+    def _array_fields_holding(self, component: str, element: bool) -> list[str]:
+        """Names of the ``FieldArrays`` fields holding the column ``component`` (a component name,
+        or the name of a one-column field)."""
+        self.cursor.execute(
+            """SELECT DISTINCT FieldName FROM FieldArrays WHERE Location = ?
+               AND (FieldName = ? OR EXISTS (SELECT 1 FROM json_each(Components) WHERE value = ?))""",
+            ("element" if element else "nodal", component, component),
+        )
+        return [name for (name,) in self.cursor.fetchall()]
+
+    def _array_case_column(
+        self, component: str, field_names: list[str], case_id: int, element: bool, instance_id
+    ) -> tuple[np.ndarray, np.ndarray] | None:
+        """``(labels, values)`` of ``component`` at the last frame of step ``case_id`` from the
+        ``FieldArrays`` table, sorted on the labels, or ``None`` when no array holds it."""
+        for field_name in field_names:
+            try:
+                fa = self.get_field_array(
+                    field_name, case_id, 1 if instance_id is None else instance_id, element=element
+                )
+            except KeyError:
+                continue
+            if component in fa.components:
+                j = fa.components.index(component)
+            elif len(fa.components) == 1:
+                j = 0
+            else:
+                raise ValueError(f"{component!r} is the field of components {fa.components}, not one component")
+            labels = fa.labels.reshape(len(fa.labels), -1)
+            order = np.lexsort(labels.T[::-1])
+            return labels[order], fa.values[order, j]
+        return None
+
+    def get_field_case_stack(
+        self, components: list[str], case_ids: list[int], element=False, instance_id=None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """The last frame of the field variables ``components`` in each step of ``case_ids`` as
+        ``(labels, stack)``. ``stack`` is ``(n_cases, n_rows, n_components)``; ``labels`` is
+        ``(n_rows,)`` point ids, or ``(n_rows, 2)`` element ids and integration points when
+        ``element`` is set. Every case must hold the same rows.
+
+        Components stored with :meth:`insert_field_array` are read from the ``FieldArrays`` table
+        (instance 1 unless ``instance_id`` is given), the others from the row tables. A case that
+        holds no rows of a component raises a ``ValueError``."""
+        if not components or not case_ids:
+            raise ValueError("No cases or components given")
+
+        table, keys = ("FieldElem", ("ElemID", "IntPt")) if element else ("FieldNodes", ("PointID",))
+        array_fields = {c: self._array_fields_holding(c, element) for c in components}
+        row_components = [c for c in components if not array_fields[c]]
+        field_ids: dict[str, list[int]] = {}
+        if row_components:
+            self.cursor.execute(
+                f"SELECT FieldID, Name FROM FieldVars WHERE Name IN ({', '.join('?' * len(row_components))})",
+                row_components,
+            )
+            for field_id, name in self.cursor.fetchall():
+                field_ids.setdefault(name, []).append(field_id)
+
+        # The last frame is looked up once per (step, field variable) and bound as a parameter;
+        # a correlated MAX(Frame) subquery would be evaluated once per row.
+        last_frame = f"SELECT MAX(Frame) FROM {table} WHERE FieldVarID = ? AND StepID = ?"
+        n_keys = len(keys)
+        labels = None
+        stack = None
+        for i, case_id in enumerate(case_ids):
+            terms, params = [], []
+            for field_id in chain.from_iterable(field_ids.get(c, []) for c in row_components):
+                self.cursor.execute(last_frame, (field_id, case_id))
+                frame = self.cursor.fetchone()[0]
+                if frame is not None:
+                    terms.append("(FieldVarID = ? AND StepID = ? AND Frame = ?)")
+                    params += [field_id, case_id, frame]
+            rows = np.empty((0, n_keys + 2))
+            if terms:
+                query = f"SELECT FieldVarID, {', '.join(keys)}, Value FROM {table} WHERE ({' OR '.join(terms)})"
+                if instance_id is not None:
+                    query += " AND InstanceID = ?"
+                    params.append(instance_id)
+                self.cursor.execute(query, params)
+                rows = np.asarray(self.cursor.fetchall(), dtype=float).reshape(-1, n_keys + 2)
+
+            for j, component in enumerate(components):
+                if array_fields[component]:
+                    column = self._array_case_column(component, array_fields[component], case_id, element, instance_id)
+                else:
+                    comp_rows = rows[np.isin(rows[:, 0], field_ids.get(component, []))]
+                    comp_rows = comp_rows[np.lexsort(comp_rows[:, n_keys:0:-1].T)]
+                    column = (
+                        (comp_rows[:, 1 : n_keys + 1].astype(np.int64), comp_rows[:, -1]) if len(comp_rows) else None
+                    )
+                if column is None:
+                    raise ValueError(f"Step {case_id} holds no {component!r}")
+
+                comp_labels, values = column
+                if labels is None:
+                    labels = comp_labels
+                    stack = np.empty((len(case_ids), len(labels), len(components)))
+                elif len(comp_labels) != len(labels) or not np.array_equal(comp_labels, labels):
+                    raise ValueError(f"Step {case_id} {component!r} does not hold the same rows as step {case_ids[0]}")
+                stack[i, :, j] = values
+
+        return (labels if element else labels[:, 0]), stack
+
+    def combine_field(
+        self, components: list[str], combinations: LoadCombinations, element=False, instance_id=None
+    ) -> tuple[np.ndarray, CombinedField]:
+        """Load combinations of the stored basic cases (steps) as ``(labels, combined field)``;
+        see :meth:`get_field_case_stack`."""
+        from ada.fem.results.combinations import CombinedField
+
+        labels, stack = self.get_field_case_stack(components, combinations.case_ids, element, instance_id)
+        return labels, CombinedField(combinations, stack)
+
     def __repr__(self):
         return f"SQLiteFEAStore({self.db_file})"
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, List, Literal, Union
 import numpy as np
 
 from ada.api.nodes import Node
+from ada.config import logger
 
 from .common import FemBase
 
@@ -101,6 +102,29 @@ class FemSet(FemBase):
         a no-op if the parent FEM can't resolve the members yet."""
         if self._member_ids is None or self.parent is None:
             return
+        container = self.parent.nodes if self.type == SetTypes.NSET else self.parent.elements
+        store = getattr(container, "store", None)
+        if store is not None:
+            # array-backed: look the rows up in bulk and write the side-table directly
+            if self.type == SetTypes.NSET:
+                for row in store.node_rows(self._member_ids).tolist():
+                    if row >= 0:
+                        store.add_extra_ref(row, self)
+            else:
+                found = np.zeros(len(self._member_ids), dtype=bool)
+                for ctype, (positions, rows) in store.elem_rows(self._member_ids).items():
+                    found[positions] = True
+                    for row in rows.tolist():
+                        store.add_elem_ref(ctype, row, self)
+                # masses/springs/connectors live outside the blocks as objects
+                for pos in np.flatnonzero(~found).tolist():
+                    try:
+                        member = container.from_id(self._member_ids[pos])
+                    except ValueError as e:
+                        logger.debug(f"FemSet {self.name}: member not resolved yet ({e})")
+                        continue
+                    member.add_obj_to_refs(self)
+            return
         try:
             for m in self.members:
                 m.add_obj_to_refs(self)
@@ -65,9 +65,11 @@ class OccBackend:
         from OCC.Extend.TopologyUtils import TopologyExplorer
 
         from ada.occ.tessellating import tessellate_shape
-        from ada.occ.utils import make_box_by_points
-        from ada.occ.utils import make_cylinder as _occ_make_cylinder
-        from ada.occ.utils import make_sphere as _occ_make_sphere
+        from ada.occ.utils import (
+            make_box_by_points,
+            make_cylinder as _occ_make_cylinder,
+            make_sphere as _occ_make_sphere,
+        )
 
         self._Bnd_Box = Bnd_Box
         self._brepbndlib = brepbndlib
@@ -271,6 +273,10 @@ class OccBackend:
         self._breptools.Clean(shape)
         return self._breptools.WriteToString(shape)
 
+    def deserialize(self, data: str) -> ShapeHandle:
+        # Inverse of serialize — reads a BREP text string back into a TopoDS_Shape.
+        return self._breptools.ReadFromString(data)
+
     def is_valid(self, shape: ShapeHandle) -> bool:
         # Topological validity (BRepCheck). geom_props=True checks geometric
         # consistency too.
@@ -10,20 +10,33 @@ The point of the cache is twofold:
 * **Serialisability** — adapy objects must stay picklable across
   process boundaries (multiprocessing fork in the audit worker,
   joblib, cache layers, plain ``copy.deepcopy``). Storing OCC
-  bodies on the object itself breaks that. The cache lives here,
-  keyed by ``obj.guid`` — the object carries only its parametric
-  description and rebuilds the OCC body on demand in any process.
+  bodies on the object itself breaks that. The cache lives here;
+  the object carries only its parametric description and rebuilds
+  the OCC body on demand in any process.
 
 Two caches share the same machinery: one for solid bodies (most
 shapes) and one for shell bodies (Plate / Beam where a thin-shell
 representation is sometimes preferred).
 
-Invalidation: keyed by ``guid`` which never changes for the life
-of an object. Mutating an object's parametric attributes does NOT
-evict the cached body — call :func:`invalidate` explicitly after a
-mutation if the change should propagate. For audit / convert
-flows the objects are constructed fresh per job so the issue
-doesn't surface in practice.
+Keys are content-addressed: a hash of the parametric description
+(``solid_geom()`` / ``shell_geom()``), so mutating an object's
+parametric attributes gives a new key and the next access rebuilds
+the body — no explicit :func:`invalidate` is needed. Objects with an
+identical description share one body. The key of each object is
+memoized against a cheap revision of it (see :func:`_revision`), so
+repeated lookups of an unchanged object skip building and hashing its
+description. Edits the revision cannot see (in-place changes to nested
+arrays or curves) need an :func:`invalidate`.
+
+Each cache is bounded by a memory budget
+(``Config().general_occ_cache_max_mb``) and evicts least recently
+used bodies first. The size of a body is estimated from its face
+count (or from its BREP serialisation when that is written anyway).
+If ``Config().general_occ_cache_spill_dir`` is set, every built body
+is also written there as a BREP file, and a miss reads it back
+before rebuilding, so repeated conversions of the same
+model skip the rebuild across processes and restarts. Hit, miss,
+spill and eviction counters are available from :func:`cache_stats`.
 
 The body is built through the active CAD backend
 (``ada.cad.active_backend().build(...)``) rather than calling the
@@ -35,22 +48,294 @@ name so a mid-run backend switch can never mix handle types.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict
+import hashlib
+import os
+import pathlib
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
 
 from ada.cad import active_backend
+from ada.config import Config, logger
+from ada.core.spatial_index import geometry_revision
 
 if TYPE_CHECKING:
     from OCC.Core.TopoDS import TopoDS_Shape
 
     from ada.base.physical_objects import BackendGeom
+    from ada.geom import Geometry
+
+
+# Rough BREP size of one face (surface, wire, edges, vertices), to size a body from its face count
+# without serializing it.
+_BYTES_PER_FACE = 2048
+
+
+@dataclass
+class CacheStats:
+    """Counters for one :class:`BodyCache`"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    spill_hits: int = 0
+    spill_writes: int = 0
+    num_entries: int = 0
+    nbytes: int = 0
+
+
+class BodyCache:
+    """LRU cache of backend shape handles keyed by content hash, bounded by an estimated memory budget.
+
+    :param max_bytes: Memory budget. Defaults to ``Config().general_occ_cache_max_mb``.
+    :param spill_dir: Directory for BREP spill files. Defaults to ``Config().general_occ_cache_spill_dir``.
+    :param on_evict: Called with the key of every entry the LRU evicts.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int | None = None,
+        spill_dir: str | pathlib.Path | None = None,
+        on_evict: Callable[[str], None] | None = None,
+    ):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.on_evict = on_evict
+        self._entries: OrderedDict[str, tuple[TopoDS_Shape, int]] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.RLock()
+        self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _max_bytes(self) -> int:
+        if self.max_bytes is not None:
+            return self.max_bytes
+        return Config().general_occ_cache_max_mb * 1024**2
+
+    def _spill_dir(self) -> pathlib.Path | None:
+        spill_dir = self.spill_dir if self.spill_dir is not None else Config().general_occ_cache_spill_dir
+        return pathlib.Path(spill_dir) if spill_dir else None
+
+    def get(self, key: str) -> TopoDS_Shape | None:
+        """Return the cached handle and mark it most recently used, or ``None``. Does not touch the counters."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def get_or_build(self, key: str, build: Callable[[], TopoDS_Shape], size_hint: int = 0) -> TopoDS_Shape:
+        """Return the handle for ``key``, reading it from the spill directory or building it on a miss.
+
+        :param size_hint: Size estimate used when the backend cannot serialize the body.
+        """
+        shape = self.get(key)
+        if shape is not None:
+            self._stats.hits += 1
+            return shape
+
+        self._stats.misses += 1
+        backend = active_backend()
+        brep = self._read_spill(key)
+        if brep is not None:
+            try:
+                shape = backend.deserialize(brep)
+                self._stats.spill_hits += 1
+            except NotImplementedError:
+                shape = None
+
+        if shape is None:
+            shape = build()
+            brep = None
+            # Only serialize when the body is spilled; sizing alone uses the face count
+            if self._spill_path(key) is not None:
+                try:
+                    brep = backend.serialize(shape)
+                except NotImplementedError:
+                    pass
+                else:
+                    self._write_spill(key, brep)
+
+        self.put(key, shape, len(brep) if brep is not None else self._estimate_size(backend, shape, size_hint))
+        return shape
+
+    @staticmethod
+    def _estimate_size(backend, shape: TopoDS_Shape, size_hint: int) -> int:
+        try:
+            return max(len(backend.faces(shape)) * _BYTES_PER_FACE, size_hint)
+        except NotImplementedError:
+            return size_hint
+
+    def put(self, key: str, shape: TopoDS_Shape, nbytes: int = 0) -> None:
+        """Insert a handle with an estimated size and evict least recently used entries beyond the budget"""
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= old[1]
+            self._entries[key] = (shape, nbytes)
+            self._nbytes += nbytes
+
+            max_bytes = self._max_bytes()
+            # Never evict the entry just inserted, even if it alone exceeds the budget
+            while self._nbytes > max_bytes and len(self._entries) > 1:
+                evicted_key, (_, evicted_nbytes) = self._entries.popitem(last=False)
+                self._nbytes -= evicted_nbytes
+                self._stats.evictions += 1
+                if self.on_evict is not None:
+                    self.on_evict(evicted_key)
+
+    def pop(self, key: str) -> TopoDS_Shape | None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            self._nbytes -= entry[1]
+            return entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def stats(self) -> CacheStats:
+        """A snapshot of the counters"""
+        s = self._stats
+        return CacheStats(s.hits, s.misses, s.evictions, s.spill_hits, s.spill_writes, len(self._entries), self._nbytes)
+
+    def reset_stats(self) -> None:
+        self._stats = CacheStats()
+
+    def _spill_path(self, key: str) -> pathlib.Path | None:
+        spill_dir = self._spill_dir()
+        if spill_dir is None:
+            return None
+        return spill_dir / f"{key}.brep"
 
-# — module-level dicts so the objects stay alive —
-occ_solid_cache: Dict[str, TopoDS_Shape] = {}
-occ_shell_cache: Dict[str, TopoDS_Shape] = {}
+    def _read_spill(self, key: str) -> str | None:
+        path = self._spill_path(key)
+        if path is None or not path.is_file():
+            return None
+        try:
+            return path.read_text()
+        except OSError as e:
+            logger.debug(f"Unable to read spilled body {path}: {e}")
+            return None
 
+    def _write_spill(self, key: str, brep: str) -> None:
+        path = self._spill_path(key)
+        if path is None or path.is_file():
+            return None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a process-unique temp file and rename, so concurrent writers never expose partial files
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(brep)
+            os.replace(tmp, path)
+            self._stats.spill_writes += 1
+        except OSError as e:
+            logger.debug(f"Unable to spill body to {path}: {e}")
 
-def _key(occ_object: "BackendGeom") -> str:
-    return f"{active_backend().name}:{occ_object.guid}"
+
+# "<backend>:<kind>:<guid>" -> content key of the latest body built for that object. Lets callers that only hold a
+# guid (e.g. the clash LRU) find the body without rebuilding the parametric description.
+_guid_keys: dict[str, str] = {}
+# content key -> the guid keys pointing at it, to drop them when the body is evicted
+_key_guids: dict[str, set[str]] = {}
+# "<backend>:<kind>:<guid>" -> the :func:`_revision` of the object when its key was computed
+_guid_revisions: dict[str, tuple] = {}
+
+
+def _remember_guid(guid_key: str, key: str) -> None:
+    old = _guid_keys.get(guid_key)
+    if old == key:
+        return
+    if old is not None:
+        _forget_guid(guid_key, old)
+    _guid_keys[guid_key] = key
+    _key_guids.setdefault(key, set()).add(guid_key)
+
+
+def _forget_guid(guid_key: str, key: str) -> None:
+    guids = _key_guids.get(key)
+    if guids is not None:
+        guids.discard(guid_key)
+        if not guids:
+            del _key_guids[key]
+
+
+def _on_evict(key: str) -> None:
+    for guid_key in _key_guids.pop(key, ()):
+        if _guid_keys.get(guid_key) == key:
+            del _guid_keys[guid_key]
+            _guid_revisions.pop(guid_key, None)
+
+
+occ_solid_cache = BodyCache(on_evict=_on_evict)
+occ_shell_cache = BodyCache(on_evict=_on_evict)
+
+
+def _description(geometry: Geometry) -> bytes:
+    # The geometry ``id`` and ``color`` do not affect the body and are left out, so objects with an
+    # identical description share one cache entry.
+    return pickle.dumps((geometry.geometry, geometry.bool_operations), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _key(description: bytes, kind: str) -> str:
+    return f"{active_backend().name}-{kind}-{hashlib.blake2b(description, digest_size=16).hexdigest()}"
+
+
+def content_key(geometry: Geometry, kind: str = "solid") -> str:
+    """Hash of the parametric description of ``geometry``, namespaced by backend and body kind"""
+    return _key(_description(geometry), kind)
+
+
+def _revision(occ_object: "BackendGeom") -> tuple:
+    """Cheap stand-in for the parametric description of an object: the counter of
+    :func:`~ada.core.spatial_index.mark_geometry_changed` (node moves, beam setters), the attribute
+    values of the object and of its placement (compared by identity) and the length of its list,
+    dict and set attributes (booleans, ...)."""
+    values = []
+    lengths = []
+    placement = getattr(occ_object, "placement", None)
+    for obj in (occ_object, placement) if placement is not None else (occ_object,):
+        for value in vars(obj).values():
+            values.append(value)
+            if isinstance(value, (list, dict, set)):
+                lengths.append(len(value))
+    return geometry_revision(), tuple(lengths), tuple(values)
+
+
+def _same_revision(a: tuple, b: tuple) -> bool:
+    return a[:2] == b[:2] and len(a[2]) == len(b[2]) and all(x is y for x, y in zip(a[2], b[2]))
+
+
+def _geometry(occ_object: "BackendGeom", kind: str) -> Geometry:
+    return occ_object.solid_geom() if kind == "solid" else occ_object.shell_geom()
+
+
+def _get_body(occ_object: "BackendGeom", cache: BodyCache, kind: str) -> TopoDS_Shape:
+    guid_key = f"{active_backend().name}:{kind}:{occ_object.guid}"
+    key = _guid_keys.get(guid_key)
+    revision = _guid_revisions.get(guid_key)
+    if key is not None and revision is not None and _same_revision(revision, _revision(occ_object)):
+        # Unchanged since its key was computed: skip building and hashing the description
+        return cache.get_or_build(key, lambda: active_backend().build(_geometry(occ_object, kind)))
+
+    geometry = _geometry(occ_object, kind)
+    description = _description(geometry)
+    key = _key(description, kind)
+    _remember_guid(guid_key, key)
+    # Taken after solid_geom(), which may set cached attributes on the object
+    _guid_revisions[guid_key] = _revision(occ_object)
+    return cache.get_or_build(key, lambda: active_backend().build(geometry), size_hint=len(description))
 
 
 def get_solid_occ(occ_object: "BackendGeom") -> TopoDS_Shape:
@@ -60,43 +345,54 @@ def get_solid_occ(occ_object: "BackendGeom") -> TopoDS_Shape:
     ``PrimCone``, ``PrimExtrude``, ``PrimRevolve``, ``PrimSweep``,
     ``Wall``, ``Pipe*`` all implement it.
     """
-    key = _key(occ_object)
-    if key not in occ_solid_cache:
-        occ_solid_cache[key] = active_backend().build(occ_object.solid_geom())
-    return occ_solid_cache[key]
+    return _get_body(occ_object, occ_solid_cache, "solid")
 
 
 def cached_solid_by_guid(guid: str) -> TopoDS_Shape:
     """Look up an already-built solid body by raw object ``guid`` for the
-    active backend. Raises ``KeyError`` if it has not been built yet (call
-    :func:`get_solid_occ` first). Keeps the backend-namespaced key format
+    active backend. Raises ``KeyError`` if it has not been built yet or has
+    been evicted (call :func:`get_solid_occ` first). Keeps the key format
     encapsulated for callers that only hold a guid (e.g. the clash LRU)."""
-    return occ_solid_cache[f"{active_backend().name}:{guid}"]
+    shape = occ_solid_cache.get(_guid_keys[f"{active_backend().name}:solid:{guid}"])
+    if shape is None:
+        raise KeyError(guid)
+    return shape
 
 
 def get_shell_occ(occ_object: "BackendGeom") -> TopoDS_Shape:
     """Same for shell geometry. Requires the object to implement
     ``shell_geom()`` — currently ``Plate``, ``Beam``, ``Pipe*``,
     ``Wall``."""
-    key = _key(occ_object)
-    if key not in occ_shell_cache:
-        occ_shell_cache[key] = active_backend().build(occ_object.shell_geom())
-    return occ_shell_cache[key]
+    return _get_body(occ_object, occ_shell_cache, "shell")
 
 
 def invalidate(guid: str) -> None:
-    """Drop the cached solid + shell for one object across all backends.
-    Callers that mutate a Beam / Plate / Prim* parametric description after
-    the body has been built use this to force a rebuild on the next
-    ``solid_occ()`` / ``shell_occ()`` call."""
+    """Forget the bodies last built for one object across all backends, so the next
+    access re-hashes its description. A body is only dropped when no other object
+    shares it. Needed after edits :func:`_revision` cannot see; also useful to
+    release memory early, e.g. after an object is exported. Spilled BREP files
+    are kept."""
     suffix = f":{guid}"
-    for cache in (occ_solid_cache, occ_shell_cache):
-        for k in [k for k in cache if k.endswith(suffix)]:
-            cache.pop(k, None)
+    for guid_key in [k for k in _guid_keys if k.endswith(suffix)]:
+        key = _guid_keys.pop(guid_key)
+        _guid_revisions.pop(guid_key, None)
+        _forget_guid(guid_key, key)
+        if key not in _key_guids:
+            cache = occ_shell_cache if ":shell:" in guid_key else occ_solid_cache
+            cache.pop(key)
+
+
+def cache_stats() -> dict[str, CacheStats]:
+    """Hit/miss/eviction/spill counters of the solid and shell caches"""
+    return {"solid": occ_solid_cache.stats(), "shell": occ_shell_cache.stats()}
 
 
 def clear_all() -> None:
-    """Drop the entire cache. Test isolation + long-running daemon
-    pruning."""
-    occ_solid_cache.clear()
-    occ_shell_cache.clear()
+    """Drop the entire in-memory cache and reset the counters. Test isolation +
+    long-running daemon pruning. Spilled BREP files are kept."""
+    for cache in (occ_solid_cache, occ_shell_cache):
+        cache.clear()
+        cache.reset_stats()
+    _guid_keys.clear()
+    _key_guids.clear()
+    _guid_revisions.clear()
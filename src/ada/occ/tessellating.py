@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import dataclasses
+import hashlib
 import os
+import pickle
 from collections import Counter as _Counter
 from dataclasses import dataclass, field
 from itertools import groupby
@@ -14,6 +17,7 @@ from ada.cad import active_backend, is_shape_handle
 from ada.config import logger
 from ada.geom import Geometry
 from ada.geom.curves import CURVE_GEOM_TUPLE as _CURVE_GEOM_TUPLE
+from ada.geom.placement import Axis2Placement3D
 from ada.occ.exceptions import (
     UnableToCreateCurveOCCGeom,
     UnableToCreateTesselationFromSolidOCCGeom,
@@ -21,8 +25,11 @@ from ada.occ.exceptions import (
 from ada.visit.colors import Color
 from ada.visit.gltf.graph import GraphNode, GraphStore
 from ada.visit.gltf.meshes import MeshStore, MeshType
-from ada.visit.gltf.optimize import concatenate_stores
-from ada.visit.gltf.store import merged_mesh_to_trimesh_scene
+from ada.visit.gltf.optimize import concatenate_stores, find_instances
+from ada.visit.gltf.store import (
+    instanced_mesh_to_trimesh_scene,
+    merged_mesh_to_trimesh_scene,
+)
 from ada.visit.render_params import RenderParams
 
 if TYPE_CHECKING:
@@ -273,6 +280,38 @@ def _emit_with_geom_transforms(ms: "MeshStore", ada_obj):
         yield MeshStore(ms.index, ms.matrix, pos, ms.indices, nrm, ms.material, ms.type, ms.node_ref)
 
 
+def _placement_free_geometry(geom: Geometry, mesh_type: MeshType) -> tuple[bytes, Geometry, np.ndarray] | None:
+    """Split a placed geometry into a hash of its placement-free description, the same geometry at the
+    origin and its 4x4 placement matrix. Returns None for geometry without an ``Axis2Placement3D`` position
+    or with boolean operations (whose tools are placed in world coordinates)."""
+    position = getattr(geom.geometry, "position", None)
+    if not isinstance(position, Axis2Placement3D) or geom.bool_operations or geom.transforms:
+        return None
+
+    local = dataclasses.replace(geom.geometry, position=Axis2Placement3D())
+    try:
+        description = pickle.dumps((local, mesh_type.value), protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+
+    # Same orthogonalisation as gp_Ax3: z is the axis, x the part of ref_direction normal to it
+    z = np.array(position.axis, dtype=np.float64)
+    z /= np.linalg.norm(z)
+    y = np.cross(z, np.asarray(position.ref_direction, dtype=np.float64))
+    y_len = np.linalg.norm(y)
+    if y_len == 0.0:
+        return None
+    y /= y_len
+    matrix = np.eye(4)
+    matrix[:3, 0] = np.cross(y, z)
+    matrix[:3, 1] = y
+    matrix[:3, 2] = z
+    matrix[:3, 3] = np.asarray(position.location, dtype=np.float64)
+
+    digest = hashlib.blake2b(description, digest_size=16).digest()
+    return digest, Geometry(geom.id, local, geom.color), matrix
+
+
 def _thicken_face_mesh(positions: np.ndarray, faces: np.ndarray, thickness: float):
     """Extrude an open face mesh into a closed thin solid along a single vector — the
     area-weighted average surface normal × ``thickness`` — matching OCC's
@@ -666,12 +705,28 @@ class TessellationFallbackError(RuntimeError):
     naming the geometry + reason, instead of completing on the OCC path."""
 
 
+# Geometries sent to a pool worker per task, and tasks kept in flight per worker
+_POOL_CHUNK_SIZE = 32
+_POOL_TASKS_PER_WORKER = 4
+
+
 @dataclass
 class BatchTessellator:
     quality: float = 1.0
     render_edges: bool = False
     parallel: bool = False
+    # Number of worker processes used by batch_tessellate. 1 tessellates in the calling process.
+    cpus: int = 1
+    # Tessellate repeated shapes once and write rigid copies as EXT_mesh_gpu_instancing instances
+    instancing: bool = False
+    # Weld coincident vertices and reorder triangles for cache locality in merged meshes,
+    # see concatenate_stores
+    weld: bool = False
+    reorder: bool = False
     material_store: dict[Color, int] = field(default_factory=dict)
+    # Instanced node name -> (N, 4, 4) instance transforms, filled by meshes_to_trimesh when instancing
+    gpu_instances: dict[str, np.ndarray] = field(default_factory=dict)
+    _local_meshes: dict[bytes, MeshStore] = field(default_factory=dict)
     _geom_id: int = 0
 
     def add_color(self, color: Color) -> int:
@@ -833,6 +888,50 @@ class BatchTessellator:
         obj: BackendGeom,
         graph_store: GraphStore = None,
         mesh_type: MeshType = MeshType.TRIANGLES,
+    ) -> MeshStore:
+        if self.instancing:
+            placed = _placement_free_geometry(geom, mesh_type)
+            if placed is not None:
+                return self._tessellate_placed_geom(geom, obj, graph_store, mesh_type, *placed)
+
+        return self._tessellate_geom(geom, obj, graph_store, mesh_type)
+
+    def _tessellate_placed_geom(
+        self,
+        geom: Geometry,
+        obj: BackendGeom,
+        graph_store: GraphStore,
+        mesh_type: MeshType,
+        digest: bytes,
+        local_geom: Geometry,
+        matrix: np.ndarray,
+    ) -> MeshStore:
+        """Tessellate ``local_geom`` once per distinct description and place a copy of it with ``matrix``"""
+        local = self._local_meshes.get(digest)
+        if local is None:
+            local = self._tessellate_geom(local_geom, obj, graph_store, mesh_type)
+            self._local_meshes[digest] = local
+
+        rot, loc = matrix[:3, :3], matrix[:3, 3]
+        position = (np.asarray(local.position, dtype=np.float64).reshape(-1, 3) @ rot.T + loc).astype(np.float32)
+        normal = None
+        if local.normal is not None and len(local.normal):
+            normal = (np.asarray(local.normal, dtype=np.float64).reshape(-1, 3) @ rot.T).astype(np.float32)
+            normal = normal.reshape(-1)
+
+        if graph_store is not None:
+            node_ref = graph_store.hash_map.get(obj.guid)
+        else:
+            node_ref = getattr(obj, "guid", geom.id)
+        mat_id = self.add_color(geom.color)
+        return MeshStore(node_ref, None, position.reshape(-1), local.indices, normal, mat_id, local.type, node_ref)
+
+    def _tessellate_geom(
+        self,
+        geom: Geometry,
+        obj: BackendGeom,
+        graph_store: GraphStore = None,
+        mesh_type: MeshType = MeshType.TRIANGLES,
     ) -> MeshStore:
         if graph_store is not None:
             node_ref = graph_store.hash_map.get(obj.guid)
@@ -1036,6 +1135,17 @@ class BatchTessellator:
         if render_override is None:
             render_override = dict()
 
+        if self.cpus > 1:
+            yield from self._batch_tessellate_pooled(objects, render_override, graph_store)
+        else:
+            yield from self._batch_tessellate_serial(objects, render_override, graph_store)
+
+    def _batch_tessellate_serial(
+        self,
+        objects: Iterable[Geometry | BackendGeom],
+        render_override: dict[str, GeomRepr],
+        graph_store: GraphStore = None,
+    ) -> Iterable[MeshStore]:
         for obj in objects:
             if isinstance(obj, BackendGeom):
                 from ada.api.shapes import ShapeProxy
@@ -1498,6 +1608,113 @@ class BatchTessellator:
                     fb_err,
                 )
 
+    @staticmethod
+    def _poolable_geometry(obj, render_override: dict[str, GeomRepr]) -> tuple[Geometry, MeshType] | None:
+        """The parametric geometry + mesh type the serial path would tessellate for ``obj``, or None when
+        ``obj`` needs one of the special paths (lazy blobs, curved plates, raw OCC bodies) of
+        :meth:`batch_tessellate` and has to stay in the calling process."""
+        if not isinstance(obj, BackendGeom):
+            return obj, MeshType.TRIANGLES
+
+        from ada.api.shapes import ShapeProxy
+
+        if isinstance(obj, ShapeProxy) or callable(getattr(obj, "extruded_solid_occ", None)):
+            return None
+        legacy = getattr(obj, "_geom", None)
+        if getattr(obj, "_occ_cache", None) is not None or (legacy is not None and is_shape_handle(legacy)):
+            return None
+
+        geom_repr = render_override.get(obj.guid, GeomRepr.SOLID)
+        if geom_repr == GeomRepr.SOLID:
+            _g = getattr(obj, "geom", None)
+            if _g is not None and isinstance(getattr(_g, "geometry", None), _CURVE_GEOM_TUPLE):
+                geom_repr = GeomRepr.LINE
+
+        try:
+            if geom_repr == GeomRepr.SOLID:
+                return obj.solid_geom(), MeshType.TRIANGLES
+            elif geom_repr == GeomRepr.SHELL:
+                return obj.shell_geom(), MeshType.TRIANGLES
+            return obj.line_geom(), MeshType.LINES
+        except NotImplementedError:
+            return None
+
+    def _batch_tessellate_pooled(
+        self,
+        objects: Iterable[Geometry | BackendGeom],
+        render_override: dict[str, GeomRepr],
+        graph_store: GraphStore = None,
+    ) -> Iterable[MeshStore]:
+        """:meth:`batch_tessellate` over a pool of ``self.cpus`` worker processes.
+
+        Workers receive chunks of parametric ``ada.geom`` descriptions and return the mesh buffers through
+        shared memory (see :mod:`ada.occ.tessellation_pool`). Results are consumed in input order and
+        material ids are assigned here, so the output is identical to the serial path. Objects needing the
+        special-case paths, and any geometry a worker could not tessellate, run serially in this process.
+        """
+        import multiprocessing as mp
+        from collections import deque
+        from concurrent.futures import ProcessPoolExecutor
+
+        from ada.occ.tessellation_pool import tessellate_chunk_worker, unpack_chunk
+
+        settings = (self.quality, self.render_edges, self.parallel, self.instancing)
+        max_in_flight = self.cpus * _POOL_TASKS_PER_WORKER
+
+        # Each pending task is (objects, pool geometry per object or None, future or None)
+        pending: deque = deque()
+
+        def drain(task) -> Iterable[MeshStore]:
+            objs, geoms, future = task
+            results = iter(unpack_chunk(*future.result())) if future is not None else iter(())
+            for obj, geom in zip(objs, geoms):
+                res = next(results) if geom is not None else None
+                if res is None:
+                    yield from self._batch_tessellate_serial([obj], render_override, graph_store)
+                    continue
+
+                mesh_type, position, indices, normal = res
+                ada_obj = obj if isinstance(obj, BackendGeom) else None
+                if ada_obj is None:
+                    node_ref = geom[0].id
+                elif graph_store is not None:
+                    node_ref = graph_store.hash_map.get(obj.guid)
+                else:
+                    node_ref = obj.guid
+                mat_id = self.add_color(geom[0].color)
+                ms = MeshStore(
+                    node_ref, None, position, indices, normal, mat_id, MeshType.from_int(mesh_type), node_ref
+                )
+                yield from _emit_with_geom_transforms(ms, ada_obj)
+
+        # OCC isn't fork-safe once initialised in the parent, so the workers are spawned
+        with ProcessPoolExecutor(max_workers=self.cpus, mp_context=mp.get_context("spawn")) as executor:
+            objs, geoms = [], []
+
+            def submit():
+                to_pool = [g for g in geoms if g is not None]
+                future = executor.submit(tessellate_chunk_worker, settings, to_pool) if to_pool else None
+                pending.append((objs, geoms, future))
+
+            for obj in objects:
+                objs.append(obj)
+                # Bare geometries are only looked up in a graph store through their owner, so keep them local
+                if graph_store is not None and not isinstance(obj, BackendGeom):
+                    geoms.append(None)
+                else:
+                    geoms.append(self._poolable_geometry(obj, render_override))
+                if len(objs) < _POOL_CHUNK_SIZE:
+                    continue
+                submit()
+                objs, geoms = [], []
+                while len(pending) >= max_in_flight:
+                    yield from drain(pending.popleft())
+
+            if objs:
+                submit()
+            while pending:
+                yield from drain(pending.popleft())
+
     def batch_tessellate_solids(
         self,
         objects: Iterable[BackendGeom],
@@ -1557,8 +1774,23 @@ class BatchTessellator:
 
         scene = trimesh.Scene(base_frame=base_frame)
         for (mat_id, _mtype), meshes in groupby(all_shapes, lambda x: (x.material, x.type)):
+            if merge_meshes and self.instancing:
+                groups, meshes = find_instances(meshes)
+                for group in groups:
+                    node_name, transforms = instanced_mesh_to_trimesh_scene(
+                        scene,
+                        group,
+                        self.get_mat_by_id(mat_id),
+                        mat_id,
+                        len(self.gpu_instances),
+                        graph,
+                        apply_transform=apply_transform,
+                    )
+                    self.gpu_instances[node_name] = transforms
+                if not meshes:
+                    continue
             if merge_meshes:
-                merged_store = concatenate_stores(list(meshes))
+                merged_store = concatenate_stores(list(meshes), weld=self.weld, reorder=self.reorder)
                 merged_mesh_to_trimesh_scene(
                     scene, merged_store, self.get_mat_by_id(mat_id), mat_id, graph, apply_transform=apply_transform
                 )
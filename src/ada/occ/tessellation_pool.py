@@ -0,0 +1,141 @@
+"""Process-pool helpers for :meth:`ada.occ.tessellating.BatchTessellator.batch_tessellate`.
+
+OCC isn't thread-safe, so the unit of parallelism is a process. The parent resolves each object's
+parametric ``ada.geom`` description (``solid_geom()`` / ``shell_geom()`` / ``line_geom()``) and ships
+chunks of them to the workers. A worker tessellates its chunk and packs every position / index /
+normal buffer into ONE shared-memory block, returning only the block name and an array layout — the
+mesh buffers never travel through the result pipe. The parent copies the arrays out, releases the
+block and assigns material ids in input order, so the result is identical to the serial path.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from ada.geom import Geometry
+    from ada.visit.gltf.meshes import MeshType
+
+# (offset, dtype, shape) of one array inside the shared block. None for a missing array.
+ArraySpec = tuple[int, str, tuple[int, ...]]
+
+
+@dataclass
+class PackedMesh:
+    """Layout of one tessellated geometry inside a worker's shared-memory block"""
+
+    mesh_type: int
+    position: ArraySpec
+    indices: ArraySpec
+    normal: ArraySpec | None
+
+
+def pack_arrays(arrays: list[np.ndarray | None]) -> tuple[str | None, list[ArraySpec | None]]:
+    """Copy ``arrays`` into a new shared-memory block. Returns the block name and the layout.
+
+    The caller of :func:`unpack_arrays` owns the block and unlinks it.
+    """
+    specs: list[ArraySpec | None] = []
+    offset = 0
+    for arr in arrays:
+        if arr is None:
+            specs.append(None)
+            continue
+        # 8-byte alignment keeps every view aligned for any of the dtypes used
+        offset = (offset + 7) & ~7
+        specs.append((offset, arr.dtype.str, arr.shape))
+        offset += arr.nbytes
+
+    if offset == 0:
+        return None, specs
+
+    shm = shared_memory.SharedMemory(create=True, size=offset)
+    try:
+        for arr, spec in zip(arrays, specs):
+            if spec is None:
+                continue
+            start, dtype, shape = spec
+            view = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=start)
+            view[...] = arr
+            del view
+    finally:
+        shm.close()
+    return shm.name, specs
+
+
+def unpack_arrays(name: str | None, specs: list[ArraySpec | None]) -> list[np.ndarray | None]:
+    """Copy the arrays out of the shared-memory block ``name`` and release the block"""
+    if name is None:
+        return [None if spec is None else np.empty(spec[2], dtype=spec[1]) for spec in specs]
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        arrays = []
+        for spec in specs:
+            if spec is None:
+                arrays.append(None)
+                continue
+            start, dtype, shape = spec
+            arrays.append(np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=start).copy())
+    finally:
+        shm.close()
+        shm.unlink()
+    return arrays
+
+
+def tessellate_chunk_worker(
+    settings: tuple[float, bool, bool, bool], geoms: list[tuple[Geometry, MeshType]]
+) -> tuple[str | None, list[PackedMesh | None]]:
+    """Pool subprocess entry: tessellate a chunk of geometries into one shared-memory block.
+
+    A geometry that fails or tessellates to nothing is returned as ``None`` so the parent can run it
+    through the serial path, which carries the logging and fallback handling.
+    """
+    from ada.config import logger
+    from ada.occ.tessellating import BatchTessellator
+
+    quality, render_edges, parallel, instancing = settings
+    bt = BatchTessellator(quality=quality, render_edges=render_edges, parallel=parallel, instancing=instancing)
+
+    arrays: list[np.ndarray | None] = []
+    results: list[tuple[int, int, bool] | None] = []
+    for geom, mesh_type in geoms:
+        try:
+            ms = bt.tessellate_geom(geom, None, mesh_type=mesh_type)
+        except Exception as e:  # noqa: BLE001 - the parent retries it serially and logs there
+            logger.debug(f"Pooled tessellation of {geom.id!r} failed, deferring to the parent: {e}")
+            ms = None
+
+        if ms is None or ms.position is None or ms.indices is None or len(ms.position) == 0 or len(ms.indices) == 0:
+            results.append(None)
+            continue
+
+        results.append((ms.type.value, len(arrays), ms.normal is not None))
+        arrays.append(np.asarray(ms.position))
+        arrays.append(np.asarray(ms.indices))
+        arrays.append(None if ms.normal is None else np.asarray(ms.normal))
+
+    name, specs = pack_arrays(arrays)
+    packed = [
+        None if res is None else PackedMesh(res[0], specs[res[1]], specs[res[1] + 1], specs[res[1] + 2])
+        for res in results
+    ]
+    return name, packed
+
+
+def unpack_chunk(name: str | None, packed: list[PackedMesh | None]):
+    """Yield ``(mesh_type, position, indices, normal)`` per geometry (None for failures) and free the block"""
+    specs = [spec for pm in packed if pm is not None for spec in (pm.position, pm.indices, pm.normal)]
+    arrays = iter(unpack_arrays(name, specs))
+    results = []
+    for pm in packed:
+        if pm is None:
+            results.append(None)
+            continue
+        position, indices, normal = next(arrays), next(arrays), next(arrays)
+        results.append((pm.mesh_type, position, indices, normal))
+    return results
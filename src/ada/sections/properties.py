@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Iterable, Union
 
 import numpy as np
 
@@ -107,6 +107,31 @@ def calculate_general_properties(section: Section) -> Union[None, GeneralPropert
     return calc_func(section)
 
 
+PACKED_PROPERTY_FIELDS = ("Ax", "Ix", "Iy", "Iz", "Iyz", "Wxmin", "Wymin", "Wzmin", "Shary", "Sharz", "Cy", "Cz")
+
+
+def pack_general_properties(
+    sections: Iterable[Section], fields: Iterable[str] = PACKED_PROPERTY_FIELDS
+) -> dict[str, np.ndarray]:
+    """Pack the general properties of ``sections`` into one float64 array per field
+    (row ``i`` = ``sections[i]``), for vectorized checks over many members.
+
+    Each distinct section object is evaluated once; a section without properties, or
+    a property that is ``None``, packs as NaN."""
+    sections = list(sections)
+    fields = tuple(fields)
+    rows: dict[int, tuple] = {}
+    packed = np.full((len(sections), len(fields)), np.nan)
+    for i, sec in enumerate(sections):
+        row = rows.get(id(sec))
+        if row is None:
+            props = sec.properties if sec is not None else None
+            row = tuple(np.nan if props is None or getattr(props, f) is None else getattr(props, f) for f in fields)
+            rows[id(sec)] = row
+        packed[i] = row
+    return {f: packed[:, j] for j, f in enumerate(fields)}
+
+
 def calc_box(sec: Section) -> GeneralProperties:
     """Calculate box cross section properties"""
 
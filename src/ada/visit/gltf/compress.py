@@ -13,6 +13,13 @@ option:
                id_hierarchy and the ADA_EXT_data extension survive and the
                viewer's picking / hierarchy keep working. ~2.5-3x smaller
                download; decoded client-side by GLTFLoader.setMeshoptDecoder.
+    quantize — KHR_mesh_quantization (see ``quantize.py``) followed by the
+               meshopt pass: positions to int16 and normals to int8 per
+               mesh, with the dequantization folded into the node
+               transforms. Index buffers, node names, scene.extras and
+               ADA_EXT_data are kept, so picking still works. Lossy (16-bit
+               positions over each mesh's extent); roughly halves the
+               meshopt download again.
 
 Fully guarded: any failure (or a missing meshoptimizer/numpy) uploads the
 original GLB unchanged — the toggle is never a hard failure.
@@ -30,15 +37,11 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-VALID_MODES = ("off", "meshopt")
+VALID_MODES = ("off", "meshopt", "quantize")
 
 
 def normalize_mode(mode: str | None) -> str:
     m = (mode or "off").strip().lower()
-    # Back-compat: an old "quantize" request maps to the safe meshopt pass
-    # (quantization is not yet wired; meshopt alone is the picking-safe win).
-    if m == "quantize":
-        m = "meshopt"
     return m if m in VALID_MODES else "off"
 
 
@@ -48,9 +51,21 @@ def compress_glb(in_path: str | Path, mode: str | None) -> Path:
     next to the input and returns that path (caller cleans it up)."""
     in_path = Path(in_path)
     m = normalize_mode(mode)
-    if m != "meshopt":
+    if m == "off":
         return in_path
     from .meshopt import meshopt_compress_glb
 
     out_path = in_path.with_suffix(".pack.glb")
-    return meshopt_compress_glb(in_path, out_path)
+    if m == "meshopt":
+        return meshopt_compress_glb(in_path, out_path)
+
+    from .quantize import quantize_glb
+
+    quantized = quantize_glb(in_path, in_path.with_suffix(".quant.glb"))
+    packed = meshopt_compress_glb(quantized, out_path)
+    if quantized == in_path or packed == out_path:
+        if quantized != in_path:
+            quantized.unlink(missing_ok=True)
+        return packed
+    # meshopt skipped or failed: ship the quantized GLB alone
+    return quantized.replace(out_path)
@@ -0,0 +1,359 @@
+"""Level-of-detail chain for GLB output (picking-safe vertex clustering).
+
+Each coarser level is a separate GLB next to the source (``<stem>.lod1.glb``,
+``<stem>.lod2.glb``, ...) listed, together with the source as level 0, in a
+``<stem>.lods.json`` manifest, so a viewer can fetch the coarsest level first and
+swap in finer ones as they arrive.
+
+Simplification is vertex clustering on a uniform grid whose cell is the level's
+geometric error. Clusters are keyed on the draw range (``scene.extras``
+``draw_ranges_<node>``) as well as the cell, so objects never merge into each
+other and every object's triangles stay one contiguous range: the kept triangles
+keep their order, and each level's draw ranges are the source ranges shifted by the
+triangles dropped before them. Objects smaller than a cell collapse to an empty
+range rather than disappearing from ``draw_ranges``. Each cluster is represented
+by one of its original vertices, so every vertex attribute is carried over as-is.
+
+Everything else in the glTF JSON (nodes, names, ``id_hierarchy``,
+``ADA_EXT_data``) is copied unchanged into every level. Primitives whose
+accessors share or interleave bufferViews, non-triangle primitives, and inputs
+that are already meshopt- or quantization-compressed are left alone; run this
+before ``compress.py``.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .meshopt import _COMP_BYTES, _TYPE_COMPONENTS, _write_glb_streaming
+from .quantize import _read_glb_json, _relay_bin
+
+if TYPE_CHECKING:
+    from ada.visit.gltf.meshes import MergedMesh
+
+logger = logging.getLogger(__name__)
+
+# Geometric error of each generated level, as a fraction of the model's bounding
+# box diagonal.
+DEFAULT_LOD_ERRORS = (0.002, 0.01, 0.04)
+
+# A level that keeps more than this fraction of the previous level's triangles
+# is not worth its download and is not written.
+MIN_REDUCTION = 0.9
+
+_DTYPES = {5120: "i1", 5121: "u1", 5122: "<i2", 5123: "<u2", 5125: "<u4", 5126: "<f4"}
+_TRIANGLES = 4
+_UINT = 5125
+
+
+@dataclass
+class ClusterResult:
+    """A simplified triangle list.
+
+    :param vertices: Original vertex index of every kept vertex (gather the vertex attributes with it).
+    :param indices: Flat triangle indices into ``vertices``.
+    :param ranges: ``(start, length)`` index ranges, one per input range, in input order.
+    """
+
+    vertices: np.ndarray
+    indices: np.ndarray
+    ranges: list[tuple[int, int]]
+
+
+def cluster_simplify(
+    position: np.ndarray, indices: np.ndarray, ranges: list[tuple[int, int]], cell: float
+) -> ClusterResult:
+    """Collapse the vertices of each range onto a grid of ``cell`` and drop the triangles
+    that become degenerate or duplicate.
+
+    Triangles outside every range are clustered together as one extra range. Ranges are
+    index offsets (multiples of 3) and must not overlap."""
+    position = np.asarray(position).reshape(-1, 3)
+    corners = np.asarray(indices, dtype=np.int64).reshape(-1, 3)
+    n_tri = len(corners)
+    if n_tri == 0 or cell <= 0:
+        vertices = np.unique(corners)
+        return ClusterResult(vertices, _remap(corners, vertices, len(position)), list(ranges))
+
+    tri_group = np.zeros(n_tri, dtype=np.int64)
+    for k, (start, length) in enumerate(ranges, start=1):
+        tri_group[start // 3 : (start + length) // 3] = k
+
+    ijk = np.floor((position - position.min(axis=0)) / cell).astype(np.int64)
+    dims = ijk.max(axis=0) + 1
+    if float(np.prod(dims, dtype=float)) * (len(ranges) + 1) < 2**62:
+        n_cells = int(np.prod(dims))
+        vertex_cell = (ijk[:, 0] * dims[1] + ijk[:, 1]) * dims[2] + ijk[:, 2]
+    else:
+        _, vertex_cell = np.unique(ijk, axis=0, return_inverse=True)
+        vertex_cell = vertex_cell.reshape(-1)
+        n_cells = int(vertex_cell.max()) + 1
+
+    keys = tri_group[:, None] * n_cells + vertex_cell[corners]
+    _, first, cluster = np.unique(keys.reshape(-1), return_index=True, return_inverse=True)
+    cluster = cluster.reshape(-1, 3)
+    keep = (cluster[:, 0] != cluster[:, 1]) & (cluster[:, 1] != cluster[:, 2]) & (cluster[:, 0] != cluster[:, 2])
+
+    # Clustering folds coincident triangles (both faces of a thin plate, neighbouring
+    # facets) onto each other; keep the first of each. Clusters never span ranges, so
+    # this cannot move a triangle between objects.
+    kept = np.flatnonzero(keep)
+    _, first_tri = np.unique(np.sort(cluster[kept], axis=1), axis=0, return_index=True)
+    keep[:] = False
+    keep[kept[first_tri]] = True
+
+    representative = corners.reshape(-1)[first]
+    new_corners = representative[cluster[keep]]
+    used = np.zeros(len(position), dtype=bool)
+    used[new_corners] = True
+    vertices = np.flatnonzero(used)
+
+    survivors = np.concatenate([[0], np.cumsum(keep)])
+    new_ranges = []
+    for start, length in ranges:
+        a, b = survivors[start // 3], survivors[(start + length) // 3]
+        new_ranges.append((3 * int(a), 3 * int(b - a)))
+    return ClusterResult(vertices, _remap(new_corners, vertices, len(position)), new_ranges)
+
+
+def _remap(corners: np.ndarray, vertices: np.ndarray, n_vertices: int) -> np.ndarray:
+    """``corners`` (original vertex ids) as indices into the compacted ``vertices``."""
+    lookup = np.zeros(n_vertices, dtype=np.uint32)
+    lookup[vertices] = np.arange(len(vertices), dtype=np.uint32)
+    return lookup[corners.reshape(-1)]
+
+
+def simplify_merged_mesh(merged_mesh: MergedMesh, cell: float) -> MergedMesh:
+    """Clustered copy of a triangle :class:`MergedMesh`; its groups keep their node refs and
+    point at the simplified index ranges."""
+    from ada.visit.gltf.meshes import GroupReference, MergedMesh, MeshType
+
+    if merged_mesh.type != MeshType.TRIANGLES:
+        raise ValueError(f"Only triangle meshes can be simplified, got {merged_mesh.type}")
+    ranges = [(g.start, g.length) for g in merged_mesh.groups]
+    res = cluster_simplify(merged_mesh.position, merged_mesh.indices, ranges, cell)
+    position = merged_mesh.position.reshape(-1, 3)[res.vertices].reshape(-1)
+    normal = None
+    if merged_mesh.normal is not None:
+        normal = merged_mesh.normal.reshape(-1, 3)[res.vertices].reshape(-1)
+    groups = [GroupReference(g.node_ref, s, n) for g, (s, n) in zip(merged_mesh.groups, res.ranges)]
+    return MergedMesh(res.indices, position, normal, merged_mesh.material, merged_mesh.type, groups)
+
+
+# ---------------------------------------------------------------------------
+# GLB pass
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Primitive:
+    mesh: int
+    prim: dict
+    range_key: str | None  # scene.extras key holding this primitive's draw ranges
+    attributes: dict[str, np.ndarray]
+    indices: np.ndarray
+
+
+def _rewritable_primitives(
+    j: dict, modes: tuple[int, ...] | None = (_TRIANGLES,)
+) -> list[tuple[int, dict, str | None]]:
+    """``(mesh index, primitive, draw-range key)`` of the indexed primitives (of ``modes``; any
+    mode if None) whose accessors each own a tightly packed bufferView."""
+    accessors = j.get("accessors", [])
+    buffer_views = j.get("bufferViews", [])
+    extras = (j.get("scenes") or [{}])[0].get("extras") or {}
+
+    views_used: dict[int, int] = {}
+    for a in accessors:
+        if a.get("bufferView") is not None:
+            views_used[a["bufferView"]] = views_used.get(a["bufferView"], 0) + 1
+    accessor_used: dict[int, int] = {}
+    for mesh in j.get("meshes", []):
+        for p in mesh.get("primitives", []):
+            for ai in [*p.get("attributes", {}).values(), p.get("indices")]:
+                if ai is not None:
+                    accessor_used[ai] = accessor_used.get(ai, 0) + 1
+
+    def tight(ai: int) -> bool:
+        a = accessors[ai]
+        bv = a.get("bufferView")
+        if bv is None or a.get("sparse") or a.get("componentType") not in _DTYPES:
+            return False
+        view = buffer_views[bv]
+        size = _COMP_BYTES[a["componentType"]] * _TYPE_COMPONENTS[a["type"]]
+        return (
+            views_used[bv] == 1
+            and accessor_used[ai] == 1
+            and a.get("byteOffset", 0) == 0
+            and view.get("byteStride", size) == size
+            and view.get("buffer", 0) == 0
+        )
+
+    range_keys: dict[int, str] = {}
+    for node in j.get("nodes", []):
+        key = f"draw_ranges_{node.get('name')}"
+        if "mesh" in node and key in extras:
+            range_keys.setdefault(node["mesh"], key)
+
+    out = []
+    for mi, mesh in enumerate(j.get("meshes", [])):
+        for pi, p in enumerate(mesh.get("primitives", [])):
+            attrs = p.get("attributes", {})
+            if modes is not None and p.get("mode", _TRIANGLES) not in modes:
+                continue
+            if p.get("targets") or p.get("indices") is None:
+                continue
+            pos = attrs.get("POSITION")
+            if pos is None or accessors[pos].get("componentType") != 5126 or "min" not in accessors[pos]:
+                continue
+            if not all(tight(ai) for ai in [*attrs.values(), p["indices"]]):
+                continue
+            # draw_ranges index into a mesh's first primitive (see comms/rest/utilities/diff.py)
+            out.append((mi, p, range_keys.get(mi) if pi == 0 else None))
+    return out
+
+
+def _read_accessor(fin, bin_off: int, j: dict, ai: int) -> np.ndarray:
+    a = j["accessors"][ai]
+    view = j["bufferViews"][a["bufferView"]]
+    n_comp = _TYPE_COMPONENTS[a["type"]]
+    fin.seek(bin_off + view.get("byteOffset", 0))
+    dtype = np.dtype(_DTYPES[a["componentType"]])
+    data = np.frombuffer(fin.read(a["count"] * n_comp * dtype.itemsize), dtype=dtype)
+    return data.reshape(-1, n_comp) if n_comp > 1 else data
+
+
+def write_glb_lods(
+    glb_path: str | Path, errors: tuple[float, ...] = DEFAULT_LOD_ERRORS, out_dir: str | Path | None = None
+) -> Path | None:
+    """Write the LOD levels of ``glb_path`` and their manifest. Returns the manifest path,
+    or None when nothing could be simplified (or anything failed; the source GLB is
+    never modified).
+
+    :param errors: Geometric error of each level as a fraction of the bounding box diagonal,
+        finest first.
+    :param out_dir: Where to write the levels and manifest. Defaults to the source's directory.
+    """
+    glb_path = Path(glb_path)
+    out_dir = Path(out_dir) if out_dir is not None else glb_path.parent
+    written: list[Path] = []
+    try:
+        j, bin_off, _bin_len = _read_glb_json(glb_path)
+        used = set(j.get("extensionsUsed", []))
+        if {"EXT_meshopt_compression", "KHR_draco_mesh_compression", "KHR_mesh_quantization"} & used:
+            logger.info("lod: %s is already compressed; simplify before compressing", glb_path.name)
+            return None
+        if len(j.get("buffers", [])) != 1:
+            return None
+        targets = _rewritable_primitives(j)
+        if not targets:
+            logger.info("lod: no simplifiable meshes in %s", glb_path.name)
+            return None
+
+        extras = (j.get("scenes") or [{}])[0].get("extras") or {}
+        with glb_path.open("rb") as fin:
+            prims = [
+                _Primitive(
+                    mi,
+                    p,
+                    key,
+                    {name: _read_accessor(fin, bin_off, j, ai) for name, ai in p["attributes"].items()},
+                    _read_accessor(fin, bin_off, j, p["indices"]),
+                )
+                for mi, p, key in targets
+            ]
+        lo = np.min([j["accessors"][p.prim["attributes"]["POSITION"]]["min"] for p in prims], axis=0)
+        hi = np.max([j["accessors"][p.prim["attributes"]["POSITION"]]["max"] for p in prims], axis=0)
+        diagonal = float(np.linalg.norm(np.asarray(hi) - np.asarray(lo)))
+        n_source = sum(len(p.indices) // 3 for p in prims)
+
+        out_dir.mkdir(parents=True, exist_ok=True)
+        levels = [
+            {
+                "level": 0,
+                "uri": glb_path.name,
+                "geometric_error": 0.0,
+                "triangles": n_source,
+                "bytes": glb_path.stat().st_size,
+            }
+        ]
+        for error in errors:
+            cell = error * diagonal
+            lj = copy.deepcopy(j)
+            lextras = lj["scenes"][0].setdefault("extras", {}) if lj.get("scenes") else {}
+            replaced: dict[int, bytes] = {}
+            n_tri = 0
+            for p in prims:
+                range_ids = list(extras[p.range_key]) if p.range_key else []
+                ranges = [tuple(int(x) for x in extras[p.range_key][nid][:2]) for nid in range_ids]
+                res = cluster_simplify(p.attributes["POSITION"], p.indices, ranges, cell)
+                n_tri += len(res.indices) // 3
+
+                ia = lj["accessors"][p.prim["indices"]]
+                ia.update(componentType=_UINT, count=len(res.indices))
+                ia.pop("min", None)
+                ia.pop("max", None)
+                replaced[ia["bufferView"]] = res.indices.astype("<u4").tobytes()
+                for name, values in p.attributes.items():
+                    a = lj["accessors"][p.prim["attributes"][name]]
+                    data = values[res.vertices]
+                    a["count"] = len(data)
+                    if "min" in a and len(data):
+                        a["min"] = np.atleast_1d(data.min(axis=0)).tolist()
+                        a["max"] = np.atleast_1d(data.max(axis=0)).tolist()
+                    replaced[a["bufferView"]] = np.ascontiguousarray(data).tobytes()
+                if p.range_key:
+                    lextras[p.range_key] = {nid: list(r) for nid, r in zip(range_ids, res.ranges)}
+
+            if n_tri > MIN_REDUCTION * levels[-1]["triangles"]:
+                logger.info("lod: error %g keeps %d of %d triangles; skipped", error, n_tri, levels[-1]["triangles"])
+                continue
+
+            out_path = out_dir / f"{glb_path.stem}.lod{len(levels)}.glb"
+            tmp_bin = out_path.with_suffix(".bintmp")
+            try:
+                with glb_path.open("rb") as fin:
+                    bin_len = _relay_bin(fin, bin_off, lj["bufferViews"], replaced, tmp_bin)
+                lj["buffers"][0]["byteLength"] = bin_len
+                _write_glb_streaming(out_path, lj, tmp_bin, bin_len)
+            finally:
+                try:
+                    os.remove(tmp_bin)
+                except OSError:
+                    pass
+            written.append(out_path)
+            levels.append(
+                {
+                    "level": len(levels),
+                    "uri": out_path.name,
+                    # the farthest a clustered vertex moves: one cell diagonal
+                    "geometric_error": cell * 3**0.5,
+                    "triangles": n_tri,
+                    "bytes": out_path.stat().st_size,
+                }
+            )
+            if n_tri == 0:
+                break
+
+        if len(levels) == 1:
+            return None
+        manifest = out_dir / f"{glb_path.stem}.lods.json"
+        manifest.write_text(
+            json.dumps({"source": glb_path.name, "bounds": [lo.tolist(), hi.tolist()], "levels": levels}, indent=2)
+        )
+        summary = ", ".join(f"{lv['triangles']} tris/{lv['bytes'] / 1e6:.1f} MB" for lv in levels)
+        logger.info("lod: %s -> %s", glb_path.name, summary)
+        return manifest
+    except Exception:
+        logger.exception("lod generation failed; keeping the single-level GLB")
+        for path in written:
+            path.unlink(missing_ok=True)
+        return None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Iterable
 
 import numpy as np
@@ -43,8 +44,16 @@ def coalesce_groups_by_node(indices: np.ndarray, groups: list[GroupReference]):
     return new_indices, new_groups
 
 
-def concatenate_stores(stores: Iterable[MeshStore], graph_store: GraphStore = None) -> MergedMesh | None:
-    """Concatenate multiple MeshStore objects into a single MergedMesh object."""
+def concatenate_stores(
+    stores: Iterable[MeshStore], graph_store: GraphStore = None, weld: bool = False, reorder: bool = False
+) -> MergedMesh | None:
+    """Concatenate multiple MeshStore objects into a single MergedMesh object.
+
+    :param weld: Merge coincident vertices (same position and normal) within each store, see
+        :func:`ada.visit.optimizing.weld_vertices`.
+    :param reorder: Reorder each store's triangles and the vertices for GPU cache locality, see
+        :func:`ada.visit.optimizing.reorder_for_cache`. Triangle meshes only.
+    """
     # Converting to list to avoid multiple iterations (e.g. if stores is a generator)
     stores = list(stores)
 
@@ -53,7 +62,7 @@ def concatenate_stores(stores: Iterable[MeshStore], graph_store: GraphStore = No
 
     if len(stores) == 1:
         store = stores[0]
-        return MergedMesh(
+        merged = MergedMesh(
             store.indices,
             store.position,
             store.normal,
@@ -65,6 +74,7 @@ def concatenate_stores(stores: Iterable[MeshStore], graph_store: GraphStore = No
                 else [GroupReference(store.node_ref, 0, len(store.position))]
             ),
         )
+        return _optimize_merged(merged, weld, reorder)
 
     groups = []
     position_list = []
@@ -87,4 +97,139 @@ def concatenate_stores(stores: Iterable[MeshStore], graph_store: GraphStore = No
     position = np.concatenate(position_list, dtype=np.float32)
     indices = np.concatenate(indices_list, dtype=np.uint32)
     normal = np.concatenate(normal_list) if has_normal else None
-    return MergedMesh(indices, position, normal, stores[0].material, stores[0].type, groups)
+    merged = MergedMesh(indices, position, normal, stores[0].material, stores[0].type, groups)
+    return _optimize_merged(merged, weld, reorder)
+
+
+def _optimize_merged(merged: MergedMesh, weld: bool, reorder: bool) -> MergedMesh:
+    """The opt-in weld / reorder stages of :func:`concatenate_stores`; draw ranges are unchanged."""
+    if merged.type == MeshType.POINTS or not (weld or reorder):
+        return merged
+    from ada.visit.optimizing import reorder_for_cache, weld_vertices
+
+    if weld:
+        merged.position, merged.indices, merged.normal = weld_vertices(
+            merged.position, merged.indices, merged.normal, merged.groups
+        )
+    if reorder and merged.type == MeshType.TRIANGLES:
+        merged.position, merged.indices, merged.normal = reorder_for_cache(
+            merged.position, merged.indices, merged.normal, merged.groups
+        )
+    return merged
+
+
+@dataclass
+class InstanceGroup:
+    """Meshes that are rigid-transformed copies of one prototype.
+
+    :param prototype: The shared mesh, in its own local frame.
+    :param transforms: (N, 4, 4) local-to-world transform per instance.
+    :param node_refs: Node reference per instance.
+    """
+
+    prototype: MeshStore
+    transforms: np.ndarray
+    node_refs: list
+
+
+def rigid_frame(points: np.ndarray) -> np.ndarray | None:
+    """Right-handed local-to-world frame (4x4) defined by the vertex order of ``points``.
+
+    The origin is the first vertex, the x-axis points to the vertex farthest from it and the y-axis towards
+    the vertex farthest from that line. Rigid copies with the same vertex order get frames that map one onto
+    the other. Returns None for degenerate (collinear) point sets.
+    """
+    origin = points[0]
+    rel = points - origin
+    dist = np.einsum("ij,ij->i", rel, rel)
+    # Symmetric shapes have several equally far vertices. Take the first one within a relative tolerance, so
+    # round-off in the copies can't pick a different vertex.
+    far = int(np.argmax(dist >= dist.max() * (1.0 - 1e-6)))
+    if dist[far] == 0.0:
+        return None
+    x = rel[far] / np.sqrt(dist[far])
+    off_axis = rel - np.outer(rel @ x, x)
+    off_dist = np.einsum("ij,ij->i", off_axis, off_axis)
+    far_off = int(np.argmax(off_dist >= off_dist.max() * (1.0 - 1e-6)))
+    if off_dist[far_off] <= 1e-12 * dist[far]:
+        return None
+    y = off_axis[far_off] / np.sqrt(off_dist[far_off])
+
+    frame = np.eye(4)
+    frame[:3, 0] = x
+    frame[:3, 1] = y
+    frame[:3, 2] = np.cross(x, y)
+    frame[:3, 3] = origin
+    return frame
+
+
+def mesh_fingerprint(store: MeshStore, tol: float = 1e-4) -> tuple[bytes, np.ndarray] | None:
+    """Hash of a mesh modulo rigid transform, and the local-to-world frame it was taken in.
+
+    Two meshes with equal fingerprints have the same material, connectivity and vertex order, and local
+    vertex coordinates equal to within ``tol``. Returns None when the mesh has no usable frame.
+    """
+    import hashlib
+
+    points = np.asarray(store.position, dtype=np.float64).reshape(-1, 3)
+    if len(points) < 3 or store.indices is None:
+        return None
+    frame = rigid_frame(points)
+    if frame is None:
+        return None
+
+    local = (points - frame[:3, 3]) @ frame[:3, :3]
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.round(local / tol).astype(np.int64).tobytes())
+    h.update(np.asarray(store.indices, dtype=np.uint32).tobytes())
+    h.update(f"{store.type.value}:{store.material}".encode())
+    return h.digest(), frame
+
+
+def find_instances(
+    stores: Iterable[MeshStore], min_instances: int = 2, tol: float = 1e-4
+) -> tuple[list[InstanceGroup], list[MeshStore]]:
+    """Split ``stores`` into groups of rigid-transformed copies and the remaining unique meshes.
+
+    Only triangle meshes are considered. Groups keep the order of their first occurrence and the remaining
+    stores keep their input order.
+
+    :param min_instances: Minimum number of copies for a mesh to become an instance group.
+    :param tol: Tolerance on the local vertex coordinates, see :func:`mesh_fingerprint`.
+    """
+    buckets: dict[bytes, list[tuple[MeshStore, np.ndarray]]] = {}
+    order: list[tuple[bytes | None, MeshStore]] = []
+    for store in stores:
+        fp = mesh_fingerprint(store, tol) if store.type == MeshType.TRIANGLES else None
+        if fp is None:
+            order.append((None, store))
+            continue
+        key, frame = fp
+        buckets.setdefault(key, []).append((store, frame))
+        order.append((key, store))
+
+    groups: list[InstanceGroup] = []
+    singles: list[MeshStore] = []
+    emitted = set()
+    for key, store in order:
+        members = buckets.get(key) if key is not None else None
+        if members is None or len(members) < min_instances:
+            singles.append(store)
+            continue
+        if key in emitted:
+            continue
+        emitted.add(key)
+
+        first, frame = members[0]
+        rot, origin = frame[:3, :3], frame[:3, 3]
+        position = ((np.asarray(first.position, dtype=np.float64).reshape(-1, 3) - origin) @ rot).astype(np.float32)
+        normal = None
+        if first.normal is not None and len(first.normal):
+            normal = (np.asarray(first.normal, dtype=np.float64).reshape(-1, 3) @ rot).astype(np.float32).reshape(-1)
+        prototype = MeshStore(
+            first.index, None, position.reshape(-1), first.indices, normal, first.material, first.type, first.node_ref
+        )
+        transforms = np.stack([f for _, f in members])
+        groups.append(InstanceGroup(prototype, transforms, [s.node_ref for s, _ in members]))
+
+    return groups, singles
@@ -0,0 +1,301 @@
+"""Picking-safe ``KHR_mesh_quantization`` pass for GLB output.
+
+Stores float32 vertex positions as normalized int16 and normals as normalized
+int8, per mesh: positions are centred on the mesh's bounds and scaled by its
+half extent (one uniform scale, so normals need no correction), and the
+dequantization ``T(centre) * S(half extent)`` is folded into every node that
+draws the mesh. The children of such a node get the inverse prepended, so
+their world transforms are unchanged.
+
+What picking relies on is left alone: index buffers (so ``draw_ranges`` index
+offsets stay valid), vertex counts and order, node order and names,
+``scene.extras`` (``id_hierarchy`` / ``draw_ranges``) and the
+``ADA_EXT_data`` extension. Only POSITION / NORMAL accessors, their
+bufferViews and the transforms of the nodes drawing them change.
+
+Meshes are left in float when quantizing them would touch state the pass
+cannot rewrite safely: morph targets, skins, animated nodes, nodes with
+``EXT_mesh_gpu_instancing`` (the viewer applies node * instance * mesh, so a
+fold into the node lands on the wrong side of the instance transforms), or
+accessors sharing / interleaving a bufferView. Runs before the meshopt pass (see
+``compress.py``); like it, any failure returns the input unchanged.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+from pathlib import Path
+
+from .meshopt import _CHUNK_BIN, _CHUNK_JSON, _GLB_MAGIC, _align4, _write_glb_streaming
+
+logger = logging.getLogger(__name__)
+
+_FLOAT = 5126
+_BYTE = 5120
+_SHORT = 5122
+
+# Same threshold as the meshopt pass: below it the saving is not worth the
+# precision loss.
+DEFAULT_MIN_BYTES = 1_000_000
+
+
+def _read_glb_json(path: Path) -> tuple[dict, int, int]:
+    """``(json, file offset of the BIN data, BIN length)`` without reading the BIN."""
+    with path.open("rb") as f:
+        magic, _ver, _len = struct.unpack("<III", f.read(12))
+        if magic != _GLB_MAGIC:
+            raise ValueError("not a GLB")
+        jlen, jtype = struct.unpack("<II", f.read(8))
+        if jtype != _CHUNK_JSON:
+            raise ValueError("expected JSON chunk first")
+        j = json.loads(f.read(jlen).decode("utf-8"))
+        blen, btype = struct.unpack("<II", f.read(8))
+        if btype != _CHUNK_BIN:
+            raise ValueError("expected BIN chunk")
+        return j, f.tell(), blen
+
+
+def _relay_bin(fin, bin_off: int, buffer_views: list[dict], replaced: dict[int, bytes], bin_path: Path) -> int:
+    """Write every bufferView in order to ``bin_path`` (4-aligned), taking the bytes of
+    the views in ``replaced`` from there and the rest from ``fin``. Updates the views'
+    offsets and lengths in place; returns the BIN length."""
+    with bin_path.open("wb") as fout:
+        off = 0
+        for i, view in enumerate(buffer_views):
+            data = replaced.get(i)
+            if data is None:
+                fin.seek(bin_off + view.get("byteOffset", 0))
+                data = fin.read(view["byteLength"])
+            view["byteOffset"] = off
+            view["byteLength"] = len(data)
+            fout.write(data)
+            off += len(data)
+            pad = _align4(off) - off
+            if pad:
+                fout.write(b"\x00" * pad)
+                off += pad
+    return off
+
+
+def _node_matrix(node: dict):
+    """Column-vector 4x4 local matrix of a glTF node."""
+    import numpy as np
+
+    if "matrix" in node:
+        return np.asarray(node["matrix"], dtype=float).reshape(4, 4).T
+    x, y, z, w = node.get("rotation", (0.0, 0.0, 0.0, 1.0))
+    r = np.array(
+        [
+            [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+            [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+            [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+        ]
+    )
+    m = np.eye(4)
+    m[:3, :3] = r * np.asarray(node.get("scale", (1.0, 1.0, 1.0)), dtype=float)
+    m[:3, 3] = node.get("translation", (0.0, 0.0, 0.0))
+    return m
+
+
+def _compose(node: dict, centre, scale: float, inverse: bool) -> None:
+    """Post-multiply ``node``'s transform by ``T(centre) S(scale)`` (or pre-multiply by its
+    inverse). Stays TRS when the node is TRS: the dequantization scale is uniform."""
+    import numpy as np
+
+    if "matrix" in node:
+        d = np.eye(4)
+        if inverse:
+            d[:3, :3] /= scale
+            d[:3, 3] = -np.asarray(centre) / scale
+            m = d @ _node_matrix(node)
+        else:
+            d[:3, :3] *= scale
+            d[:3, 3] = centre
+            m = _node_matrix(node) @ d
+        node["matrix"] = m.T.ravel().tolist()
+        return
+
+    t = np.asarray(node.get("translation", (0.0, 0.0, 0.0)), dtype=float)
+    s = np.asarray(node.get("scale", (1.0, 1.0, 1.0)), dtype=float)
+    if inverse:
+        node["translation"] = ((t - centre) / scale).tolist()
+        node["scale"] = (s / scale).tolist()
+    else:
+        rs = _node_matrix({"rotation": node.get("rotation", (0.0, 0.0, 0.0, 1.0)), "scale": s.tolist()})[:3, :3]
+        node["translation"] = (t + rs @ np.asarray(centre)).tolist()
+        node["scale"] = (s * scale).tolist()
+
+
+def _plan(j: dict) -> dict[int, dict[str, list[int]]]:
+    """``{mesh index: {"POSITION": [accessors], "NORMAL": [accessors]}}`` of the meshes
+    that can be quantized."""
+    accessors = j.get("accessors", [])
+    buffer_views = j.get("bufferViews", [])
+    nodes = j.get("nodes", [])
+
+    views_used = {}
+    for a in accessors:
+        if a.get("bufferView") is not None:
+            views_used[a["bufferView"]] = views_used.get(a["bufferView"], 0) + 1
+    animated = {ch.get("target", {}).get("node") for anim in j.get("animations", []) for ch in anim.get("channels", [])}
+    users: dict[int, list[int]] = {}
+    for i, n in enumerate(nodes):
+        if "mesh" in n:
+            users.setdefault(n["mesh"], []).append(i)
+
+    def tight(ai: int, n_comp: int) -> bool:
+        a = accessors[ai]
+        bv = a.get("bufferView")
+        if bv is None or a.get("sparse") or a.get("componentType") != _FLOAT or a.get("type") != "VEC3":
+            return False
+        view = buffer_views[bv]
+        return (
+            views_used[bv] == 1
+            and a.get("byteOffset", 0) == 0
+            and view.get("byteStride", 4 * n_comp) == 4 * n_comp
+            and view.get("buffer", 0) == 0
+        )
+
+    position_meshes: dict[int, set[int]] = {}
+    for mi, mesh in enumerate(j.get("meshes", [])):
+        for p in mesh.get("primitives", []):
+            ai = p.get("attributes", {}).get("POSITION")
+            if ai is not None:
+                position_meshes.setdefault(ai, set()).add(mi)
+
+    plan = {}
+    for mi, mesh in enumerate(j.get("meshes", [])):
+        mesh_nodes = users.get(mi, [])
+        if not mesh_nodes:
+            continue
+        if any(i in animated or "skin" in nodes[i] for i in mesh_nodes):
+            continue
+        if any("EXT_mesh_gpu_instancing" in nodes[i].get("extensions", {}) for i in mesh_nodes):
+            continue
+        if any(c in animated for i in mesh_nodes for c in nodes[i].get("children", [])):
+            continue
+        prims = mesh.get("primitives", [])
+        if not prims or any(p.get("targets") for p in prims):
+            continue
+        positions = sorted({p.get("attributes", {}).get("POSITION") for p in prims} - {None})
+        if not positions or not all(tight(ai, 3) for ai in positions):
+            continue
+        # An accessor drawn by two meshes would need two dequantization transforms.
+        if any(len(position_meshes[ai]) > 1 for ai in positions):
+            continue
+        normals = sorted({p.get("attributes", {}).get("NORMAL") for p in prims} - {None})
+        plan[mi] = {"POSITION": positions, "NORMAL": [ai for ai in normals if tight(ai, 3)]}
+    return plan
+
+
+def quantize_glb(in_path: str | Path, out_path: str | Path, *, min_bytes: int = DEFAULT_MIN_BYTES) -> Path:
+    """Quantize ``in_path`` → ``out_path`` with KHR_mesh_quantization. Returns ``out_path``
+    on success, or ``in_path`` (unchanged) when nothing is quantizable, the input is below
+    ``min_bytes``, or anything fails."""
+    in_path = Path(in_path)
+    out_path = Path(out_path)
+    try:
+        if in_path.stat().st_size < min_bytes:
+            logger.info("quantize: %s below %d bytes; left unquantized", in_path.name, min_bytes)
+            return in_path
+    except OSError:
+        pass
+    try:
+        import numpy as np
+    except Exception:
+        logger.warning("quantization skipped: numpy not available")
+        return in_path
+
+    tmp_bin = out_path.with_suffix(".bintmp")
+    try:
+        j, bin_off, _bin_len = _read_glb_json(in_path)
+        used = set(j.get("extensionsUsed", []))
+        if {"EXT_meshopt_compression", "KHR_draco_mesh_compression", "KHR_mesh_quantization"} & used:
+            logger.info("quantize: %s already compressed or quantized; skipping", in_path.name)
+            return in_path
+        if len(j.get("buffers", [])) != 1:
+            return in_path
+        plan = _plan(j)
+        if not plan:
+            logger.info("quantize: no quantizable meshes in %s", in_path.name)
+            return in_path
+
+        accessors = j["accessors"]
+        buffer_views = j["bufferViews"]
+        nodes = j["nodes"]
+        replaced: dict[int, bytes] = {}  # bufferView -> new bytes
+
+        with in_path.open("rb") as fin:
+
+            def _read(ai: int) -> np.ndarray:
+                a = accessors[ai]
+                view = buffer_views[a["bufferView"]]
+                fin.seek(bin_off + view.get("byteOffset", 0))
+                return np.frombuffer(fin.read(12 * a["count"]), dtype="<f4").reshape(-1, 3)
+
+            for mi, attrs in plan.items():
+                positions = {ai: _read(ai) for ai in attrs["POSITION"]}
+                finite = [p[np.isfinite(p).all(axis=1)] for p in positions.values()]
+                finite = [p for p in finite if len(p)]
+                if not finite or sum(len(p) for p in finite) != sum(len(p) for p in positions.values()):
+                    continue
+                lo = np.min([p.min(axis=0) for p in finite], axis=0).astype(float)
+                hi = np.max([p.max(axis=0) for p in finite], axis=0).astype(float)
+                centre = (lo + hi) / 2
+                scale = float((hi - lo).max() / 2) or 1.0
+
+                for ai, p in positions.items():
+                    q = np.zeros((len(p), 4), dtype="<i2")  # 8-byte stride: vertex attributes are 4-aligned
+                    q[:, :3] = np.clip(np.rint((p - centre) / scale * 32767), -32767, 32767)
+                    a = accessors[ai]
+                    a.update(componentType=_SHORT, normalized=True)
+                    a["min"] = q[:, :3].min(axis=0).tolist() if len(q) else [0, 0, 0]
+                    a["max"] = q[:, :3].max(axis=0).tolist() if len(q) else [0, 0, 0]
+                    buffer_views[a["bufferView"]]["byteStride"] = 8
+                    replaced[a["bufferView"]] = q.tobytes()
+
+                for ai in attrs["NORMAL"]:
+                    n = np.nan_to_num(_read(ai))
+                    q = np.zeros((len(n), 4), dtype="i1")
+                    q[:, :3] = np.clip(np.rint(n * 127), -127, 127)
+                    a = accessors[ai]
+                    a.update(componentType=_BYTE, normalized=True)
+                    a.pop("min", None)
+                    a.pop("max", None)
+                    buffer_views[a["bufferView"]]["byteStride"] = 4
+                    replaced[a["bufferView"]] = q.tobytes()
+
+                for node in nodes:
+                    if node.get("mesh") != mi:
+                        continue
+                    _compose(node, centre, scale, inverse=False)
+                    for c in node.get("children", []):
+                        _compose(nodes[c], centre, scale, inverse=True)
+
+            if not replaced:
+                return in_path
+
+            new_bin_len = _relay_bin(fin, bin_off, buffer_views, replaced, tmp_bin)
+
+        j["buffers"][0]["byteLength"] = new_bin_len
+        j["extensionsUsed"] = sorted(used | {"KHR_mesh_quantization"})
+        j["extensionsRequired"] = sorted(set(j.get("extensionsRequired", [])) | {"KHR_mesh_quantization"})
+        _write_glb_streaming(out_path, j, tmp_bin, new_bin_len)
+        logger.info(
+            "quantize: %.1f MB -> %.1f MB %s",
+            in_path.stat().st_size / 1e6,
+            out_path.stat().st_size / 1e6,
+            in_path.name,
+        )
+        return out_path
+    except Exception:
+        logger.exception("quantization failed; keeping the unquantized GLB")
+        return in_path
+    finally:
+        try:
+            os.remove(tmp_bin)
+        except OSError:
+            pass
@@ -9,6 +9,7 @@ from ada.config import logger
 from ada.visit.colors import Color, color_dict
 from ada.visit.gltf.graph import GraphNode, GraphStore
 from ada.visit.gltf.meshes import MergedMesh, MeshStore, MeshType
+from ada.visit.gltf.optimize import InstanceGroup
 from ada.visit.utils import m4x4_z_up_rot
 
 
@@ -19,6 +20,139 @@ def merged_mesh_to_trimesh_scene(
     buffer_id: int,
     graph_store: GraphStore = None,
     apply_transform: bool = False,
+):
+    mesh = _trimesh_from_merged_mesh(merged_mesh, pbr_mat, buffer_id, graph_store)
+
+    # Rotate the mesh to set Z up
+    if apply_transform:
+        mesh.apply_transform(m4x4_z_up_rot)
+
+    if isinstance(merged_mesh, MergedMesh):
+        node_name = f"node{buffer_id}"
+    else:
+        node_name = f"node{buffer_id}_{merged_mesh.node_ref}"
+
+    parent_node_name = graph_store.top_level.name if graph_store else None
+    geom_name = f"node{buffer_id}"
+
+    if graph_store:
+        graph_store.add_merged_mesh(buffer_id, merged_mesh)
+
+    return scene.add_geometry(
+        mesh,
+        node_name=node_name,
+        geom_name=geom_name,
+        parent_node_name=parent_node_name,
+    )
+
+
+def instanced_mesh_to_trimesh_scene(
+    scene: trimesh.Scene,
+    group: InstanceGroup,
+    pbr_mat: dict | Color,
+    buffer_id: int,
+    instance_id: int,
+    graph_store: GraphStore = None,
+    apply_transform: bool = False,
+) -> tuple[str, np.ndarray]:
+    """Add the prototype of an instance group to the scene once.
+
+    Returns the node name and the (N, 4, 4) instance transforms, to be written with :func:`add_gpu_instancing`
+    when the scene is exported.
+    """
+    mesh = _trimesh_from_merged_mesh(group.prototype, pbr_mat, buffer_id, None)
+    node_name = f"node{buffer_id}_inst{instance_id}"
+    parent_node_name = graph_store.top_level.name if graph_store else None
+    scene.add_geometry(mesh, node_name=node_name, geom_name=node_name, parent_node_name=parent_node_name)
+
+    transforms = group.transforms
+    if apply_transform:
+        transforms = m4x4_z_up_rot @ transforms
+    return node_name, transforms
+
+
+def _rotation_to_quaternion(rot: np.ndarray) -> np.ndarray:
+    """(N, 3, 3) rotation matrices to (N, 4) unit quaternions in glTF (x, y, z, w) order"""
+    m = rot
+    trace = m[:, 0, 0] + m[:, 1, 1] + m[:, 2, 2]
+    quat = np.empty((len(m), 4))
+
+    # Branch per matrix on the largest diagonal term for numerical stability
+    cases = np.argmax(np.stack([trace, m[:, 0, 0], m[:, 1, 1], m[:, 2, 2]], axis=1), axis=1)
+
+    i = cases == 0
+    s = np.sqrt(trace[i] + 1.0) * 2
+    quat[i] = np.stack(
+        [(m[i, 2, 1] - m[i, 1, 2]) / s, (m[i, 0, 2] - m[i, 2, 0]) / s, (m[i, 1, 0] - m[i, 0, 1]) / s, 0.25 * s], axis=1
+    )
+    i = cases == 1
+    s = np.sqrt(1.0 + m[i, 0, 0] - m[i, 1, 1] - m[i, 2, 2]) * 2
+    quat[i] = np.stack(
+        [0.25 * s, (m[i, 0, 1] + m[i, 1, 0]) / s, (m[i, 0, 2] + m[i, 2, 0]) / s, (m[i, 2, 1] - m[i, 1, 2]) / s], axis=1
+    )
+    i = cases == 2
+    s = np.sqrt(1.0 + m[i, 1, 1] - m[i, 0, 0] - m[i, 2, 2]) * 2
+    quat[i] = np.stack(
+        [(m[i, 0, 1] + m[i, 1, 0]) / s, 0.25 * s, (m[i, 1, 2] + m[i, 2, 1]) / s, (m[i, 0, 2] - m[i, 2, 0]) / s], axis=1
+    )
+    i = cases == 3
+    s = np.sqrt(1.0 + m[i, 2, 2] - m[i, 0, 0] - m[i, 1, 1]) * 2
+    quat[i] = np.stack(
+        [(m[i, 0, 2] + m[i, 2, 0]) / s, (m[i, 1, 2] + m[i, 2, 1]) / s, 0.25 * s, (m[i, 1, 0] - m[i, 0, 1]) / s], axis=1
+    )
+    return quat / np.linalg.norm(quat, axis=1, keepdims=True)
+
+
+def add_gpu_instancing(buffer_items, tree: dict, instances: dict[str, np.ndarray]) -> None:
+    """Write ``EXT_mesh_gpu_instancing`` attributes on the nodes named in ``instances``.
+
+    Meant to run as (part of) a trimesh ``buffer_postprocessor``: the TRANSLATION/ROTATION arrays are appended
+    as new buffer items and accessors.
+
+    :param instances: Node name -> (N, 4, 4) rigid instance transforms.
+    """
+    ext_name = "EXT_mesh_gpu_instancing"
+    nodes = {node.get("name"): node for node in tree.get("nodes", [])}
+    accessors = tree["accessors"]
+
+    def add_accessor(key: str, data: np.ndarray, acc_type: str) -> int:
+        view_idx = len(buffer_items)
+        buffer_items[f"_{ext_name}_{key}"] = np.ascontiguousarray(data, dtype="<f4").tobytes()
+        acc_idx = len(accessors)
+        accessors[f"_{ext_name}_{key}"] = {
+            "bufferView": view_idx,
+            "componentType": 5126,
+            "count": len(data),
+            "type": acc_type,
+        }
+        return acc_idx
+
+    num_written = 0
+    for node_name, transforms in instances.items():
+        node = nodes.get(node_name)
+        if node is None:
+            logger.warning(f"Instanced node {node_name!r} not found in the glTF tree")
+            continue
+        transforms = np.asarray(transforms, dtype=np.float64)
+        attributes = {
+            "TRANSLATION": add_accessor(f"{node_name}_t", transforms[:, :3, 3], "VEC3"),
+            "ROTATION": add_accessor(f"{node_name}_r", _rotation_to_quaternion(transforms[:, :3, :3]), "VEC4"),
+        }
+        node.setdefault("extensions", {})[ext_name] = {"attributes": attributes}
+        num_written += 1
+
+    if num_written == 0:
+        return None
+
+    # No fallback is written for the instanced nodes, so loaders must support the extension
+    for key in ("extensionsUsed", "extensionsRequired"):
+        used = tree.setdefault(key, [])
+        if ext_name not in used:
+            used.append(ext_name)
+
+
+def _trimesh_from_merged_mesh(
+    merged_mesh: MergedMesh | MeshStore, pbr_mat: dict | Color, buffer_id: int, graph_store: GraphStore = None
 ):
     vertices = merged_mesh.position.reshape(int(len(merged_mesh.position) / 3), 3)
     if merged_mesh.type == MeshType.TRIANGLES:
@@ -80,27 +214,7 @@ def merged_mesh_to_trimesh_scene(
     else:
         raise NotImplementedError(f"Mesh type {merged_mesh.type} is not supported")
 
-    # Rotate the mesh to set Z up
-    if apply_transform:
-        mesh.apply_transform(m4x4_z_up_rot)
-
-    if isinstance(merged_mesh, MergedMesh):
-        node_name = f"node{buffer_id}"
-    else:
-        node_name = f"node{buffer_id}_{merged_mesh.node_ref}"
-
-    parent_node_name = graph_store.top_level.name if graph_store else None
-    geom_name = f"node{buffer_id}"
-
-    if graph_store:
-        graph_store.add_merged_mesh(buffer_id, merged_mesh)
-
-    return scene.add_geometry(
-        mesh,
-        node_name=node_name,
-        geom_name=geom_name,
-        parent_node_name=parent_node_name,
-    )
+    return mesh
 
 
 def create_id_sequence(graph_store: GraphStore, merged_mesh: MergedMesh):
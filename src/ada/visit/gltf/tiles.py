@@ -0,0 +1,310 @@
+"""Spatially tiled GLB output.
+
+Objects (one per picking draw range) are partitioned into an octree by the centre of
+their bounding box, splitting a cell while it holds more than a triangle budget. Each
+leaf becomes one GLB (``<stem>.tile<k>.glb``), written next to the full model, and a
+``<stem>.tileset.json`` manifest lists:
+
+* ``tiles``: per tile its ``uri``, octree ``id`` (``r/3/5``: octant path from the root),
+  ``bounds`` (the union of its objects' boxes, so a tile can be culled without loading
+  it), triangle count and size;
+* ``object_tiles``: ``{node_id: [tile index, ...]}`` — which tiles draw an object;
+* ``id_hierarchy``: the full model tree, so it can be shown before any tile loads.
+
+Node ids are the full model's, so picking works the same across tiles. Every tile's
+``scenes[0].extras`` carries the draw ranges of its own buffers and the part of
+``id_hierarchy`` leading to its objects.
+
+:func:`tile_glb` splits an exported GLB along its draw ranges (used by
+``Part.to_gltf``). The streaming STEP conversion partitions its solids as they stream
+in instead (see ``convert_step_stream_to_glb``); both share :func:`octree_partition`
+and :func:`write_tileset`.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .lod import _read_accessor, _rewritable_primitives
+from .meshopt import _write_glb_streaming
+from .quantize import _read_glb_json, _relay_bin
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TILE_TRIANGLES = 500_000
+DEFAULT_MAX_DEPTH = 8
+
+# indices per triangle / line segment; other modes count single indices
+_INDICES_PER_PRIMITIVE = {4: 3, 1: 2}
+
+
+@dataclass
+class Tile:
+    """An octree leaf: ``members`` index the partitioned objects, in ascending order."""
+
+    id: str
+    members: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
+
+    def manifest_entry(self, path: Path, triangles: int) -> dict:
+        return {
+            "id": self.id,
+            "uri": path.name,
+            "bounds": [self.min.tolist(), self.max.tolist()],
+            "triangles": int(triangles),
+            "bytes": path.stat().st_size,
+        }
+
+
+def octree_partition(
+    lo: np.ndarray,
+    hi: np.ndarray,
+    triangles: np.ndarray,
+    max_triangles: int = DEFAULT_TILE_TRIANGLES,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+) -> list[Tile]:
+    """Octree leaves over objects with bounding boxes ``lo``/``hi`` (n, 3).
+
+    A cell is split into octants (by object centre) while it holds more than
+    ``max_triangles`` and more than one object, down to ``max_depth``. Leaves come out
+    depth-first, octants in order."""
+    lo = np.asarray(lo, dtype=float).reshape(-1, 3)
+    hi = np.asarray(hi, dtype=float).reshape(-1, 3)
+    triangles = np.asarray(triangles)
+    if len(lo) == 0:
+        return []
+    centre = (lo + hi) / 2
+    bits = np.array([1, 2, 4])
+
+    tiles = []
+    stack = [("r", np.arange(len(lo)), centre.min(axis=0), centre.max(axis=0), 0)]
+    while stack:
+        tile_id, members, cell_lo, cell_hi, depth = stack.pop()
+        if len(members) == 1 or depth >= max_depth or triangles[members].sum() <= max_triangles:
+            tiles.append(Tile(tile_id, members, lo[members].min(axis=0), hi[members].max(axis=0)))
+            continue
+        mid = (cell_lo + cell_hi) / 2
+        octant = (centre[members] > mid) @ bits
+        for o in range(7, -1, -1):  # pushed in reverse so octant 0 pops first
+            sel = members[octant == o]
+            if len(sel) == 0:
+                continue
+            upper = (o & bits) > 0
+            stack.append(
+                (f"{tile_id}/{o}", sel, np.where(upper, mid, cell_lo), np.where(upper, cell_hi, mid), depth + 1)
+            )
+    return tiles
+
+
+def subset_id_hierarchy(id_hierarchy: dict, node_ids) -> dict:
+    """``id_hierarchy`` restricted to ``node_ids`` and their ancestors (source order kept)."""
+    keep = set()
+    for nid in node_ids:
+        nid = str(nid)
+        while nid in id_hierarchy and nid not in keep:
+            keep.add(nid)
+            nid = str(id_hierarchy[nid][1])
+    return {k: v for k, v in id_hierarchy.items() if str(k) in keep}
+
+
+def write_tileset(
+    path: Path, source: str, entries: list[dict], object_tiles: dict[str, list[int]], id_hierarchy: dict
+) -> Path:
+    """Write the tileset manifest; ``entries`` are :meth:`Tile.manifest_entry` dicts in tile order."""
+    bounds = None
+    if entries:
+        mins = np.array([e["bounds"][0] for e in entries])
+        maxs = np.array([e["bounds"][1] for e in entries])
+        bounds = [mins.min(axis=0).tolist(), maxs.max(axis=0).tolist()]
+    data = {
+        "source": source,
+        "bounds": bounds,
+        "tiles": entries,
+        "object_tiles": object_tiles,
+        "id_hierarchy": id_hierarchy,
+    }
+    path.write_text(json.dumps(data, separators=(",", ":")))
+    return path
+
+
+def tile_glb(
+    glb_path: str | Path,
+    max_triangles: int = DEFAULT_TILE_TRIANGLES,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    out_dir: str | Path | None = None,
+) -> Path | None:
+    """Split ``glb_path`` into tiles along its draw ranges. Returns the manifest path, or
+    None when the GLB cannot be tiled (a mesh without draw ranges, shared or interleaved
+    buffers, animations, skins, instancing or compression) or anything fails. The source
+    GLB is never modified."""
+    glb_path = Path(glb_path)
+    out_dir = Path(out_dir) if out_dir is not None else glb_path.parent
+    written: list[Path] = []
+    try:
+        j, bin_off, _bin_len = _read_glb_json(glb_path)
+        used = set(j.get("extensionsUsed", []))
+        unsupported = {
+            "EXT_meshopt_compression",
+            "KHR_draco_mesh_compression",
+            "KHR_mesh_quantization",
+            "EXT_mesh_gpu_instancing",
+        }
+        if unsupported & used or j.get("animations") or j.get("skins") or len(j.get("buffers", [])) != 1:
+            logger.info("tiles: %s uses features the tiler does not rewrite; not tiled", glb_path.name)
+            return None
+
+        extras = (j.get("scenes") or [{}])[0].get("extras") or {}
+        id_hierarchy = extras.get("id_hierarchy", {})
+        meshes = j.get("meshes", [])
+        # Lines and points are tiled as well as triangles: only the index ranges matter.
+        targets = {mi: key for mi, _p, key in _rewritable_primitives(j, modes=None) if key is not None}
+        if not meshes or any(len(m.get("primitives", [])) != 1 for m in meshes) or len(targets) != len(meshes):
+            logger.info("tiles: %s has meshes without draw ranges; not tiled", glb_path.name)
+            return None
+
+        # One object per (mesh, draw range): its bounding box and triangle count.
+        buffers: dict[int, dict] = {}
+        objects: list[tuple[int, str, int, int]] = []
+        lo, hi, weights = [], [], []
+        with glb_path.open("rb") as fin:
+            for mi, key in targets.items():
+                prim = meshes[mi]["primitives"][0]
+                attributes = {name: _read_accessor(fin, bin_off, j, ai) for name, ai in prim["attributes"].items()}
+                indices = _read_accessor(fin, bin_off, j, prim["indices"])
+                buffers[mi] = {"attributes": attributes, "indices": indices}
+                position = attributes["POSITION"]
+                per_prim = _INDICES_PER_PRIMITIVE.get(prim.get("mode", 4), 1)
+                for nid, (start, length) in extras[key].items():
+                    start, length = int(start), int(length)
+                    if length == 0:
+                        continue
+                    pts = position[indices[start : start + length]]
+                    objects.append((mi, str(nid), start, length))
+                    lo.append(pts.min(axis=0))
+                    hi.append(pts.max(axis=0))
+                    weights.append(length // per_prim)
+
+        tiles = octree_partition(np.array(lo), np.array(hi), np.array(weights), max_triangles, max_depth)
+        if len(tiles) < 2:
+            logger.info("tiles: %s fits in one tile", glb_path.name)
+            return None
+
+        out_dir.mkdir(parents=True, exist_ok=True)
+        entries = []
+        object_tiles: dict[str, list[int]] = {}
+        for k, tile in enumerate(tiles):
+            by_mesh: dict[int, list[tuple[str, int, int]]] = {}
+            for i in tile.members:
+                mi, nid, start, length = objects[i]
+                by_mesh.setdefault(mi, []).append((nid, start, length))
+                in_tiles = object_tiles.setdefault(nid, [])
+                if not in_tiles or in_tiles[-1] != k:
+                    in_tiles.append(k)
+
+            path = out_dir / f"{glb_path.stem}.tile{k}.glb"
+            n_tri = _write_tile(path, j, buffers, by_mesh, targets, id_hierarchy)
+            written.append(path)
+            entries.append(tile.manifest_entry(path, n_tri))
+
+        manifest = write_tileset(
+            out_dir / f"{glb_path.stem}.tileset.json", glb_path.name, entries, object_tiles, id_hierarchy
+        )
+        logger.info("tiles: %s -> %d tiles", glb_path.name, len(entries))
+        return manifest
+    except Exception:
+        logger.exception("tiling failed; keeping the single GLB")
+        for path in written:
+            path.unlink(missing_ok=True)
+        return None
+
+
+def _write_tile(
+    path: Path,
+    j: dict,
+    buffers: dict[int, dict],
+    by_mesh: dict[int, list[tuple[str, int, int]]],
+    mesh_keys: dict[int, str],
+    id_hierarchy: dict,
+) -> int:
+    """Write one tile: the source JSON with its meshes cut down to the tile's ranges.
+    Returns the tile's primitive (triangle) count."""
+    tj = copy.deepcopy(j)
+    accessors, views, meshes, blobs = [], [], [], []
+    mesh_map: dict[int, int] = {}
+    extras = {k: v for k, v in tj["scenes"][0].get("extras", {}).items() if not k.startswith("draw_ranges_")}
+    n_prims = 0
+
+    def add_accessor(src: dict, data: np.ndarray) -> int:
+        views.append({"buffer": 0, "byteLength": data.nbytes})
+        blobs.append(np.ascontiguousarray(data).tobytes())
+        a = {k: v for k, v in src.items() if k not in ("bufferView", "byteOffset", "min", "max")}
+        a.update(bufferView=len(views) - 1, count=len(data))
+        if "min" in src:
+            a["min"] = np.atleast_1d(data.min(axis=0)).tolist()
+            a["max"] = np.atleast_1d(data.max(axis=0)).tolist()
+        accessors.append(a)
+        return len(accessors) - 1
+
+    for mi in sorted(by_mesh):
+        ranges = sorted(by_mesh[mi], key=lambda r: r[1])
+        src_prim = j["meshes"][mi]["primitives"][0]
+        indices = buffers[mi]["indices"]
+        parts = [indices[start : start + length] for _nid, start, length in ranges]
+        corners = np.concatenate(parts)
+        n_vertices = len(buffers[mi]["attributes"]["POSITION"])
+        used = np.zeros(n_vertices, dtype=bool)
+        used[corners] = True
+        vertices = np.flatnonzero(used)
+        lookup = np.zeros(n_vertices, dtype=indices.dtype)
+        lookup[vertices] = np.arange(len(vertices), dtype=indices.dtype)
+
+        prim = copy.deepcopy(src_prim)
+        prim["attributes"] = {
+            name: add_accessor(j["accessors"][src_prim["attributes"][name]], values[vertices])
+            for name, values in buffers[mi]["attributes"].items()
+        }
+        prim["indices"] = add_accessor(j["accessors"][src_prim["indices"]], lookup[corners])
+        n_prims += len(corners) // _INDICES_PER_PRIMITIVE.get(src_prim.get("mode", 4), 1)
+
+        mesh = copy.deepcopy(j["meshes"][mi])
+        mesh["primitives"] = [prim]
+        mesh_map[mi] = len(meshes)
+        meshes.append(mesh)
+
+        new_ranges, cursor = {}, 0
+        for nid, _start, length in ranges:
+            new_ranges[nid] = [cursor, length]
+            cursor += length
+        extras[mesh_keys[mi]] = new_ranges
+
+    for node in tj.get("nodes", []):
+        if "mesh" in node:
+            if node["mesh"] in mesh_map:
+                node["mesh"] = mesh_map[node["mesh"]]
+            else:
+                node.pop("mesh")
+    node_ids = [nid for ranges in by_mesh.values() for nid, _s, _l in ranges]
+    extras["id_hierarchy"] = subset_id_hierarchy(id_hierarchy, node_ids)
+    tj["scenes"][0]["extras"] = extras
+    tj.update(accessors=accessors, bufferViews=views, meshes=meshes)
+
+    tmp_bin = path.with_suffix(".bintmp")
+    try:
+        replaced = dict(enumerate(blobs))
+        bin_len = _relay_bin(None, 0, views, replaced, tmp_bin)
+        tj["buffers"] = [{"byteLength": bin_len}]
+        _write_glb_streaming(path, tj, tmp_bin, bin_len)
+    finally:
+        try:
+            os.remove(tmp_bin)
+        except OSError:
+            pass
+    return n_prims
@@ -1,16 +1,184 @@
+"""Vertex welding and draw-order optimisation for merged mesh buffers.
+
+Both work on flat buffers and never move a triangle out of its draw range
+(:class:`~ada.visit.gltf.meshes.GroupReference` ``start``/``length``, in index units), so
+the picking ranges of a :class:`~ada.visit.gltf.meshes.MergedMesh` stay valid as they are:
+
+* :func:`weld_vertices` merges vertices whose positions (and normals) agree to a
+  tolerance. Only index values change, never the index count or order. Vertices are only
+  merged within one range, so objects keep disjoint vertex sets.
+* :func:`reorder_for_cache` sorts the triangles of each range along a Morton curve through
+  their centroids, then orders the vertices by first use. Neighbouring triangles end up
+  close in the index stream, which is what the post-transform vertex cache and the vertex
+  fetch rely on.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
+
 import numpy as np
-import trimesh
 
+if TYPE_CHECKING:
+    from ada.visit.gltf.meshes import GroupReference
 
-def optimize_positions(positions: np.ndarray, indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
-    """Remove duplicate positions and update object index accordingly"""
+# Position weld tolerance, the same as trimesh's ``tol.merge`` used by ``merge_vertices``.
+WELD_TOLERANCE = 1e-8
+# Normals closer than this (per component) count as equal.
+NORMAL_TOLERANCE = 1e-4
+
+_MORTON_BITS = 10
+
+
+def _ranges(groups: Sequence[GroupReference | tuple[int, int]] | None) -> list[tuple[int, int]]:
+    if not groups:
+        return []
+    return [(g.start, g.length) if hasattr(g, "start") else (int(g[0]), int(g[1])) for g in groups]
+
+
+def _segment_ids(n: int, ranges: list[tuple[int, int]]) -> np.ndarray:
+    """Per index-buffer element: the id of the range (or of the gap between ranges) it is in,
+    increasing along the buffer."""
+    if not ranges:
+        return np.zeros(n, dtype=np.int64)
+    bounds = np.unique([0, *(s for s, _ in ranges), *(s + ln for s, ln in ranges)])
+    return np.searchsorted(bounds, np.arange(n), side="right") - 1
+
+
+def _unique_rows(keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """``(first, inverse)`` for the distinct rows of an int64 ``(n, k)`` array: ``first`` are the
+    row numbers of each row's first occurrence (ascending) and ``inverse[i]`` is the index of
+    row ``i``'s first occurrence in ``first``.
+
+    Rows are sorted by a 64-bit hash (one key) instead of lexicographically (k keys); a hash
+    collision between different rows is detected and falls back to the exact sort."""
+    n = len(keys)
+    if n == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    with np.errstate(over="ignore"):
+        h = np.zeros(n, dtype=np.uint64)
+        for col in keys.T:
+            h = (h ^ col.astype(np.uint64)) * np.uint64(0x100000001B3)
+            h ^= h >> np.uint64(29)
+    order = np.argsort(h)
+    sorted_h = h[order]
+    same = sorted_h[1:] == sorted_h[:-1]
+    if np.any(keys[order[1:][same]] != keys[order[:-1][same]]):
+        order = np.lexsort(keys.T[::-1])
+        sorted_keys = keys[order]
+        same = np.all(sorted_keys[1:] == sorted_keys[:-1], axis=1)
+    new_row = np.concatenate([[True], ~same])
 
-    if len(positions.shape) == 1:
-        positions = positions.copy().reshape(len(positions) // 3, 3)
-    if len(indices.shape) == 1:
-        indices = indices.copy().reshape(len(indices) // 3, 3)
+    run = np.cumsum(new_row) - 1
+    # the sort is not stable: take each run's smallest row number as its first occurrence
+    first = np.minimum.reduceat(order, np.flatnonzero(new_row))
+    rank = np.empty(len(first), dtype=np.int64)
+    by_first = np.argsort(first)
+    rank[by_first] = np.arange(len(first))
+    inverse = np.empty(n, dtype=np.int64)
+    inverse[order] = rank[run]
+    return first[by_first], inverse
 
-    mesh = trimesh.Trimesh(vertices=positions, faces=indices)
-    mesh.merge_vertices()
 
-    return np.array(mesh.vertices).flatten(), np.array(mesh.faces).flatten()
+def weld_vertices(
+    position: np.ndarray,
+    indices: np.ndarray,
+    normal: np.ndarray | None = None,
+    groups: Sequence[GroupReference | tuple[int, int]] | None = None,
+    tol: float = WELD_TOLERANCE,
+    normal_tol: float = NORMAL_TOLERANCE,
+    inplace: bool = False,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    """Merge the vertices of flat ``position`` (and ``normal``) buffers that agree to ``tol``
+    (``normal_tol``), returning ``(position, indices, normal)``.
+
+    Vertices keep the order of their first occurrence. Unreferenced vertices are kept, unlike
+    trimesh's ``merge_vertices`` (:func:`optimize_positions` drops them). With ``groups`` (draw ranges) a vertex
+    is only merged with vertices of the same range. With ``inplace`` the welded buffers are
+    written to the front of the input arrays and returned as views of them."""
+    p3 = position.reshape(-1, 3)
+    n3 = normal.reshape(-1, 3) if normal is not None and len(normal) else None
+    columns = [np.rint(p3.astype(np.float64) / tol).astype(np.int64)]
+    if n3 is not None:
+        columns.append(np.rint(n3.astype(np.float64) / normal_tol).astype(np.int64))
+    ranges = _ranges(groups)
+    if ranges:
+        vertex_segment = np.zeros((len(p3), 1), dtype=np.int64)
+        vertex_segment[indices, 0] = _segment_ids(len(indices), ranges)
+        columns.append(vertex_segment)
+    first, remap = _unique_rows(np.concatenate(columns, axis=1) if len(columns) > 1 else columns[0])
+
+    if inplace:
+        p3[: len(first)] = p3[first]
+        indices[:] = remap[indices]
+        out_position = position[: 3 * len(first)]
+        out_normal = None
+        if n3 is not None:
+            n3[: len(first)] = n3[first]
+            out_normal = normal[: 3 * len(first)]
+        return out_position, indices, out_normal
+
+    out_normal = n3[first].reshape(-1) if n3 is not None else normal
+    return p3[first].reshape(-1), remap[indices].astype(indices.dtype, copy=False), out_normal
+
+
+def _morton3(q: np.ndarray) -> np.ndarray:
+    """Interleave the bits of three ``_MORTON_BITS``-bit integer columns."""
+    out = np.zeros(len(q), dtype=np.int64)
+    for bit in range(_MORTON_BITS):
+        for axis in range(3):
+            out |= ((q[:, axis] >> bit) & 1) << (3 * bit + axis)
+    return out
+
+
+def reorder_for_cache(
+    position: np.ndarray,
+    indices: np.ndarray,
+    normal: np.ndarray | None = None,
+    groups: Sequence[GroupReference | tuple[int, int]] | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    """Reorder a triangle list for locality, returning ``(position, indices, normal)``.
+
+    Triangles are sorted along a Morton curve through their centroids inside each draw range
+    (and each gap between ranges), so ``groups`` stay valid unchanged. Vertices are then
+    renumbered in order of first use; unreferenced vertices go last."""
+    p3 = position.reshape(-1, 3)
+    tris = indices.reshape(-1, 3)
+    if len(tris) == 0:
+        return position, indices, normal
+
+    centroid = p3[tris].mean(axis=1)
+    lo = centroid.min(axis=0)
+    extent = np.maximum(centroid.max(axis=0) - lo, np.finfo(np.float64).tiny)
+    q = ((centroid - lo) / extent * ((1 << _MORTON_BITS) - 1)).astype(np.int64)
+    segment = _segment_ids(len(indices), _ranges(groups))[::3]
+    order = np.argsort((segment << (3 * _MORTON_BITS)) | _morton3(q))
+    new_indices = tris[order].reshape(-1)
+
+    used, first_use = np.unique(new_indices, return_index=True)
+    unused = np.setdiff1d(np.arange(len(p3)), used, assume_unique=True)
+    vertex_order = np.concatenate([used[np.argsort(first_use)], unused])
+    remap = np.empty(len(p3), dtype=np.int64)
+    remap[vertex_order] = np.arange(len(p3))
+
+    out_normal = normal
+    if normal is not None and len(normal):
+        out_normal = normal.reshape(-1, 3)[vertex_order].reshape(-1)
+    return (
+        p3[vertex_order].reshape(-1),
+        remap[new_indices].astype(indices.dtype, copy=False),
+        out_normal,
+    )
+
+
+def optimize_positions(positions: np.ndarray, indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Remove duplicate and unreferenced positions and update object index accordingly, like
+    trimesh's ``merge_vertices``."""
+    position, indices, _ = weld_vertices(np.asarray(positions).reshape(-1), np.asarray(indices).reshape(-1))
+    p3 = position.reshape(-1, 3)
+    used = np.zeros(len(p3), dtype=bool)
+    used[indices] = True
+    if used.all():
+        return position, indices
+    remap = np.cumsum(used) - 1
+    return p3[used].reshape(-1), remap[indices].astype(indices.dtype, copy=False)
@@ -21,6 +21,7 @@ class FEARenderParams:
     cfunc: Callable[[list[float]], float] = (None,)
     warp_scale: float = 1.0
     solid_beams: bool = False
+    skin_only: bool = False
 
 
 @dataclass
@@ -57,6 +58,24 @@ class RenderParams:
     # need the Properties panel and skip HTTP gzip.
     embed_object_metadata: bool = True
     force_y_is_up: bool = False
+    # Worker processes used to tessellate the model (BatchTessellator.cpus). 1 tessellates in-process.
+    tessellation_cpus: int = 1
+    # Write rigid copies of a mesh once, placed with EXT_mesh_gpu_instancing. Instanced objects are not
+    # individually pickable and need a viewer that supports the extension.
+    gpu_instancing: bool = False
+    # Geometric error (fraction of the bounding box diagonal) of each coarser level written next to an
+    # exported GLB, with a ``<stem>.lods.json`` manifest. None writes the full-resolution GLB only.
+    # See ada.visit.gltf.lod.
+    lod_errors: Optional[tuple[float, ...]] = None
+    # Also write an exported GLB as octree tiles of at most this many triangles, with a
+    # ``<stem>.tileset.json`` manifest. 0 writes the single GLB only. See ada.visit.gltf.tiles.
+    tile_triangles: int = 0
+    # Merge coincident vertices (same position and normal) within each object of a merged mesh.
+    # See ada.visit.optimizing.weld_vertices.
+    weld_vertices: bool = False
+    # Sort each object's triangles along a Morton curve and number the vertices by first use, for
+    # GPU vertex cache locality. See ada.visit.optimizing.reorder_for_cache.
+    reorder_for_cache: bool = False
 
     def __post_init__(self):
         # ensure that if unique_id is set, it is a 32-bit integer
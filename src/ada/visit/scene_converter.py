@@ -42,6 +42,8 @@ class SceneConverter:
     # GLTF processing components
     animations: list[Animation] = field(default_factory=list)
     extensions: dict = field(default_factory=dict)
+    # Node name -> (N, 4, 4) transforms written as EXT_mesh_gpu_instancing attributes
+    gpu_instances: dict = field(default_factory=dict)
 
     # Cached results
 
@@ -244,6 +246,10 @@ class SceneConverter:
         for idx, animation in enumerate(self.animations):
             animation.process(buffer_items, tree, morph_target_index=idx, num_morph_targets=len(self.animations))
         self._consume_lineage_buffers(buffer_items)
+        if self.gpu_instances:
+            from ada.visit.gltf.store import add_gpu_instancing
+
+            add_gpu_instancing(buffer_items, tree, self.gpu_instances)
 
     def _consume_lineage_buffers(self, buffer_items) -> None:
         """Append queued lineage payloads to the GLB binary and rewrite
@@ -33,7 +33,9 @@ def scene_from_fem_results(fea_res: FEAResult, converter: SceneConverter):
     graph = converter.graph
     scene = trimesh.Scene(base_frame=converter.graph.top_level.name) if converter.scene is None else converter.scene
 
-    ms = fea_res.mesh.create_mesh_stores(fea_res.name, converter.graph, converter.graph.top_level)
+    ms = fea_res.mesh.create_mesh_stores(
+        fea_res.name, converter.graph, converter.graph.top_level, skin_only=params.fea_params.skin_only is True
+    )
     ms.add_to_scene(scene, graph)
 
     # Animation channels target the node index in the *exported* glTF tree.
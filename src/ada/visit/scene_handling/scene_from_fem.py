@@ -43,12 +43,14 @@ def scene_from_fem(fem: FEM, converter: SceneConverter) -> trimesh.Scene:
     parent_node = graph.add_node(GraphNode(fem.name, graph.next_node_id(), parent=parent_part_node))
 
     use_solid_beams = params.fea_params is not None and params.fea_params.solid_beams is True
+    skin_only = params.fea_params is not None and params.fea_params.skin_only is True
 
     ms = fem.to_mesh().create_mesh_stores(
         fem.name,
         graph,
         parent_node,
         use_solid_beams=use_solid_beams,
+        skin_only=skin_only,
     )
 
     scene = trimesh.Scene(base_frame=graph.top_level.name) if converter.scene is None else converter.scene
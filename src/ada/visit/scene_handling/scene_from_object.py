@@ -57,7 +57,7 @@ def scene_from_object(physical_object: BackendGeom, converter: SceneConverter) -
     for mat_id, meshes in groupby(mesh_stores, lambda x: x.material):
         meshes = list(meshes)
 
-        merged_store = concatenate_stores(meshes)
+        merged_store = concatenate_stores(meshes, weld=params.weld_vertices, reorder=params.reorder_for_cache)
         mesh_map.append((mat_id, meshes, merged_store))
 
         merged_mesh_to_trimesh_scene(
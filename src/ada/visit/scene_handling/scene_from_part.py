@@ -28,7 +28,12 @@ def scene_from_part_or_assembly(part_or_assembly: Part | Assembly, converter: Sc
     if params.stream_from_ifc_store and params.auto_sync_ifc_store and isinstance(part_or_assembly, Assembly):
         part_or_assembly.ifc_store.sync()
 
-    bt = BatchTessellator()
+    bt = BatchTessellator(
+        cpus=params.tessellation_cpus,
+        instancing=params.gpu_instancing,
+        weld=params.weld_vertices,
+        reorder=params.reorder_for_cache,
+    )
 
     graph = converter.graph
     graph.add_nodes_from_part(part_or_assembly)
@@ -61,6 +66,7 @@ def scene_from_part_or_assembly(part_or_assembly: Part | Assembly, converter: Sc
             )
     if scene is None:
         scene = bt.tessellate_part(part_or_assembly, params=params, graph=graph)
+    converter.gpu_instances.update(bt.gpu_instances)
 
     nodes_geom = set(scene.graph.nodes_geometry)
     # Per-object guid map: lets the frontend resolve a clicked CAD
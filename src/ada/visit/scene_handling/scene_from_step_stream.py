@@ -32,6 +32,10 @@ class StepStreamSource:
     # to one contiguous draw-range). Default OFF — one node per solid, byte-identical to the
     # pre-merge output. Opt in here or via env ADA_MERGE_SAME_NAME_SIBLINGS=1.
     merge_same_name_siblings: bool = False
+    # Also write the model as octree tiles of at most this many triangles (next to the GLB,
+    # with a ``<stem>.tileset.json`` manifest; see ada.visit.gltf.tiles). 0 = one GLB only.
+    # Only used by :func:`convert_step_stream_to_glb`.
+    tile_triangles: int = 0
 
 
 # Below this solid count the ~1 s process-pool spawn overhead outweighs the
@@ -1124,61 +1128,117 @@ def convert_step_stream_to_glb(source: StepStreamSource, glb_path: str | Path) -
 
     Produces the same merge-by-colour materials + ``ADA_EXT_data`` extension + picking
     metadata (``scenes[0].extras``) as :func:`scene_from_step_stream` + trimesh export.
-    Returns ``{"meshed", "total", "skipped", "materials", "reasons"}``."""
-    import numpy as np
 
-    from ada.cadit.step.glb_spill import GlbSpillStore, write_glb_from_spill
+    With ``source.tile_triangles`` set, the solids are spilled one by one with their
+    bounding boxes instead, partitioned into an octree once the stream ends, and
+    replayed into the full GLB (unchanged) and one GLB per tile plus a tileset manifest.
+    Returns ``{"meshed", "total", "skipped", "materials", "reasons"}`` (and ``"tiles"``)."""
+    from ada.cadit.step.glb_spill import GlbSpillStore, SolidSpill
     from ada.core.guid import create_guid
     from ada.extension.design_and_analysis_extension_schema import (
         AdaDesignAndAnalysisExtension,
     )
     from ada.occ.tessellating import BatchTessellator
     from ada.visit.gltf.graph import GraphNode, GraphStore
-    from ada.visit.gltf.meshes import MergedMesh, MeshType
 
     bt = BatchTessellator()
     root = GraphNode("root", 0, hash=create_guid())
     graph = GraphStore(root, {0: root})
-    ada_ext = AdaDesignAndAnalysisExtension()
+    ada_ext = AdaDesignAndAnalysisExtension().model_dump(mode="json")
     spill = GlbSpillStore()
+    solids = SolidSpill() if source.tile_triangles > 0 else None
     try:
-        stats = _tessellate_stream(source, graph, bt, spill.add)
+        stats = _tessellate_stream(source, graph, bt, spill.add if solids is None else solids.add)
 
         if source.on_progress is not None:
             source.on_progress("merging", 0.92)
 
-        # Merge same-name siblings: reorder each material's index buffer so a merged
-        # node's ranges are contiguous (one pickable draw-range per node). Must run
-        # BEFORE the groups are read into the picking metadata + the GLB is written.
-        if _merge_siblings_enabled(source):
-            spill.coalesce_by_node()
-
-        # Register each material's picking ranges so ``to_json_hierarchy`` emits the
-        # ``draw_ranges_node{mat_id}`` sequences. ``create_id_sequence`` only reads
-        # ``.groups``, so a groups-only MergedMesh (empty buffers) is enough — the heavy
-        # vertex/index data already lives in the spill files.
-        empty_pos = np.empty(0, dtype=np.float32)
-        empty_idx = np.empty(0, dtype=np.uint32)
-        color_by_mat: dict[int, object] = {}
-        for m in spill.materials():
-            color = bt.get_mat_by_id(m.mat_id)
-            color_by_mat[m.mat_id] = color
-            if m.index_count > 0:
-                graph.add_merged_mesh(
-                    m.mat_id, MergedMesh(empty_idx, empty_pos, None, color, MeshType.TRIANGLES, m.groups)
-                )
-
-        scene_metadata = dict(graph.to_json_hierarchy())
-        scene_metadata["ada_stream_stats"] = stats
-
-        write_glb_from_spill(
-            glb_path,
-            spill,
-            color_by_mat,
-            ada_ext.model_dump(mode="json"),
-            scene_metadata,
-            base_frame=root.name,
-        )
+        if solids is not None:
+            solids.replay(range(len(solids)), spill)
+        _write_spill_glb(glb_path, spill, source, graph, bt, ada_ext, {"ada_stream_stats": stats})
+        if solids is not None:
+            stats["tiles"] = _write_stream_tiles(Path(glb_path), solids, source, graph, bt, ada_ext)
         return stats
     finally:
         spill.cleanup()
+        if solids is not None:
+            solids.cleanup()
+
+
+def _write_spill_glb(glb_path, spill, source, graph, bt, ada_ext: dict, extra_metadata: dict, node_ids=None) -> dict:
+    """Write ``spill`` as a GLB with its picking metadata; returns the scene metadata.
+    ``node_ids`` (a tile's objects) restricts ``id_hierarchy`` to them and their ancestors."""
+    import numpy as np
+
+    from ada.cadit.step.glb_spill import write_glb_from_spill
+    from ada.visit.gltf.meshes import MergedMesh, MeshType
+
+    # Merge same-name siblings: reorder each material's index buffer so a merged
+    # node's ranges are contiguous (one pickable draw-range per node). Must run
+    # BEFORE the groups are read into the picking metadata + the GLB is written.
+    if _merge_siblings_enabled(source):
+        spill.coalesce_by_node()
+
+    # Register each material's picking ranges so ``to_json_hierarchy`` emits the
+    # ``draw_ranges_node{mat_id}`` sequences. ``create_id_sequence`` only reads
+    # ``.groups``, so a groups-only MergedMesh (empty buffers) is enough — the heavy
+    # vertex/index data already lives in the spill files.
+    empty_pos = np.empty(0, dtype=np.float32)
+    empty_idx = np.empty(0, dtype=np.uint32)
+    color_by_mat: dict[int, object] = {}
+    graph.merged_meshes.clear()
+    for m in spill.materials():
+        color = bt.get_mat_by_id(m.mat_id)
+        color_by_mat[m.mat_id] = color
+        if m.index_count > 0:
+            graph.add_merged_mesh(m.mat_id, MergedMesh(empty_idx, empty_pos, None, color, MeshType.TRIANGLES, m.groups))
+
+    scene_metadata = dict(graph.to_json_hierarchy())
+    if node_ids is not None:
+        from ada.visit.gltf.tiles import subset_id_hierarchy
+
+        scene_metadata["id_hierarchy"] = subset_id_hierarchy(scene_metadata["id_hierarchy"], node_ids)
+    scene_metadata.update(extra_metadata)
+
+    write_glb_from_spill(
+        glb_path,
+        spill,
+        color_by_mat,
+        ada_ext,
+        scene_metadata,
+        base_frame=graph.top_level.name,
+    )
+    return scene_metadata
+
+
+def _write_stream_tiles(glb_path: Path, solids, source: StepStreamSource, graph, bt, ada_ext: dict) -> int:
+    """Partition the spilled solids into octree tiles and write one GLB per tile plus the
+    tileset manifest next to ``glb_path``. Returns the number of tiles."""
+    from ada.cadit.step.glb_spill import GlbSpillStore
+    from ada.visit.gltf.tiles import octree_partition, write_tileset
+
+    meshed, lo, hi, triangles = solids.bounds()
+    tiles = octree_partition(lo, hi, triangles, source.tile_triangles)
+
+    entries = []
+    object_tiles: dict[str, list[int]] = {}
+    for k, tile in enumerate(tiles):
+        members = meshed[tile.members]
+        node_ids = list(dict.fromkeys(graph.hash_map[solids.node_ref(i)].node_id for i in members))
+        tile_spill = GlbSpillStore()
+        try:
+            solids.replay(members, tile_spill)
+            path = glb_path.with_name(f"{glb_path.stem}.tile{k}.glb")
+            _write_spill_glb(path, tile_spill, source, graph, bt, ada_ext, {"tile": tile.id}, node_ids)
+        finally:
+            tile_spill.cleanup()
+        for nid in node_ids:
+            object_tiles.setdefault(nid, []).append(k)
+        entries.append(tile.manifest_entry(path, int(triangles[tile.members].sum())))
+
+    graph.merged_meshes.clear()
+    id_hierarchy = graph.to_json_hierarchy()["id_hierarchy"]
+    write_tileset(
+        glb_path.with_name(f"{glb_path.stem}.tileset.json"), glb_path.name, entries, object_tiles, id_hierarchy
+    )
+    return len(tiles)
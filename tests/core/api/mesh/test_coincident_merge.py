@@ -0,0 +1,72 @@
+"""Vectorized coincident-node detection and merging on the array substrate (MeshArrays)."""
+
+import numpy as np
+
+from ada.api.mesh.containers import ArrayNodes
+from ada.api.mesh.store import MeshArrays
+from ada.fem.shapes.definitions import LineShapes
+
+
+def _line_store(coords, conn_rows):
+    store = MeshArrays(np.asarray(coords, dtype=float), np.arange(1, len(coords) + 1))
+    conn_rows = np.asarray(conn_rows)
+    store.add_elem_block_from_id_conn(LineShapes.LINE, np.arange(1, len(conn_rows) + 1), conn_rows + 1)
+    return store
+
+
+def test_coincident_node_map_matches_brute_force():
+    rng = np.random.default_rng(1)
+    pts = rng.random((400, 3))
+    # near-duplicates, an exact duplicate and a chain a-b-c where only a-b and b-c are within tol
+    coords = np.vstack(
+        [pts, pts[:80] + rng.uniform(-1e-4, 1e-4, (80, 3)), pts[:5], [[5, 5, 5], [5.0008, 5, 5], [5.0016, 5, 5]]]
+    )
+    tol = 1e-3
+
+    store = MeshArrays(coords, np.arange(len(coords)))
+    remap = store.coincident_node_map(tol)
+
+    close = np.all(np.abs(coords[:, None] - coords[None]) <= tol, axis=2)
+    # transitive closure of the brute-force neighbour relation
+    reach = close.copy()
+    while True:
+        nxt = (reach.astype(int) @ close.astype(int)) > 0
+        if np.array_equal(nxt, reach):
+            break
+        reach = nxt
+    for row in range(len(coords)):
+        assert set(np.flatnonzero(remap == remap[row])) == set(np.flatnonzero(reach[row]))
+    assert remap[-1] == remap[-3] == remap[-2]
+
+
+def test_merge_coincident_nodes_rewrites_connectivity():
+    # two line chains meeting at x=1: rows 1 and 2 coincide, row 3 is an unreferenced copy of row 0
+    coords = [[0, 0, 0], [1, 0, 0], [1, 0, 1e-9], [0, 0, 0], [2, 0, 0]]
+    store = _line_store(coords, [[0, 1], [2, 4], [4, 2]])
+    proxy = store.node_proxy(2)
+    store.add_extra_ref(2, "set")
+
+    remap = store.merge_coincident_nodes(1e-6)
+
+    # row 2 has two element refs + one side-table ref, so it is the kept node of its group
+    assert remap.tolist() == [0, 1, 1, 0, 2]
+    assert store.n_nodes == 3
+    assert store.node_ids.tolist() == [1, 3, 5]
+    conn = store.blocks[LineShapes.LINE].conn
+    assert conn.tolist() == [[0, 1], [1, 2], [2, 1]]
+    assert store.extra_refs(1) == ["set"]
+    assert proxy.row == 1 and proxy.id == 3
+
+
+def test_array_nodes_merge_only_referenced_groups():
+    coords = [[0, 0, 0], [1, 0, 0], [1, 0, 0], [3, 0, 0], [3, 0, 0]]
+    store = _line_store(coords, [[0, 1], [2, 0]])
+    nodes = ArrayNodes(store)
+
+    nodes.merge_coincident(tol=1e-6)
+
+    # rows 3/4 are only referenced by each other's coordinates, so they stay like Nodes.merge_coincident leaves them
+    assert len(nodes) == 4
+    assert sorted(store.node_ids.tolist()) == [1, 2, 3, 4]
+    conn = store.blocks[LineShapes.LINE].conn
+    assert conn[0, 1] == conn[1, 0]
@@ -0,0 +1,67 @@
+"""Chunked offset scan of the streaming STEP reader (_scan_offset_index_chunked).
+
+The chunked scan splits the file at statement boundaries and tokenizes the chunks independently (in a
+process pool when ``scan_workers`` > 1). Its merged index must be identical to the serial byte scan.
+"""
+
+import mmap
+
+import numpy as np
+
+from ada.cadit.step.read.stream_reader import (
+    _scan_chunk,
+    _scan_offset_index,
+    _scan_offset_index_chunked,
+    prepare_stream_index,
+)
+
+
+def _serial_scan(path):
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        ids, offs, *kinds = _scan_offset_index(mm)
+    return np.frombuffer(ids, dtype=np.int64).copy(), np.frombuffer(offs, dtype=np.int64).copy(), kinds
+
+
+def _assert_same_index(chunked, serial):
+    ids, offs, *kinds = chunked
+    s_ids, s_offs, s_kinds = serial
+    assert np.array_equal(ids, s_ids)
+    assert np.array_equal(offs, s_offs)
+    assert [list(k) for k in kinds] == [list(k) for k in s_kinds]
+
+
+def test_chunked_scan_matches_serial_scan(example_files):
+    path = example_files / "step_files/as1-oc-214.stp"
+    _assert_same_index(_scan_offset_index_chunked(path, 1, n_chunks=7), _serial_scan(path))
+
+
+def test_chunked_scan_ignores_statements_inside_strings(tmp_path):
+    path = tmp_path / "strings.stp"
+    path.write_text(
+        "ISO-10303-21;\nHEADER;\nFILE_NAME('a;#9=FAKE(1)','');\nENDSEC;\nDATA;\n"
+        "#1=PRODUCT('it''s;#8=FAKE()','p','',());\n"
+        "#2=CARTESIAN_POINT('',(0.,0.,0.));\n"
+        "#3=STYLED_ITEM('',(),#2);\n"
+        "ENDSEC;\nEND-ISO-10303-21;\n"
+    )
+    ids, offs, roots, styled, *_ = _scan_offset_index_chunked(path, 1, n_chunks=3)
+    assert list(ids) == [1, 2, 3]
+    assert styled == [3]
+    _assert_same_index((ids, offs, roots, styled, *_), _serial_scan(path))
+
+    # A range that starts inside a quoted string is rejected, so the reader falls back to the serial scan
+    start = path.read_bytes().index(b";#8=")
+    assert _scan_chunk(str(path), start, path.stat().st_size) is None
+
+
+def test_prepare_stream_index_with_scan_workers(example_files):
+    path = example_files / "step_files/as1-oc-214.stp"
+    serial = prepare_stream_index(path, tolerant=True)
+    pooled = prepare_stream_index(path, tolerant=True, scan_workers=2)
+    try:
+        assert pooled.roots == serial.roots
+        assert pooled.prod_names == serial.prod_names
+        assert np.array_equal(np.fromfile(pooled.idx_offs_path, np.int64), np.fromfile(serial.idx_offs_path, np.int64))
+    finally:
+        serial.close()
+        pooled.close()
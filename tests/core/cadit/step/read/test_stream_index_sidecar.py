@@ -0,0 +1,98 @@
+"""Persistent offset-index sidecar of the streaming STEP reader (prepare_stream_index(persist_index=True))."""
+
+import shutil
+from collections import Counter
+
+import numpy as np
+import pytest
+
+import ada.cadit.step.read.stream_reader as sr
+from ada.cadit.step.read.stream_reader import (
+    build_one_solid,
+    index_sidecar_path,
+    prepare_stream_index,
+)
+
+
+@pytest.fixture
+def as1_copy(example_files, tmp_path):
+    path = tmp_path / "as1.stp"
+    shutil.copyfile(example_files / "step_files/as1-oc-214.stp", path)
+    return path
+
+
+def _solid_names(idx):
+    pool, resolver = idx.open_pool()
+    try:
+        geoms = [build_one_solid(idx, pool, resolver, rid, seq, skipped=Counter()) for seq, rid in enumerate(idx.roots)]
+    finally:
+        pool.close()
+    return [g.id for g in geoms if g is not None]
+
+
+def test_sidecar_is_reused_without_rescanning(as1_copy, monkeypatch):
+    first = prepare_stream_index(as1_copy, tolerant=True, persist_index=True)
+    first.close()
+    sidecar = index_sidecar_path(as1_copy)
+    assert (sidecar / "meta.json").is_file()
+    # close() must not remove the persisted arrays
+    assert (sidecar / "ids.i64").is_file()
+
+    def no_scan(*args, **kwargs):
+        raise AssertionError("the offset index was rescanned")
+
+    monkeypatch.setattr(sr, "_scan_offset_index", no_scan)
+    totals = []
+    second = prepare_stream_index(as1_copy, tolerant=True, persist_index=True, on_total=totals.append)
+    try:
+        assert second.roots == first.roots
+        assert second.prod_names == first.prod_names
+        assert second.colour_map == first.colour_map
+        assert second.tmap.keys() == first.tmap.keys()
+        for sid, (mats, paths) in first.tmap.items():
+            assert np.array_equal(second.tmap[sid][0], mats)
+            assert second.tmap[sid][1] == paths
+        assert totals == [len(first.roots)]
+        assert np.array_equal(np.fromfile(second.idx_ids_path, np.int64), np.fromfile(sidecar / "ids.i64", np.int64))
+        monkeypatch.undo()
+        assert _solid_names(second) == _solid_names(prepare_stream_index(as1_copy, tolerant=True))
+    finally:
+        second.close()
+
+
+def test_sidecar_is_rebuilt_when_the_file_changes(as1_copy, monkeypatch):
+    prepare_stream_index(as1_copy, tolerant=True, persist_index=True).close()
+
+    with as1_copy.open("a") as fh:
+        fh.write("\n")
+
+    calls = []
+    scan = sr._scan_offset_index
+
+    def counting_scan(mm):
+        calls.append(1)
+        return scan(mm)
+
+    monkeypatch.setattr(sr, "_scan_offset_index", counting_scan)
+    prepare_stream_index(as1_copy, tolerant=True, persist_index=True).close()
+    assert calls == [1]
+
+
+def test_sidecar_with_pickled_arrays_is_not_loaded(as1_copy, monkeypatch):
+    prepare_stream_index(as1_copy, tolerant=True, persist_index=True).close()
+    sidecar = index_sidecar_path(as1_copy)
+    # An object array can only be read back through pickle, which the loader refuses
+    np.savez(sidecar / "arrays.npz", tmap_ids=np.array([object()], dtype=object))
+
+    assert sr._load_index_sidecar(as1_copy, tolerant=True) is None
+
+    calls = []
+    scan = sr._scan_offset_index
+
+    def counting_scan(mm):
+        calls.append(1)
+        return scan(mm)
+
+    monkeypatch.setattr(sr, "_scan_offset_index", counting_scan)
+    prepare_stream_index(as1_copy, tolerant=True, persist_index=True).close()
+    assert calls == [1]
@@ -0,0 +1,73 @@
+"""Selective reads of the streaming STEP reader (StepSelection / Part.read_step_file(products=...))."""
+
+from collections import Counter
+
+import pytest
+
+import ada
+from ada.cadit.step.read.stream_reader import (
+    StepSelection,
+    build_one_solid,
+    prepare_stream_index,
+    stream_read_step,
+)
+
+
+@pytest.fixture
+def as1(example_files):
+    return example_files / "step_files/as1-oc-214.stp"
+
+
+def _instances(path, select=None):
+    geoms = stream_read_step(path, local_pool=False, tolerant=True, select=select)
+    return {g.id: len(g.transforms) if g.transforms else 1 for g in geoms}
+
+
+def test_select_products(as1):
+    full = _instances(as1)
+    assert full == {"nut": 8, "rod": 1, "bolt": 6, "l-bracket": 2, "plate": 1}
+
+    # Instances under the sub-assembly only: the rod-assembly nuts, the rod and the plate drop out
+    assert _instances(as1, StepSelection(products=["l-bracket-assembly"])) == {"nut": 6, "bolt": 6, "l-bracket": 2}
+    # A leaf product selects itself wherever it is placed
+    assert _instances(as1, StepSelection(products=["rod"])) == {"rod": 1}
+
+
+def test_select_max_depth(as1):
+    # The plate is placed directly under the root; every other solid sits in a sub-assembly
+    assert _instances(as1, StepSelection(max_depth=2)) == {"plate": 1}
+    assert _instances(as1, StepSelection(max_depth=4)) == _instances(as1)
+
+
+def test_select_bbox(as1):
+    assert _instances(as1, StepSelection(bbox=((0, 0, 0), (50, 50, 50)))) == {"l-bracket": 1, "plate": 1}
+    assert _instances(as1, StepSelection(bbox=((1e6, 1e6, 1e6), (1e6 + 1, 1e6 + 1, 1e6 + 1)))) == {}
+
+
+def test_select_in_build_one_solid(as1):
+    idx = prepare_stream_index(as1, tolerant=True)
+    pool, resolver = idx.open_pool()
+    select = StepSelection(products=["rod-assembly"])
+    try:
+        geoms = [
+            build_one_solid(idx, pool, resolver, rid, seq, skipped=Counter(), select=select)
+            for seq, rid in enumerate(idx.roots)
+        ]
+    finally:
+        pool.close()
+        idx.close()
+    assert {g.id: len(g.transforms) for g in geoms if g is not None} == {"nut": 2, "rod": 1}
+
+
+def test_select_rejected_with_local_pool(as1):
+    with pytest.raises(ValueError):
+        next(iter(stream_read_step(as1, local_pool=True, select=StepSelection(max_depth=1))))
+
+
+def test_part_read_step_file_products(as1):
+    p = ada.Part("MyPart")
+    p.read_step_file(as1, reader="tolerant", products=["rod-assembly"])
+    assert sorted(shp.name for shp in p.shapes) == ["nut", "rod"]
+
+    with pytest.raises(ValueError):
+        ada.Part("Other").read_step_file(as1, reader="occ", products=["rod"])
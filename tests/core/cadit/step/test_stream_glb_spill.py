@@ -105,3 +105,61 @@ def test_spill_glb_equivalent_to_trimesh_export(tmp_path):
         return {k: v for k, v in tree["scenes"][0]["extras"].items() if k.startswith("draw_ranges_node")}
 
     assert _draw(new) == _draw(old)  # identical per-solid picking contract
+
+
+def test_spill_tiled_output(tmp_path):
+    # Tiling writes the same full GLB plus one GLB per octree tile; every solid lands in
+    # exactly one tile with its global node id, and the tileset lists the tiles' bounds.
+    untiled = tmp_path / "a" / "c.glb"
+    tiled = tmp_path / "b" / "c.glb"
+    untiled.parent.mkdir()
+    tiled.parent.mkdir()
+    src = _colored_step(tmp_path)
+    stream_step_to_glb(src, untiled)
+    stats = stream_step_to_glb(src, tiled, tile_triangles=1)
+    assert stats["tiles"] == 2
+
+    full = _tree(tiled.read_bytes())
+    assert full["meshes"] == _tree(untiled.read_bytes())["meshes"]
+
+    tileset = json.loads((tmp_path / "b" / "c.tileset.json").read_text())
+    assert tileset["source"] == "c.glb"
+    assert tileset["id_hierarchy"] == full["scenes"][0]["extras"]["id_hierarchy"]
+    solid_ids = {nid for k, v in full["scenes"][0]["extras"].items() if k.startswith("draw_ranges_") for nid in v}
+    assert set(tileset["object_tiles"]) == solid_ids
+    for k, tile in enumerate(tileset["tiles"]):
+        t = _tree((tmp_path / "b" / tile["uri"]).read_bytes())
+        ranges = {nid for key, v in t["scenes"][0]["extras"].items() if key.startswith("draw_ranges_") for nid in v}
+        assert ranges == {nid for nid, tiles in tileset["object_tiles"].items() if tiles == [k]}
+        for prim in (m["primitives"][0] for m in t["meshes"]):
+            pos = t["accessors"][prim["attributes"]["POSITION"]]
+            assert all(lo - 1e-6 <= a for lo, a in zip(tile["bounds"][0], pos["min"]))
+            assert all(hi + 1e-6 >= b for hi, b in zip(tile["bounds"][1], pos["max"]))
+
+
+def test_solid_spill_leaves_empty_solids_out_of_the_bounds():
+    import numpy as np
+
+    from ada.cadit.step.glb_spill import GlbSpillStore, SolidSpill
+
+    solids = SolidSpill()
+    store = GlbSpillStore()
+    try:
+        tri = np.array([0, 1, 2], dtype=np.uint32)
+        solids.add(0, "a", np.array([0, 0, 0, 1, 0, 0, 0, 1, 0], dtype=np.float32), tri)
+        solids.add(0, "empty", np.empty(0, dtype=np.float32), np.empty(0, dtype=np.uint32))
+        solids.add(1, "b", np.array([5, 5, 5, 6, 5, 5, 5, 6, 5], dtype=np.float32), tri)
+
+        meshed, lo, hi, triangles = solids.bounds()
+        assert meshed.tolist() == [0, 2]
+        assert np.isfinite(lo).all() and np.isfinite(hi).all()
+        assert lo.tolist() == [[0, 0, 0], [5, 5, 5]]
+        assert hi.tolist() == [[1, 1, 0], [6, 6, 5]]
+        assert triangles.tolist() == [1, 1]
+
+        # the empty solid is still replayed into the full GLB, as an empty draw range
+        solids.replay(range(len(solids)), store)
+        assert [g.node_ref for m in store.materials() for g in m.groups] == ["a", "empty", "b"]
+    finally:
+        store.cleanup()
+        solids.cleanup()
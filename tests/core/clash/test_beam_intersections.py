@@ -0,0 +1,59 @@
+import numpy as np
+
+import ada
+from ada.api.containers import Nodes
+from ada.core.clash_check import (
+    beam_cross_check,
+    connect_beams_batch,
+    segment_intersections,
+)
+
+
+def test_segment_intersections_matches_scalar_cross_check():
+    bm1 = ada.Beam("bm1", (0, 0, 0), (10, 0, 0), "IPE300")
+    bm2 = ada.Beam("bm2", (5, -1, 0), (5, 4, 0), "IPE300")
+    bm3 = ada.Beam("bm3", (0, 2, 0), (10, 2, 0), "IPE300")
+    bm4 = ada.Beam("bm4", (2, -1, 3), (2, 4, 3), "IPE300")
+    beams = [bm1, bm2, bm3, bm4]
+
+    segs = np.array([(bm.n1.p, bm.n2.p) for bm in beams])
+    res = segment_intersections(segs, segs, pairs=[(0, 1), (0, 2), (0, 3), (1, 2)])
+
+    assert res.parallel.tolist() == [False, True, False, False]
+    assert res.hits(0.1).tolist() == [True, False, False, True]
+    for k, (i, j) in enumerate(res.pairs.tolist()):
+        scalar = beam_cross_check(beams[i], beams[j], 0.1)
+        if scalar is None:
+            assert not res.hits(0.1)[k]
+            continue
+        point, s, t = scalar
+        assert np.allclose(res.points[k], point)
+        assert np.isclose(res.s[k], s) and np.isclose(res.t[k], t)
+
+
+def test_segment_intersections_broadphase_self_join():
+    segs = np.array(
+        [
+            [(0, 0, 0), (10, 0, 0)],
+            [(5, -1, 0), (5, 4, 0)],
+            [(50, 0, 0), (60, 0, 0)],
+        ],
+        dtype=float,
+    )
+    res = segment_intersections(segs)
+    assert res.pairs.tolist() == [[0, 1]]
+    assert np.allclose(res.points[0], (5, 0, 0))
+
+
+def test_connect_beams_batch_finds_joint_nodes():
+    bm1 = ada.Beam("bm1", (0, 0, 0), (10, 0, 0), "IPE300")
+    bm2 = ada.Beam("bm2", (5, 0, 0), (5, 4, 0), "IPE300")
+    bm3 = ada.Beam("bm3", (10, 0, 0), (10, 4, 0), "IPE300")
+    p = ada.Part("MyPart") / [bm1, bm2, bm3]
+
+    nodes = Nodes()
+    nmap = dict()
+    connect_beams_batch(p.beam_clash_check(), 0.1, 1e-4, nodes, nmap)
+
+    joints = {tuple(n.p.tolist()): {bm.name for bm in members} for n, members in nmap.items()}
+    assert joints == {(5.0, 0.0, 0.0): {"bm1", "bm2"}, (10.0, 0.0, 0.0): {"bm1", "bm3"}}
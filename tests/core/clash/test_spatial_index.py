@@ -0,0 +1,98 @@
+import numpy as np
+
+import ada
+from ada.core.spatial_index import AABBTree
+from ada.geom.points import Point
+
+
+def _brute_overlaps(mins, maxs, qmin, qmax):
+    ov = np.all((mins[None] <= qmax[:, None]) & (maxs[None] >= qmin[:, None]), axis=2)
+    return {(int(q), int(p)) for q, p in zip(*np.nonzero(ov))}
+
+
+def test_aabb_tree_box_query_matches_brute_force():
+    rng = np.random.default_rng(42)
+    centres = rng.random((500, 3)) * 10
+    ext = rng.random((500, 3)) * 0.5
+    tree = AABBTree(centres - ext, centres + ext, leaf_size=4)
+
+    qc = rng.random((64, 3)) * 10
+    qe = rng.random((64, 3))
+    q, p = tree.query_boxes(qc - qe, qc + qe)
+
+    assert set(zip(q.tolist(), p.tolist())) == _brute_overlaps(centres - ext, centres + ext, qc - qe, qc + qe)
+
+
+def test_aabb_tree_nearest_and_rays():
+    mins = np.array([[0, 0, 0], [5, 0, 0], [10, 0, 0]], dtype=float)
+    tree = AABBTree(mins, mins + 1.0)
+
+    idx, dist = tree.nearest([[4.0, 0.5, 0.5], [20.0, 0.5, 0.5]], k=2)
+    assert idx.tolist() == [[1, 0], [2, 1]]
+    assert np.allclose(dist[0], [1.0, 3.0])
+
+    q, p, t = tree.query_rays([[-1.0, 0.5, 0.5]], [[1.0, 0.0, 0.0]], max_dist=8.0)
+    assert sorted(zip(t.tolist(), p.tolist())) == [(1.0, 0), (6.0, 1)]
+
+
+def test_part_spatial_index_tracks_add_and_remove():
+    bm1 = ada.Beam("bm1", (0, 0, 0), (1, 0, 0), "IPE300")
+    bm2 = ada.Beam("bm2", (5, 0, 0), (6, 0, 0), "IPE300")
+    pl1 = ada.Plate("pl1", [(0, 0), (1, 0), (1, 1), (0, 1)], 0.01, origin=(0, 0, 3))
+    p = ada.Part("MyPart") / [bm1, bm2, pl1]
+
+    index = p.spatial_index
+    assert len(index) == 3
+    assert index.query_box((-0.1, -0.1, -0.1), (1.1, 0.1, 0.1), by_type=ada.Beam) == [bm1]
+    assert index.query_box((0.2, 0.2, 2.9), (0.8, 0.8, 3.1)) == [pl1]
+
+    bm3 = p.add_beam(ada.Beam("bm3", (0, 0, 0), (0, 1, 0), "IPE300"))
+    assert bm3 in index
+
+    bm1.remove()
+    assert bm1 not in index
+    assert index.query_box((-0.1, -0.1, -0.1), (1.1, 0.1, 0.1), by_type=ada.Beam) == [bm3]
+
+
+def test_get_beams_within_volume_uses_end_nodes():
+    bm1 = ada.Beam("bm1", (0, 0, 0), (10, 0, 0), "IPE300")
+    bm2 = ada.Beam("bm2", (2, 0, 0), (2, 1, 0), "IPE300")
+    p = ada.Part("MyPart") / [bm1, bm2]
+
+    # bm1 passes straight through the box, but neither of its end nodes is inside it
+    res = p.beams.get_beams_within_volume([(1.5, 2.5), (-0.5, 1.5), (-0.5, 0.5)], margins=None)
+    assert res == {bm2}
+
+    clashes = {bm.name: {x.name for x in others} for bm, others in p.beam_clash_check()}
+    assert clashes == {"bm1": {"bm2"}, "bm2": set()}
+
+
+def test_moved_beam_is_reindexed_before_query():
+    bm1 = ada.Beam("bm1", (0, 0, 0), (1, 0, 0), "IPE300")
+    bm2 = ada.Beam("bm2", (5, 0, 0), (6, 0, 0), "IPE300")
+    p = ada.Part("MyPart") / [bm1, bm2]
+    assert p.beams.get_beams_within_volume([(-0.5, 1.5), (-0.5, 0.5), (-0.5, 0.5)], margins=None) == {bm1}
+
+    bm1.n1 = ada.Node((20, 0, 0))
+    bm1.n2 = ada.Node((21, 0, 0))
+    assert p.beams.get_beams_within_volume([(19.5, 21.5), (-0.5, 0.5), (-0.5, 0.5)], margins=None) == {bm1}
+    assert p.beams.get_beams_within_volume([(-0.5, 1.5), (-0.5, 0.5), (-0.5, 0.5)], margins=None) == set()
+
+    # moving a node without replacing it
+    bm2.n2.p = Point(5, 30, 0)
+    assert p.beams.get_beams_within_volume([(4.5, 5.5), (29.5, 30.5), (-0.5, 0.5)], margins=None) == {bm2}
+
+
+def test_batch_intersect_keeps_input_order():
+    from ada.core.clash_check import batch_intersect
+
+    bm1 = ada.Beam("bm1", (0, 0, 0), (1, 0, 0), "IPE300")
+    bm2 = ada.Beam("bm2", (0, 0, 0), (0, 1, 0), "IPE300")
+    gensec = ada.Beam("gs", (0, 0, 0), (0, 0, 1), "IPE300")
+    # legacy general sections are skipped up front
+    gensec.section._type = "gensec"
+    p = ada.Part("MyPart") / [bm1, bm2]
+
+    results = batch_intersect([bm1, gensec, bm2], None, [p.beams])
+    assert [bm.name for bm, _ in results] == ["bm1", "gs", "bm2"]
+    assert results[1][1] == []
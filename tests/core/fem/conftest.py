@@ -0,0 +1,11 @@
+import pytest
+
+from ada.config import Config
+
+
+@pytest.fixture
+def _restore_flag():
+    """Restore ``Config().meshing_array_backed`` after a test that switches it"""
+    prev = Config().meshing_array_backed
+    yield
+    Config().meshing_array_backed = prev
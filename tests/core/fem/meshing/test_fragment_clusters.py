@@ -0,0 +1,54 @@
+from itertools import pairwise
+
+import ada
+from ada.config import Config
+from ada.core.clash_check import PlateConnections
+from ada.fem.meshing import GmshSession
+from ada.fem.meshing.concepts import GmshData
+from ada.fem.meshing.partitioning.broadphase import capped_clusters
+from ada.fem.meshing.partitioning.partition_plates import fragment_plates
+
+
+def test_capped_clusters_split_a_chain():
+    # 0-1-2-...-9 is one cluster, 10-11 another
+    pairs = [(i, i + 1) for i in range(9)] + [(10, 11)]
+
+    chunks, crossing = capped_clusters(12, pairs, max_size=4)
+    assert sorted(i for c in chunks for i in c) == list(range(12))
+    assert max(len(c) for c in chunks) <= 4
+    assert [10, 11] in chunks
+    assert crossing == [(3, 4), (7, 8)]
+
+    chunks, crossing = capped_clusters(12, pairs, max_size=64)
+    assert chunks == [list(range(10)), [10, 11]]
+    assert crossing == []
+
+
+def test_capped_plate_strip_stays_conformal(monkeypatch):
+    monkeypatch.setattr(Config(), "meshing_max_fragment_cluster", 2)
+    with GmshSession(silent=True) as gs:
+        plates = []
+        for i in range(6):
+            pl = ada.Plate(f"pl{i}", [(0, 0), (1, 0), (1, 1), (0, 1)], 0.01, origin=(i, 0, 0))
+            gs.model_map[pl] = GmshData([(2, gs.model.occ.addRectangle(i, 0, 0, 1, 1))], "shell", 1, pl)
+            plates.append(pl)
+        gs.model.occ.synchronize()
+
+        edge_connected = {pl1: [pl2] for pl1, pl2 in pairwise(plates)}
+        calls = []
+        fragment = gs.model.occ.fragment
+
+        def counting_fragment(*args, **kwargs):
+            calls.append(1)
+            return fragment(*args, **kwargs)
+
+        monkeypatch.setattr(gs.model.occ, "fragment", counting_fragment)
+        fragment_plates(PlateConnections({}, edge_connected), gs)
+        monkeypatch.undo()
+
+        entities = [dt for gmsh_obj in gs.model_map.values() for dt in gmsh_obj.entities]
+        curves = {abs(tag) for _, tag in gs.model.getBoundary(entities, combined=False, oriented=False)}
+    # three 2-plate parts plus the 2 seams between them
+    assert len(calls) == 5
+    # 6 plates in a row share 5 edges: 7 vertical + 12 horizontal edges
+    assert len(curves) == 19
@@ -0,0 +1,102 @@
+"""Derived result fields: the batched kernels, the FEAResult engine and the bake wrapper."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from ada.fem.formats.sesam.results.read_sif import read_sif_file
+from ada.fem.results.artefacts import (
+    bake_fea_artefacts_from_source,
+    read_elem_field_blob_step,
+)
+from ada.fem.results.derived import (
+    beam_fibre_stress,
+    principal_stresses,
+    resultant,
+    stress_tensors,
+    tresca,
+    von_mises,
+)
+
+_SHELL = "cantilever/sesam/static/shell/STATIC_SHELL_CANTILEVER_SESAMR1.SIF"
+_LINE = "cantilever/sesam/static/line/STATIC_LINE_CANTILEVER_SESAMR1.SIF"
+
+
+def _reference_mises(s):
+    xx, yy, zz, xy, yz, zx = np.moveaxis(s, -1, 0)
+    return np.sqrt(0.5 * ((xx - yy) ** 2 + (yy - zz) ** 2 + (zz - xx) ** 2) + 3 * (xy**2 + yz**2 + zx**2))
+
+
+def test_stress_kernels_match_per_element_reference():
+    s = np.random.default_rng(1).normal(scale=100.0, size=(7, 4, 6))
+    s[2, 3] = np.nan
+
+    np.testing.assert_allclose(von_mises(s), _reference_mises(s))
+
+    values, dirs = principal_stresses(s, directions=True)
+    ok = np.isfinite(s).all(axis=-1)
+    for i, j in zip(*np.nonzero(ok)):
+        t = stress_tensors(s[i, j])
+        np.testing.assert_allclose(values[i, j], np.linalg.eigvalsh(t)[::-1], rtol=1e-12, atol=1e-9)
+        for k in range(3):  # columns are the principal directions
+            np.testing.assert_allclose(t @ dirs[i, j, :, k], values[i, j, k] * dirs[i, j, :, k], atol=1e-9)
+    assert np.isnan(values[2, 3]).all() and np.isfinite(values[ok]).all()
+    np.testing.assert_allclose(tresca(values), values[..., 0] - values[..., 2])
+
+    np.testing.assert_allclose(resultant(np.array([[3.0, 4.0, 12.0]])), [13.0])
+    np.testing.assert_allclose(
+        beam_fibre_stress(np.array([[10.0, -4.0, 6.0]]), 2.0, 2.0, 3.0), [[5.0 + 2.0 + 2.0, 5.0 - 4.0]]
+    )
+
+
+def test_engine_serves_cached_derived_fields(fem_files):
+    res = read_sif_file(fem_files / _SHELL)
+    assert {"STRESS.MISES", "STRESS.PRINCIPAL", "RVNODDIS.MAGNITUDE"} <= set(res.derived.available())
+
+    raw = res.get_field_value_by_name("STRESS")
+    mises = res.derived.get("STRESS.MISES", raw.step)
+    assert res.derived.get("STRESS.MISES", -1) is mises  # one computation per (field, step)
+
+    # leading (elem_label, ip) columns are kept; plane stress reads the missing components as zero
+    np.testing.assert_array_equal(mises.values[:, :2], raw.values[:, :2])
+    xx, yy, xy = raw.values[:, 2], raw.values[:, 3], raw.values[:, 4]
+    np.testing.assert_allclose(mises.values[:, 2], np.sqrt(xx**2 - xx * yy + yy**2 + 3 * xy**2))
+
+    disp = res.get_data("RVNODDIS.MAGNITUDE", -1)
+    np.testing.assert_allclose(disp[:, 0], np.linalg.norm(res.get_data("RVNODDIS", -1)[:, :3], axis=1))
+
+    with pytest.raises(ValueError):
+        res.derived.get("STRESS.NOPE", -1)
+
+
+def test_engine_beam_fibre_stress_from_section_forces(fem_files):
+    res = read_sif_file(fem_files / _LINE)
+    forces = res.get_field_value_by_name("FORCES")
+    fibre = res.derived.get("FORCES.FIBRE", forces.step).values
+
+    comps = forces.components
+    row = forces.values[0]
+    el_id = int(row[0])
+    sec_id = int(res.mesh.elem_data[res.mesh.elem_data[:, 0] == el_id][0, 2])
+    props = res.mesh.sections[sec_id].properties
+    n, my, mz = (row[2 + comps.index(c)] for c in ("NXX", "MXY", "MXZ"))
+    bending = abs(my) / props.Wymin + abs(mz) / props.Wzmin
+    np.testing.assert_allclose(fibre[0, 2:], [n / props.Ax + bending, n / props.Ax - bending])
+
+
+def test_bake_writes_derived_fields(fem_files, tmp_path):
+    bake = bake_fea_artefacts_from_source(fem_files / _SHELL, tmp_path, derived_fields=True)
+    fields = {f["name_canonical"]: f for f in json.loads(bake.manifest_path.read_text())["fields"]}
+    assert {"STRESS.MISES", "STRESS.TRESCA", "STRESS.PRINCIPAL", "RVNODDIS.MAGNITUDE"} <= fields.keys()
+
+    def bucket(name):
+        (per_type,) = fields[name]["per_type"]
+        return read_elem_field_blob_step(tmp_path / per_type["blob"]["url"], 0)
+
+    raw = bucket("STRESS")  # SIGXX, SIGYY, TAUXY
+    s = np.zeros(raw.shape[:-1] + (6,))
+    s[..., [0, 1, 3]] = raw
+    np.testing.assert_allclose(bucket("STRESS.MISES")[..., 0], _reference_mises(s), rtol=1e-5)
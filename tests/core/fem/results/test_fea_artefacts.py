@@ -791,7 +791,8 @@ def test_is_fea_artefact_source_classification():
     assert is_fea_artefact_source("models/wall.RMED")
     assert is_fea_artefact_source("models/wall.sif")
     assert is_fea_artefact_source("models/wall.SIF")
-    assert not is_fea_artefact_source("models/wall.frd")  # Phase 2
+    assert is_fea_artefact_source("models/wall.frd")
+    assert not is_fea_artefact_source("models/wall.odb")
     assert not is_fea_artefact_source("models/wall.glb")
     assert not is_fea_artefact_source("models/wall.ifc")
 
@@ -817,7 +818,7 @@ def test_make_stream_reader_dispatches_by_extension(fem_files, tmp_path):
             assert isinstance(r, SifStreamReader)
 
     with pytest.raises(ValueError, match="no streaming reader"):
-        make_stream_reader(tmp_path / "nope.frd")
+        make_stream_reader(tmp_path / "nope.odb")
 
 
 def test_stream_reader_registry_dispatch_and_override(tmp_path):
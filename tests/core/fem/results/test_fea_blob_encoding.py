@@ -0,0 +1,111 @@
+"""Encoded (v2) AFBL / AFEL blobs: chunked, compressed, optionally quantized / delta-coded.
+
+The lossless encodings must read back bit-identical to the raw v1 blob through
+``read_blob_step``; int16 quantization must stay within half a code of the raw values and
+keep NaN. The manifest ranges are the same either way.
+"""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from ada.fem.results.artefacts import (
+    BLOB_ENCODED_VERSION,
+    BlobEncoding,
+    ElementFieldSpec,
+    ElementStepValues,
+    FieldSpec,
+    StepValues,
+    read_blob_header,
+    read_blob_step,
+    read_elem_field_blob_step,
+    write_element_field_blob_streaming,
+    write_field_blob_streaming,
+)
+
+
+class _Steps:
+    def __init__(self, steps):
+        self.steps = steps
+
+    def iter_field_steps(self, field_name):
+        for i, values in enumerate(self.steps):
+            yield StepValues(step_index=i, step_value=float(i), values=values)
+
+    def iter_element_field_steps(self, spec):
+        for i, values in enumerate(self.steps):
+            yield ElementStepValues(step_index=i, step_value=float(i), values=values)
+
+
+def _transient(n_points=400, n_steps=11):
+    rng = np.random.default_rng(3)
+    shape = rng.normal(size=(n_points, 3))
+    steps = [(shape * np.sin(0.3 * i) + 1e-3 * rng.normal(size=shape.shape)).astype(np.float32) for i in range(n_steps)]
+    steps[4][7, 1] = np.nan
+    spec = FieldSpec("DISP", ["D1", "D2", "D3"], n_steps, n_points, "nodal", [float(i) for i in range(n_steps)])
+    return _Steps(steps), spec
+
+
+@pytest.mark.parametrize(
+    "encoding",
+    [BlobEncoding(), BlobEncoding(delta=True, keyframe_interval=4), BlobEncoding(level=1, delta=True)],
+)
+def test_lossless_encodings_round_trip(tmp_path, encoding):
+    reader, spec = _transient()
+    raw = write_field_blob_streaming(reader, spec, tmp_path / "raw.bin")
+    enc = write_field_blob_streaming(reader, spec, tmp_path / "enc.bin", encoding)
+
+    header = read_blob_header(tmp_path / "enc.bin")
+    assert header["encoding"] == enc.encoding and header["encoding"]["codec"] == "zlib"
+    assert enc.scalar_range_per_component == raw.scalar_range_per_component
+    assert enc.scalar_range_magnitude == raw.scalar_range_magnitude
+    # random access in any order, including steps behind a keyframe
+    for i in [10, 0, 5, 4, 3]:
+        np.testing.assert_array_equal(read_blob_step(tmp_path / "enc.bin", i), reader.steps[i])
+
+
+def test_int16_quantization_against_field_ranges(tmp_path):
+    reader, spec = _transient()
+    meta = write_field_blob_streaming(reader, spec, tmp_path / "q.bin", BlobEncoding(quantize="int16", delta=True))
+
+    ranges = meta.encoding["ranges"]
+    assert ranges == [list(meta.scalar_range_per_component[c]) for c in spec.components]
+    half_code = np.array([(hi - lo) / 65534 / 2 for lo, hi in ranges])
+    for i, expected in enumerate(reader.steps):
+        got = read_blob_step(tmp_path / "q.bin", i)
+        assert np.array_equal(np.isnan(got), np.isnan(expected))
+        assert (np.nan_to_num(np.abs(got - expected)) <= half_code * 1.001 + 1e-7).all()
+    assert (tmp_path / "q.bin").stat().st_size < 0.5 * spec.n_steps * spec.n_points * 3 * 4
+
+
+def test_element_field_blob_round_trips(tmp_path):
+    steps = [np.linspace(-1, 1, 5 * 4 * 6, dtype=np.float32).reshape(5, 4, 6) * i for i in range(3)]
+    comps = ["SXX", "SYY", "SZZ", "SXY", "SYZ", "SZX"]
+    spec = ElementFieldSpec("STRESS", comps, 3, "quad", 5, 4, [1, 2, 3, 4, 5], [0.0, 1.0, 2.0])
+    write_element_field_blob_streaming(_Steps(steps), spec, tmp_path / "el.bin", BlobEncoding(delta=True))
+    for i, expected in enumerate(steps):
+        np.testing.assert_array_equal(read_elem_field_blob_step(tmp_path / "el.bin", i), expected)
+
+
+def test_bake_writes_encoded_blobs(fem_files, tmp_path):
+    from ada.fem.formats.code_aster.read.med_stream_reader import RmedStreamReader
+    from ada.fem.results.artefacts import bake_artefacts
+
+    rmed = fem_files / "cantilever/code_aster/eigen_shell_cantilever_code_aster.rmed"
+    with RmedStreamReader(rmed) as reader:
+        raw = bake_artefacts(reader, tmp_path / "raw", src=rmed.stem)
+        enc = bake_artefacts(reader, tmp_path / "enc", src=rmed.stem, blob_encoding=BlobEncoding(delta=True))
+
+    raw_fields = json.loads(raw.manifest_path.read_text())["fields"]
+    enc_fields = json.loads(enc.manifest_path.read_text())["fields"]
+    assert [f["scalar_range"] for f in enc_fields] == [f["scalar_range"] for f in raw_fields]
+    for r, e in zip(raw_fields, enc_fields):
+        assert "encoding" not in r["blob"] and e["blob"]["encoding"]["delta"]
+        blob = enc.out_dir / e["blob"]["url"]
+        with open(blob, "rb") as f:
+            assert int.from_bytes(f.read(8)[4:], "little") == BLOB_ENCODED_VERSION
+        for i in range(e["n_steps"]):
+            np.testing.assert_array_equal(read_blob_step(blob, i), read_blob_step(raw.out_dir / r["blob"]["url"], i))
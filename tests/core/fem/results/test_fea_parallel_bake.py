@@ -0,0 +1,115 @@
+"""Parallel field bake: one shared pass over the steps, per-field work on writer threads.
+
+``field_workers > 1`` must not change a byte of the output — every blob and the manifest
+match the serial bake, whatever the step-buffer budget — and a field that fails its
+shape check still fails the bake.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ada.fem.formats.sesam.results.sif_stream import SifStreamReader
+from ada.fem.results.artefacts import (
+    BlobEncoding,
+    ElementFieldSpec,
+    FieldSpec,
+    StepValues,
+    bake_fea_artefacts_from_source,
+    iter_steps_shared,
+)
+
+_SIF_EIGEN = "cantilever/sesam/eigen/line/EIGEN_LINE_CANTILEVER_SESAMR1.SIF"
+_RMED_EIGEN = "cantilever/code_aster/eigen_shell_cantilever_code_aster.rmed"
+_RMED_STATIC = "cantilever/code_aster/static_shell_cantilever_code_aster.rmed"
+
+
+def _artefacts(bake):
+    return {p.name: p.read_bytes() for p in sorted(bake.out_dir.iterdir()) if p.is_file()}
+
+
+@pytest.mark.parametrize(
+    "rel, encoding",
+    [(_SIF_EIGEN, None), (_RMED_EIGEN, None), (_RMED_EIGEN, BlobEncoding(quantize="int16", delta=True))],
+)
+def test_parallel_bake_matches_serial(fem_files, tmp_path, rel, encoding):
+    src = fem_files / rel
+    serial = bake_fea_artefacts_from_source(src, tmp_path / "serial", blob_encoding=encoding, field_workers=1)
+    # a 1-byte budget forces one step in flight at a time
+    parallel = bake_fea_artefacts_from_source(
+        src, tmp_path / "parallel", blob_encoding=encoding, field_workers=3, step_buffer_bytes=1
+    )
+
+    a, b = _artefacts(serial), _artefacts(parallel)
+    assert len([n for n in a if n.endswith(".bin")]) > 2
+    assert a.keys() == b.keys()
+    assert [n for n in a if a[n] != b[n]] == []
+
+
+def test_shared_pass_matches_per_field_steps(fem_files):
+    with SifStreamReader(fem_files / _SIF_EIGEN) as reader:
+        nodal = [s for s in reader.field_specs() if s.support == "nodal"]
+        specs = [*nodal, *reader.element_field_specs()]
+        shared = list(iter_steps_shared(reader, specs))
+        assert [k for k, _ in shared] == list(range(len(specs))) * 20  # step-major
+        for k, spec in enumerate(specs):
+            if isinstance(spec, ElementFieldSpec):
+                steps = reader.iter_element_field_steps(spec)
+            else:
+                steps = reader.iter_field_steps(spec.name)
+            got = [sv for i, sv in shared if i == k]
+            for x, y in zip(steps, got, strict=True):
+                assert (x.step_index, x.step_value) == (y.step_index, y.step_value)
+                np.testing.assert_array_equal(x.values, y.values)
+
+
+def test_rmed_shared_pass_reads_each_step_once(fem_files, monkeypatch):
+    from ada.fem.formats.code_aster.read import med_stream_reader
+    from ada.fem.formats.code_aster.read.med_stream_reader import RmedStreamReader
+
+    reads = []
+    read_nodal_step = med_stream_reader._read_nodal_step
+
+    def counting_read(step_group, *args):
+        reads.append(step_group.name)
+        return read_nodal_step(step_group, *args)
+
+    with RmedStreamReader(fem_files / _RMED_STATIC) as reader:
+        specs = [s for s in reader.field_specs() if s.support == "nodal"]
+        assert len(specs) > 1
+        per_field = {k: list(reader.iter_field_steps(spec.name)) for k, spec in enumerate(specs)}
+
+        monkeypatch.setattr(med_stream_reader, "_read_nodal_step", counting_read)
+        monkeypatch.setattr(reader, "iter_field_steps", None)  # no per-field fallback
+        shared = list(iter_steps_shared(reader, specs))
+
+    # one read per (field, step) dataset, step-major
+    assert len(reads) == len(set(reads)) == sum(map(len, per_field.values()))
+    assert [sv.step_index for _, sv in shared] == sorted(sv.step_index for _, sv in shared)
+    for k, steps in per_field.items():
+        got = [sv for i, sv in shared if i == k]
+        for x, y in zip(steps, got, strict=True):
+            assert (x.step_index, x.step_value) == (y.step_index, y.step_value)
+            np.testing.assert_array_equal(x.values, y.values)
+
+
+class _BadField:
+    """Two good fields and one whose third step has the wrong shape."""
+
+    def __init__(self):
+        self.specs = [FieldSpec(n, ["X"], 4, 5, "nodal", [0.0, 1.0, 2.0, 3.0]) for n in ("A", "B", "BAD")]
+
+    def iter_field_steps(self, field_name):
+        for i in range(4):
+            n = 4 if field_name == "BAD" and i == 2 else 5
+            yield StepValues(step_index=i, step_value=float(i), values=np.full(n, i, dtype=np.float32))
+
+
+def test_parallel_write_surfaces_field_errors(tmp_path):
+    from ada.fem.results.artefacts import _FieldBlobJob, write_field_blobs_parallel
+
+    reader = _BadField()
+    jobs = [_FieldBlobJob(spec, tmp_path / f"{spec.name}.bin", None) for spec in reader.specs]
+    with pytest.raises(ValueError, match="'BAD' step 2 produced shape"):
+        write_field_blobs_parallel(reader, jobs, workers=2, step_buffer_bytes=1 << 20)
@@ -0,0 +1,120 @@
+"""Streaming CalculiX bake reader (`FrdStreamReader`) + its env gate.
+
+The streaming reader indexes the .frd blocks by byte offset and parses one result block
+per step. It must produce exactly what the full-materialise adapter over
+``read_from_frd_file_proto`` produces — pinned here at the reader level and end-to-end.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ada.fem.formats.calculix.results.frd_stream import FrdStreamReader
+from ada.fem.formats.calculix.results.read_frd_file import (
+    ReadFrdFailedException,
+    read_from_frd_file_proto,
+)
+from ada.fem.results.artefacts import (
+    FEAResultStreamAdapter,
+    bake_fea_artefacts_from_source,
+    make_stream_reader,
+)
+
+_EIGEN = "cantilever/calculix/eigen_shell_cantilever_calculix.frd"  # 20 modes
+_STATIC = "cantilever/calculix/static_solid_cantilever_calculix.frd"
+
+
+@pytest.mark.parametrize("name", [_EIGEN, _STATIC])
+def test_stream_reader_matches_adapter(fem_files, name):
+    frd = fem_files / name
+    ref = FEAResultStreamAdapter(read_from_frd_file_proto(frd))
+    with FrdStreamReader(frd) as strm:
+        g1, g2 = ref.read_mesh_geometry(), strm.read_mesh_geometry()
+        np.testing.assert_array_equal(g1.points, g2.points)
+        assert [b.cell_type for b in g1.cell_blocks] == [b.cell_type for b in g2.cell_blocks]
+        for a, b in zip(g1.cell_blocks, g2.cell_blocks):
+            np.testing.assert_array_equal(a.data, b.data)
+            np.testing.assert_array_equal(a.identifiers, b.identifiers)
+
+        def spec_key(s):
+            return s.name, s.components, s.n_steps, s.n_points, s.support, s.step_values, s.category
+
+        assert [spec_key(s) for s in strm.field_specs()] == [spec_key(s) for s in ref.field_specs()]
+        for spec in strm.field_specs():
+            a = list(ref.iter_field_steps(spec.name))
+            b = list(strm.iter_field_steps(spec.name))
+            assert len(a) == len(b) == spec.n_steps
+            for x, y in zip(a, b):
+                assert (x.step_index, x.step_value) == (y.step_index, y.step_value)
+                np.testing.assert_array_equal(x.values, y.values)
+
+
+def test_fixed_width_rows_glued_negatives_and_continuations(tmp_path):
+    frd = tmp_path / "mixed.frd"
+    frd.write_text(
+        "    1C\n"
+        "    2C                             4                                     1\n"
+        " -1         1 0.00000E+00-1.00000E+00 0.00000E+00\n"
+        " -1         2 1.00000E+00-1.00000E+00-2.50000E-01\n"
+        " -1         3 1.00000E+00 1.00000E+00 0.00000E+00\n"
+        " -1         4-1.00000E+00 1.00000E+00 0.00000E+00\n"
+        " -3\n"
+        "    3C                             2                                     1\n"
+        " -1        10    9    0    1\n"
+        " -2         1         2         3         4\n"
+        " -1        11    7    0    1\n"
+        " -2         4         1         3\n"
+        " -3\n"
+        "    1PSTEP                         1           7           1\n"
+        " -4  WIDE        7    1\n"
+        " -5  A1          1    1    0    0\n"
+        " -5  A7          1    1    0    0\n"
+        " -1         3 1.00000E+00-2.00000E+00-3.00000E+00-4.00000E+00-5.00000E+00-6.00000E+00\n"
+        " -2           7.00000E+00\n"
+        " -1         1 1.10000E+00-2.10000E+00-3.10000E+00-4.10000E+00-5.10000E+00-6.10000E+00\n"
+        " -2           7.10000E+00\n"
+        " -3\n"
+        " 9999\n"
+    )
+    with make_stream_reader(frd) as r:
+        assert isinstance(r, FrdStreamReader)
+        geom = r.read_mesh_geometry()
+        np.testing.assert_array_equal(geom.points[1], [1.0, -1.0, -0.25])
+        assert [(b.cell_type, b.identifiers.tolist(), b.data.tolist()) for b in geom.cell_blocks] == [
+            ("quad", [10], [[0, 1, 2, 3]]),
+            ("triangle", [11], [[3, 0, 2]]),
+        ]
+
+        (spec,) = r.field_specs()
+        assert spec.components == ["A1", "A7"] and spec.step_values == [7.0]
+        (step,) = r.iter_field_steps("WIDE")
+        np.testing.assert_array_equal(step.values[[2, 0]], [[1.0, -2.0], [1.1, -2.1]])
+        assert np.isnan(step.values[[1, 3]]).all()  # nodes the block does not list
+
+
+def test_missing_elements_raise(tmp_path):
+    frd = tmp_path / "empty.frd"
+    frd.write_text("    1C\n 9999\n")
+    with FrdStreamReader(frd) as r, pytest.raises(ReadFrdFailedException):
+        r.read_mesh_geometry()
+
+
+def test_bake_blobs_identical_streaming_vs_full(tmp_path, fem_files, monkeypatch):
+    frd = fem_files / _EIGEN
+
+    monkeypatch.setenv("ADA_FEA_FRD_STREAMER", "off")
+    with make_stream_reader(frd) as r:
+        assert isinstance(r, FEAResultStreamAdapter)
+    bake_full = bake_fea_artefacts_from_source(frd, tmp_path / "full", src_key=frd.stem)
+
+    monkeypatch.delenv("ADA_FEA_FRD_STREAMER", raising=False)
+    bake_strm = bake_fea_artefacts_from_source(frd, tmp_path / "stream", src_key=frd.stem)
+
+    def blobs(d):
+        return sorted(p.name for p in d.iterdir() if p.suffix == ".bin")
+
+    names = blobs(bake_full.out_dir)
+    assert names and names == blobs(bake_strm.out_dir)
+    for name in names:
+        assert (bake_full.out_dir / name).read_bytes() == (bake_strm.out_dir / name).read_bytes(), name
@@ -0,0 +1,150 @@
+"""Load combinations over basic cases: the chunked envelope, FEAResult / SQLite stacks and the bake."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from ada.fem.formats.sesam.results.read_sif import read_sif_file
+from ada.fem.formats.sesam.results.sif_stream import SifStreamReader
+from ada.fem.results.artefacts import (
+    bake_fea_artefacts_from_source,
+    read_blob_step,
+    read_elem_field_blob_step,
+)
+from ada.fem.results.combinations import (
+    CombinationEnvelopeReader,
+    CombinedField,
+    LoadCombinations,
+    envelope,
+)
+from ada.fem.results.sqlite_store import SQLiteFEAStore
+
+_SHELL = "cantilever/sesam/static/shell/STATIC_SHELL_CANTILEVER_SESAMR1.SIF"
+_EIGEN = "cantilever/sesam/eigen/line/EIGEN_LINE_CANTILEVER_SESAMR1.SIF"
+_FACTORS = {"ULS-1": {1: 1.3, 2: 0.7}, "ULS-2": {1: 1.0, 3: -1.5}, "SLS": {2: 1.0, 3: 1.0}}
+
+
+def test_chunked_envelope_matches_all_combinations():
+    rng = np.random.default_rng(3)
+    combos = LoadCombinations(list(range(40)), [1, 2, 3, 4], rng.normal(size=(40, 4)))
+    stack = rng.normal(size=(4, 1001, 3))
+
+    env = envelope(combos.coefficients, stack, chunk_rows=64)
+    full = np.einsum("ij,jrc->irc", combos.coefficients, stack)
+    np.testing.assert_allclose(env.max, full.max(axis=0))
+    np.testing.assert_allclose(env.min, full.min(axis=0))
+    np.testing.assert_array_equal(env.governing_max, full.argmax(axis=0))
+    np.testing.assert_array_equal(env.governing_absmax, np.abs(full).argmax(axis=0))
+    np.testing.assert_allclose(env.absmax, np.take_along_axis(full, env.governing_absmax[None], 0)[0])
+
+    combined = CombinedField(combos, stack)
+    np.testing.assert_allclose(combined[7], full[7])
+    with pytest.raises(KeyError):
+        combined[99]
+
+
+def test_combinations_from_dict():
+    combos = LoadCombinations.from_dict(_FACTORS)
+    assert combos.case_ids == [1, 2, 3] and combos.combination_ids == ["ULS-1", "ULS-2", "SLS"]
+    np.testing.assert_array_equal(combos.coefficients, [[1.3, 0.7, 0.0], [1.0, 0.0, -1.5], [0.0, 1.0, 1.0]])
+
+
+def test_fea_result_combine(fem_files):
+    res = read_sif_file(fem_files / _EIGEN)
+    combos = LoadCombinations.from_dict(_FACTORS)
+    combined = res.combine("RVNODDIS", combos)
+
+    expected = 1.3 * res.get_data("RVNODDIS", 1) + 0.7 * res.get_data("RVNODDIS", 2)
+    uls = combined.field_data("ULS-1")
+    np.testing.assert_allclose(uls.values[:, 1:], expected)
+    np.testing.assert_array_equal(uls.values[:, 0], res.get_field_value_by_name("RVNODDIS", 1).values[:, 0])
+    assert combined.envelope().max.shape == expected.shape
+
+    with pytest.raises(ValueError):
+        res.combine("RVNODDIS", LoadCombinations.from_dict({"X": {999: 1.0}}))
+
+
+def test_sqlite_case_stack(tmp_path):
+    store = SQLiteFEAStore(tmp_path / "res.db")
+    store.insert_table("FieldVars", [(1, "U1", ""), (2, "U2", "")])
+    rows = []
+    for step in (1, 2):
+        for point in (3, 1, 2):
+            for var in (1, 2):
+                rows.append((1, point, step, var, 0.0, -1.0))  # earlier frame, ignored
+                rows.append((1, point, step, var, 1.0, 100 * step + 10 * point + var))
+    # the last frame is per (step, field variable)
+    rows += [(1, point, 2, 2, 2.0, 1000 + 10 * point) for point in (1, 2, 3)]
+    store.insert_table("FieldNodes", rows)
+
+    combos = LoadCombinations(["A"], [1, 2], [[2.0, -1.0]])
+    labels, combined = store.combine_field(["U1", "U2"], combos)
+    assert labels.tolist() == [1, 2, 3]
+    assert combined.stack[0].tolist() == [[111, 112], [121, 122], [131, 132]]
+    assert combined.stack[1].tolist() == [[211, 1010], [221, 1020], [231, 1030]]
+    np.testing.assert_allclose(combined["A"], 2 * combined.stack[0] - combined.stack[1])
+
+    with pytest.raises(ValueError, match="'U3'"):
+        store.combine_field(["U1", "U3"], combos)
+
+
+def test_sqlite_case_stack_from_field_arrays(tmp_path):
+    store = SQLiteFEAStore(tmp_path / "res.db")
+    labels = np.array([3, 1, 2])
+    for step in (1, 2):
+        store.insert_field_array("U", step, labels, np.zeros((3, 3)), ["U1", "U2", "U3"], frame=0.0)
+        values = 100 * step + 10 * labels[:, None] + np.arange(1, 4)
+        store.insert_field_array("U", step, labels, values, ["U1", "U2", "U3"], frame=1.0)
+
+    combos = LoadCombinations(["A"], [1, 2], [[1.0, 1.5]])
+    point_ids, combined = store.combine_field(["U1", "U2", "U3"], combos)
+    assert point_ids.tolist() == [1, 2, 3]
+    assert combined.stack[1].tolist() == [[211, 212, 213], [221, 222, 223], [231, 232, 233]]
+    np.testing.assert_allclose(combined["A"], combined.stack[0] + 1.5 * combined.stack[1])
+
+    with pytest.raises(ValueError, match="'U4'"):
+        store.combine_field(["U1", "U4"], combos)
+    with pytest.raises(ValueError, match="Step 3"):
+        store.combine_field(["U1"], LoadCombinations(["B"], [1, 3], [[1.0, 1.0]]))
+
+
+def test_bake_writes_combination_envelopes(fem_files, tmp_path):
+    combos = LoadCombinations(["up", "down"], [1], [[1.5], [-0.5]])
+    bake = bake_fea_artefacts_from_source(fem_files / _SHELL, tmp_path, combinations=combos, derived_fields=True)
+    fields = {f["name_canonical"]: f for f in json.loads(bake.manifest_path.read_text())["fields"]}
+    assert {"RVNODDIS.ENV_MAX", "STRESS.ENV_ABSMAX", "STRESS.MISES"} <= fields.keys()
+    assert not any(name.startswith("STRESS.MISES.ENV") for name in fields)
+
+    disp = read_blob_step(tmp_path / fields["RVNODDIS"]["blob"]["url"], 0)
+    env_max = read_blob_step(tmp_path / fields["RVNODDIS.ENV_MAX"]["blob"]["url"], 0)
+    np.testing.assert_allclose(env_max, np.maximum(1.5 * disp, -0.5 * disp), rtol=1e-6)
+
+    def bucket(name):
+        (per_type,) = fields[name]["per_type"]
+        return read_elem_field_blob_step(tmp_path / per_type["blob"]["url"], 0)
+
+    stress = bucket("STRESS")
+    np.testing.assert_allclose(bucket("STRESS.ENV_MIN"), np.minimum(1.5 * stress, -0.5 * stress), rtol=1e-6)
+    np.testing.assert_array_equal(bucket("STRESS.ENV_GOVERNING"), 0.0)  # 1.5 always dominates |-0.5|
+
+
+def test_envelope_reader_matches_cases_on_step_ids(fem_files, caplog):
+    # nodal step values of an eigen deck with a SESTRA.LIS are frequencies, not case ids
+    combos = LoadCombinations(["A", "B"], [1, 2], [[1.3, 0.7], [1.0, -1.0]])
+    reader = CombinationEnvelopeReader(SifStreamReader(fem_files / _EIGEN), combos)
+    assert reader.field_specs()[0].step_values[0] != 1.0
+
+    names = {s.name for s in reader.field_specs()}
+    assert "RVNODDIS.ENV_MAX" in names
+    (env_max,) = reader.iter_field_steps("RVNODDIS.ENV_MAX")
+    steps = {sv.step_index: sv.values for sv in reader.iter_field_steps("RVNODDIS") if sv.step_index < 2}
+    expected = np.maximum(1.3 * steps[0] + 0.7 * steps[1], steps[0] - steps[1])
+    np.testing.assert_allclose(env_max.values, expected, rtol=1e-5, atol=1e-12)
+
+    missing = CombinationEnvelopeReader(SifStreamReader(fem_files / _EIGEN), LoadCombinations(["C"], [999], [[1.0]]))
+    with caplog.at_level("WARNING"):
+        assert not any(s.name.endswith(".ENV_MAX") for s in missing.field_specs())
+    assert "999" in caplog.text
@@ -0,0 +1,66 @@
+import numpy as np
+
+from ada.fem.formats.general import FEATypes
+from ada.fem.results.common import ElementBlock, ElementInfo, FemNodes, Mesh
+from ada.fem.shapes import ElemShape
+from ada.fem.shapes.definitions import ShellShapes, SolidShapes
+
+
+def _hex_grid(n: int, hex20_from: int = None) -> Mesh:
+    """n x n x n hexahedra with shuffled, non-contiguous node ids; elements from
+    ``hex20_from`` on are HEX20 (mid-side nodes get ids of their own)."""
+    idx = np.arange((n + 1) ** 3).reshape(n + 1, n + 1, n + 1)
+    ids = np.random.default_rng(0).permutation(np.arange(10, 10 + 3 * idx.size, 3))
+    cells = []
+    for i in range(n):
+        for j in range(n):
+            for k in range(n):
+                bottom = [idx[i, j, k], idx[i + 1, j, k], idx[i + 1, j + 1, k], idx[i, j + 1, k]]
+                top = [idx[i, j, k + 1], idx[i + 1, j, k + 1], idx[i + 1, j + 1, k + 1], idx[i, j + 1, k + 1]]
+                cells.append(bottom + top)
+    refs = ids[np.array(cells)]
+    split = len(refs) if hex20_from is None else hex20_from
+    blocks = [ElementBlock(ElementInfo(SolidShapes.HEX8, FEATypes.CODE_ASTER, "HEXA8"), refs[:split], np.arange(split))]
+    if split < len(refs):
+        mid = np.arange(10**6, 10**6 + 12 * (len(refs) - split)).reshape(-1, 12)
+        ids = np.concatenate([ids, mid.ravel()])
+        el_ids = np.arange(split, len(refs))
+        blocks.append(
+            ElementBlock(
+                ElementInfo(SolidShapes.HEX20, FEATypes.CODE_ASTER, "HEXA20"), np.hstack([refs[split:], mid]), el_ids
+            )
+        )
+    shell = refs[:n, :4]
+    blocks.append(ElementBlock(ElementInfo(ShellShapes.QUAD, FEATypes.CODE_ASTER, "QUAD4"), shell, 1000 + np.arange(n)))
+    return Mesh(blocks, FemNodes(np.zeros((len(ids), 3)), ids))
+
+
+def test_edges_and_faces_match_per_element_shapes():
+    mesh = _hex_grid(3, hex20_from=10)
+    row = {int(x): i for i, x in enumerate(mesh.nodes.identifiers)}
+    edges, faces = [], []
+    for block in mesh.elements:
+        for elem in block.node_refs:
+            shape = ElemShape(block.elem_info.type, np.array([row[int(x)] for x in elem]))
+            edges += shape.edges
+            faces += shape.get_faces()
+
+    got_edges, got_faces = mesh.get_edges_and_faces_from_mesh()
+    np.testing.assert_array_equal(got_edges, np.reshape(edges, (-1, 2)))
+    np.testing.assert_array_equal(got_faces, np.reshape(faces, (-1, 3)))
+
+
+def test_skin_only_drops_interior_solid_faces():
+    n = 4
+    mesh = _hex_grid(n, hex20_from=30)
+    edges, faces = mesh.get_edges_and_faces_from_mesh(skin_only=True)
+    all_edges, _ = mesh.get_edges_and_faces_from_mesh()
+    np.testing.assert_array_equal(edges, all_edges)
+
+    # 6 n^2 boundary quads of the block (across the HEX8 / HEX20 interface) + the n shell quads
+    assert faces.shape == (2 * (6 * n**2 + n), 3)
+    # node row r is grid point r: every kept solid triangle lies in one outer plane of the block
+    grid = np.stack(np.meshgrid(*[np.arange(n + 1)] * 3, indexing="ij"), axis=-1).reshape(-1, 3)
+    corners = grid[faces[: 2 * 6 * n**2]]
+    in_plane = (corners == corners[:, :1]).all(axis=1) & np.isin(corners[:, 0], [0, n])
+    assert in_plane.any(axis=1).all()
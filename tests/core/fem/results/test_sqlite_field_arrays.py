@@ -0,0 +1,86 @@
+import json
+import sqlite3
+
+import numpy as np
+import pytest
+
+from ada.fem.results.combinations import LoadCombinations
+from ada.fem.results.sqlite_store import SQLiteFEAStore
+
+
+def test_field_array_roundtrip(tmp_path):
+    store = SQLiteFEAStore(tmp_path / "res.db")
+    labels = np.arange(1, 6)
+    disp = np.random.default_rng(0).normal(size=(5, 3))
+    store.insert_field_array("U", 1, labels, disp * 0.5, ["U1", "U2", "U3"], frame=0.5)
+    store.insert_field_array("U", 1, labels, disp, ["U1", "U2", "U3"], frame=1.0)
+
+    last = store.get_field_array("U", 1)
+    assert last.frame == 1.0 and last.components == ["U1", "U2", "U3"]
+    np.testing.assert_array_equal(last.labels, labels)
+    np.testing.assert_array_equal(last.values, disp)
+    assert not last.values.flags.writeable  # a view on the stored blob
+    np.testing.assert_array_equal(store.get_field_array("U", 1, frame=0.5).values, disp * 0.5)
+
+    elem_labels = np.array([[10, 1], [10, 2], [11, 1]])
+    stress = np.arange(6, dtype=np.float32).reshape(3, 2)
+    store.insert_field_array("S", 1, elem_labels, stress, ["S11", "S22"])
+    store.insert_field_array("S", 1, elem_labels, stress + 1, ["S11", "S22"])  # replaces
+    s = store.get_field_array("S", 1, element=True)
+    assert s.values.dtype == np.float32 and s.labels.shape == (3, 2)
+    np.testing.assert_array_equal(s.values, stress + 1)
+    assert len(store.get_field_array_keys("S")) == 1
+
+    with pytest.raises(KeyError):
+        store.get_field_array("S", 1)  # stored as an element field
+    with pytest.raises(ValueError):
+        store.insert_field_array("U", 2, labels[:3], disp)
+
+
+def test_field_arrays_added_to_existing_database(tmp_path):
+    db = tmp_path / "dump.sqlite"
+    sqlite3.connect(db).executescript("create table FieldNodes (FieldVarID INTEGER, StepID INTEGER);")
+    store = SQLiteFEAStore(db)
+    store.insert_field_array("U", 1, [1, 2], [[0.0], [1.0]])
+    assert store.get_field_array("U", 1).values.tolist() == [[0.0], [1.0]]
+
+
+def test_row_queries_read_field_arrays_first(tmp_path):
+    store = SQLiteFEAStore(tmp_path / "res.db")
+    store.insert_table("ModelInstances", [(1, "PART-1")])
+    store.insert_table("Steps", [(1, "Step-1", "", ""), (2, "Step-2", "", "")])
+    store.insert_table("FieldVars", [(1, "RF1", "")])
+    store.insert_table("FieldNodes", [(1, 7, 1, 1, 1.0, 42.0)])
+    store.insert_field_array("U", 1, [1, 2], [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], ["U1", "U2", "U3"], frame=1.0)
+    store.insert_field_array("S", 2, [[10, 1], [10, 2]], [[7.0], [8.0]], ["S11"])
+
+    (components,) = store.conn.execute("SELECT Components FROM FieldArrays WHERE FieldName = 'U'").fetchone()
+    assert json.loads(components) == ["U1", "U2", "U3"]
+
+    assert store.get_field_nodal_data("U2", step_id=1) == [
+        ("PART-1", 1, "Step-1", "U2", 1.0, 2.0),
+        ("PART-1", 2, "Step-1", "U2", 1.0, 5.0),
+    ]
+    assert [r[3] for r in store.get_field_nodal_data("U", point_id=2)] == ["U1", "U2", "U3"]
+    assert store.get_field_elem_data("S11", int_point=2) == [("PART-1", 10, "Step-2", "S11", 2, 0.0, 8.0)]
+    # not in any array: the row tables
+    assert store.get_field_nodal_data("RF1") == [("PART-1", 7, "Step-1", "RF1", 1.0, 42.0)]
+
+
+def test_field_arrays_only_store_is_readable(tmp_path):
+    # what the code_aster export writes: FieldArrays only, one array per stored index
+    store = SQLiteFEAStore(tmp_path / "res.db")
+    store.insert_table("ModelInstances", [(1, "MESH")])
+    store.insert_table("Steps", [(1, "Step-1", "", ""), (2, "Step-2", "", "")])
+    for step in (1, 2):
+        for index in (0, 1):
+            values = [[step + index, 0.0, -1.0], [2 * (step + index), 0.0, -1.0]]
+            store.insert_field_array("DEPL", step, [1, 2], values, ["DX", "DY", "DZ"], frame=float(index))
+
+    assert store.get_field_vars() == [(None, "DX", "DEPL"), (None, "DY", "DEPL"), (None, "DZ", "DEPL")]
+    assert [r[-1] for r in store.get_field_nodal_data("DX", step_id=2)] == [2.0, 4.0, 3.0, 6.0]
+
+    combos = LoadCombinations(["A"], [1, 2], [[1.0, 1.0]])
+    labels, combined = store.combine_field(["DX", "DZ"], combos)
+    assert labels.tolist() == [1, 2]
+    np.testing.assert_array_equal(combined["A"], [[5.0, -2.0], [10.0, -2.0]])
@@ -0,0 +1,85 @@
+"""Abaqus *Nset/*Elset reading on the array-backed mesh: id-backed sets from packed id arrays."""
+
+import pytest
+
+import ada
+from ada.config import Config
+from ada.fem.formats.abaqus.read import reader
+
+_DECK = """*Heading
+*Part, name=P1
+*Node
+1, 0., 0., 0.
+2, 1., 0., 0.
+3, 1., 1., 0.
+4, 0., 1., 0.
+5, 2., 0., 0.
+6, 2., 1., 0.
+*Element, type=S4R
+1, 1, 2, 3, 4
+2, 2, 5, 6, 3
+*Nset, nset=left
+1, 4
+*Nset, nset=right
+5, 6,
+99
+*Nset, nset=every_other, generate
+1, 5, 2
+*Nset, nset=both
+left, right
+*Elset, elset=plates
+1, 2
+*End Part
+*Assembly, name=Assembly
+*Instance, name=P1-1, part=P1
+*End Instance
+*End Assembly
+"""
+
+
+def _read_sets(tmp_path):
+    (tmp_path / "m.inp").write_text(_DECK)
+    a = ada.from_fem(str(tmp_path / "m.inp"))
+    fem = [p for p in a.get_all_parts_in_assembly() if len(p.fem.nodes) > 0][0].fem
+    return fem, {fs.name: sorted(int(m.id) for m in fs.members) for fs in fem.sets}
+
+
+def test_array_sets_match_object_sets(tmp_path, _restore_flag):
+    Config().meshing_array_backed = False
+    _, obj = _read_sets(tmp_path)
+    Config().meshing_array_backed = True
+    fem, arr = _read_sets(tmp_path)
+
+    assert arr == obj
+    assert arr["right"] == [5, 6]  # the unknown id 99 is dropped
+    assert arr["every_other"] == [1, 3, 5]
+    assert arr["both"] == [1, 4, 5, 6]
+    for fs in fem.sets:
+        assert fs._member_ids is not None
+    # membership is registered on the substrate side-tables without minting per-member proxies
+    assert fem.sets.nodes["left"] in list(fem.nodes.from_id(4).refs)
+    assert fem.sets.elements["plates"] in list(fem.elements.from_id(2).refs)
+
+
+def test_set_cards_parsed_in_a_process_pool(monkeypatch):
+    monkeypatch.setattr(reader, "_PARALLEL_MIN_SET_CARDS", 1)
+    bulk = "".join(f"*Nset, nset=s{i}\n{i}, {i + 1},\n{i + 2}\n" for i in range(50)) + "*Elset, elset=named\ns1, s2\n"
+
+    serial = reader.parse_set_cards(bulk, workers=1)
+    pooled = reader.parse_set_cards(bulk, workers=2)
+
+    assert [m.group(2) for m, _ in pooled] == [m.group(2) for m, _ in serial]
+    assert [list(x) for _, x in pooled] == [list(x) for _, x in serial]
+    assert list(pooled[3][1]) == [3, 4, 5]
+    assert pooled[-1][1] == ["s1", "s2"]
+
+
+def test_id_backed_elset_skips_unresolved_members(tmp_path, _restore_flag):
+    Config().meshing_array_backed = True
+    fem, _ = _read_sets(tmp_path)
+
+    fs = ada.fem.FemSet("partly_known", [2, 99], "elset", parent=fem)
+
+    assert fs in list(fem.elements.from_id(2).refs)
+    with pytest.raises(ValueError):
+        fem.elements.from_id(99)
@@ -0,0 +1,88 @@
+"""Streaming Abaqus .inp reader (stream_inp): includes, chunking and the text skeleton."""
+
+import numpy as np
+
+import ada
+from ada.config import Config
+from ada.fem.formats.abaqus.read import stream
+from ada.fem.formats.abaqus.read.stream import (
+    StreamedElements,
+    StreamedNodes,
+    stream_inp,
+)
+from ada.fem.shapes.definitions import SolidShapes
+
+
+def _hex20_lines(n_elems: int) -> list[str]:
+    # 20 node ids do not fit one line: 15 on the first, continued by 5 on the next
+    lines = []
+    for el in range(1, n_elems + 1):
+        ids = [20 * (el - 1) + k for k in range(1, 21)]
+        lines.append(f"{el}, " + ", ".join(map(str, ids[:15])) + ",\n")
+        lines.append(", ".join(map(str, ids[15:])) + "\n")
+    return lines
+
+
+def test_stream_follows_nested_includes_and_splits_text(tmp_path, monkeypatch):
+    monkeypatch.setattr(stream, "STREAM_CHUNK", 3)
+    (tmp_path / "mesh").mkdir()
+    nodes = [f"{i}, {i}., {-i}., 0.\n" for i in range(1, 41)]
+    (tmp_path / "mesh" / "nodes.inp").write_text("*Node, nset=all_nodes\n" + "".join(nodes))
+    # nested include, resolved relative to the including file
+    (tmp_path / "mesh" / "mesh.inp").write_text(
+        "*Include, input=nodes.inp\n*Element, type=C3D20, elset=solids\n" + "".join(_hex20_lines(2))
+    )
+    (tmp_path / "model.inp").write_text(
+        "*Heading\n*Part, name=P1\n*INCLUDE, INPUT=mesh/mesh.inp\n*Elset, elset=solids_copy\n1, 2\n*End Part\n"
+    )
+
+    deck = stream_inp(tmp_path / "model.inp")
+
+    nodes_blk, elem_blk = deck.blocks
+    assert isinstance(nodes_blk, StreamedNodes) and isinstance(elem_blk, StreamedElements)
+    assert nodes_blk.nset == "all_nodes"
+    assert nodes_blk.node_ids.tolist() == list(range(1, 41))
+    np.testing.assert_array_equal(nodes_blk.coords[4], [5.0, -5.0, 0.0])
+    assert elem_blk.ctype == SolidShapes.HEX20 and elem_blk.elset == "solids"
+    assert elem_blk.el_ids.tolist() == [1, 2]
+    assert elem_blk.conn[1].tolist() == list(range(21, 41))
+
+    # the mesh data is cut out of the text, the small cards stay
+    assert "*Include" not in deck.text and "C3D20" not in deck.text
+    assert "*Elset, elset=solids_copy\n1, 2\n" in deck.text
+    assert deck.blocks_in(deck.text) == deck.blocks
+
+
+def test_node_nset_stops_at_the_next_parameter(tmp_path):
+    (tmp_path / "model.inp").write_text("*NODE, NSET=N1, SYSTEM=R\n1, 0., 0., 0.\n2, 1., 0., 0.\n")
+
+    (nodes_blk,) = stream_inp(tmp_path / "model.inp").blocks
+    assert nodes_blk.nset == "N1"
+    assert nodes_blk.node_ids.tolist() == [1, 2]
+
+
+def test_streamed_read_matches_object_read(tmp_path, _restore_flag):
+    (tmp_path / "mesh.inp").write_text(
+        "*Node\n1, 0., 0., 0.\n2, 1., 0., 0.\n3, 1., 1., 0.\n4, 0., 1., 0.\n5, 2., 0., 0.\n"
+        "*Element, type=S4R, elset=plates\n1, 1, 2, 3, 4\n*Element, type=S3, elset=tris\n2, 2, 5, 3\n"
+    )
+    (tmp_path / "model.inp").write_text(
+        "*Heading\n*Part, name=P1\n*Include, input=mesh.inp\n*Nset, nset=support\n1, 4\n*End Part\n"
+        "*Assembly, name=Assembly\n*Instance, name=P1-1, part=P1\n*End Instance\n*End Assembly\n"
+    )
+
+    def digest():
+        a = ada.from_fem(str(tmp_path / "model.inp"))
+        fem = [p for p in a.get_all_parts_in_assembly() if p.fem is not None and len(p.fem.nodes) > 0][0].fem
+        nodes = sorted((int(n.id), *[float(x) for x in n.p]) for n in fem.nodes)
+        els = sorted((int(e.id), e.type, tuple(int(n.id) for n in e.nodes)) for e in fem.elements)
+        sets = sorted((s.name, sorted(int(m.id) for m in s.members)) for s in fem.sets)
+        return type(fem.nodes).__name__, nodes, els, sets
+
+    Config().meshing_array_backed = False
+    obj = digest()
+    Config().meshing_array_backed = True
+    arr = digest()
+
+    assert obj[0] == "Nodes" and arr[0] == "ArrayNodes"
+    assert obj[1:] == arr[1:]
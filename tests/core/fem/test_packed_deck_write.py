@@ -0,0 +1,111 @@
+"""The array-level deck writers must produce the same text as the per-object writers.
+
+Builds one shell Part, formats its mesh bulk with the object-model Node/Elem, converts the
+same FEM with ``to_array_backed`` and formats it again from the packed arrays. The write
+chunk is shrunk so every block spans several chunks.
+"""
+
+import h5py
+import numpy as np
+import pytest
+
+import ada
+from ada import Node
+from ada.api.mesh.containers import ArrayElements, to_array_backed
+from ada.fem.formats import packed_write
+from ada.fem.shapes.definitions import ShellShapes
+
+
+@pytest.fixture(autouse=True)
+def _small_chunks(monkeypatch):
+    monkeypatch.setattr(packed_write.chunks, "__defaults__", (7,))
+
+
+def _shell_part(quad8=False, nx=6, ny=5) -> ada.Part:
+    p = ada.Part("MyPart")
+    fem = p.fem
+    mat = ada.Material("S355")
+    # node ids inserted out of order, and signed zeros in the coordinates
+    ids = np.arange(1, (nx + 1) * (ny + 1) + 1).reshape(nx + 1, ny + 1)[::-1]
+    nodes = {}
+    for i in range(nx + 1):
+        for j in range(ny + 1):
+            nodes[(i, j)] = fem.nodes.add(Node([i * 0.5 - 1.0, -j * 0.25, 0.0 if j % 2 else -0.0], int(ids[i, j])))
+
+    next_nid = int(ids.max()) + 1
+    els_a, els_b = [], []
+    for eid, (i, j) in enumerate(((i, j) for i in range(nx) for j in range(ny)), start=1):
+        corners = [nodes[(i, j)], nodes[(i + 1, j)], nodes[(i + 1, j + 1)], nodes[(i, j + 1)]]
+        if quad8:
+            for a, b in zip(corners, corners[1:] + corners[:1]):
+                corners.append(fem.nodes.add(Node((a.p + b.p) / 2, next_nid)))
+                next_nid += 1
+        el = fem.add_elem(ada.fem.Elem(eid, corners, ShellShapes.QUAD8 if quad8 else ShellShapes.QUAD))
+        (els_a if i < nx // 2 else els_b).append(el)
+
+    for name, els, t in (("A", els_a, 0.01), ("B", els_b, 0.02)):
+        fem_set = fem.add_set(ada.fem.FemSet(f"Set{name}", els))
+        fs = fem.add_section(ada.fem.FemSection(f"Sec{name}", "shell", fem_set, mat, thickness=t))
+        for el in els:
+            el.fem_sec = fs
+            el.elset = fs.elset
+    return p
+
+
+def _object_and_packed(part: ada.Part, write):
+    expected = write(part)
+    to_array_backed(part.fem)
+    assert isinstance(part.fem.elements, ArrayElements)
+    return expected, write(part)
+
+
+def test_abaqus_bulk_parity():
+    from ada.fem.formats.abaqus.write.write_elements import elements_str
+    from ada.fem.formats.abaqus.write.write_nodes import nodes_str
+
+    expected, packed = _object_and_packed(_shell_part(), lambda p: (nodes_str(p.fem), elements_str(p.fem, False)))
+    assert packed == expected
+
+
+@pytest.mark.parametrize("quad8", [False, True])
+def test_calculix_bulk_parity(quad8):
+    from ada.fem.formats.calculix.write.write_elements import elements_str
+    from ada.fem.formats.calculix.write.writer import nodes_str
+
+    expected, packed = _object_and_packed(
+        _shell_part(quad8), lambda p: (nodes_str(p.fem.nodes), elements_str(p.fem.elements))
+    )
+    assert packed == expected
+
+
+@pytest.mark.parametrize("quad8", [False, True])
+def test_sesam_bulk_parity(quad8):
+    from ada.fem.formats.sesam.write.write_elements import elem_str
+    from ada.fem.formats.sesam.write.write_sections import sections_str
+    from ada.fem.formats.sesam.write.writer import nodes_str, univec_str
+
+    def write(p):
+        # a hinged element writes a two-line GELREF1 through the per-element fallback
+        p.fem.elements.from_id(3).metadata["fixno"] = (1, 2)
+        thick_map = {}
+        sections_str(p.fem, thick_map)
+        univec_str(p.fem)
+        return nodes_str(p.fem), elem_str(p.fem, thick_map)
+
+    expected, packed = _object_and_packed(_shell_part(quad8), write)
+    assert packed == expected
+
+
+def test_med_bulk_parity():
+    from ada.fem.formats.code_aster.write.write_med import med_elements, med_nodes
+
+    def write(p):
+        with h5py.File("bulk.med", "w", driver="core", backing_store=False) as f:
+            families = f.create_group("FAS")
+            med_nodes(p, f, "MED_NO_PROFILE_INTERNAL", families)
+            med_elements(p, f, "MED_NO_PROFILE_INTERNAL", families)
+            return {name: np.asarray(f[name]) for name in ("NOE/COO", "MAI/QU4/NOD", "MAI/QU4/NUM")}
+
+    expected, packed = _object_and_packed(_shell_part(), write)
+    for name, values in expected.items():
+        np.testing.assert_array_equal(packed[name], values, err_msg=name)
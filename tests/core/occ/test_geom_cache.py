@@ -0,0 +1,156 @@
+import ada
+from ada.occ.geom import cache as cache_module
+from ada.occ.geom.cache import (
+    BodyCache,
+    cache_stats,
+    cached_solid_by_guid,
+    clear_all,
+    get_solid_occ,
+    invalidate,
+    occ_solid_cache,
+)
+
+
+class _CountingBackend:
+    """Records serializations; sizes bodies by face count."""
+
+    def __init__(self):
+        self.serialized = 0
+
+    def serialize(self, shape):
+        self.serialized += 1
+        return "x" * 10_000
+
+    def faces(self, shape):
+        return [None] * 6
+
+
+class _BuildingBackend(_CountingBackend):
+    name = "fake"
+
+    def build(self, geometry):
+        return object()
+
+
+def test_body_cache_evicts_least_recently_used():
+    cache = BodyCache(max_bytes=100)
+    cache.put("a", "A", 40)
+    cache.put("b", "B", 40)
+    assert cache.get("a") == "A"
+
+    cache.put("c", "C", 40)
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.stats().evictions == 1
+    assert cache.stats().nbytes == 80
+
+
+def test_body_cache_serializes_only_when_spilling(tmp_path, monkeypatch):
+    backend = _CountingBackend()
+    monkeypatch.setattr(cache_module, "active_backend", lambda: backend)
+
+    cache = BodyCache(max_bytes=10**9, spill_dir="")
+    cache.get_or_build("a", lambda: "A")
+    assert backend.serialized == 0
+    assert cache.stats().nbytes == 6 * cache_module._BYTES_PER_FACE
+
+    spilling = BodyCache(max_bytes=10**9, spill_dir=tmp_path)
+    spilling.get_or_build("a", lambda: "A")
+    assert backend.serialized == 1
+    assert spilling.stats().nbytes == 10_000 and (tmp_path / "a.brep").is_file()
+
+
+def test_evicted_bodies_drop_their_guid_keys():
+    clear_all()
+    max_bytes = occ_solid_cache.max_bytes
+    occ_solid_cache.max_bytes = 100
+    try:
+        cache_module._remember_guid("be:solid:g1", "k1")
+        cache_module._remember_guid("be:solid:g2", "k1")
+        occ_solid_cache.put("k1", "A", 60)
+        cache_module._remember_guid("be:solid:g3", "k2")
+        occ_solid_cache.put("k2", "B", 60)
+
+        assert "k1" not in occ_solid_cache
+        assert cache_module._guid_keys == {"be:solid:g3": "k2"}
+        assert cache_module._key_guids == {"k2": {"be:solid:g3"}}
+    finally:
+        occ_solid_cache.max_bytes = max_bytes
+        clear_all()
+
+
+def test_solid_cache_is_content_addressed():
+    clear_all()
+    bm1 = ada.Beam("bm1", (0, 0, 0), (1, 0, 0), "IPE300")
+    bm2 = ada.Beam("bm2", (0, 0, 0), (1, 0, 0), "IPE300")
+
+    s1 = get_solid_occ(bm1)
+    assert get_solid_occ(bm2) is s1
+    assert cache_stats()["solid"].hits == 1
+
+    # Mutating the parametric description gives a new body without an explicit invalidate
+    bm1.n2 = ada.Node((2, 0, 0))
+    assert get_solid_occ(bm1) is not s1
+    assert cache_stats()["solid"].misses == 2
+
+
+def test_solid_cache_spill_roundtrip(tmp_path):
+    clear_all()
+    occ_solid_cache.spill_dir = tmp_path
+    try:
+        pl = ada.Plate("pl1", [(0, 0), (1, 0), (1, 1), (0, 1)], 0.01)
+        get_solid_occ(pl)
+        assert len(list(tmp_path.glob("*.brep"))) == 1
+
+        clear_all()
+        get_solid_occ(pl)
+        assert cache_stats()["solid"].spill_hits == 1
+    finally:
+        occ_solid_cache.spill_dir = None
+        clear_all()
+
+
+def test_unchanged_objects_skip_hashing_their_description(monkeypatch):
+    monkeypatch.setattr(cache_module, "active_backend", _BuildingBackend)
+    descriptions = []
+    description = cache_module._description
+    monkeypatch.setattr(cache_module, "_description", lambda g: descriptions.append(g) or description(g))
+    clear_all()
+    try:
+        bm = ada.Beam("bm1", (0, 0, 0), (1, 0, 0), "IPE300")
+        pl = ada.Plate("pl1", [(0, 0), (1, 0), (1, 1), (0, 1)], 0.01)
+        s1 = get_solid_occ(bm)
+        get_solid_occ(pl)
+        for _ in range(3):
+            assert get_solid_occ(bm) is s1
+            get_solid_occ(pl)
+        assert len(descriptions) == 2
+        assert cache_stats()["solid"].hits == 6
+
+        bm.n2.p = (2, 0, 0)
+        pl.t = 0.02
+        assert get_solid_occ(bm) is not s1
+        get_solid_occ(pl)
+        assert len(descriptions) == 4
+    finally:
+        clear_all()
+
+
+def test_invalidate_keeps_shared_bodies(monkeypatch):
+    monkeypatch.setattr(cache_module, "active_backend", _BuildingBackend)
+    clear_all()
+    try:
+        bm1 = ada.Beam("bm1", (0, 0, 0), (1, 0, 0), "IPE300")
+        bm2 = ada.Beam("bm2", (0, 0, 0), (1, 0, 0), "IPE300")
+        shape = get_solid_occ(bm1)
+        assert get_solid_occ(bm2) is shape
+
+        invalidate(bm1.guid)
+        assert cached_solid_by_guid(bm2.guid) is shape
+        assert len(occ_solid_cache) == 1
+
+        invalidate(bm2.guid)
+        assert len(occ_solid_cache) == 0
+        assert cache_module._guid_keys == {} and cache_module._key_guids == {}
+    finally:
+        clear_all()
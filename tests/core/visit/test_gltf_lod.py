@@ -0,0 +1,91 @@
+import json
+
+import numpy as np
+import trimesh
+
+from ada.visit.colors import Color
+from ada.visit.gltf.lod import simplify_merged_mesh, write_glb_lods
+from ada.visit.gltf.meshes import MeshStore, MeshType
+from ada.visit.gltf.meshopt import _read_glb
+from ada.visit.gltf.optimize import concatenate_stores
+from ada.visit.gltf.store import merged_mesh_to_trimesh_scene
+from tests.core.visit.test_gltf_quantize import _write_glb
+
+
+def _stores() -> list[MeshStore]:
+    shapes = {
+        "sphere_a": trimesh.creation.icosphere(subdivisions=4, radius=1.0),
+        "sphere_b": trimesh.creation.icosphere(subdivisions=4, radius=1.0).apply_translation((3.0, 0.0, 0.0)),
+        "bolt": trimesh.creation.box((0.01, 0.01, 0.01)).apply_translation((6.1, 0.1, 0.1)),
+    }
+    return [
+        MeshStore(
+            i,
+            None,
+            np.asarray(m.vertices, dtype=np.float32).reshape(-1),
+            np.asarray(m.faces, dtype=np.uint32).reshape(-1),
+            np.asarray(m.vertex_normals, dtype=np.float32).reshape(-1),
+            0,
+            MeshType.TRIANGLES,
+            name,
+        )
+        for i, (name, m) in enumerate(shapes.items())
+    ]
+
+
+def _centres(position, indices, start, length):
+    tris = position.reshape(-1, 3)[indices[start : start + length].reshape(-1, 3)]
+    return tris.mean(axis=1)
+
+
+def test_simplified_groups_keep_each_object_in_its_own_range():
+    merged = concatenate_stores(_stores())
+    coarse = simplify_merged_mesh(merged, 0.25)
+
+    assert 0 < len(coarse.indices) < len(merged.indices) / 4
+    assert [g.node_ref for g in coarse.groups] == ["sphere_a", "sphere_b", "bolt"]
+    assert sum(g.length for g in coarse.groups) == len(coarse.indices)
+    for g, x in zip(coarse.groups[:2], (0.0, 3.0)):
+        assert g.length > 0
+        centres = _centres(coarse.position, coarse.indices, g.start, g.length)
+        assert np.abs(centres[:, 0] - x).max() <= 1.0
+    # smaller than a cell: an empty range rather than a missing one
+    assert coarse.groups[2].length == 0
+    assert len(coarse.normal) == len(coarse.position)
+
+
+def test_glb_lod_chain_and_manifest(tmp_path):
+    merged = concatenate_stores(_stores())
+    scene = trimesh.Scene()
+    merged_mesh_to_trimesh_scene(scene, merged, Color(0.5, 0.5, 0.5), 0)
+    src = tmp_path / "model.glb"
+    scene.export(src)
+    j, bin_chunk = _read_glb(src)
+    ranges = {str(i): [g.start, g.length] for i, g in enumerate(merged.groups)}
+    j["scenes"][0]["extras"] = {"draw_ranges_node0": ranges, "id_hierarchy": {"0": ["sphere_a", "*"]}}
+    _write_glb(src, j, bin_chunk)
+
+    manifest_path = write_glb_lods(src, errors=(0.01, 0.05))
+    manifest = json.loads(manifest_path.read_text())
+    levels = manifest["levels"]
+    assert [lv["uri"] for lv in levels][0] == "model.glb"
+    assert len(levels) >= 2
+    assert all(a["triangles"] > b["triangles"] for a, b in zip(levels, levels[1:]))
+    assert all(a["geometric_error"] < b["geometric_error"] for a, b in zip(levels, levels[1:]))
+
+    for lv in levels[1:]:
+        jl, bin_l = _read_glb(tmp_path / lv["uri"])
+        assert jl["scenes"][0]["extras"]["id_hierarchy"] == j["scenes"][0]["extras"]["id_hierarchy"]
+        assert [n.get("name") for n in jl["nodes"]] == [n.get("name") for n in j["nodes"]]
+        prim = jl["meshes"][0]["primitives"][0]
+        ia, pa = jl["accessors"][prim["indices"]], jl["accessors"][prim["attributes"]["POSITION"]]
+        indices = np.frombuffer(bin_l, "<u4", ia["count"], jl["bufferViews"][ia["bufferView"]]["byteOffset"])
+        position = np.frombuffer(bin_l, "<f4", 3 * pa["count"], jl["bufferViews"][pa["bufferView"]]["byteOffset"])
+        assert len(indices) == 3 * lv["triangles"] and indices.max() < pa["count"]
+        np.testing.assert_allclose(pa["min"], position.reshape(-1, 3).min(axis=0))
+
+        lranges = jl["scenes"][0]["extras"]["draw_ranges_node0"]
+        assert lranges.keys() == ranges.keys()
+        for nid, x in (("0", 0.0), ("1", 3.0)):
+            start, length = lranges[nid]
+            assert np.abs(_centres(position, indices, start, length)[:, 0] - x).max() <= 1.0
@@ -0,0 +1,136 @@
+import json
+import struct
+
+import numpy as np
+import trimesh
+
+from ada.fem.formats.sesam.results.read_sif import read_sif_file
+from ada.visit.colors import Color
+from ada.visit.gltf.meshes import MeshStore, MeshType
+from ada.visit.gltf.meshopt import _read_glb
+from ada.visit.gltf.optimize import find_instances
+from ada.visit.gltf.quantize import _node_matrix, quantize_glb
+from ada.visit.gltf.store import add_gpu_instancing, instanced_mesh_to_trimesh_scene
+
+_SHELL = "cantilever/sesam/static/shell/STATIC_SHELL_CANTILEVER_SESAMR1.SIF"
+
+
+def _write_glb(path, j, bin_chunk):
+    js = json.dumps(j).encode()
+    js += b" " * (-len(js) % 4)
+    with open(path, "wb") as f:
+        f.write(struct.pack("<III", 0x46546C67, 2, 28 + len(js) + len(bin_chunk)))
+        f.write(struct.pack("<II", len(js), 0x4E4F534A) + js)
+        f.write(struct.pack("<II", len(bin_chunk), 0x004E4942) + bin_chunk)
+
+
+def _world_positions(j, bin_chunk) -> dict[str, np.ndarray]:
+    """Dequantized world-space POSITION of every mesh node, by node name."""
+    out = {}
+
+    def walk(ni, parent):
+        node = j["nodes"][ni]
+        m = parent @ _node_matrix(node)
+        if "mesh" in node:
+            a = j["accessors"][j["meshes"][node["mesh"]]["primitives"][0]["attributes"]["POSITION"]]
+            view = j["bufferViews"][a["bufferView"]]
+            dtype, scale = {5126: ("<f4", 1.0), 5122: ("<i2", 32767.0)}[a["componentType"]]
+            stride = view.get("byteStride", 12) // np.dtype(dtype).itemsize
+            raw = np.frombuffer(bin_chunk, dtype=dtype, count=a["count"] * stride, offset=view["byteOffset"])
+            local = raw.reshape(-1, stride)[:, :3] / scale
+            out[node["name"]] = local @ m[:3, :3].T + m[:3, 3]
+        for c in node.get("children", []):
+            walk(c, m)
+
+    for root in j["scenes"][0]["nodes"]:
+        walk(root, np.eye(4))
+    return out
+
+
+def test_quantized_glb_keeps_geometry_and_picking_metadata(fem_files, tmp_path):
+    plain = tmp_path / "shell.glb"
+    read_sif_file(fem_files / _SHELL).to_gltf(plain, -1, "RVNODDIS")
+    j, bin_chunk = _read_glb(plain)
+    j["scenes"][0]["extras"] = {"draw_ranges": {"EL1": [0, 6]}, "id_hierarchy": {"1": ["EL1", "root"]}}
+    j["extensions"] = {"ADA_EXT_data": {"simulation_objects": [{"name": "shell"}]}}
+    j["extensionsUsed"] = ["ADA_EXT_data"]
+    _write_glb(plain, j, bin_chunk)
+
+    packed = quantize_glb(plain, tmp_path / "shell.q.glb", min_bytes=0)
+    assert packed == tmp_path / "shell.q.glb"
+    jq, bin_q = _read_glb(packed)
+    assert plain.stat().st_size > packed.stat().st_size
+    assert "KHR_mesh_quantization" in jq["extensionsRequired"]
+
+    # picking metadata, node order / names and index buffers are untouched
+    assert jq["scenes"] == j["scenes"] and jq["extensions"] == j["extensions"]
+    assert [n["name"] for n in jq["nodes"]] == [n["name"] for n in j["nodes"]]
+    for mesh, mesh_q in zip(j["meshes"], jq["meshes"]):
+        for p, pq in zip(mesh["primitives"], mesh_q["primitives"]):
+            if "indices" in p:
+                a, aq = j["accessors"][p["indices"]], jq["accessors"][pq["indices"]]
+                v, vq = j["bufferViews"][a["bufferView"]], jq["bufferViews"][aq["bufferView"]]
+                src = bin_chunk[v["byteOffset"] : v["byteOffset"] + v["byteLength"]]
+                assert bin_q[vq["byteOffset"] : vq["byteOffset"] + vq["byteLength"]] == src
+
+    world, world_q = _world_positions(j, bin_chunk), _world_positions(jq, bin_q)
+    assert world.keys() == world_q.keys() and len(world) == 2
+    extent = max(np.ptp(p, axis=0).max() for p in world.values())
+    assert {jq["accessors"][m["primitives"][0]["attributes"]["POSITION"]]["componentType"] for m in jq["meshes"]} == {
+        5122
+    }
+    for name, p in world.items():
+        np.testing.assert_allclose(world_q[name], p, atol=extent / 32767)
+
+
+def test_animated_meshes_are_left_in_float(fem_files, tmp_path):
+    plain = tmp_path / "shell.glb"
+    read_sif_file(fem_files / _SHELL).to_gltf(plain, -1, "RVNODDIS")
+    j, bin_chunk = _read_glb(plain)
+    j["animations"] = [{"channels": [{"sampler": 0, "target": {"node": 0, "path": "translation"}}], "samplers": []}]
+    j["animations"].append({"channels": [{"sampler": 0, "target": {"node": 1, "path": "weights"}}], "samplers": []})
+    _write_glb(plain, j, bin_chunk)
+
+    assert quantize_glb(plain, tmp_path / "shell.q.glb", min_bytes=0) == plain
+
+
+def test_gpu_instanced_meshes_are_left_in_float(tmp_path):
+    box = trimesh.creation.box((1, 2, 3))
+    stores = []
+    for i in range(3):
+        m = np.eye(4)
+        m[:3, :3] = trimesh.transformations.rotation_matrix(0.5 * i, [1, 1, 0])[:3, :3]
+        m[:3, 3] = (10.0, 3.0 * i, 0.0)
+        position = trimesh.transform_points(box.vertices, m).astype(np.float32).ravel()
+        stores.append(MeshStore(i, None, position, box.faces.astype(np.uint32).ravel(), None, 0, MeshType.TRIANGLES, i))
+    groups, _ = find_instances(stores)
+    scene = trimesh.Scene()
+    node_name, transforms = instanced_mesh_to_trimesh_scene(scene, groups[0], Color(0.5, 0.5, 0.5), 0, 0)
+    # a plain mesh next to it, which is quantized
+    scene.add_geometry(trimesh.creation.icosphere(subdivisions=3), node_name="plain", geom_name="plain")
+    plain = tmp_path / "instanced.glb"
+    plain.write_bytes(
+        scene.export(
+            file_type="glb", buffer_postprocessor=lambda b, t: add_gpu_instancing(b, t, {node_name: transforms})
+        )
+    )
+
+    packed = quantize_glb(plain, tmp_path / "instanced.q.glb", min_bytes=0)
+    assert packed == tmp_path / "instanced.q.glb"
+    j, bin_chunk = _read_glb(plain)
+    jq, bin_q = _read_glb(packed)
+    (node,) = [n for n in jq["nodes"] if n.get("name") == node_name]
+    assert node == next(n for n in j["nodes"] if n.get("name") == node_name)
+    assert "EXT_mesh_gpu_instancing" in node["extensions"]
+
+    world, world_q = _world_positions(j, bin_chunk), _world_positions(jq, bin_q)
+    position_type = {
+        n["name"]: jq["accessors"][jq["meshes"][n["mesh"]]["primitives"][0]["attributes"]["POSITION"]]
+        for n in jq["nodes"]
+        if "mesh" in n
+    }
+    assert position_type[node_name]["componentType"] == 5126
+    assert position_type["plain"]["componentType"] == 5122
+    # node * instance * mesh: the instanced prototype is bit-identical, so every instance is too
+    np.testing.assert_array_equal(world_q[node_name], world[node_name])
+    np.testing.assert_allclose(world_q["plain"], world["plain"], atol=2 / 32767)
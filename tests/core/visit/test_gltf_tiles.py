@@ -0,0 +1,88 @@
+import json
+
+import numpy as np
+import trimesh
+
+from ada.visit.colors import Color
+from ada.visit.gltf.meshes import MeshStore, MeshType
+from ada.visit.gltf.meshopt import _read_glb
+from ada.visit.gltf.optimize import concatenate_stores
+from ada.visit.gltf.store import merged_mesh_to_trimesh_scene
+from ada.visit.gltf.tiles import octree_partition, tile_glb
+from tests.core.visit.test_gltf_quantize import _write_glb
+
+
+def test_octree_partition_respects_budget_and_covers_all_objects():
+    rng = np.random.default_rng(1)
+    lo = rng.random((200, 3)) * 100
+    hi = lo + rng.random((200, 3))
+    triangles = rng.integers(10, 100, 200)
+
+    tiles = octree_partition(lo, hi, triangles, max_triangles=1000)
+
+    members = np.concatenate([t.members for t in tiles])
+    assert sorted(members.tolist()) == list(range(200))
+    for t in tiles:
+        assert triangles[t.members].sum() <= 1000 or len(t.members) == 1
+        np.testing.assert_array_equal(t.min, lo[t.members].min(axis=0))
+        np.testing.assert_array_equal(t.max, hi[t.members].max(axis=0))
+    assert len({t.id for t in tiles}) == len(tiles)
+
+
+def test_tiled_glb_splits_objects_and_keeps_picking_metadata(tmp_path):
+    centres = [(x * 3.0, y * 3.0, 0.0) for x in range(4) for y in range(2)]
+    stores = []
+    for i, c in enumerate(centres):
+        m = trimesh.creation.icosphere(subdivisions=2).apply_translation(c)
+        stores.append(
+            MeshStore(
+                i,
+                None,
+                np.asarray(m.vertices, dtype=np.float32).reshape(-1),
+                np.asarray(m.faces, dtype=np.uint32).reshape(-1),
+                np.asarray(m.vertex_normals, dtype=np.float32).reshape(-1),
+                0,
+                MeshType.TRIANGLES,
+                str(i + 1),
+            )
+        )
+    merged = concatenate_stores(stores)
+    scene = trimesh.Scene()
+    merged_mesh_to_trimesh_scene(scene, merged, Color(0.5, 0.5, 0.5), 0)
+    src = tmp_path / "model.glb"
+    scene.export(src)
+    j, bin_chunk = _read_glb(src)
+    hierarchy = {"0": ["root", "*"], **{str(i + 1): [f"obj{i}", "0"] for i in range(len(centres))}}
+    ranges = {g.node_ref: [g.start, g.length] for g in merged.groups}
+    j["scenes"][0]["extras"] = {"draw_ranges_node0": ranges, "id_hierarchy": hierarchy}
+    _write_glb(src, j, bin_chunk)
+
+    per_object = len(merged.indices) // 3 // len(centres)
+    manifest = json.loads(tile_glb(src, max_triangles=2 * per_object).read_text())
+
+    assert manifest["source"] == "model.glb" and manifest["id_hierarchy"] == hierarchy
+    assert len(manifest["tiles"]) >= 4
+    assert sorted(manifest["object_tiles"]) == sorted(ranges)
+    assert all(len(tiles) == 1 for tiles in manifest["object_tiles"].values())
+
+    for k, tile in enumerate(manifest["tiles"]):
+        assert tile["triangles"] <= 2 * per_object
+        jt, bin_t = _read_glb(tmp_path / tile["uri"])
+        extras = jt["scenes"][0]["extras"]
+        objects = [nid for nid, tiles in manifest["object_tiles"].items() if tiles == [k]]
+        assert sorted(extras["draw_ranges_node0"]) == sorted(objects)
+        assert set(extras["id_hierarchy"]) == {"0", *objects}
+        assert [n.get("name") for n in jt["nodes"]] == [n.get("name") for n in j["nodes"]]
+
+        prim = jt["meshes"][0]["primitives"][0]
+        ia, pa = jt["accessors"][prim["indices"]], jt["accessors"][prim["attributes"]["POSITION"]]
+        indices = np.frombuffer(bin_t, "<u4", ia["count"], jt["bufferViews"][ia["bufferView"]]["byteOffset"])
+        position = np.frombuffer(bin_t, "<f4", 3 * pa["count"], jt["bufferViews"][pa["bufferView"]]["byteOffset"])
+        position = position.reshape(-1, 3)
+        assert tile["triangles"] == len(indices) // 3
+        for nid in objects:
+            start, length = extras["draw_ranges_node0"][nid]
+            pts = position[indices[start : start + length]]
+            np.testing.assert_allclose(pts.mean(axis=0), centres[int(nid) - 1], atol=0.1)
+            assert np.all(pts.min(axis=0) >= np.array(tile["bounds"][0]) - 1e-6)
+            assert np.all(pts.max(axis=0) <= np.array(tile["bounds"][1]) + 1e-6)
@@ -0,0 +1,94 @@
+import json
+import struct
+
+import numpy as np
+import trimesh
+
+import ada
+from ada.occ.tessellating import BatchTessellator
+from ada.visit.colors import Color
+from ada.visit.gltf.meshes import MeshStore, MeshType
+from ada.visit.gltf.optimize import find_instances
+from ada.visit.gltf.store import add_gpu_instancing, instanced_mesh_to_trimesh_scene
+
+
+def _rotation(angle: float) -> np.ndarray:
+    m = np.eye(4)
+    m[:3, :3] = trimesh.transformations.rotation_matrix(angle, [1, 1, 0])[:3, :3]
+    return m
+
+
+def _box_stores(transforms: list[np.ndarray]) -> list[MeshStore]:
+    box = trimesh.creation.box((1, 2, 3))
+    stores = []
+    for i, m in enumerate(transforms):
+        position = trimesh.transform_points(box.vertices, m).astype(np.float32).ravel()
+        stores.append(MeshStore(i, None, position, box.faces.astype(np.uint32).ravel(), None, 0, MeshType.TRIANGLES, i))
+    return stores
+
+
+def _glb_json(data: bytes) -> dict:
+    json_len = struct.unpack("<I", data[12:16])[0]
+    return json.loads(data[20 : 20 + json_len])
+
+
+def test_find_instances_groups_rigid_copies():
+    transforms = []
+    for i in range(4):
+        m = _rotation(0.3 * i)
+        m[:3, 3] = (5.0 * i, 1.0, 2.0)
+        transforms.append(m)
+
+    stores = _box_stores(transforms)
+    # A scaled box is not a rigid copy
+    scaled = np.diag([2.0, 1.0, 1.0, 1.0])
+    stores += _box_stores([scaled])
+
+    groups, singles = find_instances(stores)
+    assert len(groups) == 1
+    assert len(singles) == 1
+    assert groups[0].node_refs == [0, 1, 2, 3]
+
+    proto = groups[0].prototype.position.reshape(-1, 3)
+    for store, m in zip(stores, groups[0].transforms):
+        world = trimesh.transform_points(proto, m)
+        assert np.allclose(world, store.position.reshape(-1, 3), atol=1e-5)
+
+
+def test_glb_ext_mesh_gpu_instancing():
+    transforms = []
+    for i in range(3):
+        m = _rotation(0.5 * i)
+        m[:3, 3] = (0.0, 3.0 * i, 0.0)
+        transforms.append(m)
+
+    groups, _ = find_instances(_box_stores(transforms))
+    scene = trimesh.Scene()
+    node_name, inst_transforms = instanced_mesh_to_trimesh_scene(scene, groups[0], Color(0.5, 0.5, 0.5), 0, 0)
+    data = scene.export(
+        file_type="glb", buffer_postprocessor=lambda b, t: add_gpu_instancing(b, t, {node_name: inst_transforms})
+    )
+
+    tree = _glb_json(data)
+    assert "EXT_mesh_gpu_instancing" in tree["extensionsUsed"]
+    assert "EXT_mesh_gpu_instancing" in tree["extensionsRequired"]
+    (node,) = [n for n in tree["nodes"] if n.get("name") == node_name]
+    attributes = node["extensions"]["EXT_mesh_gpu_instancing"]["attributes"]
+    assert tree["accessors"][attributes["TRANSLATION"]]["count"] == 3
+    assert tree["accessors"][attributes["ROTATION"]]["type"] == "VEC4"
+
+    # The prototype vertex data is stored once
+    assert len(tree["meshes"]) == 1
+
+
+def test_batch_tessellator_instancing_tessellates_once():
+    beams = [ada.Beam(f"bm{i}", (0, i, 0), (1, i, 1), "IPE300") for i in range(5)]
+
+    bt = BatchTessellator(instancing=True)
+    stores = list(bt.batch_tessellate(beams))
+    assert len(stores) == 5
+    assert len(bt._local_meshes) == 1
+
+    bt.meshes_to_trimesh(stores)
+    assert len(bt.gpu_instances) == 1
+    assert len(next(iter(bt.gpu_instances.values()))) == 5
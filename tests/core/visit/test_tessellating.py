@@ -110,3 +110,33 @@ def test_tessellate_empty_shape_does_not_abort():
     tm = tessellate_shape(empty)  # must not abort the interpreter
     assert len(tm.faces) == 0
     assert len(tm.positions) == 0
+
+
+def test_batch_tessellate_process_pool_matches_serial():
+    import io
+
+    import ada
+
+    objects = [ada.Beam(f"bm{i}", (i, 0, 0), (i + 1, 0, 0), "IPE300") for i in range(5)]
+    objects += [ada.Plate(f"pl{i}", [(0, 0), (1, 0), (1, 1), (0, 1)], 0.01, origin=(0, 0, i)) for i in range(5)]
+    a = ada.Assembly() / (ada.Part("MyPart") / objects)
+
+    serial, pooled = io.BytesIO(), io.BytesIO()
+    a.to_gltf(serial)
+    a.to_gltf(pooled, cpus=2)
+
+    assert len(serial.getvalue()) > 0
+    assert pooled.getvalue() == serial.getvalue()
+
+
+def test_tessellation_pool_shared_memory_roundtrip():
+    import numpy as np
+
+    from ada.occ.tessellation_pool import pack_arrays, unpack_arrays
+
+    arrays = [np.arange(7, dtype=np.float32), None, np.arange(6, dtype=np.uint32).reshape(2, 3)]
+    out = unpack_arrays(*pack_arrays(arrays))
+
+    assert out[1] is None
+    for a, b in zip((out[0], out[2]), (arrays[0], arrays[2])):
+        assert a.dtype == b.dtype and np.array_equal(a, b)
@@ -0,0 +1,117 @@
+import numpy as np
+import trimesh
+
+from ada.visit.gltf.meshes import MeshStore, MeshType
+from ada.visit.gltf.optimize import concatenate_stores
+from ada.visit.optimizing import optimize_positions, reorder_for_cache, weld_vertices
+
+
+def _soup(mesh: trimesh.Trimesh) -> tuple[np.ndarray, np.ndarray]:
+    position = np.asarray(mesh.vertices[mesh.faces], dtype=np.float32).reshape(-1)
+    return position, np.arange(len(position) // 3, dtype=np.uint32)
+
+
+def _triangles(position, indices, start=0, length=None):
+    length = len(indices) - start if length is None else length
+    return position.reshape(-1, 3)[indices[start : start + length]].reshape(-1, 9)
+
+
+def test_weld_matches_trimesh_and_keeps_triangles():
+    sphere = trimesh.creation.icosphere(subdivisions=3)
+    position, indices = _soup(sphere)
+
+    welded, new_indices = optimize_positions(position, indices)
+
+    assert len(welded) // 3 == len(sphere.vertices)
+    assert new_indices.dtype == indices.dtype and len(new_indices) == len(indices)
+    np.testing.assert_array_equal(_triangles(welded, new_indices), _triangles(position, indices))
+
+
+def test_weld_respects_ranges_and_normals():
+    position, indices = _soup(trimesh.creation.box())
+    # the same box twice: one range each
+    position2 = np.concatenate([position, position])
+    indices2 = np.concatenate([indices, indices + len(indices)])
+    groups = [(0, len(indices)), (len(indices), len(indices))]
+
+    welded, new_indices, _ = weld_vertices(position2, indices2, groups=groups)
+    assert len(welded) // 3 == 16
+    assert set(new_indices[: len(indices)]).isdisjoint(new_indices[len(indices) :])
+
+    # flat-shaded box: a corner with three face normals stays three vertices
+    normal = np.repeat(trimesh.creation.box().face_normals, 3, axis=0).astype(np.float32).reshape(-1)
+    welded, new_indices, new_normal = weld_vertices(position, indices, normal)
+    assert len(welded) // 3 == 24 and len(new_normal) == len(welded)
+    np.testing.assert_array_equal(_triangles(new_normal, new_indices), _triangles(normal, indices))
+
+    inplace, inplace_indices, _ = weld_vertices(position.copy(), indices.copy(), inplace=True)
+    reference, reference_indices, _ = weld_vertices(position, indices)
+    np.testing.assert_array_equal(inplace, reference)
+    np.testing.assert_array_equal(inplace_indices, reference_indices)
+
+
+def test_reorder_keeps_each_range_triangle_set():
+    a, b = trimesh.creation.icosphere(subdivisions=2), trimesh.creation.icosphere(subdivisions=2)
+    b.apply_translation((3.0, 0.0, 0.0))
+    position = np.concatenate([a.vertices, b.vertices]).astype(np.float32).reshape(-1)
+    indices = np.concatenate([a.faces, b.faces + len(a.vertices)]).astype(np.uint32).reshape(-1)
+    groups = [(0, a.faces.size), (a.faces.size, b.faces.size)]
+
+    new_position, new_indices, _ = reorder_for_cache(position, indices, groups=groups)
+
+    assert len(new_position) == len(position) and len(new_indices) == len(indices)
+    for start, length in groups:
+        before = _triangles(position, indices, start, length)
+        after = _triangles(new_position, new_indices, start, length)
+        assert sorted(map(tuple, before)) == sorted(map(tuple, after))
+    # vertices are numbered in order of first use
+    _, first = np.unique(new_indices, return_index=True)
+    assert np.all(np.diff(first) > 0)
+
+
+def test_concatenate_stores_weld_and_reorder_keep_draw_ranges():
+    stores = []
+    for i in range(3):
+        m = trimesh.creation.icosphere(subdivisions=2).apply_translation((3.0 * i, 0.0, 0.0))
+        position, indices = _soup(m)
+        stores.append(MeshStore(i, None, position, indices, None, 0, MeshType.TRIANGLES, str(i)))
+    plain = concatenate_stores(stores)
+    merged = concatenate_stores(stores, weld=True, reorder=True)
+
+    assert len(merged.position) < len(plain.position) / 5
+    assert [(g.node_ref, g.start, g.length) for g in merged.groups] == [
+        (g.node_ref, g.start, g.length) for g in plain.groups
+    ]
+    for g in merged.groups:
+        before = _triangles(plain.position, plain.indices, g.start, g.length)
+        after = _triangles(merged.position, merged.indices, g.start, g.length)
+        assert sorted(map(tuple, before)) == sorted(map(tuple, after))
+
+
+def test_optimize_positions_drops_unreferenced_vertices():
+    position, indices = _soup(trimesh.creation.box())
+    # an extra vertex no triangle uses, like trimesh's merge_vertices drops
+    position = np.concatenate([position, np.float32([9.0, 9.0, 9.0])])
+
+    welded, new_indices = optimize_positions(position, indices)
+
+    assert len(welded) // 3 == 8
+    np.testing.assert_array_equal(_triangles(welded, new_indices), _triangles(position, indices))
+
+
+def test_batch_tessellator_welds_merged_meshes():
+    from ada.occ.tessellating import BatchTessellator
+
+    def stores():
+        for i in range(3):
+            m = trimesh.creation.icosphere(subdivisions=2).apply_translation((3.0 * i, 0.0, 0.0))
+            position, indices = _soup(m)
+            yield MeshStore(i, None, position, indices, None, 0, MeshType.TRIANGLES, str(i))
+
+    plain = BatchTessellator().meshes_to_trimesh(stores())
+    welded = BatchTessellator(weld=True, reorder=True).meshes_to_trimesh(stores())
+
+    (plain_mesh,) = plain.geometry.values()
+    (welded_mesh,) = welded.geometry.values()
+    assert len(welded_mesh.vertices) < len(plain_mesh.vertices) / 5
+    assert len(welded_mesh.faces) == len(plain_mesh.faces)
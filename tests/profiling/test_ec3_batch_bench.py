@@ -0,0 +1,40 @@
+"""Batch EN 1993-1-1 6.3.2 check: a jacket-sized utilization matrix in one vectorized pass.
+
+40 000 members over 200 load combinations, from four shared sections, timing
+``ec3_654_batch`` (resistance per member plus the utilization matrix) and the top-N summary.
+
+Run with::
+
+    pytest tests/profiling/test_ec3_batch_bench.py --benchmark-only
+
+Not run by ``pixi run test`` (it ignores tests/profiling).
+"""
+
+import numpy as np
+import pytest
+
+import ada
+from ada.calc.ec3_ex import Ec3MemberTable, ec3_654_batch
+
+N_MEMBERS = 40_000
+N_CASES = 200
+
+
+@pytest.mark.benchmark(group="ec3-batch")
+def test_bench_ec3_654_batch(benchmark):
+    rng = np.random.default_rng(0)
+    secs = [ada.Section(f"IPE{h}", from_str=f"IPE{h}") for h in (300, 400, 500, 600)]
+    mat = ada.Material("S355")
+    pick = rng.integers(0, len(secs), N_MEMBERS)
+    members = Ec3MemberTable.from_members(
+        np.arange(1, N_MEMBERS + 1), [secs[i] for i in pick], [mat] * N_MEMBERS, rng.uniform(2.0, 12.0, N_MEMBERS)
+    )
+    forces = np.zeros((N_MEMBERS, N_CASES, 6))
+    forces[..., 4] = rng.normal(scale=1e5, size=(N_MEMBERS, N_CASES))
+
+    def run():
+        check = ec3_654_batch(members, forces)
+        return check.governing_case, check.top(50)
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info["member_cases"] = N_MEMBERS * N_CASES
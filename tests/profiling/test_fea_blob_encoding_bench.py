@@ -0,0 +1,66 @@
+"""FEA field-blob encoding benchmark: size and per-step decode throughput.
+
+Writes one smooth transient displacement field (a travelling wave over a structured grid plus
+a little noise) as a raw v1 AFBL blob and in each :class:`BlobEncoding` variant, then times
+``read_blob_step`` over every step. ``extra_info`` carries the size ratio against the raw
+blob and the decoded MB/s, so the benchmark table reports both.
+
+Run with::
+
+    pytest tests/profiling/test_fea_blob_encoding_bench.py --benchmark-only
+
+Not run by ``pixi run test`` (it ignores tests/profiling).
+"""
+
+import numpy as np
+import pytest
+
+from ada.fem.results.artefacts import (
+    BlobEncoding,
+    FieldSpec,
+    StepValues,
+    read_blob_step,
+    write_field_blob_streaming,
+)
+
+N_SIDE = 300
+N_STEPS = 40
+
+ENCODINGS = {
+    "raw": None,
+    "zlib": BlobEncoding(),
+    "zlib-delta": BlobEncoding(delta=True),
+    "int16": BlobEncoding(quantize="int16"),
+    "int16-delta": BlobEncoding(quantize="int16", delta=True),
+}
+
+
+class _Transient:
+    def __init__(self):
+        xs, ys = np.meshgrid(np.linspace(0, 1, N_SIDE), np.linspace(0, 1, N_SIDE), indexing="ij")
+        self.x, self.y = xs.ravel(), ys.ravel()
+        self.noise = np.random.default_rng(0).normal(scale=1e-5, size=(self.x.size, 3))
+
+    def iter_field_steps(self, field_name):
+        for i in range(N_STEPS):
+            t = i / N_STEPS
+            w = np.sin(2 * np.pi * (self.x - t)) * self.y
+            values = np.column_stack([0.1 * w, 0.05 * w * self.x, w]) + self.noise
+            yield StepValues(step_index=i, step_value=t, values=values)
+
+
+@pytest.mark.benchmark(group="fea-blob-decode")
+@pytest.mark.parametrize("name", list(ENCODINGS))
+def test_bench_blob_decode(benchmark, tmp_path, name):
+    spec = FieldSpec("DISP", ["D1", "D2", "D3"], N_STEPS, N_SIDE * N_SIDE, "nodal", list(range(N_STEPS)))
+    raw_bytes = N_STEPS * spec.n_points * spec.n_components * 4
+    blob = tmp_path / "fea.DISP.bin"
+    write_field_blob_streaming(_Transient(), spec, blob, ENCODINGS[name])
+
+    def run():
+        for i in range(N_STEPS):
+            read_blob_step(blob, i)
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info["size_ratio"] = round(blob.stat().st_size / raw_bytes, 4)
+    benchmark.extra_info["decode_MB_per_s"] = round(raw_bytes / 1e6 / benchmark.stats.stats.mean, 1)
@@ -0,0 +1,79 @@
+"""Parallel field bake benchmark: many fields written one at a time vs on writer threads.
+
+A synthetic reader serves 30 nodal fields over 24 steps; reading a step costs a fixed sleep
+(the stand-in for a SIN/RMED record gather) whether one field or all of them is wanted, which
+is what the step-major ``iter_steps_for_fields`` pass saves. Each parametrization writes the
+same blobs (zlib-encoded, so the per-field work is not trivial) with ``workers`` writer
+threads.
+
+On a single core the ``workers`` > 1 runs gain only from reading each step once (30x fewer
+step reads, ~7 s of the sleeps here); 2 and 4 threads time the same. Extra threads only pay
+off with spare cores for the encode and write.
+
+Run with::
+
+    pytest tests/profiling/test_fea_parallel_bake_bench.py --benchmark-only
+
+Not run by ``pixi run test`` (it ignores tests/profiling).
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from ada.fem.results.artefacts import (
+    BlobEncoding,
+    FieldSpec,
+    StepValues,
+    _FieldBlobJob,
+    _write_blob_job,
+    write_field_blobs_parallel,
+)
+
+N_FIELDS = 30
+N_STEPS = 24
+N_POINTS = 50_000
+STEP_READ_S = 0.01
+
+
+class _ManyFields:
+    def __init__(self):
+        rng = np.random.default_rng(0)
+        self.base = rng.normal(size=(N_POINTS, 3)).astype(np.float32)
+        self.specs = [
+            FieldSpec(f"F{k}", ["X", "Y", "Z"], N_STEPS, N_POINTS, "nodal", [float(i) for i in range(N_STEPS)])
+            for k in range(N_FIELDS)
+        ]
+
+    def _values(self, k, i):
+        return self.base * np.float32(np.sin(0.1 * i + k))
+
+    def iter_field_steps(self, field_name):
+        k = int(field_name[1:])
+        for i in range(N_STEPS):
+            time.sleep(STEP_READ_S)
+            yield StepValues(step_index=i, step_value=float(i), values=self._values(k, i))
+
+    def iter_steps_for_fields(self, specs):
+        for i in range(N_STEPS):
+            time.sleep(STEP_READ_S)
+            for k, spec in enumerate(specs):
+                yield k, StepValues(step_index=i, step_value=float(i), values=self._values(int(spec.name[1:]), i))
+
+
+@pytest.mark.benchmark(group="fea-parallel-bake")
+@pytest.mark.parametrize("workers", [1, 2, 4])
+def test_bench_parallel_field_bake(benchmark, tmp_path, workers):
+    reader = _ManyFields()
+    encoding = BlobEncoding(level=1)
+
+    def run():
+        jobs = [_FieldBlobJob(spec, tmp_path / f"fea.{spec.name}.bin", encoding) for spec in reader.specs]
+        if workers == 1:
+            return [_write_blob_job(reader, job) for job in jobs]
+        return write_field_blobs_parallel(reader, jobs, workers, 256 * 1024 * 1024)
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info["fields"] = N_FIELDS
+    benchmark.extra_info["steps"] = N_STEPS
@@ -0,0 +1,89 @@
+"""Result store throughput: row-per-value ``FieldNodes`` tables vs. columnar ``FieldArrays`` blobs.
+
+One 3-component nodal field over a 1M-node model, written and read back at one step, through
+``insert_table`` + ``get_field_nodal_data`` (one row per node and component) and through
+``insert_field_array`` + ``get_field_array`` (one blob pair per field and step).
+
+Run with::
+
+    pytest tests/profiling/test_fea_result_store_bench.py --benchmark-only
+
+Not run by ``pixi run test`` (it ignores tests/profiling).
+"""
+
+import numpy as np
+import pytest
+
+from ada.fem.results.sqlite_store import SQLiteFEAStore
+
+N_NODES = 1_000_000
+COMPONENTS = ["U1", "U2", "U3"]
+
+
+def _store(tmp_path_factory, name):
+    store = SQLiteFEAStore(tmp_path_factory.mktemp("store") / f"{name}.db")
+    store.insert_table("ModelInstances", [(1, "PART-1")])
+    store.insert_table("Steps", [(1, "Step-1", "", "")])
+    store.insert_table("FieldVars", [(i + 1, c, "") for i, c in enumerate(COMPONENTS)])
+    return store
+
+
+def _field():
+    rng = np.random.default_rng(0)
+    return np.arange(1, N_NODES + 1), rng.normal(size=(N_NODES, len(COMPONENTS)))
+
+
+@pytest.mark.benchmark(group="fea-result-store-write")
+def test_bench_write_rows(benchmark, tmp_path_factory):
+    labels, values = _field()
+
+    def run():
+        store = _store(tmp_path_factory, "rows")
+        for j in range(len(COMPONENTS)):
+            rows = zip(
+                [1] * N_NODES, labels.tolist(), [1] * N_NODES, [j + 1] * N_NODES, [1.0] * N_NODES, values[:, j].tolist()
+            )
+            store.insert_table("FieldNodes", list(rows))
+
+    benchmark.pedantic(run, rounds=1, iterations=1)
+    benchmark.extra_info["values"] = values.size
+
+
+@pytest.mark.benchmark(group="fea-result-store-write")
+def test_bench_write_arrays(benchmark, tmp_path_factory):
+    labels, values = _field()
+
+    def run():
+        _store(tmp_path_factory, "arrays").insert_field_array("U", 1, labels, values, COMPONENTS, frame=1.0)
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info["values"] = values.size
+
+
+@pytest.mark.benchmark(group="fea-result-store-read")
+def test_bench_read_rows(benchmark, tmp_path_factory):
+    labels, values = _field()
+    store = _store(tmp_path_factory, "rows")
+    for j in range(len(COMPONENTS)):
+        rows = zip(
+            [1] * N_NODES, labels.tolist(), [1] * N_NODES, [j + 1] * N_NODES, [1.0] * N_NODES, values[:, j].tolist()
+        )
+        store.insert_table("FieldNodes", list(rows))
+
+    def run():
+        return np.column_stack(
+            [np.array([r[-1] for r in store.get_field_nodal_data(c, step_id=1)]) for c in COMPONENTS]
+        )
+
+    out = benchmark.pedantic(run, rounds=3, iterations=1)
+    np.testing.assert_array_equal(out, values)
+
+
+@pytest.mark.benchmark(group="fea-result-store-read")
+def test_bench_read_arrays(benchmark, tmp_path_factory):
+    labels, values = _field()
+    store = _store(tmp_path_factory, "arrays")
+    store.insert_field_array("U", 1, labels, values, COMPONENTS, frame=1.0)
+
+    out = benchmark.pedantic(lambda: store.get_field_array("U", 1).values, rounds=3, iterations=1)
+    np.testing.assert_array_equal(out, values)
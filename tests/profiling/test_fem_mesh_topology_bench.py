@@ -0,0 +1,67 @@
+"""Edge / triangle extraction for FEM result meshes: per-element ``ElemShape`` loop vs. the
+per-type template gather in ``Mesh.get_edges_and_faces_from_mesh``.
+
+A 40 x 40 x 40 HEX8 block (64 000 elements, non-contiguous node ids), all faces and the
+exterior skin only.
+
+Run with::
+
+    pytest tests/profiling/test_fem_mesh_topology_bench.py --benchmark-only
+
+Not run by ``pixi run test`` (it ignores tests/profiling).
+"""
+
+import numpy as np
+import pytest
+
+from ada.fem.formats.general import FEATypes
+from ada.fem.results.common import ElementBlock, ElementInfo, FemNodes, Mesh
+from ada.fem.shapes import ElemShape
+from ada.fem.shapes.definitions import SolidShapes
+
+N = 40
+
+
+def _hex_block() -> Mesh:
+    idx = np.arange((N + 1) ** 3).reshape(N + 1, N + 1, N + 1)
+    ids = np.random.default_rng(0).permutation(idx.size) * 2 + 1
+    c = idx[:-1, :-1, :-1].ravel()
+    dj, dk = N + 1, 1
+    di = (N + 1) ** 2
+    cells = np.stack([c, c + di, c + di + dj, c + dj, c + dk, c + di + dk, c + di + dj + dk, c + dj + dk], axis=1)
+    block = ElementBlock(ElementInfo(SolidShapes.HEX8, FEATypes.CODE_ASTER, "HEXA8"), ids[cells], np.arange(len(cells)))
+    return Mesh([block], FemNodes(np.zeros((idx.size, 3)), ids))
+
+
+@pytest.mark.benchmark(group="fem-mesh-topology")
+def test_bench_per_element_shapes(benchmark):
+    mesh = _hex_block()
+
+    def run():
+        nmap = {x: i for i, x in enumerate(mesh.nodes.identifiers)}
+        edges, faces = [], []
+        for block in mesh.elements:
+            refs = np.vectorize(nmap.get)(block.node_refs)
+            for elem in refs:
+                shape = ElemShape(block.elem_info.type, elem)
+                edges += shape.edges
+                faces += shape.get_faces()
+        return np.array(edges).reshape(-1, 2), np.array(faces).reshape(-1, 3)
+
+    benchmark.pedantic(run, rounds=1, iterations=1)
+
+
+@pytest.mark.benchmark(group="fem-mesh-topology")
+def test_bench_templates(benchmark):
+    mesh = _hex_block()
+    edges, faces = benchmark.pedantic(mesh.get_edges_and_faces_from_mesh, rounds=3, iterations=1)
+    assert faces.shape == (12 * N**3, 3)
+
+
+@pytest.mark.benchmark(group="fem-mesh-topology")
+def test_bench_templates_skin_only(benchmark):
+    mesh = _hex_block()
+    edges, faces = benchmark.pedantic(
+        lambda: mesh.get_edges_and_faces_from_mesh(skin_only=True), rounds=3, iterations=1
+    )
+    assert faces.shape == (12 * N**2, 3)
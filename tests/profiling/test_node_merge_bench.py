@@ -0,0 +1,61 @@
+"""Coincident-node merge benchmark.
+
+``MeshArrays.merge_coincident_nodes`` merges coincident nodes in one sort-and-sweep pass over the
+packed coords, where the object path does a ``get_by_volume`` + ``replace_node`` per node. This
+benchmark merges the seam of two structured shell grids that share every node along one edge
+(the situation after ``fem/concat.py`` or multi-part meshing), plus a scattered set of doubled
+nodes, and times the merge.
+
+Run with::
+
+    pytest tests/profiling/test_node_merge_bench.py --benchmark-only
+
+Not run by ``pixi run test`` (it ignores tests/profiling).
+"""
+
+import numpy as np
+import pytest
+
+from ada.api.mesh.store import MeshArrays
+from ada.fem.shapes.definitions import ShellShapes
+
+# Nodes per side of each of the two grids, and the number of scattered doubled nodes
+N_SIDE = 500
+N_DOUBLED = 20_000
+
+
+def _grid(x0: float) -> tuple[np.ndarray, np.ndarray]:
+    xs, ys = np.meshgrid(np.arange(N_SIDE) * 0.01 + x0, np.arange(N_SIDE) * 0.01, indexing="ij")
+    coords = np.column_stack([xs.ravel(), ys.ravel(), np.zeros(xs.size)])
+    idx = np.arange(N_SIDE * N_SIDE).reshape(N_SIDE, N_SIDE)
+    quads = np.column_stack([idx[:-1, :-1].ravel(), idx[1:, :-1].ravel(), idx[1:, 1:].ravel(), idx[:-1, 1:].ravel()])
+    return coords, quads
+
+
+def _make_store() -> MeshArrays:
+    c1, q1 = _grid(0.0)
+    # the second grid starts on the last column of the first -> N_SIDE seam nodes
+    c2, q2 = _grid((N_SIDE - 1) * 0.01)
+    rng = np.random.default_rng(0)
+    doubled = c1[rng.choice(len(c1), N_DOUBLED, replace=False)] + 1e-7
+    coords = np.vstack([c1, c2, doubled])
+    conn = np.vstack([q1, q2 + len(c1)])
+    store = MeshArrays(coords, np.arange(1, len(coords) + 1))
+    store.add_elem_block_from_id_conn(ShellShapes.QUAD, np.arange(1, len(conn) + 1), conn + 1)
+    return store
+
+
+@pytest.mark.benchmark(group="node-merge")
+def test_bench_merge_coincident_nodes(benchmark):
+    stores = iter([_make_store() for _ in range(3)])
+
+    def run():
+        store = next(stores)
+        store.merge_coincident_nodes(1e-4)
+        return store
+
+    store = benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info["n_nodes_after"] = store.n_nodes
+
+    assert store.n_nodes == 2 * N_SIDE * N_SIDE - N_SIDE
+    assert store.blocks[ShellShapes.QUAD].conn.max() < store.n_nodes
@@ -0,0 +1,160 @@
+"""Partitioning broadphase benchmark.
+
+``split_crossing_beams`` fragments each cluster of beams with touching bounding boxes in one OCC
+call, and ``fragment_plates`` does the same for each cluster of edge-connected plates (capped at
+``Config().meshing_max_fragment_cluster`` members). This benchmark times both, on separate beam
+grids and on a plate deck, against the pairwise loops they replaced (one call per ordered beam
+pair, one per edge-connected plate pair). It counts the ``occ.fragment`` calls of each path and
+checks that the clustered plate deck comes out conformal.
+
+The geometry is added straight through gmsh's OCC API, so no CAD backend is needed.
+
+Run with::
+
+    pytest tests/profiling/test_partition_bench.py --benchmark-only
+
+Not run by ``pixi run test`` (it ignores tests/profiling).
+"""
+
+import pytest
+
+import ada
+from ada.config import Config
+from ada.core.clash_check import PlateConnections
+from ada.fem.meshing import GmshSession
+from ada.fem.meshing.concepts import GmshData
+from ada.fem.meshing.partitioning.partition_beams import split_crossing_beams
+from ada.fem.meshing.partitioning.partition_plates import fragment_plates
+
+# Number of separate grids and the number of beams per direction in each grid
+N_GRIDS = 4
+N_PER_DIR = 4
+
+# Plates per side of the square plate deck
+N_DECK = 20
+
+
+def _count_fragments(gs: GmshSession, monkeypatch) -> list:
+    calls = []
+    fragment = gs.model.occ.fragment
+
+    def counting_fragment(*args, **kwargs):
+        calls.append(1)
+        return fragment(*args, **kwargs)
+
+    monkeypatch.setattr(gs.model.occ, "fragment", counting_fragment)
+    return calls
+
+
+def _add_beam_grids(gs: GmshSession) -> None:
+    occ = gs.model.occ
+    for g in range(N_GRIDS):
+        z = 10.0 * g
+        for i in range(N_PER_DIR):
+            for name, p1, p2 in (
+                (f"bmx{g}_{i}", (0, i, z), (N_PER_DIR, i, z)),
+                (f"bmy{g}_{i}", (i, 0, z), (i, N_PER_DIR, z)),
+            ):
+                bm = ada.Beam(name, p1, p2, "IPE300")
+                line = occ.addLine(occ.addPoint(*p1), occ.addPoint(*p2))
+                gs.model_map[bm] = GmshData([(1, line)], "line", 1, bm)
+    occ.synchronize()
+
+
+def _add_plate_deck(gs: GmshSession) -> PlateConnections:
+    plates = {}
+    for i in range(N_DECK):
+        for j in range(N_DECK):
+            pl = ada.Plate(f"pl{i}_{j}", [(0, 0), (1, 0), (1, 1), (0, 1)], 0.01, origin=(i, j, 0))
+            gs.model_map[pl] = GmshData([(2, gs.model.occ.addRectangle(i, j, 0, 1, 1))], "shell", 1, pl)
+            plates[(i, j)] = pl
+    gs.model.occ.synchronize()
+
+    edge_connected = {}
+    for (i, j), pl in plates.items():
+        con = [plates[k] for k in ((i + 1, j), (i, j + 1)) if k in plates]
+        if con:
+            edge_connected[pl] = con
+    return PlateConnections({}, edge_connected)
+
+
+def _fragment_pair(gs: GmshSession, obj, tool, remove_object: bool) -> None:
+    obj_gmsh, tool_gmsh = gs.model_map[obj], gs.model_map[tool]
+    _, res_map = gs.model.occ.fragment(
+        obj_gmsh.entities, tool_gmsh.entities, removeTool=False, removeObject=remove_object
+    )
+    num_object_entities = len(obj_gmsh.entities)
+    obj_gmsh.entities = [e for new in res_map[:num_object_entities] for e in new]
+    tool_gmsh.entities = [e for new in res_map[num_object_entities:] for e in new]
+
+
+def _pairwise_split_crossing_beams(gs: GmshSession) -> None:
+    """The loop ``split_crossing_beams`` replaced: every ordered pair of beams"""
+    beams = [obj for obj in gs.model_map if type(obj) is ada.Beam]
+    for bm in beams:
+        for other_bm in beams:
+            if bm is not other_bm:
+                _fragment_pair(gs, bm, other_bm, remove_object=True)
+    gs.model.occ.synchronize()
+
+
+def _pairwise_fragment_plates(plate_con: PlateConnections, gs: GmshSession) -> None:
+    """The loop ``fragment_plates`` replaced: every edge-connected pair of plates"""
+    for pl1, con_plates in plate_con.edge_connected.items():
+        for pl2 in con_plates:
+            _fragment_pair(gs, pl1, pl2, remove_object=False)
+    gs.model.occ.synchronize()
+
+
+@pytest.mark.benchmark(group="partitioning")
+@pytest.mark.parametrize("path", ["pairwise", "clustered"])
+def test_bench_split_crossing_beams_call_count(benchmark, monkeypatch, path):
+    def run():
+        with GmshSession(silent=True) as gs:
+            _add_beam_grids(gs)
+            calls = _count_fragments(gs, monkeypatch)
+            if path == "pairwise":
+                _pairwise_split_crossing_beams(gs)
+            else:
+                split_crossing_beams(gs)
+            monkeypatch.undo()
+            return len(calls)
+
+    num_calls = benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info["occ_fragment_calls"] = num_calls
+
+    num_beams = N_GRIDS * 2 * N_PER_DIR
+    # pairwise: one call per ordered pair of beams; clustered: one call per grid
+    assert num_calls == (num_beams * (num_beams - 1) if path == "pairwise" else N_GRIDS)
+
+
+@pytest.mark.benchmark(group="partitioning-plates")
+@pytest.mark.parametrize("path, max_cluster", [("pairwise", None), ("clustered", 64), ("clustered", 512)])
+def test_bench_fragment_plate_deck(benchmark, monkeypatch, path, max_cluster):
+    def run():
+        with GmshSession(silent=True) as gs:
+            plate_con = _add_plate_deck(gs)
+            calls = _count_fragments(gs, monkeypatch)
+            if path == "pairwise":
+                _pairwise_fragment_plates(plate_con, gs)
+            else:
+                monkeypatch.setattr(Config(), "meshing_max_fragment_cluster", max_cluster)
+                fragment_plates(plate_con, gs)
+            monkeypatch.undo()
+
+            entities = [dt for gmsh_obj in gs.model_map.values() for dt in gmsh_obj.entities]
+            curves = {abs(tag) for _, tag in gs.model.getBoundary(entities, combined=False, oriented=False)}
+            return len(calls), len(curves)
+
+    num_calls, num_curves = benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info["occ_fragment_calls"] = num_calls
+    benchmark.extra_info["plate_edges"] = num_curves
+
+    if path == "pairwise":
+        # One call per edge-connected pair. Fragmenting pairs while keeping both inputs leaves
+        # duplicate edges behind, so the deck is not conformal (``plate_edges`` is only recorded).
+        assert num_calls == 2 * N_DECK * (N_DECK - 1)
+    elif N_DECK**2 <= max_cluster:
+        # One call for the whole deck, and every shared edge is a single curve
+        assert num_calls == 1
+        assert num_curves == 2 * N_DECK * (N_DECK + 1)
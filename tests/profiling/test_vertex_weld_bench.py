@@ -0,0 +1,89 @@
+"""Vertex weld / reorder benchmark on a 10M-vertex merged triangle soup.
+
+``optimize_positions`` used to round-trip through ``trimesh.Trimesh.merge_vertices``; it now calls
+the vectorized :func:`ada.visit.optimizing.weld_vertices`. This benchmark builds an unindexed
+soup of ~3.3M triangles (10M vertices) split over 1000 draw ranges, as a merged export of many
+tessellated objects looks, and times the trimesh baseline, the weld (with and without draw
+ranges) and the Morton-order :func:`~ada.visit.optimizing.reorder_for_cache` pass.
+
+Run with::
+
+    pytest tests/profiling/test_vertex_weld_bench.py --benchmark-only
+
+Not run by ``pixi run test`` (it ignores tests/profiling).
+"""
+
+import numpy as np
+import pytest
+
+from ada.visit.optimizing import reorder_for_cache, weld_vertices
+
+# Quads per side of the tessellated sheet, and the number of draw ranges (objects)
+N_SIDE = 1291
+N_GROUPS = 1000
+
+
+def _soup() -> tuple[np.ndarray, np.ndarray, list[tuple[int, int]]]:
+    xs, ys = np.meshgrid(np.arange(N_SIDE + 1) * 0.01, np.arange(N_SIDE + 1) * 0.01, indexing="ij")
+    grid = np.column_stack([xs.ravel(), ys.ravel(), np.sin(xs.ravel()) * np.cos(ys.ravel())])
+    idx = np.arange((N_SIDE + 1) ** 2).reshape(N_SIDE + 1, N_SIDE + 1)
+    a, b, c, d = idx[:-1, :-1].ravel(), idx[1:, :-1].ravel(), idx[1:, 1:].ravel(), idx[:-1, 1:].ravel()
+    faces = np.column_stack([a, b, c, a, c, d]).reshape(-1, 3)
+    position = grid[faces].astype(np.float32).reshape(-1)
+    indices = np.arange(len(position) // 3, dtype=np.uint32)
+    step = len(faces) // N_GROUPS * 3
+    groups = [(s, min(step, len(indices) - s)) for s in range(0, len(indices), step)]
+    return position, indices, groups
+
+
+@pytest.fixture(scope="module")
+def soup():
+    return _soup()
+
+
+@pytest.mark.benchmark(group="vertex-weld")
+def test_bench_trimesh_merge_vertices(benchmark, soup):
+    import trimesh
+
+    position, indices, _ = soup
+
+    def run():
+        mesh = trimesh.Trimesh(vertices=position.reshape(-1, 3), faces=indices.reshape(-1, 3), process=False)
+        mesh.merge_vertices()
+        return mesh
+
+    mesh = benchmark.pedantic(run, rounds=1, iterations=1)
+    benchmark.extra_info["n_vertices_after"] = len(mesh.vertices)
+
+
+@pytest.mark.benchmark(group="vertex-weld")
+def test_bench_weld_vertices(benchmark, soup):
+    position, indices, _ = soup
+
+    welded, new_indices, _ = benchmark.pedantic(lambda: weld_vertices(position, indices), rounds=3, iterations=1)
+    benchmark.extra_info["n_vertices_after"] = len(welded) // 3
+
+    assert len(welded) // 3 == (N_SIDE + 1) ** 2
+    assert len(new_indices) == len(indices)
+
+
+@pytest.mark.benchmark(group="vertex-weld")
+def test_bench_weld_vertices_in_draw_ranges(benchmark, soup):
+    position, indices, groups = soup
+
+    welded, _, _ = benchmark.pedantic(lambda: weld_vertices(position, indices, groups=groups), rounds=3, iterations=1)
+    benchmark.extra_info["n_vertices_after"] = len(welded) // 3
+
+    assert (N_SIDE + 1) ** 2 < len(welded) // 3 < len(indices)
+
+
+@pytest.mark.benchmark(group="vertex-weld")
+def test_bench_reorder_for_cache(benchmark, soup):
+    position, indices, groups = soup
+    welded, new_indices, _ = weld_vertices(position, indices, groups=groups)
+
+    _, reordered, _ = benchmark.pedantic(
+        lambda: reorder_for_cache(welded, new_indices, groups=groups), rounds=3, iterations=1
+    )
+
+    assert len(reordered) == len(indices)